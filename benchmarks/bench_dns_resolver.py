@@ -50,8 +50,23 @@ def resolve_par(res, count=10, begin=0):
         gs.append(gevent.spawn(quiet, res.gethostbyname, 'x%s.com' % index))
     gevent.joinall(gs)
 
+def resolve_bulk(res, count=10, begin=0):
+    hosts = ['x%s.com' % index
+             for index in range(begin, count + begin)
+             if index not in blacklist]
+    for _ in res.resolve_many(hosts, 0, socket.AF_INET):
+        pass
+
 N = 300
 
+# A few names that are looked up over and over, as by a service that
+# talks to the same backends for every request.
+HOT_NAMES = ['x%s.com' % i for i in range(5)]
+
+def resolve_hot(res, count=10, begin=0):
+    for index in range(begin, count + begin):
+        quiet(res.gethostbyname, HOT_NAMES[index % len(HOT_NAMES)])
+
 def run_all(resolver_name, resolve):
 
     res = drresolve('gevent.resolver.' + resolver_name + '.Resolver')
@@ -79,7 +94,7 @@ def main():
     runner = perf.Runner(processes=5, values=3,
                          add_cmdline_args=worker_cmd)
 
-    all_names = 'dnspython', 'blocking', 'ares', 'thread'
+    all_names = 'dnspython', 'blocking', 'ares', 'thread', 'caching', 'stub'
     runner.argparser.add_argument('benchmark',
                                   nargs='*',
                                   default='all',
@@ -103,6 +118,14 @@ def main():
                           run_all,
                           name, resolve_par,
                           inner_loops=N)
+        runner.bench_func(name + ' hot',
+                          run_all,
+                          name, resolve_hot,
+                          inner_loops=N)
+        runner.bench_func(name + ' many',
+                          run_all,
+                          name, resolve_bulk,
+                          inner_loops=N)
 
 if __name__ == '__main__':
     main()
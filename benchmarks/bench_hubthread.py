@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for running greenlets in several hubs with
+:class:`gevent.hubthread.HubThreadGroup`.
+
+Each task does some pure-Python work with a few cooperative yields.
+The time to finish a fixed number of tasks is compared for the
+current hub alone and for groups of 1, 2 and 4 hub threads. With the
+GIL, extra threads can't help (and add switching overhead); on a
+free-threaded build of CPython with enough cores, time per task
+falls nearly in proportion to the number of threads.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+
+import pyperf as perf
+from pyperf import perf_counter
+
+import gevent
+from gevent.hubthread import HubThreadGroup
+
+# Tasks per loop.
+N = 400
+# Work per task.
+WORK = 5000
+
+
+def _task():
+    for _ in range(4):
+        total = 0
+        for i in range(WORK):
+            total += i
+        gevent.sleep(0)
+
+
+def bench_current_hub(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        gevent.joinall([gevent.spawn(_task) for _ in range(N)])
+    return perf_counter() - t0
+
+
+def bench_group(loops, size):
+    total = 0
+    for _ in range(loops):
+        group = HubThreadGroup(size)
+        group.start()
+        t0 = perf_counter()
+        for _ in range(N):
+            group.spawn(_task)
+        # Waits for all the tasks.
+        group.stop()
+        total += perf_counter() - t0
+    return total
+
+
+def main():
+    runner = perf.Runner()
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    runner.metadata['gil_enabled'] = str(gil)
+    runner.bench_time_func('current hub', bench_current_hub, inner_loops=N)
+    for size in (1, 2, 4):
+        runner.bench_time_func('%d hub threads' % size, bench_group, size, inner_loops=N)
+
+if __name__ == '__main__':
+    main()
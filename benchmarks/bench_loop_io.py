@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for the cost of IO readiness in the event loop.
+
+These mostly measure how quickly the loop can start and stop watching
+sockets and deliver readiness, which is where the loop implementations
+(and the libev backends) differ. Compare loops by running this once for
+each, for example::
+
+    GEVENT_LOOP=libev-cext python bench_loop_io.py -o libev.json
+    GEVENT_LOOP=gevent.libev.corecext.iouring_loop python bench_loop_io.py -o iouring.json
+    GEVENT_LOOP=libuv python bench_loop_io.py -o libuv.json
+    python -m pyperf compare_to libev.json iouring.json libuv.json
+
+``GEVENT_*`` environment variables are passed to the worker processes.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import sys
+
+import pyperf as perf
+from pyperf import perf_counter
+
+import gevent
+from gevent import socket
+
+# The number of socket pairs.
+PAIRS = 100
+# The number of round trips made over each pair.
+ROUND_TRIPS = 10
+
+
+def _ping(sock, count):
+    for _ in range(count):
+        sock.sendall(b'x')
+        sock.recv(1)
+
+def _pong(sock, count):
+    for _ in range(count):
+        sock.recv(1)
+        sock.sendall(b'x')
+
+def bench_ping_pong(loops):
+    # Every recv has to wait, so each round trip starts and
+    # stops a read watcher on both sockets.
+    pairs = [socket.socketpair() for _ in range(PAIRS)]
+    try:
+        t0 = perf_counter()
+        for _ in range(loops):
+            glets = []
+            for a, b in pairs:
+                glets.append(gevent.spawn(_pong, b, ROUND_TRIPS))
+                glets.append(gevent.spawn(_ping, a, ROUND_TRIPS))
+            gevent.joinall(glets)
+        return perf_counter() - t0
+    finally:
+        for a, b in pairs:
+            a.close()
+            b.close()
+
+def bench_wake_all(loops):
+    # Many sockets become readable in the same loop iteration.
+    pairs = [socket.socketpair() for _ in range(PAIRS * 10)]
+    try:
+        t0 = perf_counter()
+        for _ in range(loops):
+            glets = [gevent.spawn(b.recv, 1) for _, b in pairs]
+            gevent.sleep()
+            for a, _ in pairs:
+                a.send(b'x')
+            gevent.joinall(glets)
+        return perf_counter() - t0
+    finally:
+        for a, b in pairs:
+            a.close()
+            b.close()
+
+
+def main():
+    argv = sys.argv[1:]
+    env_options = [
+        '--inherit-environ',
+        ','.join([k for k in os.environ
+                  if k.startswith(('GEVENT', 'PYTHON', 'PURE_PYTHON'))])]
+    argv[0:0] = env_options
+
+    runner = perf.Runner()
+    runner.parse_args(argv)
+    loop = gevent.get_hub().loop
+    runner.metadata['gevent_loop'] = '%s.%s' % (type(loop).__module__, type(loop).__name__)
+    runner.metadata['gevent_backend'] = str(getattr(loop, 'backend', ''))
+
+    runner.bench_time_func('ping pong',
+                           bench_ping_pong,
+                           inner_loops=PAIRS * ROUND_TRIPS)
+    runner.bench_time_func('wake all',
+                           bench_wake_all,
+                           inner_loops=PAIRS * 10)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for the overhead of :meth:`gevent.hub.Hub.start_loop_stats`.
+
+Greenlets sleep for a moment, so each one goes through a timer and an
+iteration of the event loop, with and without loop statistics. The
+time reported is per greenlet.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+
+import gevent
+
+N = 1000
+
+
+def _run(loops):
+    t0 = perf.perf_counter()
+    for _ in range(loops):
+        gevent.joinall([gevent.spawn(gevent.sleep, 0.0001) for _ in range(N)])
+    return perf.perf_counter() - t0
+
+
+def bench_no_stats(loops):
+    return _run(loops)
+
+
+def bench_stats(loops):
+    hub = gevent.get_hub()
+    hub.start_loop_stats()
+    try:
+        return _run(loops)
+    finally:
+        hub.stop_loop_stats()
+
+
+def main():
+    runner = perf.Runner()
+    runner.bench_time_func('no loop stats', bench_no_stats, inner_loops=N)
+    runner.bench_time_func('loop stats', bench_stats, inner_loops=N)
+
+
+if __name__ == '__main__':
+    main()
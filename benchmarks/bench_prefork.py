@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for :class:`gevent.prefork.PreforkRunner`.
+
+A small WSGI application is served by 1, 2, 4 and (if there are more
+CPUs than that) one worker per CPU. One client process per CPU sends
+requests over keep-alive connections; the time reported is per
+request. On a machine with enough cores, and with the clients not
+themselves the bottleneck, throughput grows nearly linearly with the
+number of workers.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import socket
+import subprocess
+import sys
+from multiprocessing import Pool
+
+import pyperf as perf
+from pyperf import perf_counter
+
+# Requests sent by each client process per loop.
+N = 200
+# Simulated per-request CPU work in the application.
+WORK = 2000
+
+REQUEST = b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\n'
+
+
+def _serve(workers, reuse_port):
+    from gevent.prefork import PreforkRunner
+    from gevent.pywsgi import WSGIServer
+
+    body = [b'x' * 100]
+
+    def application(_environ, start_response):
+        for _ in range(WORK):
+            pass
+        start_response('200 OK', [('Content-Length', '100')])
+        return body
+
+    runner = PreforkRunner(
+        ('127.0.0.1', 0),
+        lambda listener: WSGIServer(listener, application, log=None),
+        workers=workers,
+        reuse_port=reuse_port)
+    sys.stdout.write('%d\n' % runner.address[1])
+    sys.stdout.flush()
+    runner.serve_forever()
+
+
+def _client(args):
+    port, loops = args
+    with socket.create_connection(('127.0.0.1', port)) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with sock.makefile('rb') as rfile:
+            for _ in range(loops * N):
+                sock.sendall(REQUEST)
+                while rfile.readline() != b'\r\n':
+                    pass
+                rfile.read(100)
+
+
+class _Server(object):
+
+    def __init__(self, workers, reuse_port):
+        # (not on Py2) pylint:disable=consider-using-with
+        self.process = subprocess.Popen(
+            [sys.executable, __file__, '--serve', str(workers), str(int(reuse_port))],
+            stdout=subprocess.PIPE)
+        self.port = int(self.process.stdout.readline())
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+def _bench(loops, workers, reuse_port):
+    clients = os.cpu_count() or 1
+    server = _Server(workers, reuse_port)
+    try:
+        with Pool(clients) as pool:
+            # Establish the connections (and let the workers start).
+            pool.map(_client, [(server.port, 0)] * clients)
+            t0 = perf_counter()
+            pool.map(_client, [(server.port, loops)] * clients)
+            elapsed = perf_counter() - t0
+        # Per request.
+        return elapsed / clients
+    finally:
+        server.close()
+
+
+def main():
+    if sys.argv[1:2] == ['--serve']:
+        _serve(int(sys.argv[2]), bool(int(sys.argv[3])))
+        return
+
+    from gevent.server import SO_REUSEPORT
+
+    runner = perf.Runner()
+    cpus = os.cpu_count() or 1
+    counts = [1, 2, 4]
+    if cpus > 4:
+        counts.append(cpus)
+    for workers in counts:
+        runner.bench_time_func('prefork %d workers shared socket' % workers,
+                               _bench, workers, False, inner_loops=N)
+        if SO_REUSEPORT is not None:
+            runner.bench_time_func('prefork %d workers SO_REUSEPORT' % workers,
+                                   _bench, workers, True, inner_loops=N)
+
+if __name__ == '__main__':
+    main()
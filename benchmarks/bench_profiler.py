@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for the overhead of :class:`gevent.util.GreenletProfiler`.
+
+Several greenlets do a little work and yield to each other, without
+monitoring, with the monitoring thread, and with the monitoring thread
+sampling for the profiler. The time reported is per switch.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+
+import gevent
+from gevent.util import GreenletProfiler
+
+# Greenlets, and the times each one yields.
+GREENLETS = 10
+SWITCHES = 100
+N = GREENLETS * SWITCHES
+
+
+def _work():
+    for _ in range(SWITCHES):
+        for _ in range(50):
+            pass
+        gevent.sleep(0)
+
+
+def _run(loops):
+    t0 = perf.perf_counter()
+    for _ in range(loops):
+        gevent.joinall([gevent.spawn(_work) for _ in range(GREENLETS)])
+    return perf.perf_counter() - t0
+
+
+def _start_monitor():
+    gevent.config.monitor_thread = True
+    # The benchmark blocks for longer than the default between
+    # switches into the hub, but that isn't what we're measuring.
+    gevent.config.print_blocking_reports = False
+    return gevent.get_hub().start_periodic_monitoring_thread()
+
+
+def bench_no_monitor(loops):
+    return _run(loops)
+
+
+def bench_monitor(loops):
+    _start_monitor()
+    return _run(loops)
+
+
+def bench_profiler(loops, interval):
+    _start_monitor()
+    with GreenletProfiler(interval):
+        return _run(loops)
+
+
+def main():
+    runner = perf.Runner()
+    runner.bench_time_func('no monitor', bench_no_monitor, inner_loops=N)
+    runner.bench_time_func('monitor thread', bench_monitor, inner_loops=N)
+    runner.bench_time_func('profiler 10ms', bench_profiler, 0.01, inner_loops=N)
+    runner.bench_time_func('profiler 5ms', bench_profiler, 0.005, inner_loops=N)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for producing response headers in :mod:`gevent.pywsgi`.
+
+This times what the handler does with the status and headers an
+application provides: ``start_response``, ``finalize_headers``
+(which adds ``Date`` and ``Content-Length``) and serializing the
+header block to the socket (here, one that discards it).
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+from pyperf import perf_counter
+
+from gevent import pywsgi
+
+N = 1000
+BODY = [b'hello world']
+HEADERS = [
+    ('Content-Type', 'text/html; charset=utf-8'),
+    ('Cache-Control', 'no-cache'),
+    ('X-Frame-Options', 'SAMEORIGIN'),
+    ('Set-Cookie', 'session=8f14e45fceea167a5a36dedd4bea2543; Path=/; HttpOnly'),
+]
+
+
+class _Socket(object):
+    def sendall(self, data):
+        pass
+
+    def sendall_buffers(self, buffers):
+        pass
+
+
+def _bench(loops, status, headers):
+    handler = pywsgi.WSGIHandler(_Socket(), ('127.0.0.1', 12345), None, rfile=object())
+    handler.request_version = 'HTTP/1.1'
+    handler.result = BODY
+    start_response = handler.start_response
+    total = 0
+    for _ in range(loops):
+        t0 = perf_counter()
+        for _ in range(N):
+            handler.headers_sent = False
+            handler.response_use_chunked = False
+            start_response(status, headers)
+            handler.write(b'')
+        total += perf_counter() - t0
+    return total
+
+
+def main():
+    runner = perf.Runner()
+    runner.bench_time_func('start_response and headers', _bench, '200 OK', HEADERS,
+                           inner_loops=N)
+    runner.bench_time_func('start_response and headers 404', _bench, '404 Not Found',
+                           [('Content-Type', 'text/plain')],
+                           inner_loops=N)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for parsing a request in :mod:`gevent.pywsgi`.
+
+This times what the handler does between reading the request line and
+calling the application: ``read_request`` followed by
+``get_environ``. It compares the current handler with one that uses
+:func:`http.client.parse_headers` and the generic header loop, as
+pywsgi did before :mod:`gevent._http_parser`. That module is faster
+still when compiled; run with and without ``PURE_PYTHON`` to see both.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from io import BytesIO
+from http import client
+
+import pyperf as perf
+from pyperf import perf_counter
+
+from gevent import pywsgi
+
+# What a browser sends for a page load.
+REQUEST_LINE = 'GET /static/css/site.css?v=1234 HTTP/1.1\r\n'
+HEADERS = (
+    b'Host: www.example.com\r\n'
+    b'User-Agent: Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0\r\n'
+    b'Accept: text/css,*/*;q=0.1\r\n'
+    b'Accept-Language: en-US,en;q=0.5\r\n'
+    b'Accept-Encoding: gzip, deflate, br\r\n'
+    b'Connection: keep-alive\r\n'
+    b'Referer: https://www.example.com/\r\n'
+    b'Cookie: session=8f14e45fceea167a5a36dedd4bea2543; theme=dark\r\n'
+    b'Sec-Fetch-Dest: style\r\n'
+    b'Sec-Fetch-Mode: no-cors\r\n'
+    b'Sec-Fetch-Site: same-origin\r\n'
+    b'If-None-Match: "5d8c72a5edda8d6a"\r\n'
+    b'\r\n'
+)
+N = 1000
+
+
+class _Server(object):
+    def get_environ(self):
+        return {}
+
+
+class StdlibHandler(pywsgi.WSGIHandler):
+
+    def MessageClass(self, fp, *args):
+        return client.parse_headers(fp, _class=pywsgi.OldMessage)
+
+    def _headers(self):
+        return self._header_lines()
+
+
+def _bench(loops, handler_class):
+    handler = handler_class(None, ('127.0.0.1', 12345), _Server(), rfile=BytesIO())
+    read_request = handler.read_request
+    get_environ = handler.get_environ
+    rfiles = [BytesIO(HEADERS) for _ in range(N)]
+    total = 0
+    for _ in range(loops):
+        for rfile in rfiles:
+            rfile.seek(0)
+        t0 = perf_counter()
+        for rfile in rfiles:
+            handler.rfile = rfile
+            read_request(REQUEST_LINE)
+            get_environ()
+        total += perf_counter() - t0
+    return total
+
+
+def main():
+    runner = perf.Runner()
+    runner.bench_time_func('parse request stdlib', _bench, StdlibHandler,
+                           inner_loops=N)
+    runner.bench_time_func('parse request', _bench, pywsgi.WSGIHandler,
+                           inner_loops=N)
+
+if __name__ == '__main__':
+    main()
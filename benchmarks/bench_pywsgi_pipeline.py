@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for pipelined HTTP/1.1 requests to :mod:`gevent.pywsgi`.
+
+A client sends a batch of small GET requests in one write, the way
+pipelining clients and some load balancers do, then reads all the
+responses. This compares collecting the responses into one write
+(the default) with sending each response separately
+(``pipeline_buffer_size = 0``). For comparison, it also times an
+ordinary keep-alive client that sends one request at a time, which
+must not pay for the check for pipelined requests.
+
+Writing many small responses separately also runs into Nagle's
+algorithm and delayed ACKs, so the unbuffered case is timed with and
+without ``TCP_NODELAY``.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+from pyperf import perf_counter
+
+from gevent import socket
+from gevent.pywsgi import WSGIServer
+from gevent.pywsgi import WSGIHandler
+
+# Requests per batch
+PIPELINE_DEPTH = 16
+# Batches per loop
+N = 50
+BODY = b'hello world'
+
+
+def app(_environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain'),
+                              ('Content-Length', str(len(BODY)))])
+    return [BODY]
+
+
+class UnbufferedHandler(WSGIHandler):
+    pipeline_buffer_size = 0
+
+
+class UnbufferedNoDelayHandler(UnbufferedHandler):
+
+    def __init__(self, sock, *args):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super(UnbufferedNoDelayHandler, self).__init__(sock, *args)
+
+
+def _bench(loops, handler_class, depth=PIPELINE_DEPTH):
+    server = WSGIServer(('127.0.0.1', 0), app, log=None, handler_class=handler_class)
+    server.start()
+    batch = b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\n' * depth
+    buf = bytearray(65536)
+    try:
+        with socket.create_connection(('127.0.0.1', server.server_port)) as conn:
+            # Measure the response size once.
+            conn.sendall(batch)
+            expected = 0
+            while True:
+                expected += conn.recv_into(buf)
+                if bytes(buf[:expected]).count(BODY) == depth:
+                    break
+
+            t0 = perf_counter()
+            for _ in range(loops):
+                for _ in range(N):
+                    conn.sendall(batch)
+                    remaining = expected
+                    while remaining:
+                        remaining -= conn.recv_into(buf)
+            return perf_counter() - t0
+    finally:
+        server.stop()
+
+
+def main():
+    runner = perf.Runner()
+    runner.bench_time_func('pywsgi pipelined coalesced', _bench, WSGIHandler,
+                           inner_loops=N * PIPELINE_DEPTH)
+    runner.bench_time_func('pywsgi pipelined unbuffered', _bench, UnbufferedHandler,
+                           inner_loops=N * PIPELINE_DEPTH)
+    runner.bench_time_func('pywsgi pipelined unbuffered nodelay', _bench,
+                           UnbufferedNoDelayHandler,
+                           inner_loops=N * PIPELINE_DEPTH)
+    runner.bench_time_func('pywsgi keep-alive', _bench, WSGIHandler, 1,
+                           inner_loops=N)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for serving a large file from :mod:`gevent.pywsgi`.
+
+The application returns the file either wrapped in
+``wsgi.file_wrapper`` (which lets the server use ``sendfile(2)``) or
+as a plain iterator of blocks, the way applications had to before
+the file wrapper existed.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import tempfile
+
+import pyperf as perf
+from pyperf import perf_counter
+
+from gevent import socket
+from gevent.pywsgi import WSGIServer
+
+MB = 1024 * 1024
+# Size of the file served.
+SIZE = 256 * MB
+BLKSIZE = 65536
+
+
+def _iter_file(f):
+    while True:
+        data = f.read(BLKSIZE)
+        if not data:
+            break
+        yield data
+
+
+def _make_app(filename, use_wrapper):
+    def app(environ, start_response):
+        f = open(filename, 'rb') # pylint:disable=consider-using-with
+        start_response('200 OK', [('Content-Length', str(SIZE)),
+                                  ('Content-Type', 'application/octet-stream')])
+        if use_wrapper:
+            return environ['wsgi.file_wrapper'](f, BLKSIZE)
+        return _iter_file(f)
+    return app
+
+
+def _run(loops, filename, use_wrapper):
+    server = WSGIServer(('127.0.0.1', 0), _make_app(filename, use_wrapper), log=None)
+    server.start()
+    request = b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\n'
+    buf = bytearray(BLKSIZE * 4)
+    try:
+        with socket.create_connection(('127.0.0.1', server.server_port)) as conn:
+            t0 = perf_counter()
+            for _ in range(loops):
+                conn.sendall(request)
+                # Read through the headers (which fit in the first
+                # recv) and then exactly SIZE bytes of body.
+                received = conn.recv_into(buf)
+                header_end = bytes(buf[:received]).index(b'\r\n\r\n') + 4
+                remaining = SIZE - (received - header_end)
+                while remaining:
+                    remaining -= conn.recv_into(buf, min(len(buf), remaining))
+            return perf_counter() - t0
+    finally:
+        server.stop()
+
+
+def main():
+    fd, filename = tempfile.mkstemp(prefix='gevent-bench-')
+    try:
+        chunk = os.urandom(MB)
+        for _ in range(SIZE // MB):
+            os.write(fd, chunk)
+        os.close(fd)
+
+        runner = perf.Runner()
+        runner.bench_time_func('pywsgi file_wrapper (sendfile)',
+                               _run, filename, True)
+        runner.bench_time_func('pywsgi iterate file',
+                               _run, filename, False)
+    finally:
+        os.remove(filename)
+
+if __name__ == '__main__':
+    main()
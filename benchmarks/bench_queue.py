@@ -55,7 +55,93 @@ def bench_bounded_queue_block(kind=queue.Queue, hub=False):
     g.join()
     assert g.value == 'Finished'
 
+def _memory(kind, maxsize=N):
+    # The bytes allocated by a full queue, and what's still allocated
+    # after moving 10 * N items through it. The items are all the
+    # same object, so only the queue's own storage counts.
+    import tracemalloc
+    item = object()
+    kind(maxsize) # Create the hub, import things...
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        q = kind(maxsize)
+        for _ in range(maxsize):
+            q.put(item)
+        full = tracemalloc.get_traced_memory()[0] - before
+        for _ in range(10 * N):
+            q.get()
+            q.put(item)
+        after = tracemalloc.get_traced_memory()[0] - before
+        return full, after
+    finally:
+        tracemalloc.stop()
+
+def memory():
+    for kind in queue.Queue, queue.RingQueue:
+        print('%-10s full: %7d bytes; after churn: %7d bytes' % (
+            (kind.__name__,) + _memory(kind)))
+
+BATCH = 100
+
+def bench_bounded_queue_block_many(kind=queue.Queue, maxsize=BATCH):
+    # Like bench_bounded_queue_block, but moving the items in
+    # batches with put_many/get_many.
+    q = kind(maxsize)
+    items = list(range(N))
+
+    def get():
+        result = []
+        while len(result) < N:
+            result.extend(q.get_many(BATCH))
+        assert result == items
+        return "Finished"
+
+    g = gevent.spawn(get)
+    for i in range(0, N, BATCH):
+        q.put_many(items[i:i + BATCH])
+    g.join()
+    assert g.value == 'Finished'
+
+def _cross_thread(put, get):
+    # Produce N items in a native thread (which has its own hub) and
+    # consume them in this one.
+    from gevent._threading import start_new_thread
+
+    def produce():
+        for i in range(N):
+            put(i)
+    start_new_thread(produce, ())
+    for i in range(N):
+        j = get()
+        assert i == j, (i, j)
+
+def bench_cross_thread_threadsafe_queue():
+    q = queue.ThreadSafeQueue()
+    _cross_thread(q.put, q.get)
+    q.close()
+
+def bench_cross_thread_run_callback_threadsafe():
+    # The alternative: one async wakeup for every item.
+    q = queue.UnboundQueue()
+    loop = gevent.get_hub().loop
+
+    # Like the threadpool, keep the loop alive while waiting for
+    # the other thread.
+    keepalive = loop.async_()
+    keepalive.start(lambda: None)
+
+    def put(i):
+        loop.run_callback_threadsafe(q.put, i)
+    _cross_thread(put, q.get)
+    keepalive.close()
+
 def main():
+    import sys
+    if sys.argv[1:] == ['--memory']:
+        memory()
+        return
+
     runner = perf.Runner()
 
     runner.bench_func('bench_unbounded_queue_noblock',
@@ -95,6 +181,32 @@ def main():
                       queue.PriorityQueue,
                       inner_loops=N)
 
+    runner.bench_func('bench_ring_queue_noblock',
+                      bench_bounded_queue_noblock,
+                      queue.RingQueue,
+                      inner_loops=N)
+
+    runner.bench_func('bench_ring_queue_block',
+                      bench_bounded_queue_block,
+                      queue.RingQueue,
+                      inner_loops=N)
+
+    runner.bench_func('bench_bounded_queue_block_many',
+                      bench_bounded_queue_block_many,
+                      inner_loops=N)
+
+    runner.bench_func('bench_channel_many',
+                      bench_bounded_queue_block_many,
+                      queue.Channel, 1,
+                      inner_loops=N)
+
+    runner.bench_func('bench_cross_thread_threadsafe_queue',
+                      bench_cross_thread_threadsafe_queue,
+                      inner_loops=N)
+
+    runner.bench_func('bench_cross_thread_run_callback_threadsafe',
+                      bench_cross_thread_run_callback_threadsafe,
+                      inner_loops=N)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for proxying a TCP stream through gevent.
+
+Data is sent from a client, through a proxy, to a server that
+discards it. The proxy either copies with ``recv``/``sendall`` (like
+``examples/portforwarder.py`` used to), or uses
+:func:`gevent.socket.relay` with or without ``splice(2)``.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+from pyperf import perf_counter
+
+import gevent
+from gevent import socket
+from gevent import _socketcommon
+from gevent.server import StreamServer
+
+MB = 1024 * 1024
+# Megabytes sent per loop.
+N = 64
+DATA = b'x' * MB
+
+
+def _sink(sock, _address):
+    buf = bytearray(65536)
+    while sock.recv_into(buf):
+        pass
+
+
+def _forward(source, dest):
+    while True:
+        data = source.recv(65536)
+        if not data:
+            break
+        dest.sendall(data)
+    dest.shutdown(socket.SHUT_WR)
+
+
+def _recv_send(client, upstream):
+    reverse = gevent.spawn(_forward, upstream, client)
+    _forward(client, upstream)
+    reverse.join()
+
+
+def _relay(client, upstream):
+    socket.relay(client, upstream)
+
+
+def _run(loops, proxy_func):
+    sink = StreamServer(('127.0.0.1', 0), _sink)
+    sink.start()
+
+    def proxy_handle(client, _address):
+        with socket.create_connection(('127.0.0.1', sink.server_port)) as upstream:
+            proxy_func(client, upstream)
+
+    proxy = StreamServer(('127.0.0.1', 0), proxy_handle)
+    proxy.start()
+    try:
+        t0 = perf_counter()
+        for _ in range(loops):
+            with socket.create_connection(('127.0.0.1', proxy.server_port)) as conn:
+                for _ in range(N):
+                    conn.sendall(DATA)
+                conn.shutdown(socket.SHUT_WR)
+                # Wait for the proxy to finish.
+                while conn.recv(1):
+                    pass
+        return perf_counter() - t0
+    finally:
+        proxy.stop()
+        sink.stop()
+
+
+def bench_recv_sendall(loops):
+    return _run(loops, _recv_send)
+
+
+def bench_relay_splice(loops):
+    return _run(loops, _relay)
+
+
+def bench_relay_buffered(loops):
+    flags = _socketcommon._SPLICE_FLAGS
+    _socketcommon._SPLICE_FLAGS = None
+    try:
+        return _run(loops, _relay)
+    finally:
+        _socketcommon._SPLICE_FLAGS = flags
+
+
+def main():
+    runner = perf.Runner()
+    runner.bench_time_func('proxy recv/sendall', bench_recv_sendall, inner_loops=N)
+    if _socketcommon._SPLICE_FLAGS is not None:
+        runner.bench_time_func('proxy relay splice', bench_relay_splice, inner_loops=N)
+    runner.bench_time_func('proxy relay buffered', bench_relay_buffered, inner_loops=N)
+
+if __name__ == '__main__':
+    main()
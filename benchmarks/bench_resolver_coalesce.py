@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for coalescing concurrent identical lookups in the thread
+resolver.
+
+Many greenlets look up the same name at once, as when a connection
+pool reconnects, and a few greenlets each look up a different name.
+The time reported is per caller. Before the timings, the number of
+lookups that reached the threadpool for each workload is printed.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import _socket
+
+import pyperf as perf
+
+import gevent
+from gevent.resolver.thread import Resolver
+
+CALLERS = 100
+HOST = 'localhost'
+
+
+class CountingPool(object):
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.jobs = 0
+
+    def apply(self, func, args=None, kwds=None):
+        self.jobs += 1
+        return self.pool.apply(func, args, kwds)
+
+
+def _uncoalesced(resolver):
+    # What the resolver did before coalescing.
+    return lambda host, port: resolver.pool.apply(_socket.getaddrinfo, (host, port))
+
+
+def _run_same(lookup):
+    gevent.joinall([gevent.spawn(lookup, HOST, 80) for _ in range(CALLERS)])
+
+
+def _run_different(lookup):
+    gevent.joinall([gevent.spawn(lookup, HOST, port) for port in range(CALLERS)])
+
+
+def _count_jobs(coalesce, run):
+    resolver = Resolver()
+    resolver.pool = pool = CountingPool(resolver.pool)
+    run(resolver.getaddrinfo if coalesce else _uncoalesced(resolver))
+    return pool.jobs
+
+
+def _bench(loops, coalesce, run):
+    resolver = Resolver()
+    lookup = resolver.getaddrinfo if coalesce else _uncoalesced(resolver)
+    t0 = perf.perf_counter()
+    for _ in range(loops):
+        run(lookup)
+    return perf.perf_counter() - t0
+
+
+def main():
+    runner = perf.Runner()
+    benchmarks = [
+        ('same name', _run_same),
+        ('different ports', _run_different),
+    ]
+    args = runner.parse_args()
+    if not args.worker:
+        for name, run in benchmarks:
+            print('%s: %d callers, %d lookups uncoalesced, %d coalesced' % (
+                name, CALLERS, _count_jobs(False, run), _count_jobs(True, run)))
+    for name, run in benchmarks:
+        runner.bench_time_func(name + ' uncoalesced', _bench, False, run, inner_loops=CALLERS)
+        runner.bench_time_func(name + ' coalesced', _bench, True, run, inner_loops=CALLERS)
+
+
+if __name__ == '__main__':
+    main()
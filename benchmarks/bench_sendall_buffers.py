@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for sending a response made of many small buffers.
+
+This is the shape of a typical WSGI response: a header block followed
+by many small body chunks. It compares one ``sendall`` per buffer,
+joining the buffers and sending once, and ``sendall_buffers``.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+from pyperf import perf_counter
+
+from gevent import socket
+from gevent.server import StreamServer
+
+# The number of responses sent per loop.
+N = 100
+
+
+def recvall(sock, _):
+    while sock.recv(65536):
+        pass
+
+
+def _buffers(count, size):
+    headers = b'HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\n'
+    return [headers] + [b'x' * size for _ in range(count)]
+
+
+def bench_sendall_each(loops, conn, buffers):
+    sendall = conn.sendall
+    t0 = perf_counter()
+    for _ in range(loops):
+        for _ in range(N):
+            for buf in buffers:
+                sendall(buf)
+    return perf_counter() - t0
+
+
+def bench_join(loops, conn, buffers):
+    sendall = conn.sendall
+    t0 = perf_counter()
+    for _ in range(loops):
+        for _ in range(N):
+            sendall(b''.join(buffers))
+    return perf_counter() - t0
+
+
+def bench_sendall_buffers(loops, conn, buffers):
+    sendall_buffers = conn.sendall_buffers
+    t0 = perf_counter()
+    for _ in range(loops):
+        for _ in range(N):
+            sendall_buffers(buffers)
+    return perf_counter() - t0
+
+
+def main():
+    runner = perf.Runner()
+    server = StreamServer(("127.0.0.1", 0), recvall)
+    server.start()
+    conn = socket.create_connection((server.server_host, server.server_port))
+
+    try:
+        for count, size in ((16, 64), (64, 1024), (8, 65536)):
+            buffers = _buffers(count, size)
+            suffix = ' %dx%d' % (count, size)
+            runner.bench_time_func('sendall each' + suffix,
+                                   bench_sendall_each, conn, buffers,
+                                   inner_loops=N)
+            runner.bench_time_func('join and sendall' + suffix,
+                                   bench_join, conn, buffers,
+                                   inner_loops=N)
+            runner.bench_time_func('sendall_buffers' + suffix,
+                                   bench_sendall_buffers, conn, buffers,
+                                   inner_loops=N)
+    finally:
+        conn.close()
+        server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for admission control in :class:`gevent.server.StreamServer`.
+
+The first pair measures the cost of the bookkeeping when the server
+is not overloaded. The second measures how long a client waits to
+find out that a server whose pool is saturated can't serve it: with
+only a :class:`gevent.pool.Pool` it waits until a handler finishes;
+with :attr:`~gevent.baseserver.BaseServer.max_concurrency` it is
+turned away at once.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+from pyperf import perf_counter
+
+import gevent
+from gevent import socket
+from gevent.event import Event
+from gevent.server import StreamServer
+
+# Connections per loop.
+N = 100
+# How long the pool stays saturated.
+BUSY_TIME = 0.05
+
+
+def _reply(sock, _address):
+    sock.sendall(b'x')
+
+
+def _connect_and_read(port):
+    with socket.create_connection(('127.0.0.1', port)) as conn:
+        conn.recv(1)
+
+
+def _run_handle(loops, **attrs):
+    server = StreamServer(('127.0.0.1', 0), _reply)
+    for k, v in attrs.items():
+        setattr(server, k, v)
+    server.start()
+    try:
+        t0 = perf_counter()
+        for _ in range(loops):
+            for _ in range(N):
+                _connect_and_read(server.server_port)
+        return perf_counter() - t0
+    finally:
+        server.stop()
+
+
+def bench_handle_default(loops):
+    return _run_handle(loops)
+
+
+def bench_handle_admission(loops):
+    return _run_handle(loops, max_concurrency=1000, max_queue_time=10)
+
+
+def _run_saturated(loops, **attrs):
+    release = Event()
+    holding = []
+
+    def handle(sock, _address):
+        if not holding:
+            # This connection occupies the pool until released.
+            holding.append(sock)
+            release.wait()
+            holding.pop()
+            return
+        sock.sendall(b'x')
+
+    server = StreamServer(('127.0.0.1', 0), handle, spawn=1)
+    for k, v in attrs.items():
+        setattr(server, k, v)
+    server.start()
+    try:
+        total = 0
+        for _ in range(loops):
+            release.clear()
+            with socket.create_connection(('127.0.0.1', server.server_port)):
+                while not holding:
+                    gevent.sleep(0.001)
+                timer = gevent.spawn_later(BUSY_TIME, release.set)
+                t0 = perf_counter()
+                _connect_and_read(server.server_port)
+                total += perf_counter() - t0
+                timer.kill()
+                release.set()
+                while holding:
+                    gevent.sleep(0.001)
+        return total
+    finally:
+        server.stop()
+
+
+def bench_saturated_pool(loops):
+    return _run_saturated(loops)
+
+
+def bench_saturated_shed(loops):
+    return _run_saturated(loops, max_concurrency=1)
+
+
+def main():
+    runner = perf.Runner()
+    runner.bench_time_func('handle default', bench_handle_default, inner_loops=N)
+    runner.bench_time_func('handle admission control', bench_handle_admission, inner_loops=N)
+    runner.bench_time_func('saturated pool', bench_saturated_pool)
+    runner.bench_time_func('saturated max_concurrency', bench_saturated_shed)
+
+if __name__ == '__main__':
+    main()
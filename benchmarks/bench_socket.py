@@ -64,6 +64,96 @@ def bench_gevent_udp(loops):
     finally:
         conn.close()
 
+# For the UDP packets-per-second benchmarks: the datagrams
+# sent per loop, in bursts small enough not to overflow the
+# receive buffer.
+PACKETS = 4096
+BURST = 64
+
+def _udp_pair():
+    recv = gsocket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    recv.bind(('127.0.0.1', 0))
+    send = gsocket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    send.connect(recv.getsockname())
+    return send, recv
+
+def _udp_pps(loops, send_burst, recv_burst):
+    send, recv = _udp_pair()
+    try:
+        start = perf.perf_counter()
+        for __ in range(loops):
+            for _ in range(PACKETS // BURST):
+                send_burst(send)
+                recv_burst(recv)
+        return perf.perf_counter() - start
+    finally:
+        send.close()
+        recv.close()
+
+def _send_each(sock):
+    for _ in range(BURST):
+        sock.send(SMALL_DATA)
+
+def _recv_each(sock):
+    for _ in range(BURST):
+        sock.recvfrom(8192)
+
+_BURST_DATAGRAMS = [(SMALL_DATA, None)] * BURST
+
+def _send_many(sock):
+    sock.sendto_many(_BURST_DATAGRAMS)
+
+def _recv_many(sock):
+    received = 0
+    while received < BURST:
+        received += len(sock.recvfrom_many(BURST - received, 8192))
+
+def bench_gevent_udp_pps_each(loops):
+    return _udp_pps(loops, _send_each, _recv_each)
+
+def bench_gevent_udp_pps_many(loops):
+    return _udp_pps(loops, _send_many, _recv_many)
+
+def _udp_pps_server(loops, batch_size):
+    from gevent.event import Event
+    from gevent.server import DatagramServer
+    received = [0]
+    burst_done = Event()
+
+    if batch_size:
+        def handle(datagrams):
+            received[0] += len(datagrams)
+            if received[0] >= BURST:
+                burst_done.set()
+    else:
+        def handle(_data, _address):
+            received[0] += 1
+            if received[0] >= BURST:
+                burst_done.set()
+
+    server = DatagramServer(('127.0.0.1', 0), handle, batch_size=batch_size)
+    server.start()
+    send = gsocket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    send.connect(('127.0.0.1', server.server_port))
+    try:
+        start = perf.perf_counter()
+        for __ in range(loops):
+            for _ in range(PACKETS // BURST):
+                received[0] = 0
+                burst_done.clear()
+                _send_many(send)
+                burst_done.wait()
+        return perf.perf_counter() - start
+    finally:
+        send.close()
+        server.stop()
+
+def bench_gevent_udp_pps_server(loops):
+    return _udp_pps_server(loops, None)
+
+def bench_gevent_udp_pps_server_batch(loops):
+    return _udp_pps_server(loops, BURST)
+
 def _do_sendall(loops, send, recv):
     for s in send, recv:
         os.set_inheritable(s.fileno(), True)
@@ -150,6 +240,23 @@ def main():
         bench_gevent_udp,
         inner_loops=N)
 
+    runner.bench_time_func(
+        'gevent udp pps send/recvfrom',
+        bench_gevent_udp_pps_each,
+        inner_loops=PACKETS)
+    runner.bench_time_func(
+        'gevent udp pps sendto_many/recvfrom_many',
+        bench_gevent_udp_pps_many,
+        inner_loops=PACKETS)
+    runner.bench_time_func(
+        'gevent udp pps DatagramServer',
+        bench_gevent_udp_pps_server,
+        inner_loops=PACKETS)
+    runner.bench_time_func(
+        'gevent udp pps DatagramServer batch',
+        bench_gevent_udp_pps_server_batch,
+        inner_loops=PACKETS)
+
 
 if __name__ == "__main__":
     main()
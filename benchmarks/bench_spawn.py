@@ -79,7 +79,41 @@ def _test(spawn, sleep, options):
                  sleep_duration,
                  join_duration)
 
-def test(spawn, sleep, options):
+def _test_many(spawn_many, sleep, options):
+    # Like _test, but for spawn_many(func, iterable) and joining with
+    # the function given as options.join.
+    global counter
+    counter = 0
+    before_spawn = perf_counter()
+    greenlets = spawn_many(noop_incr, xrange(N))
+    spawn_duration = perf_counter() - before_spawn
+
+    if options.sleep:
+        assert counter == 0, counter
+        before_sleep = perf_counter()
+        sleep(0)
+        sleep_duration = perf_counter() - before_sleep
+        assert counter == N, (counter, N)
+    else:
+        sleep_duration = -1
+
+    if options.join:
+        before_join = perf_counter()
+        options.join(greenlets)
+        join_duration = perf_counter() - before_join
+        assert counter == N, (counter, N)
+    else:
+        join_duration = -1
+
+    return Times(spawn_duration,
+                 sleep_duration,
+                 join_duration)
+
+def noop_incr(_p):
+    global counter
+    counter += 1
+
+def test(spawn, sleep, options, _test=_test):
     all_times = [
         _test(spawn, sleep, options)
         for _ in xrange(options.loops)
@@ -87,8 +121,8 @@ def test(spawn, sleep, options):
 
     spawn_duration = sum(x.spawn_duration for x in all_times)
     sleep_duration = sum(x.sleep_duration for x in all_times)
-    join_duration = sum(x.sleep_duration for x in all_times
-                        if x != -1)
+    join_duration = sum(x.join_duration for x in all_times
+                        if x.join_duration != -1)
 
     return Times(spawn_duration, sleep_duration, join_duration)
 
@@ -125,6 +159,28 @@ def bench_geventpool(options):
     return times
 
 
+def bench_geventpoolreuse(options):
+    from gevent import sleep
+    from gevent.pool import Pool
+    p = Pool(reuse_greenlets=True)
+    if options.join:
+        options.join = p.join
+    times = test(p.spawn, sleep, options)
+    return times
+
+
+def bench_geventmany(options):
+    from gevent import sleep, spawn_many
+    return test(spawn_many, sleep, options, _test_many)
+
+
+def bench_geventpoolmany(options):
+    from gevent import sleep
+    from gevent.pool import Pool
+    p = Pool()
+    return test(p.spawn_many, sleep, options, _test_many)
+
+
 try:
     __import__('eventlet')
 except ImportError:
@@ -218,7 +274,32 @@ def main(argv=None):
                                Options(sleep=True, join=True),
                                inner_loops=N)
 
+    if 'geventpoolreuse' in names:
+        runner.bench_time_func('geventpoolreuse join',
+                               join_time,
+                               bench_geventpoolreuse,
+                               Options(sleep=True, join=True),
+                               inner_loops=N)
+
+    if 'geventmany' in names:
+        # Running the greenlets while joining them.
+        from gevent import joinall
+        from gevent import wait
+        runner.bench_time_func('geventmany joinall',
+                               join_time,
+                               bench_geventmany,
+                               Options(sleep=False, join=joinall),
+                               inner_loops=N)
+        runner.bench_time_func('geventmany wait',
+                               join_time,
+                               bench_geventmany,
+                               Options(sleep=False, join=wait),
+                               inner_loops=N)
+
     for name in names:
+        if name.endswith('many'):
+            # No keyword arguments.
+            continue
         runner.bench_time_func(name + ' spawn kwarg',
                                spawn_time,
                                globals()['bench_' + name],
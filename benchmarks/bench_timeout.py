@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for the cost of starting and cancelling timeouts.
+
+Most timeouts, such as those guarding blocking socket operations, are
+cancelled long before they expire. This compares doing that with a
+native loop timer per timeout against doing it with the hub's coarse
+timer wheel (``GEVENT_TIMEOUT_RESOLUTION``).
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pyperf as perf
+from pyperf import perf_counter
+
+import gevent
+from gevent import socket
+from gevent.timeout import Timeout
+from gevent._timerwheel import TimerWheel
+
+N = 1000
+
+RESOLUTION = 0.1
+
+
+def _use_wheel(resolution):
+    hub = gevent.get_hub()
+    hub.timer_wheel = TimerWheel(hub.loop, resolution) if resolution else None
+
+
+def bench_start_cancel(loops, resolution):
+    _use_wheel(resolution)
+    start_new = Timeout._start_new_or_dummy
+    t0 = perf_counter()
+    for _ in range(loops):
+        for _ in range(N):
+            timeout = start_new(30)
+            timeout.cancel()
+    return perf_counter() - t0
+
+
+def bench_outstanding(loops, resolution):
+    # Many timeouts live at the same time, as with many idle
+    # keep-alive connections.
+    _use_wheel(resolution)
+    t0 = perf_counter()
+    for _ in range(loops):
+        timeouts = [Timeout.start_new(30 + i % 60) for i in range(N)]
+        for timeout in timeouts:
+            timeout.close()
+    return perf_counter() - t0
+
+
+def bench_socket_recv(loops, resolution):
+    # Each recv that has to wait starts and cancels a timeout.
+    _use_wheel(resolution)
+    a, b = socket.socketpair()
+    a.settimeout(30)
+    b.settimeout(30)
+
+    def echo():
+        for _ in range(loops * N):
+            b.sendall(b.recv(1))
+
+    try:
+        t0 = perf_counter()
+        glet = gevent.spawn(echo)
+        for _ in range(loops * N):
+            a.sendall(b'x')
+            a.recv(1)
+        glet.join()
+        return perf_counter() - t0
+    finally:
+        a.close()
+        b.close()
+
+
+def main():
+    runner = perf.Runner()
+    for name, func in (
+            ('start and cancel', bench_start_cancel),
+            ('outstanding', bench_outstanding),
+            ('socket recv with timeout', bench_socket_recv),
+    ):
+        runner.bench_time_func(name + ' precise',
+                               func, None,
+                               inner_loops=N)
+        runner.bench_time_func(name + ' wheel',
+                               func, RESOLUTION,
+                               inner_loops=N)
+
+if __name__ == '__main__':
+    main()
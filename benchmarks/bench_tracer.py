@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """
-Benchmarks for gevent.queue
+Benchmarks for greenlet tracers (gevent._tracer)
 
 """
 from __future__ import absolute_import
@@ -9,7 +9,7 @@ from __future__ import print_function
 
 import contextlib
 
-import perf
+import pyperf as perf
 
 import greenlet
 import gevent
@@ -82,6 +82,14 @@ def bench_max_switch_tracer(loops):
     with tracer(monitor.MaxSwitchTracer, object, 1):
         return _run(loops)
 
+def bench_cpu_accounting_tracer(loops):
+    with tracer(monitor.CPUAccountingTracer):
+        return _run(loops)
+
+def bench_cpu_accounting_tracer_perf_counter(loops):
+    with tracer(monitor.CPUAccountingTracer, perf.perf_counter):
+        return _run(loops)
+
 def main():
     runner = perf.Runner()
 
@@ -115,6 +123,18 @@ def main():
         inner_loops=N
     )
 
+    runner.bench_time_func(
+        "cpu accounting tracer",
+        bench_cpu_accounting_tracer,
+        inner_loops=N
+    )
+
+    runner.bench_time_func(
+        "cpu accounting tracer (perf_counter)",
+        bench_cpu_accounting_tracer_perf_counter,
+        inner_loops=N
+    )
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,9 @@
+Add admission control to gevent servers. Setting
+:attr:`gevent.baseserver.BaseServer.max_concurrency` or
+:attr:`~gevent.baseserver.BaseServer.max_queue_time` makes a server
+shed connections once too many are in progress, or once one has
+waited too long for its handler to start, instead of letting them
+queue. :class:`gevent.pywsgi.WSGIServer` answers shed connections
+with ``503 Service Unavailable``. The new ``connections_accepted``,
+``connections_shed`` and ``connections_in_flight`` attributes count
+them.
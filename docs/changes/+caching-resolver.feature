@@ -0,0 +1,7 @@
+Add :class:`gevent.resolver.caching.Resolver`, selected with
+``GEVENT_RESOLVER=caching``. It caches the answers of another
+resolver's ``getaddrinfo`` and ``gethostbyname``. Answers are kept for
+the TTL of their DNS records when the ares or dnspython resolvers
+supply it, or for a configurable default otherwise. It also caches
+names that don't exist, and bounds the cache with LRU eviction. See
+:attr:`gevent._config.Config.resolver_cache_backend`.
@@ -0,0 +1,7 @@
+Add per-greenlet CPU time accounting. :class:`gevent.util.cpu_accounting`
+records the time each greenlet spends running and the number of times
+it switches away, totaled by labels set with
+:func:`gevent.util.set_cpu_label`. The monitor thread can do the same
+continuously and periodically emit :class:`gevent.events.CPUUsageReport`
+events with the top users; see
+:attr:`gevent._config.Config.cpu_accounting_period`.
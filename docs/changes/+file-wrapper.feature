@@ -0,0 +1,7 @@
+:mod:`gevent.pywsgi` now provides ``wsgi.file_wrapper``
+(:class:`gevent.pywsgi.FileWrapper`). When an application returns one
+around a regular file, the server sends the file with
+``os.sendfile()`` instead of reading it into Python, and fills in a
+``Content-Length`` if the application didn't. In addition,
+:meth:`gevent.socket.socket.sendfile` now uses ``os.sendfile()``
+cooperatively instead of always falling back to ``send()``.
@@ -0,0 +1,5 @@
+Add :class:`gevent.util.GreenletProfiler`, a sampling profiler that
+runs in the hub's monitoring thread and records the stacks of the
+running greenlets, grouped by greenlet name, in the collapsed-stack
+format used by flame graph tools. It can be started and stopped at
+runtime.
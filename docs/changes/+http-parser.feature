@@ -0,0 +1,6 @@
+Make :mod:`gevent.pywsgi` parse request lines and headers faster.
+Well-formed headers no longer go through the :mod:`email` parser,
+and building the WSGI environ from them no longer formats and
+re-splits each header line. When gevent is built with its C
+accelerators, the new parser is compiled with Cython. Unusual
+requests still take the old path, so the results are unchanged.
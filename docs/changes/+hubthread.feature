@@ -0,0 +1,8 @@
+Add :mod:`gevent.hubthread` for running several hubs in one process,
+each in its own native thread. This is intended for free-threaded
+builds of CPython, where the hubs can run on different cores.
+:class:`~gevent.hubthread.HubThread` and
+:class:`~gevent.hubthread.HubThreadGroup` start the threads and
+accept work for them from any thread.
+:class:`~gevent.hubthread.HubThreadServer` accepts connections in
+one hub and spreads them across the threads.
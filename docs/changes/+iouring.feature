@@ -0,0 +1,6 @@
+Add ``gevent.libev.corecext.iouring_loop`` (and
+``gevent.libev.corecffi.iouring_loop``). It is libev configured to
+prefer the Linux io_uring backend, which submits readiness changes in
+a batch once per loop iteration, falling back to epoll when io_uring
+is unavailable. This backend is experimental and is not yet one of the
+named ``GEVENT_LOOP`` choices. See :ref:`libev-iouring`.
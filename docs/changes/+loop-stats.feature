@@ -0,0 +1,6 @@
+Add event loop statistics. :meth:`gevent.hub.Hub.start_loop_stats`
+records histograms of the duration of each iteration of the event
+loop, the time spent polling for IO and running Python code, and the
+number of callbacks queued and watchers fired. The monitor thread can
+periodically emit them as :class:`gevent.events.LoopStatsReport`
+events; see :attr:`gevent._config.Config.loop_stats_period`.
@@ -0,0 +1,6 @@
+Add ``recvfrom_many(count, bufsize)`` and ``sendto_many(datagrams)`` to
+gevent sockets to receive or send many datagrams at once, using
+``recvmmsg`` and ``sendmmsg`` on Linux. :class:`gevent.server.DatagramServer`
+accepts a *batch_size* argument; when given, the handler is called once
+per batch with a list of ``(data, address)`` tuples instead of once per
+datagram, and ``sendto_many`` is available for replies.
@@ -0,0 +1,6 @@
+When a client pipelines HTTP/1.1 requests, :mod:`gevent.pywsgi` now
+collects the responses to requests that have already arrived and
+sends them in a single write, in order. It stops collecting as soon
+as no further request is waiting. The limit is set by the new
+:attr:`gevent.pywsgi.WSGIHandler.pipeline_buffer_size` attribute;
+setting it to 0 sends every response immediately.
@@ -0,0 +1,5 @@
+Add a *reuse_greenlets* option to :class:`gevent.pool.Pool`. With it,
+:meth:`~gevent.pool.Pool.spawn` runs each function in a raw greenlet
+kept from an earlier task, not a new :class:`~gevent.Greenlet`, and
+returns a lightweight :class:`~gevent.pool.PooledTask` handle. This
+makes spawning many short tasks several times cheaper.
@@ -0,0 +1,7 @@
+Add :mod:`gevent.prefork`, whose :class:`~gevent.prefork.PreforkRunner`
+runs a server such as :class:`gevent.pywsgi.WSGIServer` in several
+worker processes, each with its own hub, to use more than one CPU
+core. The workers either share one inherited listening socket or each
+listen with ``SO_REUSEPORT``. The runner restarts workers that die,
+replaces them one at a time on ``SIGHUP``, and stops them gracefully
+on ``SIGTERM``.
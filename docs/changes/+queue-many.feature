@@ -0,0 +1,5 @@
+Add ``put_many`` and ``get_many`` methods to the queues in
+:mod:`gevent.queue` (:class:`~gevent.queue.SimpleQueue`, its
+subclasses, and :class:`~gevent.queue.Channel`). They move a batch of
+items at once, waking any waiting greenlets in a single pass of the
+event loop rather than once per item.
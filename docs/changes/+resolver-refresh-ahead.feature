@@ -0,0 +1,6 @@
+:class:`gevent.resolver.caching.Resolver` now refreshes cached answers
+that are in use before they expire. It looks them up again in the
+background, so callers don't wait when a hot name expires. See
+:attr:`gevent._config.Config.resolver_cache_refresh_ahead` and
+:attr:`gevent._config.Config.resolver_cache_max_refreshes`. The
+resolver also counts its hits, misses and refreshes.
@@ -0,0 +1,8 @@
+Add ``resolve_many(hosts, port=0, family=0, socktype=0, proto=0,
+flags=0)`` to the resolvers. It looks up many host names at once with
+``getaddrinfo`` and yields ``(host, result)`` pairs as they finish,
+where *result* is the list of addresses or the exception. The ares
+resolver gives all the queries to the c-ares channel at once, and the
+thread resolver looks names up in batches, so each thread pool job
+handles several of them. The caching resolver answers what it can
+from its cache. The ``dns_mass_resolve.py`` example uses it.
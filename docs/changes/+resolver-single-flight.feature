@@ -0,0 +1,6 @@
+The resolvers now coalesce concurrent identical lookups. When many
+greenlets call ``getaddrinfo``, ``gethostbyname`` or
+``gethostbyname_ex`` for the same arguments at once, only one lookup
+runs, and every caller gets its result or error. This covers the
+thread resolver and the resolvers based on
+``gevent.resolver.AbstractResolver`` (ares and dnspython).
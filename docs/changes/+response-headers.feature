@@ -0,0 +1,4 @@
+Make starting a response in :mod:`gevent.pywsgi` cheaper. The
+``Date`` header is formatted at most once per second and shared
+between responses. Status lines and header names are encoded once
+and cached. The header block is built with a single join.
@@ -0,0 +1,4 @@
+Add :class:`gevent.queue.RingQueue`, a fixed-size :class:`~gevent.queue.Queue`
+that keeps its items in a preallocated ring buffer. It can either
+block when full, like ``Queue``, or discard the oldest item to make
+room.
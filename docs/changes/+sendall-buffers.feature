@@ -0,0 +1,7 @@
+Add ``sendall_buffers(buffers[, flags])`` to gevent sockets. It sends a
+sequence of bytes-like objects using vectored I/O (``sendmsg``) where
+available, resuming after partial writes, without copying them
+together. SSL sockets join the buffers and send them as one write.
+:mod:`gevent.pywsgi` uses this to send the response headers together
+with the first body chunk, and each chunk of a chunked response with
+its framing, in a single system call.
@@ -0,0 +1,5 @@
+Add :func:`gevent.spawn_many` (:meth:`gevent.Greenlet.spawn_many`)
+and :meth:`gevent.pool.Group.spawn_many` to create and start many
+greenlets running the same function at once, scheduling them with a
+single loop callback. :func:`gevent.joinall` now waits for the
+greenlets with a single wakeup instead of one per greenlet.
@@ -0,0 +1,6 @@
+Add :func:`gevent.socket.splice` and :func:`gevent.socket.relay` to
+cooperatively copy data from one socket to another, or in both
+directions between two sockets. On Linux they use ``splice(2)``
+through a pipe, so the data never enters Python. Elsewhere they reuse
+a single receive buffer. The ``portforwarder.py`` example uses
+``relay``.
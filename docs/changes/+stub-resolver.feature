@@ -0,0 +1,8 @@
+Add ``gevent.resolver.stub.Resolver`` (``GEVENT_RESOLVER=stub``), a
+resolver that speaks DNS itself over gevent's sockets, without a
+compiled extension or third-party package. Queries to each nameserver
+share a UDP socket and are matched to their answers by ID, so many
+lookups can be waiting at once; truncated answers are asked again over
+TCP. It uses the nameservers, search domains and options from
+``/etc/resolv.conf`` (or ``GEVENT_RESOLVER_NAMESERVERS`` and
+``GEVENT_RESOLVER_TIMEOUT``) and answers from ``/etc/hosts`` first.
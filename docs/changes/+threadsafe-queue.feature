@@ -0,0 +1,5 @@
+Add :class:`gevent.queue.ThreadSafeQueue`, an unbounded queue that
+any thread or hub can put items into, and that greenlets in the hub
+that created it can get from. Puts made before the consumer hub gets
+a chance to run share one wakeup, so handing a batch of items from a
+native thread costs one ``async_`` notification, not one per item.
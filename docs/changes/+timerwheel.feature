@@ -0,0 +1,7 @@
+Add an optional coarse timer wheel for :class:`gevent.Timeout`. When
+``GEVENT_TIMEOUT_RESOLUTION`` (:attr:`gevent.config.timeout_resolution`)
+is set, timeouts at least that long are kept in a hashed wheel
+advanced by a single loop timer instead of each using its own native
+timer, making the common start-then-cancel pattern (for example, socket
+operations with a timeout) cheaper. Such timeouts may expire up to one
+resolution late, never early.
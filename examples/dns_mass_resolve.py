@@ -13,28 +13,22 @@ variable. To enable threading resolver:
 from __future__ import print_function
 import gevent
 from gevent import socket
-from gevent.pool import Pool
+from gevent.hub import get_hub
 
 N = 1000
-# limit ourselves to max 10 simultaneous outstanding requests
-pool = Pool(10)
 finished = 0
 
-
-def job(url):
-    global finished
-    try:
-        try:
-            ip = socket.gethostbyname(url)
-            print('%s = %s' % (url, ip))
-        except socket.gaierror as ex:
-            print('%s failed with %s' % (url, ex))
-    finally:
-        finished += 1
+# Give all the names to the resolver at once; it looks them up
+# concurrently and gives us each answer as soon as it's ready.
+resolver = get_hub().resolver
+hosts = ['%s.com' % x for x in range(10, 10 + N)]
 
 with gevent.Timeout(2, False):
-    for x in range(10, 10 + N):
-        pool.spawn(job, '%s.com' % x)
-    pool.join()
+    for host, result in resolver.resolve_many(hosts, 0, socket.AF_INET, socket.SOCK_STREAM):
+        finished += 1
+        if isinstance(result, Exception):
+            print('%s failed with %s' % (host, result))
+        else:
+            print('%s = %s' % (host, result[0][4][0]))
 
 print('finished within 2 seconds: %s/%s' % (finished, N))
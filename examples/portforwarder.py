@@ -16,7 +16,7 @@ import sys
 import signal
 import gevent
 from gevent.server import StreamServer
-from gevent.socket import create_connection, gethostbyname
+from gevent.socket import create_connection, gethostbyname, relay
 
 
 class PortForwarder(StreamServer):
@@ -32,11 +32,23 @@ class PortForwarder(StreamServer):
         except IOError as ex:
             log('%s:%s failed to connect to %s:%s: %s', address[0], address[1], self.dest[0], self.dest[1], ex)
             return
-        forwarders = (gevent.spawn(forward, source, dest, self),
-                      gevent.spawn(forward, dest, source, self))
-        # if we return from this method, the stream will be closed out
-        # from under us, so wait for our children
-        gevent.joinall(forwarders)
+        # Copy data in both directions until both sides are done. If
+        # we return from this method, the stream will be closed out
+        # from under us.
+        try:
+            sent, received = relay(source, dest)
+        except KeyboardInterrupt:
+            # On Windows, a Ctrl-C signal (sent by a program) usually winds
+            # up here, not in the installed signal handler.
+            if not self.closed:
+                self.close()
+        except socket.error as ex:
+            log('%s:%s connection failed: %s', address[0], address[1], ex)
+        else:
+            log('%s:%s closed; sent %s bytes, received %s bytes',
+                address[0], address[1], sent, received)
+        finally:
+            dest.close()
 
     def close(self):
         if self.closed:
@@ -46,40 +58,6 @@ class PortForwarder(StreamServer):
             StreamServer.close(self)
 
 
-def forward(source, dest, server):
-    try:
-        source_address = '%s:%s' % source.getpeername()[:2]
-        dest_address = '%s:%s' % dest.getpeername()[:2]
-    except socket.error as e:
-        # We could be racing signals that close the server
-        # and hence a socket.
-        log("Failed to get all peer names: %s", e)
-        return
-
-    try:
-        while True:
-            try:
-                data = source.recv(1024)
-                log('%s->%s: %r', source_address, dest_address, data)
-                if not data:
-                    break
-                dest.sendall(data)
-            except KeyboardInterrupt:
-                # On Windows, a Ctrl-C signal (sent by a program) usually winds
-                # up here, not in the installed signal handler.
-                if not server.closed:
-                    server.close()
-                break
-            except socket.error:
-                if not server.closed:
-                    server.close()
-                break
-    finally:
-        source.close()
-        dest.close()
-        server = None
-
-
 def parse_address(address):
     try:
         hostname, port = address.rsplit(':', 1)
@@ -138,6 +138,11 @@ TRACER = Extension(name="gevent._gevent_c_tracer",
                    depends=['src/gevent/_gevent_c_tracer.pxd'],
                    include_dirs=get_include_dirs())
 
+HTTP_PARSER = Extension(name="gevent._gevent_c_http_parser",
+                        sources=["src/gevent/_http_parser.py"],
+                        depends=['src/gevent/_gevent_c_http_parser.pxd'],
+                        include_dirs=get_include_dirs())
+
 
 _to_cythonize = [
     GLT_PRIMITIVES,
@@ -155,6 +160,7 @@ _to_cythonize = [
     IMAP,
     EVENT,
     QUEUE,
+    HTTP_PARSER,
 ]
 
 EXT_MODULES = [
@@ -173,6 +179,7 @@ EXT_MODULES = [
     HUB_PRIMITIVES,
     GLT_PRIMITIVES,
     TRACER,
+    HTTP_PARSER,
 ]
 
 if bool_from_environ('GEVENTSETUP_DISABLE_ARES'):
@@ -283,6 +290,9 @@ if PYPY:
     EXT_MODULES.remove(TRACER)
     _to_cythonize.remove(TRACER)
 
+    EXT_MODULES.remove(HTTP_PARSER)
+    _to_cythonize.remove(HTTP_PARSER)
+
 
 for mod in _to_cythonize:
     EXT_MODULES.remove(mod)
@@ -50,6 +50,7 @@ __all__ = [
     'sleep',
     'spawn',
     'spawn_later',
+    'spawn_many',
     'spawn_raw',
     'wait',
     'with_timeout',
@@ -76,6 +77,7 @@ from gevent._hub_primitives import wait_on_objects as wait
 from gevent.greenlet import Greenlet, joinall, killall
 spawn = Greenlet.spawn
 spawn_later = Greenlet.spawn_later
+spawn_many = Greenlet.spawn_many
 #: The singleton configuration object for gevent.
 
 from gevent.timeout import Timeout, with_timeout
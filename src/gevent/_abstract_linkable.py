@@ -502,6 +502,10 @@ class AbstractLinkable(object):
             except catch as ex:
                 if ex is not timer:
                     raise
+                # Don't leave a cycle (timer -> traceback -> this
+                # frame -> timer) keeping the frames, and so this
+                # greenlet, alive until the garbage collector runs.
+                ex.__traceback__ = None
                 # test_set_and_clear and test_timeout in test_threading
                 # rely on the exact return values, not just truthish-ness
                 return False
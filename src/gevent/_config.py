@@ -337,9 +337,107 @@ class Resolver(ImportableSetting, Setting):
         'thread': 'gevent.resolver.thread.Resolver',
         'block': 'gevent.resolver.blocking.Resolver',
         'dnspython': 'gevent.resolver.dnspython.Resolver',
+        'caching': 'gevent.resolver.caching.Resolver',
+        'stub': 'gevent.resolver.stub.Resolver',
     }
 
 
+class ResolverCacheBackend(ImportableSetting, Setting):
+    name = 'resolver_cache_backend'
+
+    desc = """\
+    The callable that creates the resolver that
+    :class:`gevent.resolver.caching.Resolver` caches answers from.
+
+    .. versionadded:: NEXT
+    """
+
+    default = [
+        'thread',
+        'dnspython',
+        'ares',
+        'block',
+    ]
+
+    shortname_map = {
+        'ares': 'gevent.resolver.ares.Resolver',
+        'thread': 'gevent.resolver.thread.Resolver',
+        'block': 'gevent.resolver.blocking.Resolver',
+        'dnspython': 'gevent.resolver.dnspython.Resolver',
+        'stub': 'gevent.resolver.stub.Resolver',
+    }
+
+
+class ResolverCacheSize(IntSettingMixin, Setting):
+    name = 'resolver_cache_size'
+    default = 1000
+
+    desc = """\
+    The maximum number of answers that
+    :class:`gevent.resolver.caching.Resolver` keeps.
+
+    .. versionadded:: NEXT
+    """
+
+
+class ResolverCacheTTL(FloatSettingMixin, Setting):
+    name = 'resolver_cache_ttl'
+    default = 60.0
+
+    desc = """\
+    How long, in seconds, :class:`gevent.resolver.caching.Resolver`
+    keeps an answer when the resolver it wraps can't say how long the
+    DNS records may be cached.
+
+    .. versionadded:: NEXT
+    """
+
+
+class ResolverCacheNegativeTTL(FloatSettingMixin, Setting):
+    name = 'resolver_cache_negative_ttl'
+    default = 10.0
+
+    desc = """\
+    How long, in seconds, :class:`gevent.resolver.caching.Resolver`
+    remembers that a name doesn't exist.
+
+    .. versionadded:: NEXT
+    """
+
+
+class ResolverCacheRefreshAhead(FloatSettingMixin, Setting):
+    name = 'resolver_cache_refresh_ahead'
+    default = 0.1
+
+    desc = """\
+    The fraction of the lifetime of an answer cached by
+    :class:`gevent.resolver.caching.Resolver` during which using it
+    starts looking it up again in the background, so that it's
+    replaced before it expires. Set it to None to turn that off.
+
+    .. versionadded:: NEXT
+    """
+
+    def validate(self, value):
+        value = FloatSettingMixin.validate(self, value)
+        if value is not None and value >= 1:
+            raise ValueError("Must be less than 1")
+        return value
+
+
+class ResolverCacheMaxRefreshes(IntSettingMixin, Setting):
+    name = 'resolver_cache_max_refreshes'
+    default = 10
+
+    desc = """\
+    The maximum number of background lookups that
+    :class:`gevent.resolver.caching.Resolver` runs at once to refresh
+    the answers it caches.
+
+    .. versionadded:: NEXT
+    """
+
+
 
 class Threadpool(ImportableSetting, Setting):
 
@@ -491,6 +589,31 @@ class TrackGreenletTree(BoolSettingMixin, Setting):
     """
 
 
+class TimeoutResolution(FloatSettingMixin, Setting):
+    name = 'timeout_resolution'
+    environment_key = 'GEVENT_TIMEOUT_RESOLUTION'
+    default = None
+
+    desc = """\
+    If set, the precision (in seconds) that is acceptable for
+    :class:`gevent.Timeout` objects, including the timeouts of
+    blocking socket operations.
+
+    Timeouts of at least this many seconds are then kept in a timer
+    wheel belonging to the hub (see :mod:`gevent._timerwheel`) instead
+    of each using its own event loop timer. This makes starting and
+    cancelling them much cheaper, which matters when there are many
+    connections with timeouts, but they may expire up to this many
+    seconds late. Shorter timeouts, and those created with
+    ``ref=False``, always use precise timers.
+
+    The default, ``None``, uses precise timers for every timeout.
+    Something like ``0.1`` is a reasonable choice for network servers.
+
+    .. versionadded:: NEXT
+    """
+
+
 ## Monitoring settings
 # All env keys should begin with GEVENT_MONITOR
 
@@ -595,6 +718,41 @@ class MonitorMemoryMaxUsage(ByteCountSettingMixin, Setting):
     cap memory usage, you must choose a value.
     """
 
+class MonitorCPUAccountingPeriod(FloatSettingMixin, Setting):
+    name = 'cpu_accounting_period'
+
+    environment_key = 'GEVENT_MONITOR_CPU_ACCOUNTING_PERIOD'
+    default = None
+
+    desc = """\
+    If `monitor_thread` is enabled and this is set, the monitor thread
+    accounts for the CPU time used by each greenlet in its hub (see
+    :func:`gevent.util.get_cpu_stats`), and this is approximately how
+    long (in seconds) it waits between emitting
+    :class:`gevent.events.CPUUsageReport` events listing the labels
+    (see :func:`gevent.util.set_cpu_label`) that used the most.
+
+    Accounting makes every greenlet switch somewhat more expensive.
+
+    .. versionadded:: NEXT
+    """
+
+class MonitorLoopStatsPeriod(FloatSettingMixin, Setting):
+    name = 'loop_stats_period'
+
+    environment_key = 'GEVENT_MONITOR_LOOP_STATS_PERIOD'
+    default = None
+
+    desc = """\
+    If `monitor_thread` is enabled and this is set, the hub collects
+    statistics about the iterations of its event loop (see
+    :meth:`gevent.hub.Hub.start_loop_stats`), and this is approximately
+    how long (in seconds) the monitor thread waits between emitting
+    :class:`gevent.events.LoopStatsReport` events with them.
+
+    .. versionadded:: NEXT
+    """
+
 # The ares settings are all interpreted by
 # gevent/resolver/ares.pyx, so we don't do
 # any validation here.
@@ -701,6 +859,16 @@ class ResolverNameservers(AresSettingMixin, Setting):
       Similar to dnspython, but with more platform and compile-time
       options. ares validates that the members of the list are valid
       addresses.
+
+    * stub
+
+      Like dnspython, this replaces the nameservers from
+      ``/etc/resolv.conf``. Each member of the list is an IP address,
+      optionally with a port, as in ``127.0.0.1:5353`` or
+      ``[::1]:5353``; the addresses are validated.
+
+    .. versionchanged:: NEXT
+       Add the stub resolver.
     """
 
     # Normal string-to-list rules. But still validate_anything.
@@ -723,7 +891,7 @@ class ResolverTimeout(FloatSettingMixin, AresSettingMixin, Setting):
     desc = """\
     The total amount of time that the DNS resolver will spend making queries.
 
-    Only the ares and dnspython resolvers support this.
+    Only the ares, dnspython and stub resolvers support this.
 
     .. versionadded:: 1.3a2
     """
@@ -0,0 +1,27 @@
+cimport cython
+
+cdef re
+cdef Parser
+cdef http_client
+
+cdef Py_ssize_t _MAXLINE
+cdef Py_ssize_t _MAXHEADERS
+cdef object _LineTooLong
+cdef object _HTTPException
+cdef frozenset _HTTP_VERSIONS
+cdef object _match_simple_header
+cdef dict _ENVIRON_KEYS
+cdef Py_ssize_t _MAX_ENVIRON_KEYS
+
+
+cpdef object parse_request_line(str requestline)
+
+@cython.locals(lines=list, pairs=list, name=str, value=str, lowered=str)
+cpdef object read_headers(object rfile, object message_class)
+
+cdef object _parse_headers(list lines, object message_class)
+
+@cython.locals(result=list, keys=dict, name=str)
+cpdef list environ_headers(object header_items)
+
+cdef object _environ_key(str name)
@@ -41,3 +41,25 @@ cdef class MaxSwitchTracer(_HubTracer):
 
     @cython.locals(switched_at=double)
     cpdef _trace(self, str event, tuple args)
+
+
+cdef class GreenletCPUStats:
+    cdef public object label
+    cdef public double cpu_time
+    cdef public Py_ssize_t switches
+
+@cython.locals(stats=GreenletCPUStats)
+cpdef GreenletCPUStats get_cpu_stats(glet)
+
+cdef class CPUAccountingTracer(GreenletTracer):
+    cdef readonly object timer
+    cdef readonly double last_switch
+    cdef readonly dict totals
+
+    @cython.locals(now=double)
+    cpdef _trace(self, str event, tuple args)
+
+    @cython.locals(stats=GreenletCPUStats, total=GreenletCPUStats)
+    cdef _charge(self, glet, double elapsed)
+
+    cpdef dict take_totals(self)
@@ -11,6 +11,8 @@ from gevent._gevent_c_greenlet_primitives cimport SwitchOutGreenletWithLoop
 cdef bint _PYPY
 cdef sys_getframe
 cdef sys_exc_info
+cdef getswitchinterval
+cdef perf_counter
 cdef Timeout
 cdef GreenletExit
 cdef InvalidSwitchError
@@ -139,6 +141,8 @@ cdef class Greenlet(greenlet):
     cdef object _start_event
     cdef str _formatted_info
     cdef object _ident
+    # Set by gevent._tracer.CPUAccountingTracer.
+    cdef public object _cpu_stats
 
     cpdef bint has_links(self)
     cpdef join(self, timeout=*)
@@ -209,6 +213,30 @@ cdef class _dummy_event:
 cdef _dummy_event _cancelled_start_event
 cdef _dummy_event _start_completed_event
 
+@cython.final
+@cython.internal
+cdef class _batch_start_event:
+    cdef readonly bint pending
+    cdef readonly bint active
+
+    cpdef stop(self)
+    cpdef close(self)
+
+@cython.locals(glet=Greenlet)
+cdef _start_all(list greenlets)
+@cython.locals(glet=Greenlet, i=Py_ssize_t, count=Py_ssize_t)
+cpdef _switch_all(list greenlets, Py_ssize_t start=*)
+
+@cython.final
+@cython.internal
+cdef class _JoinAll:
+    cdef readonly list done
+    cdef Py_ssize_t remaining
+    cdef object waiter
+
+@cython.locals(countdown=_JoinAll)
+cdef list _joinall(greenlets, timeout)
+
 cpdef _kill(Greenlet glet, object exception, object waiter)
 
 @cython.locals(diehards=list)
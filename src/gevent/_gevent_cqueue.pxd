@@ -68,6 +68,8 @@ cdef class SimpleQueue:
 
     cpdef put(self, item, block=*, timeout=*)
     cpdef put_nowait(self, item)
+    cpdef put_many(self, items, block=*, timeout=*)
+    cpdef get_many(self, max_items, block=*, timeout=*)
 
     cdef __get_or_peek(self, method, block, timeout)
 
@@ -106,6 +108,14 @@ cdef class PriorityQueue(Queue):
 cdef class LifoQueue(Queue):
     pass
 
+cdef class RingQueue(Queue):
+    cdef Py_ssize_t _head
+    cdef Py_ssize_t _count
+    cdef readonly bint overwrite
+    cdef readonly Py_ssize_t dropped
+
+    cdef list _items(self)
+
 cdef class Channel:
     cdef __weakref__
     cdef readonly getters
@@ -115,5 +125,7 @@ cdef class Channel:
 
     cpdef get(self, block=*, timeout=*)
     cpdef get_nowait(self)
+    cpdef put_many(self, items, block=*, timeout=*)
+    cpdef get_many(self, max_items, block=*, timeout=*)
 
     cdef _schedule_unlock(self)
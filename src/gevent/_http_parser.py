@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 gevent contributors. See LICENSE for details.
+# cython: auto_pickle=False,embedsignature=True,always_allow_keywords=False
+"""
+Parsing of HTTP/1.x request lines and headers for :mod:`gevent.pywsgi`.
+
+This module is compiled with Cython when gevent is built with its
+C accelerators. The results are always identical to what
+:mod:`http.client` and the WSGI handler produce on their own; these
+functions just take a shorter path for the well-formed requests that
+make up nearly all traffic, and defer to the standard library for
+anything else.
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import re
+from email.parser import Parser
+from http import client as http_client
+
+__all__ = [
+    'parse_request_line',
+    'read_headers',
+    'environ_headers',
+]
+
+# The limits enforced by http.client.parse_headers().
+_MAXLINE = getattr(http_client, '_MAXLINE', 65536)
+_MAXHEADERS = getattr(http_client, '_MAXHEADERS', 100)
+
+_LineTooLong = http_client.LineTooLong
+_HTTPException = http_client.HTTPException
+
+_HTTP_VERSIONS = frozenset(('HTTP/1.0', 'HTTP/1.1'))
+
+# A header line that the email parser used by http.client would treat
+# as a single, complete header: a name made of printable ASCII other
+# than ':' (its ``headerRE``), and a value without CR or LF or, to
+# be safe, the other characters ``str.splitlines()`` treats as line
+# breaks. Anything else (obsolete line folding, stray CRs, lines
+# that aren't headers at all) goes to the email parser.
+_match_simple_header = re.compile(
+    br'([\x21-\x39\x3b-\x7e]+):[ \t]*([^\r\n\x0b\x0c\x1c\x1d\x1e\x85]*)\r?\n?\Z'
+).match
+
+# Header name -> WSGI environ key, or None if the header is not
+# copied into the environ.
+_ENVIRON_KEYS = {}
+# Header names are chosen by the client, so don't let this grow
+# without bound.
+_MAX_ENVIRON_KEYS = 1000
+
+
+def parse_request_line(requestline):
+    """
+    Split the stripped request line *requestline* into its command,
+    path and version if it is an ordinary HTTP/1.0 or HTTP/1.1 request.
+
+    Returns None for anything else, in which case the caller must
+    parse (and validate) it the long way.
+    """
+    words = requestline.split()
+    if len(words) == 3 and words[2] in _HTTP_VERSIONS:
+        return words
+    return None
+
+
+def read_headers(rfile, message_class):
+    """
+    Read the request headers from the binary file *rfile* and return
+    an instance of *message_class*, a subclass of
+    :class:`http.client.HTTPMessage`.
+
+    This is equivalent to :func:`http.client.parse_headers`, including
+    the exceptions it raises, except that if every header is a simple
+    ``Name: value`` line the message is built directly instead of
+    through :mod:`email.parser`.
+    """
+    lines = []
+    readline = rfile.readline
+    while True:
+        line = readline(_MAXLINE + 1)
+        if len(line) > _MAXLINE:
+            raise _LineTooLong("header line")
+        lines.append(line)
+        if len(lines) > _MAXHEADERS:
+            raise _HTTPException("got more than %d headers" % _MAXHEADERS)
+        if line in (b'\r\n', b'\n', b''):
+            break
+
+    # The last line is the terminator
+    pairs = []
+    for line in lines[:-1]:
+        match = _match_simple_header(line)
+        if match is None:
+            return _parse_headers(lines, message_class)
+        name = match.group(1).decode('latin-1')
+        value = match.group(2).decode('latin-1')
+        if len(name) == 12 and name.lower() == 'content-type':
+            lowered = value.lower()
+            if 'multipart' in lowered or 'message' in lowered:
+                # The email parser goes looking for a body with these.
+                return _parse_headers(lines, message_class)
+        pairs.append((name, value))
+
+    message = message_class()
+    set_raw = message.set_raw
+    for name, value in pairs:
+        set_raw(name, value)
+    message.set_payload('')
+    return message
+
+
+def _parse_headers(lines, message_class):
+    # What http.client.parse_headers does with the lines it read.
+    hstring = b''.join(lines).decode('iso-8859-1')
+    return Parser(_class=message_class).parsestr(hstring)
+
+
+def environ_headers(header_items):
+    """
+    Given the ``(name, value)`` pairs of the request headers, return
+    a list of the ``(key, value)`` pairs to put in the WSGI environ.
+
+    The key is the name converted to a CGI variable with a ``HTTP_``
+    prefix; the value has surrounding whitespace removed. Headers
+    whose names contain underscores are dropped (they can't be
+    distinguished from the same name with dashes), as are
+    ``Content-Type`` and ``Content-Length``, which have their own keys.
+    """
+    result = []
+    keys = _ENVIRON_KEYS
+    for name, value in header_items:
+        key = keys.get(name, False)
+        if key is False:
+            key = _environ_key(name)
+        if key is not None:
+            result.append((key, value.strip()))
+    return result
+
+
+def _environ_key(name):
+    if '_' in name:
+        key = None
+    else:
+        key = 'HTTP_' + name.replace('-', '_').upper()
+        if key in ('HTTP_CONTENT_TYPE', 'HTTP_CONTENT_LENGTH'):
+            key = None
+    if len(_ENVIRON_KEYS) < _MAX_ENVIRON_KEYS:
+        _ENVIRON_KEYS[name] = key
+    return key
+
+
+from gevent._util import import_c_accel
+import_c_accel(globals(), 'gevent.__http_parser')
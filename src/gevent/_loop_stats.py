@@ -0,0 +1,255 @@
+# Copyright (c) 2026 gevent contributors. See LICENSE for details.
+"""
+Statistics about the iterations of an event loop.
+
+Each iteration of the loop runs the callbacks queued with
+``run_callback``, polls for IO (blocking until there is some, or a
+timer expires), and then runs the watchers that became ready. While
+:class:`LoopStats` is started, it measures each of those and adds the
+results to fixed-bucket :class:`Histogram` objects.
+
+Use :meth:`gevent.hub.Hub.start_loop_stats` to start collecting
+statistics for a hub; the monitoring thread can publish them
+periodically (see :attr:`gevent._config.Config.loop_stats_period`).
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from bisect import bisect_left
+
+from gevent._compat import perf_counter
+
+__all__ = [
+    'Histogram',
+    'LoopHistograms',
+    'LoopStats',
+]
+
+#: The bucket upper bounds, in seconds, for the histograms of times.
+TIME_BUCKETS = (
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0,
+)
+
+#: The bucket upper bounds for the histograms of counts.
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class Histogram(object):
+    """
+    Counts values in fixed buckets.
+
+    The value *v* is counted in the first bucket whose upper bound in
+    *bounds* is at least *v*; values greater than all the bounds are
+    counted in one more, final, bucket.
+    """
+
+    __slots__ = (
+        'bounds',
+        'counts',
+        'count',
+        'total',
+        'max',
+    )
+
+    def __init__(self, bounds):
+        #: The upper bounds of the buckets, in increasing order.
+        self.bounds = tuple(bounds)
+        #: The number of values in each bucket. This has one more
+        #: entry than *bounds*.
+        self.counts = [0] * (len(self.bounds) + 1)
+        #: The number of values.
+        self.count = 0
+        #: The sum of the values.
+        self.total = 0
+        #: The largest value.
+        self.max = 0
+
+    def add(self, value):
+        """Count *value*."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        """The mean of the values, or 0 if there are none."""
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, fraction):
+        """
+        Return the upper bound of the bucket that holds the value at
+        *fraction* (between 0 and 1) of the way through the sorted
+        values. For the last bucket, this is the largest value.
+        """
+        if not self.count:
+            return 0
+        # The position of the value we're looking for, counting from 1.
+        wanted = max(1, fraction * self.count)
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= wanted:
+                return bound
+        return self.max
+
+    def __repr__(self):
+        return '<%s count=%d mean=%r max=%r>' % (
+            type(self).__name__,
+            self.count,
+            self.mean,
+            self.max,
+        )
+
+
+class LoopHistograms(object):
+    """
+    The histograms for a number of loop iterations.
+    """
+
+    def __init__(self):
+        #: The time of each complete iteration.
+        self.iteration_time = Histogram(TIME_BUCKETS)
+        #: The time spent polling for IO; for an idle loop, this is
+        #: most of the iteration.
+        self.poll_time = Histogram(TIME_BUCKETS)
+        #: The time spent running Python code: the watchers that fired
+        #: and the callbacks. This is the time the loop couldn't
+        #: respond to anything else.
+        self.run_time = Histogram(TIME_BUCKETS)
+        #: The number of callbacks waiting to be run at the start of
+        #: each iteration.
+        self.callbacks = Histogram(COUNT_BUCKETS)
+        #: The number of watchers that fired after each poll.
+        self.watchers = Histogram(COUNT_BUCKETS)
+
+    def __repr__(self):
+        return '<%s iteration_time=%r poll_time=%r run_time=%r callbacks=%r watchers=%r>' % (
+            type(self).__name__,
+            self.iteration_time,
+            self.poll_time,
+            self.run_time,
+            self.callbacks,
+            self.watchers,
+        )
+
+
+class LoopStats(object):
+    """
+    Collects :class:`LoopHistograms` for the iterations of *loop*.
+
+    The measurements come from watchers (two ``prepare`` watchers and
+    a ``check`` watcher) that every loop implementation supports, so
+    they work the same way for all of them. On libev, the watcher
+    priorities put these watchers right around the poll. The libuv
+    loop doesn't support prepare watchers (and runs IO watchers in
+    the middle of its poll), so for it ``poll_time`` and ``run_time``
+    aren't collected; the others all come from the ``check`` watcher,
+    and ``callbacks`` is the number waiting at the end of each
+    iteration instead of the start.
+    """
+
+    _before_callbacks = None
+    _before_poll = None
+    _after_poll = None
+
+    def __init__(self, loop):
+        self.loop = loop
+        #: The histograms being collected; see :meth:`take`.
+        self.histograms = LoopHistograms()
+        self._queued = 0
+        self._poll_started = 0
+        self._poll_ended = 0
+
+    @property
+    def started(self):
+        return self._after_poll is not None
+
+    def start(self):
+        """Start collecting statistics. This must be called in the loop's thread."""
+        if self.started:
+            return
+        loop = self.loop
+        # On libev, the prepare watchers are run highest priority
+        # first, around the one that runs the callbacks, and the
+        # check watchers are run before any other watchers that
+        # became ready.
+        try:
+            self._before_callbacks = loop.prepare(ref=False, priority=loop.MAXPRI)
+            self._before_poll = loop.prepare(ref=False, priority=loop.MINPRI)
+        except TypeError:
+            # libuv
+            self._before_callbacks = self._before_poll = None
+        else:
+            self._before_callbacks.start(self._on_before_callbacks)
+            self._before_poll.start(self._on_before_poll)
+        self._after_poll = loop.check(ref=False, priority=loop.MAXPRI)
+        self._after_poll.start(self._on_after_poll)
+        # We're running Python code now; the first run_time, and
+        # the first iteration_time, are from here to the first poll.
+        self._poll_started = self._poll_ended = perf_counter()
+
+    def stop(self):
+        """Stop collecting statistics."""
+        for name in '_before_callbacks', '_before_poll', '_after_poll':
+            watcher = getattr(self, name)
+            if watcher is not None:
+                setattr(self, name, None)
+                watcher.stop()
+                watcher.close()
+
+    def take(self):
+        """
+        Return the histograms collected so far and start new ones.
+
+        This may be called from any thread.
+        """
+        histograms = self.histograms
+        self.histograms = LoopHistograms()
+        return histograms
+
+    def _on_before_callbacks(self):
+        self._queued = len(self.loop._callbacks)
+
+    def _on_before_poll(self):
+        now = perf_counter()
+        histograms = self.histograms
+        histograms.callbacks.add(self._queued)
+        self._queued = 0
+        if self._poll_ended:
+            histograms.run_time.add(now - self._poll_ended)
+        if self._poll_started:
+            histograms.iteration_time.add(now - self._poll_started)
+        self._poll_started = now
+
+    def _on_after_poll(self):
+        now = perf_counter()
+        histograms = self.histograms
+        if self._before_poll is None:
+            # All we know is when each iteration ends. libuv runs
+            # this callback in the same batch as the other watchers
+            # that became ready. If it's alone, and there are no
+            # callbacks, the iteration did nothing (libuv runs one of
+            # those right after most that did something); its time
+            # is counted as part of the next one.
+            loop = self.loop
+            watchers = loop.pendingcnt - 1
+            callbacks = len(loop._callbacks)
+            if watchers <= 0 and not callbacks:
+                return
+            histograms.iteration_time.add(now - self._poll_ended)
+            histograms.callbacks.add(callbacks)
+            histograms.watchers.add(max(watchers, 0))
+        else:
+            if self._poll_started:
+                histograms.poll_time.add(now - self._poll_started)
+            histograms.watchers.add(self.loop.pendingcnt)
+        self._poll_ended = now
@@ -0,0 +1,319 @@
+# Copyright (c) 2026 gevent. See LICENSE for details.
+"""
+Batched datagram I/O.
+
+On Linux, this uses ``recvmmsg(2)`` and ``sendmmsg(2)`` (by way of
+:mod:`ctypes`) to receive or send many datagrams in a single system
+call. Elsewhere, or for address families we don't know how to encode,
+it falls back to equivalent loops around ``recvfrom`` and ``sendto``.
+
+The functions here operate on native, non-blocking sockets and
+raise :exc:`BlockingIOError` if nothing at all could be transferred;
+the cooperative versions are methods of :class:`gevent.socket.socket`.
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import, print_function, division
+
+import os
+import sys
+from struct import Struct
+from struct import pack
+from struct import unpack_from
+from struct import error as StructError
+
+from _socket import AF_INET
+from _socket import AF_INET6
+from _socket import inet_ntop
+from _socket import inet_pton
+
+from gevent._compat import PYPY
+
+__all__ = [
+    'recvfrom_many',
+    'sendto_many',
+]
+
+# The most messages the kernel accepts in one call (UIO_MAXIOV).
+MAX_BATCH = 1024
+
+_SOCKADDR_SIZE = 128 # sizeof(struct sockaddr_storage)
+
+
+def _recvfrom_many_loop(sock, count, bufsize, flags):
+    result = []
+    recvfrom = sock.recvfrom
+    for _ in range(count):
+        try:
+            result.append(recvfrom(bufsize, flags))
+        except BlockingIOError:
+            if not result:
+                raise
+            break
+    return result
+
+
+def _sendto_many_loop(sock, datagrams, flags):
+    sent = 0
+    for data, address in datagrams:
+        try:
+            if address is None:
+                sock.send(data, flags)
+            else:
+                sock.sendto(data, flags, address)
+        except BlockingIOError:
+            if not sent:
+                raise
+            break
+        sent += 1
+    return sent
+
+
+_libc = None
+if sys.platform.startswith('linux') and not PYPY:
+    try:
+        import ctypes
+        from ctypes import c_int
+        from ctypes import c_uint
+        from ctypes import c_size_t
+        from ctypes import c_void_p
+        from ctypes import Structure
+
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.recvmmsg # pylint:disable=pointless-statement
+        _libc.sendmmsg # pylint:disable=pointless-statement
+    except (ImportError, OSError, AttributeError): # pragma: no cover
+        _libc = None
+
+
+if _libc is not None:
+
+    class _iovec(Structure):
+        _fields_ = [
+            ('iov_base', c_void_p),
+            ('iov_len', c_size_t),
+        ]
+
+    class _msghdr(Structure):
+        _fields_ = [
+            ('msg_name', c_void_p),
+            ('msg_namelen', c_uint),
+            ('msg_iov', c_void_p),
+            ('msg_iovlen', c_size_t),
+            ('msg_control', c_void_p),
+            ('msg_controllen', c_size_t),
+            ('msg_flags', c_int),
+        ]
+
+    class _mmsghdr(Structure):
+        _fields_ = [
+            ('msg_hdr', _msghdr),
+            ('msg_len', c_uint),
+        ]
+
+    _recvmmsg = _libc.recvmmsg
+    _recvmmsg.argtypes = [c_int, c_void_p, c_uint, c_int, c_void_p]
+    _recvmmsg.restype = c_int
+
+    _sendmmsg = _libc.sendmmsg
+    _sendmmsg.argtypes = [c_int, c_void_p, c_uint, c_int]
+    _sendmmsg.restype = c_int
+
+    # Going through ctypes attributes for each message is slow, so
+    # we build and read the arrays of headers with struct instead.
+    # In native mode, struct aligns fields the way the C compiler does.
+    _IOVEC = Struct('@PN')
+    # msg_name, msg_namelen, msg_iov, msg_iovlen
+    _MSGHDR_START = Struct('@PIPN')
+    _MMSGHDR_SIZE = ctypes.sizeof(_mmsghdr)
+    _MSG_NAMELEN_OFFSET = _msghdr.msg_namelen.offset
+    _MSG_LEN_OFFSET = _mmsghdr.msg_len.offset
+    assert _IOVEC.size == ctypes.sizeof(_iovec)
+    assert _MMSGHDR_SIZE % 4 == 0 and _MSG_LEN_OFFSET % 4 == 0 and _MSG_NAMELEN_OFFSET % 4 == 0
+    assert _MSGHDR_START.size == _msghdr.msg_iovlen.offset + ctypes.sizeof(c_size_t)
+
+    def _raise_errno():
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+
+    def _address_of(buf):
+        # The address of the writable buffer *buf*, which must
+        # stay alive (and not be resized) while the address is used.
+        return ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+
+    class _RecvVector(object):
+        # The message headers and buffers for one recvmmsg() call,
+        # allocated once and reused.
+
+        def __init__(self, count, bufsize):
+            self.data = bytearray(count * bufsize)
+            self.names = bytearray(count * _SOCKADDR_SIZE)
+            self.iovs = bytearray(count * _IOVEC.size)
+            self.msgs = bytearray(count * _MMSGHDR_SIZE)
+            data_addr = _address_of(self.data)
+            names_addr = _address_of(self.names)
+            iovs_addr = _address_of(self.iovs)
+            for i in range(count):
+                _IOVEC.pack_into(self.iovs, i * _IOVEC.size,
+                                 data_addr + i * bufsize, bufsize)
+                _MSGHDR_START.pack_into(self.msgs, i * _MMSGHDR_SIZE,
+                                        names_addr + i * _SOCKADDR_SIZE, _SOCKADDR_SIZE,
+                                        iovs_addr + i * _IOVEC.size, 1)
+            # The kernel overwrites msg_namelen (and msg_len), so we
+            # restore the headers from this before each use.
+            self.template = bytes(self.msgs)
+            self.msgs_addr = _address_of(self.msgs)
+            self.data_view = memoryview(self.data)
+            # The headers as an array of unsigned ints, so that
+            # msg_len and msg_namelen can be read by index.
+            self.msgs_fields = memoryview(self.msgs).cast('I')
+
+    # Vectors not currently in use, by (count, bufsize). Taking one
+    # with pop() and returning it with append() is atomic, so this
+    # is safe to share between threads; and no greenlet switch can
+    # happen while one is in use.
+    _free_vectors = {}
+
+    # Decoded addresses, by their raw sockaddr. Datagram traffic
+    # usually comes from a limited set of peers.
+    _address_cache = {}
+
+    def _decode_address(raw):
+        try:
+            return _address_cache[raw]
+        except KeyError:
+            pass
+        if not raw:
+            return None
+        family, = unpack_from('=H', raw)
+        if family == AF_INET:
+            port, = unpack_from('!H', raw, 2)
+            address = (inet_ntop(AF_INET, raw[4:8]), port)
+        else:
+            port, flowinfo = unpack_from('!HI', raw, 2)
+            scope_id, = unpack_from('=I', raw, 24)
+            address = (inet_ntop(AF_INET6, raw[8:24]), port, flowinfo, scope_id)
+        if len(_address_cache) > 1000:
+            _address_cache.clear()
+        _address_cache[raw] = address
+        return address
+
+    def _recvfrom_many_mmsg(sock, count, bufsize, flags):
+        key = (count, bufsize)
+        try:
+            vector = _free_vectors.setdefault(key, []).pop()
+        except IndexError:
+            vector = _RecvVector(count, bufsize)
+        try:
+            msgs = vector.msgs
+            msgs[:] = vector.template
+            received = _recvmmsg(sock.fileno(), vector.msgs_addr, count, flags, None)
+            if received < 0:
+                _raise_errno()
+
+            data = vector.data_view
+            names = vector.names
+            fields = vector.msgs_fields
+            result = []
+            start = name_start = 0
+            msg_len_index = _MSG_LEN_OFFSET // 4
+            namelen_index = _MSG_NAMELEN_OFFSET // 4
+            for _ in range(received):
+                result.append((
+                    bytes(data[start:start + fields[msg_len_index]]),
+                    _decode_address(bytes(names[name_start:name_start + fields[namelen_index]]))
+                ))
+                start += bufsize
+                name_start += _SOCKADDR_SIZE
+                msg_len_index += _MMSGHDR_SIZE // 4
+                namelen_index += _MMSGHDR_SIZE // 4
+            return result
+        finally:
+            _free_vectors[key].append(vector)
+
+    def _encode_address(family, address):
+        # Returns None if *address* isn't a numeric address for *family*.
+        try:
+            if family == AF_INET:
+                host, port = address
+                return pack('=H', AF_INET) + pack('!H', port) + inet_pton(AF_INET, host) + bytes(8)
+            host, port = address[:2]
+            flowinfo = address[2] if len(address) > 2 else 0
+            scope_id = address[3] if len(address) > 3 else 0
+            return (pack('=H', AF_INET6) + pack('!HI', port, flowinfo)
+                    + inet_pton(AF_INET6, host) + pack('=I', scope_id))
+        except (OSError, ValueError, TypeError, StructError):
+            return None
+
+    def _sendto_many_mmsg(sock, datagrams, flags):
+        # Returns None if any address needs to be resolved.
+        count = len(datagrams)
+        # Rather than keeping pointers to each piece of data, copy
+        # them into one buffer; datagrams are small, and this lets us
+        # take any kind of buffer.
+        datas = [data if isinstance(data, bytes) else bytes(data) for data, _ in datagrams]
+        data = bytearray(b''.join(datas))
+        data.append(0) # Never empty, so it has an address.
+        names = {}
+        family = sock.family
+        namelen = 16 if family == AF_INET else 28
+        for _, address in datagrams:
+            if address is not None and address not in names:
+                name = _encode_address(family, address)
+                if name is None:
+                    return None
+                names[address] = name
+        name_list = list(names)
+        name_buf = bytearray(b''.join(names.values()) or b'\0')
+        name_addr = _address_of(name_buf)
+        name_addrs = {address: name_addr + i * namelen for i, address in enumerate(name_list)}
+
+        iovs = bytearray(count * _IOVEC.size)
+        msgs = bytearray(count * _MMSGHDR_SIZE)
+        data_addr = _address_of(data)
+        iovs_addr = _address_of(iovs)
+        iov_pack = _IOVEC.pack_into
+        hdr_pack = _MSGHDR_START.pack_into
+        offset = 0
+        for i, (piece, (_, address)) in enumerate(zip(datas, datagrams)):
+            length = len(piece)
+            iov_pack(iovs, i * _IOVEC.size, data_addr + offset, length)
+            offset += length
+            if address is None:
+                hdr_pack(msgs, i * _MMSGHDR_SIZE, 0, 0, iovs_addr + i * _IOVEC.size, 1)
+            else:
+                hdr_pack(msgs, i * _MMSGHDR_SIZE, name_addrs[address], namelen,
+                         iovs_addr + i * _IOVEC.size, 1)
+        sent = _sendmmsg(sock.fileno(), _address_of(msgs), count, flags)
+        if sent < 0:
+            _raise_errno()
+        return sent
+
+    def recvfrom_many(sock, count, bufsize, flags=0):
+        """
+        Receive up to *count* datagrams of at most *bufsize* bytes
+        each from *sock*, returning a list of ``(data, address)``
+        tuples.
+        """
+        if sock.family not in (AF_INET, AF_INET6):
+            return _recvfrom_many_loop(sock, count, bufsize, flags)
+        return _recvfrom_many_mmsg(sock, min(count, MAX_BATCH), bufsize, flags)
+
+    def sendto_many(sock, datagrams, flags=0):
+        """
+        Send the ``(data, address)`` tuples in the sequence
+        *datagrams* from *sock*, returning how many were sent. An
+        address of None means to use the address *sock* is connected
+        to.
+        """
+        if sock.family in (AF_INET, AF_INET6):
+            sent = _sendto_many_mmsg(sock, datagrams[:MAX_BATCH], flags)
+            if sent is not None:
+                return sent
+            # Probably a hostname; let sendto() resolve it (and
+            # produce the appropriate error).
+        return _sendto_many_loop(sock, datagrams, flags)
+
+else:
+    recvfrom_many = _recvfrom_many_loop
+    sendto_many = _sendto_many_loop
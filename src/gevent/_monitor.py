@@ -14,10 +14,15 @@ from gevent.events import notify
 from gevent.events import EventLoopBlocked
 from gevent.events import MemoryUsageThresholdExceeded
 from gevent.events import MemoryUsageUnderThreshold
+from gevent.events import CPUUsageReport
+from gevent.events import LoopStatsReport
 from gevent.events import IPeriodicMonitorThread
 from gevent.events import implementer
 
 from gevent._tracer import GreenletTracer
+from gevent._tracer import CPUAccountingTracer
+from gevent._tracer import top_cpu_usage
+from gevent._tracer import get_cpu_stats
 from gevent._compat import thread_mod_name
 from gevent._compat import perf_counter
 from gevent._compat import get_this_psutil_process
@@ -89,6 +94,15 @@ class PeriodicMonitoringThread(object):
     # The instance of GreenletTracer we're using
     _greenlet_tracer = None
 
+    # The number of labels included in each CPUUsageReport.
+    cpu_usage_report_size = 10
+
+    # When we last took the CPU accounting totals.
+    _last_cpu_report_time = 0
+
+    # When we last took the loop statistics.
+    _last_loop_stats_time = 0
+
     def __init__(self, hub):
         self._hub_wref = wref(hub, self._on_hub_gc)
         self.should_run = True
@@ -288,6 +302,64 @@ class PeriodicMonitoringThread(object):
                                      max(GEVENT_CONFIG.memory_monitor_period,
                                          self.min_memory_monitor_period))
 
+    def install_cpu_accounting(self, period=None):
+        """
+        Start accounting for the CPU time used by the greenlets of the
+        hub and reporting the top users every *period* seconds
+        (by default, the configured ``cpu_accounting_period``).
+
+        Like the constructor, this must be called in the hub's thread.
+        """
+        if period is None:
+            period = GEVENT_CONFIG.cpu_accounting_period
+        if not isinstance(self._greenlet_tracer, CPUAccountingTracer):
+            # It also does everything the plain tracer did, so
+            # replace it rather than adding a second trace function.
+            self._greenlet_tracer.kill()
+            self._greenlet_tracer = CPUAccountingTracer()
+            self._last_cpu_report_time = perf_counter()
+            # Most of the hub's time is usually spent waiting for IO;
+            # keep that apart from unlabeled greenlets.
+            stats = get_cpu_stats(self.hub)
+            if stats.label is None:
+                stats.label = 'hub'
+        self.add_monitoring_function(self.monitor_cpu_usage, period)
+
+    def monitor_cpu_usage(self, hub):
+        now = perf_counter()
+        interval = now - self._last_cpu_report_time
+        self._last_cpu_report_time = now
+        totals = self._greenlet_tracer.take_totals()
+        event = CPUUsageReport(top_cpu_usage(totals, self.cpu_usage_report_size),
+                               interval, hub=hub)
+        notify(event)
+        return event
+
+    def install_loop_stats(self, period=None):
+        """
+        Start collecting the hub's loop statistics and emitting them
+        every *period* seconds (by default, the configured
+        ``loop_stats_period``).
+
+        This must be called in the hub's thread.
+        """
+        if period is None:
+            period = GEVENT_CONFIG.loop_stats_period
+        self.hub.start_loop_stats()
+        self._last_loop_stats_time = perf_counter()
+        self.add_monitoring_function(self.monitor_loop_stats, period)
+
+    def monitor_loop_stats(self, hub):
+        loop_stats = hub.loop_stats
+        if loop_stats is None:
+            return None
+        now = perf_counter()
+        interval = now - self._last_loop_stats_time
+        self._last_loop_stats_time = now
+        event = LoopStatsReport(loop_stats.take(), interval, hub=hub)
+        notify(event)
+        return event
+
     def monitor_memory_usage(self, _hub):
         max_allowed = GEVENT_CONFIG.max_memory_usage
         if not max_allowed:
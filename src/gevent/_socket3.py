@@ -86,6 +86,41 @@ class _wrefsocket(_socket.socket):
                            lambda s, nv: s.settimeout(nv))
 
 
+# The most buffers a single sendmsg() can take; passing more
+# fails with EMSGSIZE or EINVAL.
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError): # pragma: no cover
+    _IOV_MAX = -1
+if _IOV_MAX <= 0: # pragma: no cover
+    _IOV_MAX = 1024
+
+
+def _buffer_views(buffers):
+    # Byte-oriented views of the non-empty *buffers*, so that lengths
+    # are in bytes and a partially sent view can be sliced.
+    views = []
+    for buf in buffers:
+        view = _get_memory(buf)
+        if not isinstance(view, memoryview):
+            view = memoryview(view)
+        if view.nbytes:
+            views.append(view.cast('B') if view.format != 'B' or view.ndim != 1 else view)
+    return views
+
+
+def _consume_views(views, sent):
+    # Remove *sent* bytes from the front of *views*, in place.
+    i = 0
+    nviews = len(views)
+    while i < nviews and sent >= views[i].nbytes:
+        sent -= views[i].nbytes
+        i += 1
+    del views[:i]
+    if sent:
+        views[0] = views[0][sent:]
+
+
 class socket(_socketcommon.SocketMixin):
     """
     gevent `socket.socket <https://docs.python.org/3/library/socket.html#socket-objects>`_
@@ -419,13 +454,136 @@ class socket(_socketcommon.SocketMixin):
                         return 0
                     raise
 
+        def sendall_buffers(self, buffers, flags=0):
+            """
+            sendall_buffers(buffers[, flags]) -> None
+
+            Send the contents of each of the bytes-like objects in the
+            iterable *buffers*, in order, as if they had been
+            concatenated and passed to :meth:`sendall`, but without
+            copying them.
+
+            Where the platform supports it, this uses vectored I/O
+            (:meth:`sendmsg`, ``writev``), so that many small buffers
+            (for example, HTTP headers and a response body) can be
+            written in a single system call. Partial writes are resumed,
+            and the socket's timeout applies to the whole operation, as
+            for :meth:`sendall`.
+
+            .. versionadded:: NEXT
+            """
+            buffers = list(buffers)
+            total = 0
+            for buf in buffers:
+                total += len(buf) if isinstance(buf, (bytes, bytearray)) else memoryview(buf).nbytes
+            if not total:
+                return
+            end = None
+            if self.timeout is not None:
+                end = time.time() + self.timeout
+            sock_sendmsg = self._sock.sendmsg
+
+            sent = 0
+            if len(buffers) <= _IOV_MAX:
+                # Usually everything fits in the socket buffer, so try
+                # sending without making any views.
+                try:
+                    sent = sock_sendmsg(buffers, (), flags)
+                except error as ex:
+                    if ex.args[0] not in GSENDAGAIN or self.timeout == 0.0:
+                        raise
+                    self._wait_writable(end)
+                if sent == total:
+                    return
+
+            views = _buffer_views(buffers)
+            _consume_views(views, sent)
+            started = sent > 0
+            while views:
+                if started and end is not None and time.time() >= end:
+                    raise _timeout_error('timed out')
+                started = True
+                try:
+                    sent = sock_sendmsg(views[:_IOV_MAX], (), flags)
+                except error as ex:
+                    if ex.args[0] not in GSENDAGAIN or self.timeout == 0.0:
+                        raise
+                    self._wait_writable(end)
+                    continue
+                _consume_views(views, sent)
+
+        def _wait_writable(self, end):
+            # Wait for no longer than is left before *end*, the
+            # deadline for the whole operation.
+            if end is None:
+                self._wait(self._write_event)
+                return
+            timeleft = end - time.time()
+            if timeleft <= 0:
+                raise _timeout_error('timed out')
+            wait(self._write_event, timeleft, hub=self.hub)
+    else:
+        def sendall_buffers(self, buffers, flags=0):
+            # No vectored I/O; sending a single buffer is still generally
+            # cheaper than one system call per (small) buffer.
+            self.sendall(b''.join(buffers), flags)
+
 
     # sendfile: new in 3.5. But there's no real reason to not
-    # support it everywhere. Note that we can't use os.sendfile()
-    # because it's not cooperative.
+    # support it everywhere. We can use os.sendfile() on our
+    # non-blocking socket, waiting for it to become writable when it
+    # would block.
     def _sendfile_use_sendfile(self, file, offset=0, count=None):
         # This is called directly by tests
-        raise __socket__._GiveupOnSendfile() # pylint:disable=no-member
+        # pylint:disable=no-member
+        if not hasattr(os, 'sendfile'):
+            raise __socket__._GiveupOnSendfile("os.sendfile() not available on this platform")
+        self._check_sendfile_params(file, offset, count)
+        sockno = self.fileno()
+        try:
+            fileno = file.fileno()
+        except (AttributeError, io.UnsupportedOperation) as err:
+            raise __socket__._GiveupOnSendfile(err)  # not a regular file
+        try:
+            fsize = os.fstat(fileno).st_size
+        except OSError as err:
+            raise __socket__._GiveupOnSendfile(err)  # not a regular file
+        if not fsize:
+            return 0  # empty file
+        # Truncate to 1GiB to avoid OverflowError, see bpo-38319.
+        blocksize = min(count or fsize, 2 ** 30)
+        if self.gettimeout() == 0:
+            raise ValueError("non-blocking sockets are not supported")
+
+        total_sent = 0
+        os_sendfile = os.sendfile
+        try:
+            while True:
+                if count:
+                    blocksize = min(count - total_sent, blocksize)
+                    if blocksize <= 0:
+                        break
+                try:
+                    sent = os_sendfile(sockno, fileno, offset, blocksize)
+                except BlockingIOError:
+                    self._wait(self._write_event)
+                    continue
+                except OSError as err:
+                    if total_sent == 0:
+                        # We can get here for different reasons, the main
+                        # one being 'file' is not a regular mmap(2)-like
+                        # file, in which case we'll fall back on using
+                        # plain send().
+                        raise __socket__._GiveupOnSendfile(err)
+                    raise
+                if sent == 0:
+                    break  # EOF
+                offset += sent
+                total_sent += sent
+            return total_sent
+        finally:
+            if total_sent > 0 and hasattr(file, 'seek'):
+                file.seek(offset)
 
     def _sendfile_use_send(self, file, offset=0, count=None):
         self._check_sendfile_params(file, offset, count)
@@ -497,8 +655,14 @@ class socket(_socketcommon.SocketMixin):
         .. versionadded:: 1.1rc4
            Added in Python 3.5, but available under all Python 3 versions in
            gevent.
+        .. versionchanged:: NEXT
+           Use :func:`os.sendfile` when possible, instead of always
+           reading the file and sending it with :meth:`send`.
         """
-        return self._sendfile_use_send(file, offset, count)
+        try:
+            return self._sendfile_use_sendfile(file, offset, count)
+        except __socket__._GiveupOnSendfile: # pylint:disable=no-member
+            return self._sendfile_use_send(file, offset, count)
 
 
     if os.name == 'nt':
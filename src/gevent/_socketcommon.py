@@ -27,6 +27,8 @@ __extensions__ = [
     'wait_read',
     'wait_write',
     'wait_readwrite',
+    'splice',
+    'relay',
 ]
 
 # standard functions and classes that this module re-imports
@@ -68,13 +70,18 @@ __imports__ = [
 ]
 
 
+import os
+import sys
 import time
 
+from greenlet import getcurrent
+
 from gevent._hub_local import get_hub_noargs as get_hub
 from gevent._compat import string_types, integer_types
 from gevent._compat import WIN as is_windows
 from gevent._compat import OSX as is_macos
 from gevent._compat import exc_clear
+from gevent._compat import reraise
 from gevent._util import copy_globals
 from gevent._greenlet_primitives import get_memory as _get_memory
 from gevent._hub_primitives import wait_on_socket as _wait_on_socket
@@ -170,6 +177,163 @@ def cancel_wait(watcher, error=cancel_wait_ex):
     get_hub().cancel_wait(watcher, error)
 
 
+if hasattr(os, 'splice'):
+    # Linux, Python 3.10+
+    _SPLICE_FLAGS = os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK # pylint:disable=no-member
+else:
+    _SPLICE_FLAGS = None
+
+
+def _copy_buffered(src, dst, count, bufsize):
+    # Reuse one buffer for everything.
+    buf = bytearray(bufsize)
+    view = memoryview(buf)
+    total = 0
+    while count is None or total < count:
+        want = bufsize if count is None else min(bufsize, count - total)
+        received = src.recv_into(buf, want)
+        if not received:
+            break
+        dst.sendall(view[:received])
+        total += received
+    return total
+
+
+def _copy_spliced(src, dst, count, bufsize):
+    # Move data from src to a pipe and from the pipe to dst, all
+    # within the kernel. Returns None if the sockets can't be
+    # spliced; that's only detected before anything has been
+    # transferred.
+    splice_ = os.splice # pylint:disable=no-member
+    flags = _SPLICE_FLAGS
+    src_fd = src.fileno()
+    dst_fd = dst.fileno()
+    pipe_r, pipe_w = os.pipe()
+    try:
+        total = 0
+        while count is None or total < count:
+            want = bufsize if count is None else min(bufsize, count - total)
+            try:
+                received = splice_(src_fd, pipe_w, want, flags=flags)
+            except OSError as ex:
+                if ex.errno == EINVAL and not total:
+                    return None
+                if ex.errno != EAGAIN:
+                    raise
+                src._wait(src._read_event)
+                continue
+            if not received:
+                break
+            total += received
+            while received:
+                try:
+                    received -= splice_(pipe_r, dst_fd, received, flags=flags)
+                except OSError as ex:
+                    if ex.errno != EAGAIN:
+                        raise
+                    dst._wait(dst._write_event)
+        return total
+    finally:
+        os.close(pipe_r)
+        os.close(pipe_w)
+
+
+def splice(src, dst, count=None, bufsize=65536):
+    """
+    splice(src, dst, count=None, bufsize=65536) -> int
+
+    Copy data from the gevent socket *src* to the gevent socket *dst*
+    until *src* reaches end of file or, if *count* is given, until
+    that many bytes have been copied. Returns the number of bytes
+    copied. Neither socket is closed or shut down.
+
+    On Linux, this uses ``splice(2)`` through an intermediate pipe,
+    so the data never has to be copied into (or out of) Python; up to
+    *bufsize* bytes are moved at a time. Elsewhere, or if either
+    socket is an SSL socket, this falls back to receiving into a
+    single reused buffer of *bufsize* bytes and sending that.
+
+    Each socket's timeout applies to each individual wait for it to
+    become readable or writable, as with :meth:`~socket.socket.recv`
+    and :meth:`~socket.socket.sendall`. Non-blocking sockets are not
+    supported.
+
+    .. versionadded:: NEXT
+    """
+    if src.timeout == 0.0 or dst.timeout == 0.0:
+        raise ValueError("non-blocking sockets are not supported")
+    if (_SPLICE_FLAGS is not None
+            and getattr(src, '_sslobj', None) is None
+            and getattr(dst, '_sslobj', None) is None):
+        total = _copy_spliced(src, dst, count, bufsize)
+        if total is not None:
+            return total
+    return _copy_buffered(src, dst, count, bufsize)
+
+
+def relay(a, b, bufsize=65536):
+    """
+    relay(a, b, bufsize=65536) -> (int, int)
+
+    Copy data in both directions between the gevent sockets *a* and
+    *b*, as with :func:`splice`, until both have reached end of file.
+    This is the core of a TCP proxy.
+
+    When one socket reaches end of file, the other is shut down for
+    writing so that its peer sees end of file too. The sockets are
+    not closed. Returns a tuple of the number of bytes copied from *a*
+    to *b* and from *b* to *a*.
+
+    If copying in either direction raises an exception, copying in
+    the other direction is stopped and the exception is raised, as
+    soon as it happens.
+
+    .. versionadded:: NEXT
+    """
+    from gevent.greenlet import Greenlet
+
+    def one_way(src, dst):
+        copied = splice(src, dst, bufsize=bufsize)
+        try:
+            dst.shutdown(SHUT_WR)
+        except error: # pylint:disable=undefined-variable
+            # Already disconnected.
+            pass
+        return copied
+
+    current = getcurrent()
+    copying = [True]
+
+    def reverse_copy():
+        # Return the error rather than raising it: it's for our
+        # caller, not the hub, to report.
+        try:
+            return one_way(b, a), None
+        except Exception: # pylint:disable=broad-except
+            return None, sys.exc_info()
+
+    def reverse_done(glet):
+        # Runs in the hub. If copying from *b* failed, don't wait
+        # for *a* to reach end of file, which might never happen;
+        # raise the error now.
+        if copying[0] and glet.value[1] is not None:
+            current.throw(*glet.value[1])
+
+    reverse = Greenlet.spawn(reverse_copy)
+    reverse.link_value(reverse_done)
+    try:
+        forward = one_way(a, b)
+        copying[0] = False
+        backward, exc_info = reverse.get()
+        if exc_info is not None:
+            reraise(*exc_info)
+        return forward, backward
+    finally:
+        copying[0] = False
+        reverse.unlink(reverse_done)
+        reverse.kill()
+
+
 def gethostbyname(hostname):
     """
     gethostbyname(host) -> address
@@ -709,6 +873,61 @@ class SocketMixin(object):
                     return 0
                 raise
 
+    def recvfrom_many(self, count, bufsize, flags=0):
+        """
+        recvfrom_many(count, bufsize[, flags]) -> [(data, address), ...]
+
+        Receive at least one and up to *count* datagrams, each of up to
+        *bufsize* bytes, as a list of ``(data, address)`` tuples, waiting
+        only if none are available.
+
+        On Linux, this uses a single ``recvmmsg`` system call, so that
+        a busy datagram socket can be drained with far fewer system
+        calls and wakeups than calling :meth:`recvfrom` repeatedly.
+
+        .. versionadded:: NEXT
+        """
+        # Imported here so that importing gevent.socket doesn't load
+        # ctypes.
+        from gevent import _mmsg
+        while 1:
+            try:
+                return _mmsg.recvfrom_many(self._sock, count, bufsize, flags)
+            except _SocketError as ex:
+                if ex.args[0] != EWOULDBLOCK or self.timeout == 0.0:
+                    raise
+            self._wait(self._read_event)
+
+    def sendto_many(self, datagrams, flags=0):
+        """
+        sendto_many(datagrams[, flags]) -> count
+
+        Send each of the ``(data, address)`` tuples in the iterable
+        *datagrams*, in order, returning the number sent. An *address*
+        of None sends to the address the socket is connected to.
+
+        On Linux, this uses ``sendmmsg`` to send many datagrams in a
+        single system call. Like :meth:`sendall`, this waits until
+        everything has been sent, unless the socket is non-blocking.
+
+        .. versionadded:: NEXT
+        """
+        from gevent import _mmsg
+        datagrams = list(datagrams)
+        sent = 0
+        while sent < len(datagrams):
+            try:
+                sent += _mmsg.sendto_many(self._sock, datagrams[sent:] if sent else datagrams, flags)
+            except _SocketError as ex:
+                if ex.args[0] not in GSENDAGAIN:
+                    raise
+                if self.timeout == 0.0:
+                    if sent:
+                        break
+                    raise
+                self._wait(self._write_event)
+        return sent
+
     def send(self, data, flags=0, timeout=timeout_default):
         if timeout is timeout_default:
             timeout = self.timeout
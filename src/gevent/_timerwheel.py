@@ -0,0 +1,206 @@
+# Copyright (c) 2026 gevent. See LICENSE for details.
+"""
+A coarse, hashed timer wheel.
+
+Every blocking operation with a timeout (for example, a socket
+``recv`` after ``settimeout``) creates a :class:`gevent.timeout.Timeout`,
+and ordinarily each of those allocates, starts and stops a native
+loop timer, even though the overwhelming majority are cancelled long
+before they expire.
+
+A :class:`TimerWheel` replaces those native timers with small Python
+objects kept in a ring of buckets, one bucket per *resolution*
+seconds. Adding and removing a timer are O(1) dictionary operations,
+and a single repeating loop timer advances the wheel, firing whatever
+has expired. The price is precision: a timer may fire up to
+*resolution* seconds late (but never early).
+
+Timeouts use the hub's wheel when :attr:`gevent.config.timeout_resolution
+<gevent._config.Config.timeout_resolution>` is set.
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import, print_function, division
+
+import sys
+from math import ceil
+
+from gevent._compat import monotonic
+
+__all__ = [
+    'TimerWheel',
+]
+
+
+class _WheelTimer(object):
+    # Mimics the parts of the API of ``loop.timer`` that
+    # gevent.timeout.Timeout uses.
+
+    __slots__ = (
+        '_wheel',
+        'seconds',
+        'callback',
+        'args',
+        # The absolute tick we expire on, or -1 if we're not
+        # in the wheel.
+        '_tick',
+        # Expired, but the callback hasn't been run yet.
+        'pending',
+    )
+
+    def __init__(self, wheel, seconds):
+        self._wheel = wheel
+        self.seconds = seconds
+        self.callback = None
+        self.args = None
+        self._tick = -1
+        self.pending = False
+
+    @property
+    def active(self):
+        return self._tick >= 0
+
+    def start(self, callback, *args, **kwargs):
+        # ``update`` is accepted for compatibility with loop timers;
+        # we always read the clock.
+        # pylint:disable=unused-argument
+        if self._wheel is None:
+            raise ValueError('operation on closed timer')
+        if self._tick >= 0:
+            self._wheel._remove(self)
+        self.callback = callback
+        self.args = args
+        self.pending = False
+        self._wheel._add(self)
+
+    def stop(self):
+        if self._tick >= 0:
+            self._wheel._remove(self)
+        self.callback = None
+        self.args = None
+        self.pending = False
+
+    def close(self):
+        self.stop()
+        self._wheel = None
+
+    def __repr__(self):
+        return '<%s at 0x%x seconds=%s active=%s pending=%s>' % (
+            type(self).__name__, id(self), self.seconds, self.active, self.pending
+        )
+
+
+class TimerWheel(object):
+    """
+    TimerWheel(loop, resolution, slots=512)
+
+    Schedules many coarse timers using one repeating *loop* timer
+    that fires every *resolution* seconds while any timer is active.
+
+    Timers whose expiration falls in the same *resolution*-sized
+    interval share a bucket; *slots* is the number of buckets. Timers
+    further in the future than ``slots * resolution`` seconds share
+    buckets with nearer ones and are simply skipped until their turn
+    comes around.
+    """
+
+    def __init__(self, loop, resolution, slots=512):
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self.loop = loop
+        self.resolution = resolution
+        self._slots = [{} for _ in range(slots)]
+        # The number of timers in the wheel.
+        self._count = 0
+        # The last tick we processed.
+        self._current_tick = int(monotonic() / resolution)
+        self._driver = loop.timer(resolution, resolution)
+
+    def __len__(self):
+        return self._count
+
+    def timer(self, seconds):
+        """
+        Return a new, unstarted, timer object that will expire
+        *seconds* after it is started.
+        """
+        return _WheelTimer(self, seconds)
+
+    def _add(self, timer):
+        now = monotonic()
+        if not self._driver.active:
+            # While we're idle, the driver isn't running and we
+            # stop keeping track of time.
+            self._current_tick = int(now / self.resolution)
+            self._driver.start(self._advance)
+        # Round up so we never expire early.
+        tick = int(ceil((now + timer.seconds) / self.resolution))
+        if tick <= self._current_tick:
+            tick = self._current_tick + 1
+        timer._tick = tick
+        self._slots[tick % len(self._slots)][timer] = None
+        self._count += 1
+
+    def _remove(self, timer):
+        del self._slots[timer._tick % len(self._slots)][timer]
+        timer._tick = -1
+        # Leave the driver running until the next tick; when timers
+        # are quickly added and removed one at a time (the common
+        # case), that avoids stopping and starting it each time.
+        self._count -= 1
+
+    def _advance(self):
+        slots = self._slots
+        nslots = len(slots)
+        now_tick = int(monotonic() / self.resolution)
+        # If the loop was blocked we may have missed ticks; but there's
+        # never a need to look at any bucket more than once.
+        first_tick = self._current_tick + 1
+        last_tick = min(now_tick, self._current_tick + nslots)
+        self._current_tick = now_tick
+
+        expired = []
+        for tick in range(first_tick, last_tick + 1):
+            slot = slots[tick % nslots]
+            if not slot:
+                continue
+            for timer in list(slot):
+                if timer._tick <= now_tick:
+                    del slot[timer]
+                    timer._tick = -1
+                    timer.pending = True
+                    expired.append(timer)
+
+        self._count -= len(expired)
+        if not self._count:
+            self._driver.stop()
+
+        for timer in expired:
+            # A previous callback may have stopped (or restarted) this
+            # timer.
+            if not timer.pending:
+                continue
+            timer.pending = False
+            try:
+                timer.callback(*timer.args)
+            except: # pylint:disable=bare-except
+                self.loop.handle_error(timer, *sys.exc_info())
+
+    def close(self):
+        """
+        Stop all timers and release the native loop timer.
+        """
+        for slot in self._slots:
+            for timer in slot:
+                timer._tick = -1
+            slot.clear()
+        self._count = 0
+        if self._driver is not None:
+            self._driver.stop()
+            self._driver.close()
+            self._driver = None
+
+    def __repr__(self):
+        return '<%s at 0x%x resolution=%s timers=%d>' % (
+            type(self).__name__, id(self), self.resolution, self._count
+        )
@@ -7,6 +7,7 @@ from __future__ import division
 import sys
 import _socket
 import errno
+from functools import partial
 
 from gevent.greenlet import Greenlet
 from gevent.event import Event
@@ -14,6 +15,7 @@ from gevent.hub import get_hub
 from gevent._compat import string_types
 from gevent._compat import integer_types
 from gevent._compat import xrange
+from gevent._compat import perf_counter
 
 
 
@@ -36,6 +38,24 @@ def _handle_and_close_when_done(handle, close, args_tuple):
         close(*args_tuple)
 
 
+# The version of the above used when admission control is enabled.
+# It runs in the handler's greenlet, so this is where we find out how
+# long the connection waited to be handled. *waiting* is a one-item
+# list, true until this starts; see BaseServer._admitted_handler_died.
+def _handle_admitted(server, handle, close, args_tuple, accepted_at, waiting):
+    waiting[0] = False
+    try:
+        max_queue_time = server.max_queue_time
+        if max_queue_time is not None and perf_counter() - accepted_at > max_queue_time:
+            server._shed(args_tuple)
+            return None
+        server.connections_accepted += 1
+        return handle(*args_tuple)
+    finally:
+        server.connections_in_flight -= 1
+        close(*args_tuple)
+
+
 class BaseServer(object):
     """
     An abstract base class that implements some common functionality for the servers in gevent.
@@ -76,6 +96,9 @@ class BaseServer(object):
        closing of the socket, fixing ResourceWarnings under Python 3 and PyPy.
     .. versionchanged:: 1.5
        Now a context manager that returns itself and calls :meth:`stop` on exit.
+    .. versionchanged:: NEXT
+       Add admission control; see :attr:`max_concurrency` and
+       :attr:`max_queue_time`.
 
     """
     # pylint: disable=too-many-instance-attributes,bare-except,broad-except
@@ -104,6 +127,25 @@ class BaseServer(object):
     #: (usually 1) changes the default to 1 (in libuv only; this does not affect gevent).
     max_accept = 100
 
+    #: If not None, the most connections that may be waiting to be
+    #: handled or being handled at once. Connections accepted beyond
+    #: that are shed: passed to :meth:`do_shed` and closed without
+    #: calling the handler. If a :class:`~gevent.pool.Pool` is used to
+    #: spawn handlers, connections are also shed while it is full,
+    #: instead of leaving them to wait in the listen backlog.
+    #:
+    #: .. versionadded:: NEXT
+    max_concurrency = None
+
+    #: If not None, the most seconds a connection may wait between
+    #: being accepted and its handler starting to run (for example,
+    #: while the event loop is busy with other greenlets). Connections
+    #: that wait longer are shed as for :attr:`max_concurrency`; by
+    #: then the client has probably given up anyway.
+    #:
+    #: .. versionadded:: NEXT
+    max_queue_time = None
+
     _spawn = Greenlet.spawn
 
     #: the default timeout that we wait for the client connections to close in stop()
@@ -124,6 +166,21 @@ class BaseServer(object):
         # deferred until the various ``set_`` methods are called, and it's not documented
         # when it's safe to call those
         self.pool = None # can be set from ``spawn``; overrides self.full()
+        #: The number of connections that have been passed to the handler.
+        #:
+        #: .. versionadded:: NEXT
+        self.connections_accepted = 0
+        #: The number of connections that have been shed because of
+        #: :attr:`max_concurrency` or :attr:`max_queue_time`.
+        #:
+        #: .. versionadded:: NEXT
+        self.connections_shed = 0
+        #: The number of connections accepted but not yet finished
+        #: with. This is only kept up to date while
+        #: :attr:`max_concurrency` or :attr:`max_queue_time` is set.
+        #:
+        #: .. versionadded:: NEXT
+        self.connections_in_flight = 0
         try:
             self.set_listener(listener)
             self.set_spawn(spawn)
@@ -204,6 +261,26 @@ class BaseServer(object):
         handle = self._handle
         close = self.do_close
 
+        if self.max_concurrency is not None or self.max_queue_time is not None:
+            self.connections_in_flight += 1
+            waiting = [True]
+            try:
+                if spawn is None:
+                    _handle_admitted(self, handle, close, args, perf_counter(), waiting)
+                else:
+                    handler = spawn(_handle_admitted, self, handle, close, args,
+                                    perf_counter(), waiting)
+                    rawlink = getattr(handler, 'rawlink', None)
+                    if rawlink is not None:
+                        rawlink(partial(self._admitted_handler_died, waiting, args))
+            except:
+                if spawn is not None:
+                    self.connections_in_flight -= 1
+                    close(*args)
+                raise
+            return
+
+        self.connections_accepted += 1
         try:
             if spawn is None:
                 _handle_and_close_when_done(handle, close, args)
@@ -213,15 +290,51 @@ class BaseServer(object):
             close(*args)
             raise
 
+    def _admitted_handler_died(self, waiting, args, _handler):
+        # If the handler was killed before it started (as when stop()
+        # kills the pool), _handle_admitted didn't get to finish with
+        # the connection, so we do.
+        if waiting[0]:
+            waiting[0] = False
+            self.connections_in_flight -= 1
+            self.do_close(*args)
+
     def do_close(self, *args):
         pass
 
+    def do_shed(self, *args):
+        """
+        Called with the arguments that would have been passed to the
+        handler when a connection is shed because of
+        :attr:`max_concurrency` or :attr:`max_queue_time`. After this
+        returns, :meth:`do_close` is called.
+
+        This may be called in the event loop, so it must not block.
+        The default does nothing, so the connection is simply closed.
+
+        .. versionadded:: NEXT
+        """
+
+    def _shed(self, args):
+        # The caller closes the connection.
+        self.connections_shed += 1
+        try:
+            self.do_shed(*args)
+        except:
+            self.loop.handle_error((args[1:], self), *sys.exc_info())
+
+    def _over_concurrency(self):
+        max_concurrency = self.max_concurrency
+        if max_concurrency is None:
+            return False
+        return self.connections_in_flight >= max_concurrency or self.full()
+
     def do_read(self):
         raise NotImplementedError()
 
     def _do_read(self):
         for _ in xrange(self.max_accept):
-            if self.full():
+            if self.max_concurrency is None and self.full():
                 self.stop_accepting()
                 if self.pool is not None:
                     self.pool._semaphore.rawlink(self._start_accepting_if_started)
@@ -245,6 +358,12 @@ class BaseServer(object):
                     self.delay = min(self.max_delay, self.delay * 2)
                 break
             else:
+                if self._over_concurrency():
+                    try:
+                        self._shed(args)
+                    finally:
+                        self.do_close(*args)
+                    continue
                 try:
                     self.do_handle(*args)
                 except:
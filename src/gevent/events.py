@@ -40,6 +40,10 @@ __all__ = [
     'MemoryUsageThresholdExceeded',
     'IMemoryUsageUnderThreshold',
     'MemoryUsageUnderThreshold',
+    'ICPUUsageReport',
+    'CPUUsageReport',
+    'ILoopStatsReport',
+    'LoopStatsReport',
 
     # Hub
     'IPeriodicMonitorThread',
@@ -285,6 +289,85 @@ class MemoryUsageUnderThreshold(_AbstractMemoryEvent):
         self.max_memory_usage = max_usage
 
 
+class ICPUUsageReport(Interface):
+    """
+    The event emitted periodically with the greenlets that used the
+    most CPU time, when the monitor thread is accounting for it.
+
+    See :attr:`gevent._config.Config.cpu_accounting_period`.
+
+    This event is emitted in the monitor thread.
+
+    .. versionadded:: NEXT
+    """
+
+    usage = Attribute("A list of the totals for the labels (see :func:`gevent.util.set_cpu_label`) "
+                      "that used the most CPU time since the last report, most first. "
+                      "Each has the attributes ``label``, ``cpu_time`` and ``switches``.")
+    interval = Attribute("The fractional seconds since the last report.")
+    hub = Attribute("The hub being monitored.")
+
+
+@implementer(ICPUUsageReport)
+class CPUUsageReport(object):
+    """
+    Implementation of `ICPUUsageReport`.
+
+    .. versionadded:: NEXT
+    """
+
+    def __init__(self, usage, interval, hub=None):
+        self.usage = usage
+        self.interval = interval
+        self.hub = hub
+
+    def __repr__(self):
+        return "<%s interval=%.3f usage=%r>" % (
+            self.__class__.__name__,
+            self.interval,
+            self.usage,
+        )
+
+
+class ILoopStatsReport(Interface):
+    """
+    The event emitted periodically with statistics about the
+    iterations of a hub's event loop.
+
+    See :attr:`gevent._config.Config.loop_stats_period`.
+
+    This event is emitted in the monitor thread.
+
+    .. versionadded:: NEXT
+    """
+
+    histograms = Attribute("The :class:`gevent._loop_stats.LoopHistograms` "
+                           "for the iterations since the last report.")
+    interval = Attribute("The fractional seconds since the last report.")
+    hub = Attribute("The hub being monitored.")
+
+
+@implementer(ILoopStatsReport)
+class LoopStatsReport(object):
+    """
+    Implementation of `ILoopStatsReport`.
+
+    .. versionadded:: NEXT
+    """
+
+    def __init__(self, histograms, interval, hub=None):
+        self.histograms = histograms
+        self.interval = interval
+        self.hub = hub
+
+    def __repr__(self):
+        return "<%s interval=%.3f histograms=%r>" % (
+            self.__class__.__name__,
+            self.interval,
+            self.histograms,
+        )
+
+
 class IGeventPatchEvent(Interface):
     """
     The root for all monkey-patch events gevent emits.
@@ -5,6 +5,8 @@ from __future__ import absolute_import, print_function, division
 
 from sys import _getframe as sys_getframe
 from sys import exc_info as sys_exc_info
+from sys import getswitchinterval
+from time import perf_counter
 from weakref import ref as wref
 
 # XXX: How to get cython to let us rename this as RawGreenlet
@@ -693,6 +695,31 @@ class Greenlet(greenlet):
         g.start()
         return g
 
+    @classmethod
+    def spawn_many(cls, function, iterable):
+        """
+        spawn_many(function, iterable) -> list
+
+        Create a new :class:`Greenlet` for each item in *iterable*,
+        to run ``function(item)``, and schedule them all to run.
+        This can be used as ``gevent.spawn_many`` or
+        ``Greenlet.spawn_many``.
+
+        This is equivalent to ``[spawn(function, item) for item in
+        iterable]``, except that all the greenlets are started by a
+        single callback in the event loop, which is faster when there
+        are many of them. They start in order.
+
+        :return: A list of the new greenlets.
+
+        .. versionadded:: NEXT
+        """
+        if not callable(function):
+            raise TypeError("function must be callable")
+        greenlets = [cls(function, item) for item in iterable]
+        _start_all(greenlets)
+        return greenlets
+
     @classmethod
     def spawn_later(cls, seconds, *args, **kwargs):
         """
@@ -1051,6 +1078,106 @@ _cancelled_start_event = _dummy_event()
 _start_completed_event = _dummy_event()
 
 
+class _batch_start_event(object):
+    # The start event of a greenlet started by _start_all(). The
+    # shared loop callback only switches to greenlets whose event is
+    # still pending, so stopping this (by killing the greenlet, or
+    # when it runs) works just like stopping a callback.
+    __slots__ = ('pending', 'active')
+
+    def __init__(self):
+        self.pending = True
+        self.active = False
+
+    def stop(self):
+        self.pending = False
+
+    def close(self):
+        pass
+
+
+def _start_all(greenlets):
+    # Start all the (unstarted) Greenlet objects in the list with
+    # one loop callback.
+    if not greenlets:
+        return
+    for glet in greenlets:
+        if glet._start_event is None:
+            _call_spawn_callbacks(glet)
+            glet._start_event = _batch_start_event()
+    hub = get_my_hub(glet) # pylint:disable=undefined-variable,undefined-loop-variable
+    hub.loop.run_callback(_switch_all, greenlets)
+
+
+# How many greenlets _switch_all() switches to between checks of
+# the time, as the loop does for its callbacks.
+_SWITCH_ALL_CHECK_COUNT = 50
+
+def _switch_all(greenlets, start=0):
+    # The loop callback for _start_all(). Like the loop running
+    # separate callbacks, once the switch interval is used up, leave
+    # the rest for a later callback so that the loop can poll for IO.
+    expiration = perf_counter() + getswitchinterval()
+    count = len(greenlets)
+    i = start
+    while i < count:
+        glet = greenlets[i]
+        i += 1
+        if glet._start_event.pending:
+            try:
+                glet.switch()
+            except: # pylint:disable=bare-except, undefined-variable
+                get_my_hub(glet).handle_error(glet, *sys_exc_info())
+        if (i < count
+                and not (i - start) % _SWITCH_ALL_CHECK_COUNT
+                and perf_counter() >= expiration):
+            get_my_hub(glet).loop.run_callback(_switch_all, greenlets, i) # pylint:disable=undefined-variable
+            return
+
+
+class _JoinAll(object):
+    # Linked to each greenlet in joinall(); wakes the waiter once,
+    # when the last one is ready, rather than once for each.
+    __slots__ = ('done', 'remaining', 'waiter')
+
+    def __init__(self, remaining, waiter):
+        self.done = []
+        self.remaining = remaining
+        self.waiter = waiter
+
+    def __call__(self, glet):
+        self.done.append(glet)
+        self.remaining -= 1
+        if not self.remaining:
+            self.waiter.switch(None)
+
+
+def _joinall(greenlets, timeout):
+    # joinall() without *count* or *raise_error*. Some objects
+    # merge duplicate links, so only link each once.
+    greenlets = list({id(glet): glet for glet in greenlets}.values())
+    if not greenlets:
+        return []
+    waiter = Waiter() # pylint:disable=undefined-variable
+    countdown = _JoinAll(len(greenlets), waiter)
+    for glet in greenlets:
+        glet.rawlink(countdown)
+    timer = None
+    if timeout is not None:
+        timer = get_hub().loop.timer(timeout, priority=-1)
+        timer.start(waiter.switch, None)
+    try:
+        waiter.get()
+    finally:
+        if timer is not None:
+            timer.stop()
+            timer.close()
+        if countdown.remaining:
+            for glet in greenlets:
+                glet.unlink(countdown)
+    return countdown.done
+
+
 # This is *only* called as a callback from the hub via Greenlet.kill(),
 # and its first argument is the Greenlet. So we can be sure about the types.
 def _kill(glet, exception, waiter):
@@ -1080,8 +1207,15 @@ def joinall(greenlets, timeout=None, raise_error=False, count=None):
         are waited for.
     :return: A sequence of the greenlets that finished before the timeout (if any)
         expired.
+
+    .. versionchanged:: NEXT
+       When waiting for all the *greenlets* without *raise_error*,
+       the caller is only woken up once, when the last one finishes
+       (or the timeout expires), rather than once for each.
     """
     if not raise_error:
+        if count is None and greenlets is not None:
+            return _joinall(greenlets, timeout)
         return wait(greenlets, timeout=timeout, count=count)
 
     done = []
@@ -35,6 +35,7 @@ from gevent._compat import reraise
 from gevent._util import readproperty
 from gevent._util import Lazy
 from gevent._util import gmctime
+from gevent._util import _NONE
 from gevent._ident import IdentRegistry
 
 from gevent._hub_local import get_hub
@@ -401,6 +402,12 @@ class Hub(WaitOperationsGreenlet):
     # An instance of PeriodicMonitoringThread, if started.
     periodic_monitoring_thread = None
 
+    #: The :class:`gevent._loop_stats.LoopStats` for the event loop,
+    #: once :meth:`start_loop_stats` has been called.
+    #:
+    #: .. versionadded:: NEXT
+    loop_stats = None
+
     # The ident of the thread we were created in, which should be the
     # thread that we run in.
     thread_ident = None
@@ -445,6 +452,7 @@ class Hub(WaitOperationsGreenlet):
             self.loop = self.loop_class(flags=loop, default=default) # pylint:disable=not-callable
         self._resolver = None
         self._threadpool = None
+        self._timer_wheel = _NONE
         self.format_context = GEVENT_CONFIG.format_context
 
         Hub._hub_counter += 1
@@ -700,12 +708,45 @@ class Hub(WaitOperationsGreenlet):
 
             if self.main_hub:
                 self.periodic_monitoring_thread.install_monitor_memory_usage()
+            if GEVENT_CONFIG.cpu_accounting_period:
+                self.periodic_monitoring_thread.install_cpu_accounting()
+            if GEVENT_CONFIG.loop_stats_period:
+                self.periodic_monitoring_thread.install_loop_stats()
 
             notify_and_call_entry_points(PeriodicMonitorThreadStartedEvent(
                 self.periodic_monitoring_thread))
 
         return self.periodic_monitoring_thread
 
+    def start_loop_stats(self):
+        """
+        Start collecting histograms of the duration of each iteration
+        of the event loop, the time it spends polling for IO and running
+        Python code, the number of callbacks queued and the number of
+        watchers that fire.
+
+        This must be called from the thread running this hub. Returns
+        :attr:`loop_stats`. See also
+        :attr:`gevent._config.Config.loop_stats_period`.
+
+        .. versionadded:: NEXT
+        """
+        if self.loop_stats is None:
+            from gevent._loop_stats import LoopStats
+            self.loop_stats = LoopStats(self.loop)
+        self.loop_stats.start()
+        return self.loop_stats
+
+    def stop_loop_stats(self):
+        """
+        Stop collecting the statistics started by :meth:`start_loop_stats`.
+        Those already collected remain in :attr:`loop_stats`.
+
+        .. versionadded:: NEXT
+        """
+        if self.loop_stats is not None:
+            self.loop_stats.stop()
+
     def join(self, timeout=None):
         """
         Wait for the event loop to finish. Exits only when there
@@ -787,12 +828,18 @@ class Hub(WaitOperationsGreenlet):
         if self.periodic_monitoring_thread is not None:
             self.periodic_monitoring_thread.kill()
             self.periodic_monitoring_thread = None
+        if self.loop_stats is not None:
+            self.loop_stats.stop()
+            self.loop_stats = None
         if self._resolver is not None:
             self._resolver.close()
             del self._resolver
         if self._threadpool is not None:
             self._threadpool.kill()
             del self._threadpool
+        if self._timer_wheel is not _NONE and self._timer_wheel is not None:
+            self._timer_wheel.close()
+            self._timer_wheel = None
 
         # Let the frame be cleaned up by causing the run() function to
         # exit. This is the only way to guarantee that the hub itself
@@ -889,6 +936,33 @@ class Hub(WaitOperationsGreenlet):
                           thread to prevent them from halting the event loop.
                           """)
 
+    def _get_timer_wheel(self):
+        if self._timer_wheel is _NONE:
+            resolution = GEVENT_CONFIG.timeout_resolution
+            wheel = None
+            if resolution:
+                from gevent._timerwheel import TimerWheel
+                wheel = TimerWheel(self.loop, resolution)
+            self._timer_wheel = wheel
+        return self._timer_wheel
+
+    def _set_timer_wheel(self, value):
+        if self._timer_wheel is not _NONE and self._timer_wheel is not None:
+            self._timer_wheel.close()
+        self._timer_wheel = value
+
+    timer_wheel = property(_get_timer_wheel, _set_timer_wheel,
+                           doc="""
+                           The :class:`gevent._timerwheel.TimerWheel` used for
+                           coarse timeouts, or ``None`` if all timeouts are precise.
+
+                           This is created on first use according to
+                           :attr:`gevent.config.timeout_resolution
+                           <gevent._config.Config.timeout_resolution>`.
+
+                           .. versionadded:: NEXT
+                           """)
+
 
 set_default_hub_class(Hub)
 
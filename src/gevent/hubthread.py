@@ -0,0 +1,283 @@
+# Copyright (c) 2026 gevent contributors. See LICENSE for details.
+"""
+Running several hubs in one process, one per native thread.
+
+Each native thread that uses gevent gets its own hub and event loop.
+With the GIL, only one of them runs Python code at a time, so this
+mostly helps with blocking C calls; on a free-threaded ("no-GIL")
+build of CPython, the hubs run in parallel on different CPU cores.
+
+:class:`HubThread` starts a native thread running a hub and accepts
+work for it from any thread. :class:`HubThreadGroup` spreads work
+across several of them, and :class:`HubThreadServer` is a
+:class:`~gevent.server.StreamServer` that accepts connections in one
+hub and hands each to the next hub of a group.
+
+Objects that belong to a hub (sockets, events, locks, queues...) must
+only be used by greenlets running in that hub. The only things that
+cross between hubs here are the callables and arguments passed to
+:meth:`HubThread.spawn` and, for the server, plain file descriptors.
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+from collections import deque
+
+from _socket import close as _close_fd
+
+from gevent._threading import Lock
+from gevent._threading import start_new_thread
+from gevent.greenlet import Greenlet
+from gevent.hub import get_hub
+from gevent.server import StreamServer
+from gevent.socket import socket as GeventSocket
+
+__all__ = [
+    'HubThread',
+    'HubThreadGroup',
+    'HubThreadServer',
+]
+
+
+class HubThread(object):
+    """
+    A native thread running its own hub.
+
+    Work is given to it with :meth:`spawn`, which may be called from
+    any thread. The thread keeps running until :meth:`stop` is called.
+    """
+
+    #: The hub running in the thread, once it has started.
+    hub = None
+
+    def __init__(self, name=None):
+        self.name = name
+        # Only appending and popping from the left are used; deque
+        # does both atomically, with or without the GIL.
+        self._inbox = deque()
+        self._async = None
+        self._ready = None
+        self._finished = None
+        # Held while checking the state and sending to, or closing,
+        # the async watcher, so it's never used while another thread
+        # closes it.
+        self._lock = Lock()
+        self._stopping = False
+
+    def start(self):
+        """
+        Start the thread and wait for its hub to be ready.
+        """
+        if self._finished is not None:
+            raise RuntimeError('HubThread already started')
+        self._ready = Lock()
+        self._finished = Lock()
+        self._ready.acquire()
+        self._finished.acquire()
+        start_new_thread(self._run, ())
+        # Only a moment, so don't bother being cooperative.
+        with self._ready:
+            pass
+
+    def _run(self):
+        try:
+            hub = self.hub = get_hub()
+            if self.name:
+                hub.name = self.name
+            # Any number of sends between two iterations of the loop
+            # only call _drain once.
+            self._async = hub.loop.async_()
+            self._async.start(self._drain)
+            self._ready.release()
+            # Runs until _drain stops the async watcher and every
+            # greenlet spawned here has finished.
+            hub.join()
+            hub.destroy(destroy_loop=True)
+        finally:
+            self.hub = None
+            self._finished.release()
+
+    def _drain(self):
+        inbox = self._inbox
+        while inbox:
+            item = inbox.popleft()
+            if item is None:
+                with self._lock:
+                    self._async.stop()
+                    self._async.close()
+                    self._async = None
+                continue
+            Greenlet.spawn(item[0], *item[1])
+
+    def spawn(self, func, *args):
+        """
+        Run ``func(*args)`` in a new greenlet in this thread's hub.
+
+        This may be called from any thread, including greenlets in
+        other hubs. Exceptions are reported by this thread's hub.
+
+        :raises RuntimeError: If the thread hasn't been started, or
+            :meth:`stop` has been called.
+        """
+        with self._lock:
+            if self._stopping:
+                raise RuntimeError('HubThread stopped')
+            if self._async is None:
+                raise RuntimeError('HubThread not started')
+            self._inbox.append((func, args))
+            self._async.send()
+
+    def stop(self, timeout=None):
+        """
+        Let the greenlets already running or spawned in the thread
+        finish, then stop the thread.
+
+        This blocks the calling thread (not just the calling greenlet)
+        for up to *timeout* seconds waiting for that; it returns
+        whether the thread has stopped.
+        """
+        if self._finished is None:
+            return True
+        with self._lock:
+            if not self._stopping:
+                self._stopping = True
+                self._inbox.append(None)
+                self._async.send()
+        if self._finished.acquire(timeout=-1 if timeout is None else timeout):
+            self._finished.release()
+            return True
+        return False
+
+
+class HubThreadGroup(object):
+    """
+    A group of *size* :class:`HubThread` instances.
+
+    :meth:`spawn` passes each piece of work to the next thread in
+    turn.
+    """
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError('size must be positive: %r' % (size,))
+        self.threads = [HubThread('hubthread-%d' % i) for i in range(size)]
+        self._next = 0
+
+    def __len__(self):
+        return len(self.threads)
+
+    def start(self):
+        """Start all the threads."""
+        for thread in self.threads:
+            thread.start()
+
+    def spawn(self, func, *args):
+        """
+        Run ``func(*args)`` in a new greenlet in the next thread.
+
+        This may be called from any thread.
+        """
+        # Concurrent callers may occasionally pick the same thread;
+        # that's harmless.
+        index = self._next
+        self._next = (index + 1) % len(self.threads)
+        self.threads[index].spawn(func, *args)
+
+    def stop(self, timeout=None):
+        """
+        Stop all the threads, waiting up to *timeout* seconds for each.
+        Returns whether they all stopped.
+        """
+        stopped = True
+        for thread in self.threads:
+            stopped = thread.stop(timeout) and stopped
+        return stopped
+
+
+class HubThreadServer(StreamServer):
+    """
+    A :class:`~gevent.server.StreamServer` that accepts connections
+    in the current hub and handles each in the next thread of a
+    :class:`HubThreadGroup`.
+
+    :keyword hubs: Either a :class:`HubThreadGroup`, which the caller
+        must start and stop, or the number of threads in a group that
+        the server starts and stops along with itself (by default, the
+        number of CPUs).
+
+    The other arguments are as for
+    :class:`~gevent.server.StreamServer`, except that there is no
+    *spawn* argument: each connection is handled in a new greenlet
+    in one of the threads. The *handle* function and anything it
+    uses must be safe to call from any of those threads.
+    """
+
+    def __init__(self, listener, handle=None, hubs=None, backlog=None, **ssl_args):
+        if hubs is None:
+            hubs = os.cpu_count() or 1
+        if isinstance(hubs, HubThreadGroup):
+            self.hubs = hubs
+            self._own_hubs = False
+        else:
+            self.hubs = HubThreadGroup(hubs)
+            self._own_hubs = True
+        self._hubs_running = False
+        StreamServer.__init__(self, listener, handle=handle, backlog=backlog, spawn=None, **ssl_args)
+
+    def start(self):
+        if self._own_hubs and not self._hubs_running:
+            self.hubs.start()
+            self._hubs_running = True
+        StreamServer.start(self)
+
+    def stop(self, timeout=None):
+        """
+        Stop accepting connections. If the server started its own
+        threads, also wait (up to *timeout* seconds) for the connections
+        they are handling to finish and stop them.
+        """
+        StreamServer.stop(self, timeout)
+        if self._own_hubs and self._hubs_running:
+            if timeout is None:
+                timeout = self.stop_timeout
+            self.hubs.stop(timeout)
+            # Threads can't be restarted; have new ones ready in case
+            # the server is.
+            self.hubs = HubThreadGroup(len(self.hubs))
+            self._hubs_running = False
+
+    def init_socket(self):
+        StreamServer.init_socket(self)
+        self._socket_args = (self.socket.family, self.socket.type, self.socket.proto)
+
+    def do_read(self):
+        # Return the raw file descriptor; a socket object would
+        # belong to this hub.
+        sock = self.socket
+        try:
+            fd, address = sock._accept()
+        except BlockingIOError:
+            if not sock.timeout:
+                return
+            raise
+        return fd, address
+
+    def do_handle(self, fd, address): # pylint:disable=arguments-differ
+        self.connections_accepted += 1
+        self.hubs.spawn(self._handle_in_hub, self._handle, self._socket_args, fd, address)
+
+    def do_close(self, fd, *args):
+        # Only called for connections that never reached a thread.
+        _close_fd(fd)
+
+    @staticmethod
+    def _handle_in_hub(handle, socket_args, fd, address):
+        sock = GeventSocket(*socket_args, fileno=fd)
+        try:
+            handle(sock, address)
+        finally:
+            sock.close()
@@ -59,7 +59,8 @@ __all__ = ['get_version',
            'recommended_backends',
            'embeddable_backends',
            'time',
-           'loop']
+           'loop',
+           'iouring_loop']
 
 
 cdef extern from "callbacks.h":
@@ -260,6 +261,16 @@ cpdef _events_to_str(int events):
     return '|'.join(result)
 
 
+cpdef unsigned int _iouring_flags(object flags) except *:
+    # See corecffi.py for the rationale.
+    cdef unsigned int c_flags = _flags_to_int(flags)
+    if c_flags & libev.EVBACKEND_MASK:
+        return c_flags
+    if libev.ev_supported_backends() & libev.EVBACKEND_IOURING:
+        c_flags |= libev.EVBACKEND_IOURING | libev.ev_recommended_backends()
+    return c_flags
+
+
 def supported_backends():
     return _flags_to_list(libev.ev_supported_backends())
 
@@ -816,6 +827,24 @@ cdef public class loop [object PyGeventLoopObject, type PyGeventLoop_Type]:
         raise AttributeError("sigfd")
 
 
+class iouring_loop(loop):
+    """
+    A :class:`loop` that prefers libev's Linux io_uring backend.
+
+    If no backend is given in *flags*, the io_uring backend is used
+    when the running kernel supports it, falling back to the
+    recommended backends otherwise.
+
+    .. versionadded:: NEXT
+    """
+
+    # The backend is chosen in loop.__cinit__, which receives the
+    # arguments given to __new__, so that's where we have to
+    # substitute the flags.
+    def __new__(cls, flags=None, default=None, ptr=0):
+        return loop.__new__(cls, _iouring_flags(flags), default, ptr)
+
+
 from zope.interface import classImplements
 
 # XXX: This invokes the side-table lookup, we would
@@ -478,12 +478,24 @@ class loop(AbstractLoop):
 
     _prepare_ran_callbacks = False
 
+    # The number of queued watcher callbacks in the batch being run.
+    _pendingcnt = 0
+
+    @property
+    def pendingcnt(self):
+        # Watcher callbacks are queued while libuv runs, and we run
+        # them all together afterwards; while we do, this is how many
+        # there are (so, like libev, the number of watchers that
+        # became ready).
+        return self._pendingcnt
+
     def __run_queued_callbacks(self):
         if not self._queued_callbacks:
             return False
 
         cbs = self._queued_callbacks[:]
         del self._queued_callbacks[:]
+        self._pendingcnt = len(cbs)
 
         for watcher_ptr, arg in cbs:
             handle = watcher_ptr.data
@@ -509,6 +521,7 @@ class loop(AbstractLoop):
                             _callbacks.python_stop(handle_after_callback)
                     finally:
                         watcher_ptr.data = ffi.NULL
+        self._pendingcnt = 0
         return True
 
 
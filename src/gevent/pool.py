@@ -16,10 +16,19 @@ reached the limit, until there is a free slot.
 from __future__ import print_function, absolute_import, division
 
 
-from gevent.hub import GreenletExit, getcurrent, kill as _kill
+import sys
+
+from greenlet import greenlet as RawGreenlet
+
+from gevent.hub import GreenletExit, getcurrent, get_hub, kill as _kill
 from gevent.greenlet import joinall, Greenlet
+from gevent.greenlet import _start_all
+from gevent.greenlet import SpawnedLink
+from gevent.greenlet import SuccessSpawnedLink
+from gevent.greenlet import FailureSpawnedLink
 from gevent.queue import Full as QueueFull
 from gevent.timeout import Timeout
+from gevent.event import AsyncResult
 from gevent.event import Event
 from gevent.lock import Semaphore, DummySemaphore
 
@@ -27,10 +36,14 @@ from gevent._compat import izip
 from gevent._imap import IMap
 from gevent._imap import IMapUnordered
 
+# Not on PyPy.
+_getrefcount = getattr(sys, 'getrefcount', None)
+
 __all__ = [
     'Group',
     'Pool',
     'PoolFull',
+    'PooledTask',
 ]
 
 
@@ -393,6 +406,37 @@ class Group(GroupMappingMixin):
         self.start(greenlet)
         return greenlet
 
+    def spawn_many(self, func, iterable):
+        """
+        Begin a new greenlet running ``func(item)`` for each item in
+        *iterable*, and add them to the collection of greenlets this
+        group is monitoring.
+
+        This is equivalent to calling :meth:`spawn` for each item, but
+        faster when there are many: all the greenlets are started by
+        a single callback in the event loop (see
+        :meth:`gevent.Greenlet.spawn_many`).
+
+        :return: A list of the new greenlets.
+
+        .. versionadded:: NEXT
+        """
+        if not callable(func):
+            raise TypeError("function must be callable")
+        return self._spawn_batch(func, iterable)
+
+    def _spawn_batch(self, func, items):
+        greenlet_class = self.greenlet_class
+        greenlets = [greenlet_class(func, item) for item in items]
+        discard = self._discard
+        for greenlet in greenlets:
+            greenlet.rawlink(discard)
+        self.greenlets.update(greenlets)
+        if greenlets:
+            self._empty_event.clear()
+        _start_all(greenlets)
+        return greenlets
+
 #     def close(self):
 #         """Prevents any more tasks from being submitted to the pool"""
 #         self.add = RaiseException("This %s has been closed" % self.__class__.__name__)
@@ -517,9 +561,132 @@ class PoolFull(QueueFull):
     """
 
 
+class _Worker(RawGreenlet):
+    # The greenlet that runs the tasks of a pool that reuses them.
+
+    def throw(self, *args):
+        # Like a Greenlet, once we've finished, ignore exceptions
+        # thrown by a Timeout (say) that was never cancelled.
+        if not self.dead:
+            return RawGreenlet.throw(self, *args)
+        return None
+
+
+class PooledTask(AsyncResult):
+    """
+    The object returned by :meth:`Pool.spawn` for a pool that reuses
+    its greenlets.
+
+    It stands in for the :class:`~gevent.Greenlet` that would
+    otherwise have been spawned: it has the same :meth:`get`,
+    :meth:`join`, :meth:`kill`, :meth:`ready`, :meth:`successful`,
+    :meth:`rawlink` methods and :attr:`value`, :attr:`exception` and
+    :attr:`dead` attributes (those of :class:`~gevent.event.AsyncResult`,
+    plus a few, including :meth:`link`), with the same meanings.
+
+    .. versionadded:: NEXT
+    """
+
+    __slots__ = (
+        'func',
+        'args',
+        'kwargs',
+        '_worker',
+    )
+
+    def __init__(self, func, args, kwargs):
+        AsyncResult.__init__(self)
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        # The raw greenlet running us, while we run.
+        self._worker = None
+
+    def __repr__(self):
+        return '<%s at 0x%x: %s>' % (type(self).__name__, id(self), self.func)
+
+    @property
+    def dead(self):
+        """Whether the task has finished, or was killed before it started."""
+        return bool(self.ready())
+
+    def join(self, timeout=None):
+        """Wait until the task finishes or *timeout* expires."""
+        self.wait(timeout)
+
+    def link(self, callback, SpawnedLink=SpawnedLink):
+        """As for :meth:`gevent.Greenlet.link`."""
+        self.rawlink(SpawnedLink(callback))
+
+    def link_value(self, callback, SpawnedLink=SuccessSpawnedLink):
+        """As for :meth:`gevent.Greenlet.link_value`."""
+        self.link(callback, SpawnedLink=SpawnedLink)
+
+    def link_exception(self, callback, SpawnedLink=FailureSpawnedLink):
+        """As for :meth:`gevent.Greenlet.link_exception`."""
+        self.link(callback, SpawnedLink=SpawnedLink)
+
+    def kill(self, exception=GreenletExit, block=True, timeout=None):
+        """
+        Raise *exception* in the task, as :meth:`gevent.Greenlet.kill`
+        does. A task that hasn't started yet never runs.
+        """
+        if self.ready():
+            return
+        if self._worker is None:
+            # Not started; the worker skips tasks that are finished.
+            if not isinstance(exception, BaseException):
+                exception = exception()
+            self._finish(None, (type(exception), exception, None))
+        else:
+            get_hub().loop.run_callback(self._throw, exception)
+        if block:
+            self.join(timeout)
+
+    def _throw(self, exception):
+        # In the hub. The worker may have moved on since.
+        worker = self._worker
+        if worker is not None and not self.ready():
+            worker.throw(exception)
+
+    def _run(self):
+        func = self.func
+        args = self.args
+        kwargs = self.kwargs
+        try:
+            result = func(*args, **kwargs) if kwargs else func(*args)
+        except: # pylint:disable=bare-except
+            self._finish(None, sys.exc_info())
+        else:
+            self._finish(result, None)
+
+    def _finish(self, result, exc_info):
+        self._worker = None
+        if exc_info is None:
+            self.set(result)
+        elif isinstance(exc_info[1], GreenletExit):
+            # Like a Greenlet, killing isn't a failure.
+            self.set(exc_info[1])
+        else:
+            self.set_exception(exc_info[1], exc_info if exc_info[2] is not None else None)
+            if exc_info[2] is not None:
+                try:
+                    get_hub().handle_error(self, *exc_info)
+                except: # pylint:disable=bare-except
+                    # Reporting it failed (stderr is broken?); that
+                    # mustn't cost the pool its worker.
+                    pass
+        # Don't keep them alive.
+        self.args = self.kwargs = None
+
+
 class Pool(Group):
 
-    def __init__(self, size=None, greenlet_class=None):
+    #: When reusing greenlets, the most idle greenlets to keep for
+    #: later tasks.
+    max_idle_greenlets = 100
+
+    def __init__(self, size=None, greenlet_class=None, reuse_greenlets=False):
         """
         Create a new pool.
 
@@ -542,9 +709,36 @@ class Pool(Group):
               to spawn in this pool will block forever. This is only useful
               if an application uses :meth:`wait_available` with a timeout and checks
               :meth:`free_count` before attempting to spawn.
+
+        :keyword bool reuse_greenlets: If true, :meth:`spawn` doesn't
+            create a new :class:`~gevent.Greenlet` for each call.
+            Instead, each function runs in a raw greenlet that, when
+            the function returns, waits to run the next one spawned;
+            :meth:`spawn` returns a :class:`PooledTask`. This makes
+            spawning many short tasks considerably cheaper, but the
+            function doesn't run in a ``Greenlet`` of its own:
+            :func:`gevent.getcurrent` returns the shared greenlet, and
+            anything attached to it, such as :class:`gevent.local.local`
+            values or :mod:`contextvars`, carries over from one task to
+            the next. Greenlets passed to :meth:`add` or :meth:`start`
+            are unaffected.
+
+            A task can also leave behind something that would wake
+            the greenlet later, such as a :class:`~gevent.Timeout` it
+            started but never cancelled. That wake-up would then
+            interrupt whatever task the greenlet was running. To
+            prevent that, a greenlet that anything still refers to
+            doesn't take another task; a new greenlet runs the task
+            instead. On PyPy, which can't tell, tasks must cancel
+            everything they start.
+
+        .. versionchanged:: NEXT
+           Add the *reuse_greenlets* parameter.
         """
         if size is not None and size < 0:
             raise ValueError('size must not be negative: %r' % (size, ))
+        if reuse_greenlets and greenlet_class is not None:
+            raise ValueError('reuse_greenlets cannot be used with greenlet_class')
         Group.__init__(self)
         self.size = size
         if greenlet_class is not None:
@@ -554,6 +748,9 @@ class Pool(Group):
         else:
             factory = Semaphore
         self._semaphore = factory(size)
+        self.reuse_greenlets = reuse_greenlets
+        # Raw greenlets waiting for a task.
+        self._idle = []
 
     def wait_available(self, timeout=None):
         """
@@ -649,6 +846,120 @@ class Pool(Group):
         Group._discard(self, greenlet)
         self._semaphore.release()
 
+    def spawn(self, *args, **kwargs): # pylint:disable=arguments-differ
+        """
+        Begin a new greenlet with the given arguments (which are passed
+        to the greenlet constructor) and add it to the collection of greenlets
+        this group is monitoring, blocking until there is room for it.
+
+        :return: The newly started greenlet or, if this pool reuses
+            greenlets, a :class:`PooledTask`.
+        """
+        if not self.reuse_greenlets:
+            return Group.spawn(self, *args, **kwargs)
+
+        func = args[0]
+        if not callable(func):
+            raise TypeError("function must be callable")
+        task = PooledTask(func, args[1:], kwargs)
+        if not self._semaphore.acquire():
+            raise PoolFull() # pragma: no cover
+        # Unlike a Greenlet, we're not linked to the task; the worker
+        # discards it when it's done.
+        self.greenlets.add(task)
+        self._empty_event.clear()
+
+        hub = get_hub()
+        if self._idle:
+            worker = self._idle.pop()
+        else:
+            worker = _Worker(self._run_worker, hub)
+        hub.loop.run_callback(worker.switch, task)
+        return task
+
+    def spawn_many(self, func, iterable):
+        """
+        Like :meth:`Group.spawn_many`, but blocking as needed until
+        there's room in the pool for each greenlet. Each time it
+        blocks, the greenlets that fit are started together.
+        """
+        if not callable(func):
+            raise TypeError("function must be callable")
+        if self.reuse_greenlets:
+            return [self.spawn(func, item) for item in iterable]
+
+        result = []
+        semaphore = self._semaphore
+        items = iter(iterable)
+        for item in items:
+            # Wait for room for one, then take all the room there is.
+            semaphore.acquire()
+            batch = [item]
+            while semaphore.acquire(blocking=False):
+                try:
+                    batch.append(next(items))
+                except StopIteration:
+                    semaphore.release()
+                    break
+                except:
+                    # Give back the room for this batch, and the
+                    # room we just took.
+                    for _ in range(len(batch) + 1):
+                        semaphore.release()
+                    raise
+            try:
+                result.extend(self._spawn_batch(func, batch))
+            except:
+                for _ in batch:
+                    semaphore.release()
+                raise
+        return result
+
+    def _run_worker(self, task):
+        # The body of a reused greenlet, switched to by the hub with
+        # each task to run.
+        current = getcurrent()
+        hub = current.parent
+        idle = self._idle
+        # How many references there are to us when we're handed a
+        # task. Any more when we're handed a later one means something
+        # left over from an earlier task (a Timeout that was never
+        # cancelled, a callback) holds us, and could wake us in the
+        # middle of that task.
+        refs = _getrefcount(current) if _getrefcount is not None else None
+        while True:
+            if not task.ready():
+                task._worker = current
+                current._pooled_task = task
+                task._run()
+                current._pooled_task = None
+            if task in self.greenlets:
+                self._discard(task)
+
+            if len(idle) >= self.max_idle_greenlets:
+                return
+            idle.append(current)
+            try:
+                task = hub.switch()
+            except: # pylint:disable=bare-except
+                # Something left over from a previous task (say, a
+                # timer that was never cancelled) woke us up.
+                task = None
+            if type(task) is not PooledTask: # pylint:disable=unidiomatic-typecheck
+                if current in idle:
+                    idle.remove(current)
+                return
+            if refs is not None and _getrefcount(current) > refs:
+                # A new greenlet runs it instead. Once we've finished,
+                # anything that wakes us is ignored, as it would be
+                # for a Greenlet that had finished.
+                hub.loop.run_callback(_Worker(self._run_worker, hub).switch, task)
+                return
+
+    def _apply_immediately(self):
+        current = getcurrent()
+        return current in self or getattr(current, '_pooled_task', None) in self
+
 
 class pass_value(object):
     __slots__ = ['callback']
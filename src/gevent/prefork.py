@@ -0,0 +1,345 @@
+# Copyright (c) 2026 gevent contributors. See LICENSE for details.
+"""
+Running a server in several pre-forked processes.
+
+A gevent hub only uses one CPU core. To use more, a server can be run
+in several worker processes, each with its own hub, all accepting
+connections on the same address. :class:`PreforkRunner` starts those
+processes, restarts any that die, and replaces them one at a time
+when asked to reload.
+
+For example::
+
+    from gevent.prefork import PreforkRunner
+    from gevent.pywsgi import WSGIServer
+
+    def make_server(listener):
+        return WSGIServer(listener, application, spawn=1000)
+
+    PreforkRunner(('', 8000), make_server, workers=4).serve_forever()
+
+Availability: POSIX.
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import signal
+import sys
+
+from gevent import os as gos
+from gevent.baseserver import parse_address
+from gevent.event import Event
+from gevent.hub import get_hub
+from gevent.hub import getcurrent
+from gevent.hub import signal as signal_handler
+from gevent.hub import sleep
+from gevent.queue import Empty
+from gevent.queue import Queue
+from gevent.server import _tcp_listener
+from gevent.server import DEFAULT_REUSE_ADDR
+from gevent.server import SO_REUSEPORT
+from gevent.timeout import Timeout
+
+__all__ = [
+    'PreforkRunner',
+]
+
+
+class _Worker(object):
+    # The parent's record of one worker process.
+
+    def __init__(self, pid):
+        self.pid = pid
+        # Set by the child watcher when the process has exited.
+        self.exited = Event()
+        # True once we've asked it to stop.
+        self.retiring = False
+
+
+class PreforkRunner(object):
+    """
+    Run a server in *workers* processes sharing one listening address.
+
+    :param listener: The address to listen on, as for
+        :class:`~gevent.server.StreamServer`, or a bound and listening
+        socket to share with the workers.
+    :param server_factory: A callable that is called in each worker
+        process with that worker's listening socket and returns an
+        (unstarted) server, such as a
+        :class:`~gevent.pywsgi.WSGIServer`. Because this runs in the
+        worker, it is also the place for any per-process
+        initialization.
+    :keyword int workers: The number of worker processes. Defaults to
+        the number of CPUs.
+    :keyword bool reuse_port: If true, each worker binds its own
+        listening socket with ``SO_REUSEPORT`` and the kernel
+        distributes new connections between them. Otherwise (the
+        default) the parent creates one listening socket and the
+        workers inherit it and compete to accept from it; set
+        :attr:`~gevent.baseserver.BaseServer.max_accept` low on the
+        server in that case (for a ``WSGIServer``, passing an
+        environment with ``wsgi.multiprocess`` set does that).
+    :keyword int backlog: The listen backlog; defaults to that of
+        :class:`~gevent.server.StreamServer`.
+
+    The parent process should do nothing but supervise the workers,
+    by calling :meth:`serve_forever` from its main greenlet. (As
+    always with ``fork()``, any other greenlets it was running would
+    carry on running in each worker too.) While :meth:`serve_forever`
+    is running, ``SIGHUP`` triggers :meth:`reload` and ``SIGTERM`` or
+    ``SIGINT`` :meth:`stop`.
+
+    Workers stop gracefully when sent ``SIGTERM``: they stop
+    accepting, call the server's ``stop()`` method, and let
+    connections that are still being handled finish for up to
+    :attr:`graceful_timeout` seconds before exiting.
+    """
+
+    #: How long a stopping worker waits for its connections to finish.
+    graceful_timeout = 10
+
+    #: How long to wait for a new worker to start serving before
+    #: considering it failed.
+    worker_ready_timeout = 30
+
+    #: How long to wait before replacing a worker that died before it
+    #: started serving, so that a broken configuration doesn't turn
+    #: into a fork loop.
+    restart_delay = 1
+
+    _poll_interval = 1
+
+    def __init__(self, listener, server_factory, workers=None, reuse_port=False, backlog=None):
+        if not hasattr(gos, 'fork_and_watch'):
+            raise TypeError('PreforkRunner requires fork() and child watchers')
+        if reuse_port and SO_REUSEPORT is None:
+            raise ValueError('SO_REUSEPORT is not available on this platform')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError('workers must be a positive integer: %r' % (workers,))
+
+        self.server_factory = server_factory
+        self.workers = workers
+        self.reuse_port = reuse_port
+        if backlog is None:
+            from gevent.server import StreamServer
+            backlog = StreamServer.backlog
+        self.backlog = backlog
+
+        if hasattr(listener, 'accept'):
+            if reuse_port:
+                raise ValueError('reuse_port cannot be used with a socket')
+            self.socket = listener
+            self.family = listener.family
+        else:
+            self.family, address = parse_address(listener)
+            # With SO_REUSEPORT this socket only reserves the address
+            # (resolving port 0); the kernel only hands connections
+            # to sockets that are listening.
+            self.socket = _tcp_listener(address, backlog=backlog,
+                                        reuse_addr=DEFAULT_REUSE_ADDR,
+                                        family=self.family,
+                                        reuse_port=reuse_port,
+                                        listen=not reuse_port)
+        #: The address the workers listen on.
+        self.address = self.socket.getsockname()
+
+        self._workers = {} # {pid: _Worker}
+        self._commands = Queue()
+        self._signal_watchers = ()
+
+    @property
+    def worker_pids(self):
+        """The process IDs of the current workers."""
+        return [pid for pid, worker in self._workers.items() if not worker.retiring]
+
+    def serve_forever(self):
+        """
+        Start the workers and supervise them until :meth:`stop` is called.
+
+        Raises :exc:`RuntimeError` if the first workers can't be started.
+        """
+        self._signal_watchers = [
+            signal_handler(signal.SIGHUP, self.reload),
+            signal_handler(signal.SIGTERM, self.stop),
+            signal_handler(signal.SIGINT, self.stop),
+        ]
+        try:
+            self._run()
+        finally:
+            self._cancel_signals()
+
+    def reload(self):
+        """
+        Replace the workers one at a time with new ones, each new
+        worker being started before the old one is told to stop.
+        """
+        self._commands.put(('reload',))
+
+    def stop(self):
+        """
+        Stop all the workers gracefully and make :meth:`serve_forever` return.
+        """
+        self._commands.put(('stop',))
+
+    def close(self):
+        """Close the listening socket in this process."""
+        self.socket.close()
+
+    def _cancel_signals(self):
+        for watcher in self._signal_watchers:
+            watcher.cancel()
+        self._signal_watchers = ()
+
+    # The parent. Everything happens in the greenlet that called
+    # serve_forever(), which is also where each new worker starts out;
+    # anything waiting in another greenlet would wake up in the worker.
+
+    def _run(self):
+        try:
+            for _ in range(self.workers):
+                if self._spawn_worker() is None:
+                    raise RuntimeError('Worker failed to start')
+            while True:
+                try:
+                    # Neither signal nor child watchers keep the loop
+                    # running, so don't wait without a timeout.
+                    command = self._commands.get(timeout=self._poll_interval)
+                except Empty:
+                    continue
+                if command[0] == 'stop':
+                    break
+                if command[0] == 'reload':
+                    self._reload()
+                elif command[0] == 'exited':
+                    self._replace(command[1])
+        finally:
+            self._stop_workers()
+
+    def _spawn_worker(self):
+        # Returns the new _Worker, or None if it didn't start serving.
+        ready_r, ready_w = os.pipe()
+        try:
+            pid = gos.fork_and_watch(self._on_worker_exit)
+        except:
+            os.close(ready_r)
+            os.close(ready_w)
+            raise
+        if not pid:
+            os.close(ready_r)
+            self._run_worker(ready_w)
+            # Not reached.
+        os.close(ready_w)
+        worker = self._workers[pid] = _Worker(pid)
+        try:
+            gos.make_nonblocking(ready_r)
+            with Timeout(self.worker_ready_timeout, False):
+                if gos.nb_read(ready_r, 1):
+                    return worker
+        finally:
+            os.close(ready_r)
+        # Exited (closing the pipe) or hung before it started serving.
+        self._kill(worker, signal.SIGKILL)
+        return None
+
+    def _on_worker_exit(self, watcher):
+        # In the hub.
+        worker = self._workers.pop(watcher.pid, None)
+        if worker is None:
+            return
+        worker.exited.set()
+        if not worker.retiring:
+            self._commands.put(('exited', worker.pid))
+
+    def _replace(self, _pid):
+        if self._spawn_worker() is None:
+            # Try again later, after handling anything else queued.
+            sleep(self.restart_delay)
+            self._commands.put(('exited', None))
+
+    def _reload(self):
+        for worker in list(self._workers.values()):
+            if worker.retiring:
+                continue
+            if self._spawn_worker() is None:
+                # Keep the old one; the new code doesn't work.
+                break
+            self._retire(worker)
+
+    def _retire(self, worker):
+        self._kill(worker, signal.SIGTERM)
+        # Leave a little extra time for the worker to exit.
+        if not worker.exited.wait(self.graceful_timeout + 1):
+            self._kill(worker, signal.SIGKILL)
+            worker.exited.wait(self.graceful_timeout)
+
+    def _kill(self, worker, signum):
+        worker.retiring = True
+        try:
+            os.kill(worker.pid, signum)
+        except OSError:
+            # Already gone.
+            pass
+
+    def _stop_workers(self):
+        workers = list(self._workers.values())
+        for worker in workers:
+            self._kill(worker, signal.SIGTERM)
+        for worker in workers:
+            if not worker.exited.wait(self.graceful_timeout + 1):
+                self._kill(worker, signal.SIGKILL)
+                worker.exited.wait(1)
+
+    # The worker.
+
+    def _run_worker(self, ready_w):
+        status = 1
+        try:
+            # Inherited from the parent; the parent handles these.
+            self._cancel_signals()
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            status = self._serve_in_worker(ready_w)
+        except SystemExit as ex:
+            status = ex.code if isinstance(ex.code, int) else 1
+        except:
+            get_hub().print_exception(self, *sys.exc_info())
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(status)
+
+    def _serve_in_worker(self, ready_w):
+        if self.reuse_port:
+            parent_socket = self.socket
+            self.socket = _tcp_listener(self.address, backlog=self.backlog,
+                                        reuse_addr=DEFAULT_REUSE_ADDR,
+                                        family=self.family,
+                                        reuse_port=True)
+            parent_socket.close()
+        server = self.server_factory(self.socket)
+        server.start()
+        os.write(ready_w, b'1')
+        os.close(ready_w)
+
+        # Closing makes serve_forever() return after stopping the
+        # server, which waits for its pool (if any).
+        watcher = signal_handler(signal.SIGTERM, server.close)
+        try:
+            server.serve_forever(stop_timeout=self.graceful_timeout)
+        finally:
+            watcher.cancel()
+        hub = get_hub()
+        if getcurrent() is hub.parent:
+            # Without a pool, stopping the server doesn't wait for the
+            # connections it was handling; wait for everything else
+            # to finish. (Only the main greenlet can do this.)
+            hub.join(timeout=self.graceful_timeout)
+        return 0
@@ -35,6 +35,8 @@ from __future__ import absolute_import
 
 import errno
 from io import BytesIO
+import os
+import stat
 import string
 import sys
 import time
@@ -48,6 +50,9 @@ import gevent
 from gevent.server import StreamServer
 from gevent.hub import GreenletExit
 from gevent._compat import reraise
+from gevent._http_parser import parse_request_line
+from gevent._http_parser import read_headers
+from gevent._http_parser import environ_headers
 
 from functools import partial
 unquote_latin1 = partial(unquote, encoding='latin-1')
@@ -61,6 +66,7 @@ __all__ = [
     'Environ',
     'SecureEnviron',
     'WSGISecureEnviron',
+    'FileWrapper',
 ]
 
 
@@ -117,6 +123,12 @@ _ERRORS[400] = (_BAD_REQUEST_STATUS, _BAD_REQUEST_HEADERS, _BAD_REQUEST_BODY)
 _REQUEST_TOO_LONG_RESPONSE = b"HTTP/1.1 414 Request URI Too Long\r\nConnection: close\r\nContent-length: 0\r\n\r\n"
 _BAD_REQUEST_RESPONSE = b"HTTP/1.1 400 Bad Request\r\nConnection: close\r\nContent-length: 0\r\n\r\n"
 _CONTINUE_RESPONSE = b"HTTP/1.1 100 Continue\r\n\r\n"
+_SERVICE_UNAVAILABLE_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Connection: close\r\n"
+    b"Retry-After: 1\r\n"
+    b"Content-length: 0\r\n\r\n"
+)
 
 
 def format_date_time(timestamp):
@@ -129,6 +141,37 @@ def format_date_time(timestamp):
     return value
 
 
+# (int(timestamp), format_date_time(timestamp)) for the second in
+# which a response was last started. Responses in the same second
+# share the value. It's only ever replaced as a whole, so it's safe to
+# share between threads.
+_date_cache = (0, b'')
+
+def _current_date():
+    global _date_cache # pylint:disable=global-statement
+    second = int(time.time())
+    cached = _date_cache
+    if cached[0] == second:
+        return cached[1]
+    value = format_date_time(second)
+    _date_cache = (second, value)
+    return value
+
+
+# Caches of encoded values for start_response and _write_with_headers.
+# The keys are provided by the application, which may build them
+# from client input, so they're limited in size. Entries are only
+# added for values that passed validation.
+
+_MAX_CACHED = 500
+# native status string -> (latin-1 status, integer code)
+_status_cache = {}
+# latin-1 status -> b'HTTP/1.1 <status>\r\n'
+_status_line_cache = {}
+# native header name -> (latin-1 name, lower-case native name)
+_header_name_cache = {}
+
+
 class _InvalidClientInput(IOError):
     # Internal exception raised by Input indicating that the client
     # sent invalid data at the lowest level of the stream. The result
@@ -485,13 +528,48 @@ except ImportError:
 
     def headers_factory(fp, *args): # pylint:disable=unused-argument
         try:
-            ret = client.parse_headers(fp, _class=OldMessage)
+            # Equivalent to client.parse_headers(fp, _class=OldMessage)
+            ret = read_headers(fp, OldMessage)
         except client.LineTooLong:
             ret = OldMessage()
             ret.status = 'Line too long'
         return ret
 
 
+class FileWrapper(object):
+    """
+    The ``wsgi.file_wrapper`` provided to applications.
+
+    Iterating this object reads *filelike* in blocks of *blksize*
+    bytes, as described in :pep:`3333`. But when an application returns
+    one of these for a regular file (one with a ``fileno``), the handler
+    instead sends the rest of the file straight from the kernel with
+    :func:`os.sendfile`, where that's available and the connection
+    isn't encrypted.
+
+    .. versionadded:: NEXT
+    """
+
+    def __init__(self, filelike, blksize=8192):
+        self.filelike = filelike
+        self.blksize = blksize
+        close = getattr(filelike, 'close', None)
+        if close is not None:
+            self.close = close
+
+    def __iter__(self):
+        read = self.filelike.read
+        blksize = self.blksize
+        while True:
+            data = read(blksize)
+            if not data:
+                break
+            yield data
+
+    def close(self): # pylint:disable=method-hidden
+        "Does nothing; replaced by the close method of *filelike*, if it has one."
+
+
 class WSGIHandler(object):
     """
     Handles HTTP requests from a socket, creates the WSGI environment, and
@@ -511,6 +589,23 @@ class WSGIHandler(object):
 
     protocol_version = 'HTTP/1.1'
 
+    #: When a client pipelines requests (sends another request
+    #: before it has read the response to the previous one), the
+    #: responses to requests that were already waiting are collected
+    #: and sent together, in one system call, instead of one at a
+    #: time. This is the most that is collected before sending. Set
+    #: it to 0 to send every response as it is produced.
+    #:
+    #: Only responses to requests without a body are collected, and
+    #: only those known to be short (the application returned a
+    #: list, or set a small ``Content-Length``); any other response
+    #: is sent as it is produced. Collecting stops as soon as no
+    #: further request has been received, so responses are never
+    #: delayed waiting for the client.
+    #:
+    #: .. versionadded:: NEXT
+    pipeline_buffer_size = 65536
+
     def MessageClass(self, *args):
         return headers_factory(*args)
 
@@ -546,6 +641,7 @@ class WSGIHandler(object):
     request_version = None # str: 'HTTP 1.1'
     command = None # str: 'GET'
     path = None # str: '/'
+    _pipeline_output = None # bytearray: collected responses to pipelined requests
 
     def __init__(self, sock, address, server, rfile=None):
         # Deprecation: The rfile kwarg was introduced in 1.0a1 as part
@@ -582,6 +678,7 @@ class WSGIHandler(object):
                     continue
 
                 self.status, response_body = result # pylint:disable=unpacking-non-sequence
+                self._flush_pipeline_output()
                 self.socket.sendall(response_body)
                 if self.time_finish == 0:
                     self.time_finish = time.time()
@@ -589,6 +686,10 @@ class WSGIHandler(object):
                 break
         finally:
             if self.socket is not None:
+                try:
+                    self._flush_pipeline_output()
+                except socket.error:
+                    pass
                 _sock = getattr(self.socket, '_sock', None) # Python 3
                 try:
                     # read out request data to prevent error: [Errno 104] Connection reset by peer
@@ -638,20 +739,25 @@ class WSGIHandler(object):
         """
         # pylint:disable=too-many-branches
         self.requestline = raw_requestline.rstrip()
-        words = self.requestline.split()
-        if len(words) == 3:
+        words = parse_request_line(self.requestline)
+        if words is not None:
+            # An ordinary HTTP/1.0 or HTTP/1.1 request.
             self.command, self.path, self.request_version = words
-            if not self._check_http_version():
-                raise _InvalidClientRequest('Invalid http version: %r' % (raw_requestline,))
-        elif len(words) == 2:
-            self.command, self.path = words
-            if self.command != "GET":
-                raise _InvalidClientRequest('Expected GET method; Got command=%r; path=%r; raw=%r' % (
-                    self.command, self.path, raw_requestline,))
-            self.request_version = "HTTP/0.9"
-            # QQQ I'm pretty sure we can drop support for HTTP/0.9
         else:
-            raise _InvalidClientRequest('Invalid HTTP method: %r' % (raw_requestline,))
+            words = self.requestline.split()
+            if len(words) == 3:
+                self.command, self.path, self.request_version = words
+                if not self._check_http_version():
+                    raise _InvalidClientRequest('Invalid http version: %r' % (raw_requestline,))
+            elif len(words) == 2:
+                self.command, self.path = words
+                if self.command != "GET":
+                    raise _InvalidClientRequest('Expected GET method; Got command=%r; path=%r; raw=%r' % (
+                        self.command, self.path, raw_requestline,))
+                self.request_version = "HTTP/0.9"
+                # QQQ I'm pretty sure we can drop support for HTTP/0.9
+            else:
+                raise _InvalidClientRequest('Invalid HTTP method: %r' % (raw_requestline,))
 
         self.headers = self.MessageClass(self.rfile, 0)
 
@@ -805,7 +911,10 @@ class WSGIHandler(object):
         self.environ = self.get_environ()
         self.application = self.server.application
 
+        self._begin_pipelined_response()
         self.handle_one_response()
+        if self._pipeline_output is not None:
+            self._end_pipelined_response()
 
         if self.close_connection:
             return
@@ -815,6 +924,92 @@ class WSGIHandler(object):
 
         return True  # read more requests
 
+    def _next_request_received(self):
+        # Has the client already sent (the start of) another request?
+        # This is asked after every request without a body, so it
+        # must never wait for one. peek() returns what rfile has
+        # buffered, or, if nothing is, reads from the socket; with
+        # the socket's timeout at zero, that read returns what has
+        # arrived, or nothing, at once. (Pipelined requests usually
+        # arrive together, so they're already buffered.)
+        rfile = self.rfile
+        sock = self.socket
+        peek = getattr(rfile, 'peek', None)
+        if peek is None or rfile.closed:
+            return False
+        try:
+            timeout = sock.gettimeout()
+            sock.settimeout(0.0)
+        except (AttributeError, socket.error):
+            return False
+        try:
+            return bool(peek(1))
+        except (ValueError, socket.error):
+            # I/O on closed file, or a socket error that reading the
+            # next request will report.
+            return False
+        finally:
+            sock.settimeout(timeout)
+
+    def _begin_pipelined_response(self):
+        # Decide whether to collect the response to this request with
+        # the others in _pipeline_output, or send it as it is produced.
+        # We only collect while requests are already waiting, and only
+        # for requests without a body: reading a body may block
+        # waiting on the client, and, for Expect: 100-continue, would
+        # write to the socket directly. An upgraded connection is
+        # handed to the application, which must find the response
+        # already sent.
+        if (self.pipeline_buffer_size > 0
+                and not self.content_length
+                and 'HTTP_TRANSFER_ENCODING' not in self.environ
+                and self.environ['wsgi.input_terminated']
+                and not self._connection_upgrade_requested()
+                and (self._pipeline_output is not None or self._next_request_received())):
+            if self._pipeline_output is None:
+                self._pipeline_output = bytearray()
+        elif self._pipeline_output is not None:
+            self._end_pipelined_response(flush=True)
+
+    def _end_pipelined_response(self, flush=False):
+        # Send the collected responses unless we're going to add the
+        # response to another request that's already been received.
+        if (flush
+                or self.close_connection
+                or len(self._pipeline_output) >= self.pipeline_buffer_size
+                or not self._next_request_received()):
+            try:
+                self._flush_pipeline_output()
+            except socket.error as ex:
+                # Like handle_one_response, for a response that has
+                # already been logged.
+                self.close_connection = True
+                if ex.args[0] not in self.ignored_socket_errors:
+                    self.handle_error(*sys.exc_info())
+
+    def _flush_pipeline_output(self):
+        output = self._pipeline_output
+        if output is not None:
+            self._pipeline_output = None
+            if output:
+                self.socket.sendall(output)
+
+    def _pipelined_response_complete(self):
+        # Can the response we're starting be collected whole? Only if
+        # we know it's short: its body is already at hand (the result
+        # is a list, say), or it has a small Content-Length. Anything
+        # else, such as a stream of events, could be produced slowly,
+        # and must reach the client as it is.
+        if self.code == 101:
+            return False
+        if self.provided_content_length is not None:
+            try:
+                length = int(self.provided_content_length)
+            except ValueError:
+                return False
+            return 0 <= length < self.pipeline_buffer_size
+        return self.code in (204, 304) or hasattr(self.result, '__len__')
+
     def _connection_upgrade_requested(self):
         if self.headers.get('Connection', '').lower() == 'upgrade':
             return True
@@ -824,7 +1019,7 @@ class WSGIHandler(object):
 
     def finalize_headers(self):
         if self.provided_date is None:
-            self.response_headers.append((b'Date', format_date_time(time.time())))
+            self.response_headers.append((b'Date', _current_date()))
 
         self.connection_upgraded = self.code == 101
 
@@ -844,7 +1039,10 @@ class WSGIHandler(object):
                     if self.response_use_chunked:
                         self.response_headers.append((b'Transfer-Encoding', b'chunked'))
 
-    def _sendall(self, data):
+    def _sendall(self, data, flush=False):
+        if self._pipeline_output is not None:
+            self._sendall_buffers((data,), flush)
+            return
         try:
             self.socket.sendall(data)
         except socket.error as ex:
@@ -854,23 +1052,58 @@ class WSGIHandler(object):
             raise
         self.response_length += len(data)
 
-    def _write(self, data,
-               _bytearray=bytearray):
+    def _sendall_buffers(self, buffers, flush=False):
+        output = self._pipeline_output
+        if output is not None:
+            # Copy the data now: the application is allowed to reuse
+            # its buffers once we return.
+            for data in buffers:
+                output += data
+            self.response_length += sum(len(data) for data in buffers)
+            if len(output) < self.pipeline_buffer_size and not flush:
+                return
+            # Don't let a large (or unknown) response pile up. Send
+            # what we have, and the rest of this response as it is
+            # produced.
+            self._pipeline_output = None
+            try:
+                self.socket.sendall(output)
+            except socket.error as ex:
+                self.status = 'socket error: %s' % ex
+                if self.code > 0:
+                    self.code = -self.code
+                raise
+            return
+
+        sendall_buffers = getattr(self.socket, 'sendall_buffers', None)
+        try:
+            if sendall_buffers is not None:
+                sendall_buffers(buffers)
+            else:
+                # Not a gevent socket.
+                self.socket.sendall(b''.join(buffers))
+        except socket.error as ex:
+            self.status = 'socket error: %s' % ex
+            if self.code > 0:
+                self.code = -self.code
+            raise
+        self.response_length += sum(len(data) for data in buffers)
+
+    def _body_buffers(self, data):
+        # The buffers to send for *data*, a chunk of the response body.
+        if self.response_use_chunked:
+            # The chunk header, the data, and the trailer.
+            return [b'%x\r\n' % len(data), data, b'\r\n']
+        return [data]
+
+    def _write(self, data):
         if not data:
             # The application/middleware are allowed to yield
             # empty bytestrings.
             return
 
         if self.response_use_chunked:
-            # Write the chunked encoding header
-            header_str = b'%x\r\n' % len(data)
-            towrite = _bytearray(header_str)
-
-            # data
-            towrite += data
-            # trailer
-            towrite += b'\r\n'
-            self._sendall(towrite)
+            self._sendall_buffers(self._body_buffers(data))
         else:
             self._sendall(data)
 
@@ -896,21 +1129,27 @@ class WSGIHandler(object):
         self.finalize_headers()
 
         # self.response_headers and self.status are already in latin-1, as encoded by self.start_response
-        towrite = bytearray(b'HTTP/1.1 ')
-        towrite += self.status
-        towrite += b'\r\n'
+        status_line = _status_line_cache.get(self.status)
+        if status_line is None:
+            status_line = b'HTTP/1.1 ' + self.status + b'\r\n'
+            if len(_status_line_cache) < _MAX_CACHED:
+                _status_line_cache[self.status] = status_line
+        parts = [status_line]
         for header, value in self.response_headers:
-            towrite += header
-            towrite += b': '
-            towrite += value
-            towrite += b"\r\n"
-
-        towrite += b'\r\n'
-        self._sendall(towrite)
-        # No need to copy the data into towrite; we may make an extra syscall
-        # but the copy time could be substantial too, and it reduces the chances
-        # of sendall being able to send everything in one go
-        self._write(data)
+            parts += (header, b': ', value, b'\r\n')
+        parts.append(b'\r\n')
+        towrite = b''.join(parts)
+        # If we're collecting, but can't collect this response, send
+        # it (with what's collected) as it's produced, from now on.
+        flush = self._pipeline_output is not None and not self._pipelined_response_complete()
+        if not data:
+            self._sendall(towrite, flush)
+            return
+        # Send the headers and the body together, in one system call
+        # where possible, without copying the data into towrite.
+        buffers = self._body_buffers(data)
+        buffers.insert(0, towrite)
+        self._sendall_buffers(buffers, flush)
 
     def start_response(self, status, headers, exc_info=None):
         """
@@ -945,16 +1184,28 @@ class WSGIHandler(object):
         # although we are allowed to do so if needed. This slightly increases memory usage.
         # We also check for HTTP Response Splitting vulnerabilities
         response_headers = []
+        provided_connection = None # Did the wsgi app give us a Connection header?
+        provided_date = None
+        provided_content_length = None
         header = None
         value = None
         try:
             for header, value in headers:
-                if not isinstance(header, str):
-                    raise UnicodeError("The header must be a native string", header, value)
-                if not isinstance(value, str):
+                # Most applications use the same few header names, so
+                # remember the ones we've already checked and encoded.
+                cached = _header_name_cache.get(header) if isinstance(header, str) else None
+                if cached is None:
+                    if not isinstance(header, str):
+                        raise UnicodeError("The header must be a native string", header, value)
+                    if not isinstance(value, str):
+                        raise UnicodeError("The value must be a native string", header, value)
+                    if '\r' in header or '\n' in header:
+                        raise ValueError('carriage return or newline in header name', header)
+                    cached = (header.encode("latin-1"), header.lower())
+                    if len(_header_name_cache) < _MAX_CACHED:
+                        _header_name_cache[header] = cached
+                elif not isinstance(value, str):
                     raise UnicodeError("The value must be a native string", header, value)
-                if '\r' in header or '\n' in header:
-                    raise ValueError('carriage return or newline in header name', header)
                 if '\r' in value or '\n' in value:
                     raise ValueError('carriage return or newline in header value', value)
                 # Either we're on Python 2, in which case bytes is correct, or
@@ -969,38 +1220,36 @@ class WSGIHandler(object):
                 # Note: Some Python 2 implementations, like Jython, may allow non-octet (above 255) values
                 # in their str implementation; this is mentioned in the WSGI spec, but we don't
                 # run on any platform like that so we can assume that a str value is pure bytes.
-                response_headers.append((header.encode("latin-1"),
-                                         value.encode("latin-1")))
+                response_headers.append((cached[0], value.encode("latin-1")))
+                lowered = cached[1]
+                if lowered == 'connection':
+                    provided_connection = value
+                elif lowered == 'date':
+                    provided_date = value
+                elif lowered == 'content-length':
+                    provided_content_length = value
         except UnicodeEncodeError:
             # If we get here, we're guaranteed to have a header and value
             raise UnicodeError("Non-latin1 header", repr(header), repr(value))
 
         # Same as above
-        if not isinstance(status, str):
-            raise UnicodeError("The status string must be a native string")
-        if '\r' in status or '\n' in status:
-            raise ValueError("carriage return or newline in status", status)
-        # don't assign to anything until the validation is complete, including parsing the
-        # code
-        code = int(status.split(' ', 1)[0])
-
-        self.status = status.encode("latin-1")
+        cached = _status_cache.get(status) if isinstance(status, str) else None
+        if cached is None:
+            if not isinstance(status, str):
+                raise UnicodeError("The status string must be a native string")
+            if '\r' in status or '\n' in status:
+                raise ValueError("carriage return or newline in status", status)
+            # don't assign to anything until the validation is complete, including parsing the
+            # code
+            cached = (status.encode("latin-1"), int(status.split(' ', 1)[0]))
+            if len(_status_cache) < _MAX_CACHED:
+                _status_cache[status] = cached
+
+        self.status, self.code = cached
         self._orig_status = status # Preserve the native string for logging
         self.response_headers = response_headers
-        self.code = code
-
-        provided_connection = None # Did the wsgi app give us a Connection header?
-        self.provided_date = None
-        self.provided_content_length = None
-
-        for header, value in headers:
-            header = header.lower()
-            if header == 'connection':
-                provided_connection = value
-            elif header == 'date':
-                self.provided_date = value
-            elif header == 'content-length':
-                self.provided_content_length = value
+        self.provided_date = provided_date
+        self.provided_content_length = provided_content_length
 
         if self.request_version == 'HTTP/1.0' and provided_connection is None:
             conntype = b'close' if self.close_connection else b'keep-alive'
@@ -1038,7 +1287,58 @@ class WSGIHandler(object):
             length,
             delta)
 
+    def _sendfile_result(self):
+        # If the result is a FileWrapper around a regular file, send the
+        # headers and then the file, letting the socket use
+        # os.sendfile(), and return True.
+        filelike = self.result.filelike
+        sendfile = getattr(self.socket, 'sendfile', None)
+        if sendfile is None or self.code in (101, 204, 304):
+            return False
+        try:
+            fileno = filelike.fileno()
+            offset = filelike.tell()
+            st = os.fstat(fileno)
+        except (AttributeError, OSError, ValueError):
+            # Includes io.UnsupportedOperation
+            return False
+        if not stat.S_ISREG(st.st_mode):
+            return False
+
+        count = max(st.st_size - offset, 0)
+        if self.provided_content_length is None:
+            # Otherwise we'd have to use chunking
+            self.provided_content_length = str(count)
+            self.response_headers.append((b'Content-Length', str(count).encode('latin-1')))
+        else:
+            try:
+                provided = int(self.provided_content_length)
+            except ValueError:
+                return False
+            if provided < 0:
+                # Leave it to the iteration path; we mustn't send the
+                # headers and then fail.
+                return False
+            count = min(provided, count)
+
+        self.write(b'')
+        if count:
+            try:
+                self._flush_pipeline_output()
+                sent = sendfile(filelike, offset, count)
+            except socket.error as ex:
+                self.status = 'socket error: %s' % ex
+                if self.code > 0:
+                    self.code = -self.code
+                raise
+            self.response_length += sent
+        return True
+
     def process_result(self):
+        if (isinstance(self.result, FileWrapper)
+                and self.status and not self.headers_sent
+                and self._sendfile_result()):
+            return
         for data in self.result:
             if data:
                 self.write(data)
@@ -1195,6 +1495,13 @@ class WSGIHandler(object):
         return ('400', _BAD_REQUEST_RESPONSE)
 
     def _headers(self):
+        if isinstance(self.headers, OldMessage):
+            # Parsed by headers_factory; we don't need to format
+            # and split each header line.
+            return environ_headers(self.headers._headers)
+        return self._header_lines()
+
+    def _header_lines(self):
         key = None
         value = None
         IGNORED_KEYS = (None, 'CONTENT_TYPE', 'CONTENT_LENGTH')
@@ -1285,6 +1592,8 @@ class WSGIHandler(object):
         self.wsgi_input = Input(self.rfile, self.content_length, socket=sock, chunked_input=chunked)
 
         env['wsgi.input'] = self.wsgi_input if handling_reads else self.rfile
+        if 'wsgi.file_wrapper' not in env:
+            env['wsgi.file_wrapper'] = FileWrapper
         # This is a non-standard flag indicating that our input stream is
         # self-terminated (returns EOF when consumed).
         # See https://github.com/gevent/gevent/issues/1308
@@ -1563,6 +1872,10 @@ class WSGIServer(StreamServer):
         ``error_log`` arguments.
     .. versionchanged:: 20.6.0
         Passing a ``handle`` kwarg to the constructor is now officially deprecated.
+    .. versionchanged:: NEXT
+        Connections shed by admission control (see
+        :attr:`~gevent.baseserver.BaseServer.max_concurrency`) get a
+        ``503 Service Unavailable`` response.
     """
 
     #: A callable taking three arguments: (socket, address, server) and returning
@@ -1703,6 +2016,30 @@ class WSGIServer(StreamServer):
         handler = self.handler_class(sock, address, self)
         handler.handle()
 
+    def do_shed(self, sock, address):
+        """
+        Send a ``503 Service Unavailable`` response, if that can be
+        done without blocking. Over HTTPS, the connection is just
+        closed; a TLS handshake is too much work for a rejection.
+
+        .. versionadded:: NEXT
+        """
+        # pylint:disable=arguments-differ
+        if self.ssl_enabled:
+            return
+        try:
+            sock.settimeout(0)
+            # Read what we can of the request first. Closing a socket
+            # with unread data makes the kernel reset the connection,
+            # and the client may never see the response.
+            try:
+                sock.recv(65536)
+            except (BlockingIOError, socket.timeout):
+                pass
+            sock.send(_SERVICE_UNAVAILABLE_RESPONSE)
+        except socket.error:
+            pass
+
 def _main():
     # Provisional main handler, for quick tests, not production
     # usage.
@@ -55,10 +55,11 @@ _Empty = Empty = __queue__.Empty
 from gevent.timeout import Timeout
 from gevent._hub_local import get_hub_noargs as get_hub
 from gevent.exceptions import InvalidSwitchError
+from gevent.exceptions import InvalidThreadUseError
 
 __all__ = []
 __implements__ = ['Queue', 'PriorityQueue', 'LifoQueue', 'SimpleQueue']
-__extensions__ = ['JoinableQueue', 'Channel']
+__extensions__ = ['JoinableQueue', 'Channel', 'ThreadSafeQueue', 'RingQueue']
 __imports__ = ['Empty', 'Full']
 
 if hasattr(__queue__, 'ShutDown'): # New in 3.13
@@ -86,6 +87,10 @@ def _safe_remove(deq, item):
     except ValueError:
         pass
 
+def _switch_all(waiters):
+    for waiter in waiters:
+        waiter.switch(waiter)
+
 import gevent._waiter
 locals()['Waiter'] = gevent._waiter.Waiter
 locals()['getcurrent'] = __import__('greenlet').getcurrent
@@ -355,6 +360,81 @@ class SimpleQueue(object):
         """
         self.put(item, False)
 
+    def put_many(self, items, block=True, timeout=None):
+        """
+        Put all the *items* into the queue, in order.
+
+        This is like calling :meth:`put` for each item, except that
+        greenlets waiting in :meth:`get` are woken with one pass of
+        the event loop no matter how many items there are.
+
+        If there isn't room for all the items and *block* is false,
+        raise :class:`Full` without putting any of them. Otherwise,
+        block if necessary until there is room for the rest; if
+        *timeout* is given and expires first, raise :class:`Full`.
+        The items put before then stay in the queue.
+
+        .. versionadded:: NEXT
+        """
+        if self.is_shutdown:
+            raise ShutDown
+        if block and timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        items = list(items)
+        count = len(items)
+        if self._maxsize != -1:
+            room = self._maxsize - self.qsize()
+            if room < 0:
+                room = 0
+            if room < count and not block:
+                raise Full
+        else:
+            room = count
+
+        index = 0
+        while index < room and index < count:
+            self._put(items[index])
+            index += 1
+        if self.getters and index:
+            self._schedule_unlock()
+        if index == count:
+            return
+
+        # Wait for room for the rest, one at a time, but all
+        # within the same timeout.
+        timeout = Timeout._start_new_or_dummy(timeout, Full)
+        try:
+            while index < count:
+                self.put(items[index])
+                index += 1
+        finally:
+            timeout.cancel()
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """
+        Remove and return a list of up to *max_items* items from the
+        queue, in the order :meth:`get` would return them.
+
+        If the queue is empty, this first waits for an item exactly
+        like :meth:`get`, with the same meaning for *block* and
+        *timeout*; the list is never empty. Greenlets waiting in
+        :meth:`put` for the space that is freed are woken with one
+        pass of the event loop.
+
+        .. versionadded:: NEXT
+        """
+        if max_items < 1:
+            raise ValueError("'max_items' must be a positive number")
+        if self.qsize():
+            result = []
+        else:
+            result = [self.get(block, timeout)]
+        while len(result) < max_items and self.qsize():
+            result.append(self._get())
+        if self.putters:
+            self._schedule_unlock()
+        return result
+
     def __get_or_peek(self, method, block, timeout):
         # Internal helper method. The `method` should be either
         # self._get when called from self.get() or self._peek when
@@ -680,6 +760,127 @@ class LifoQueue(Queue):
         return self.queue[-1]
 
 
+class RingQueue(Queue):
+    """
+    A :class:`Queue` with a fixed *maxsize*, whose items are kept in
+    a list of that size allocated up front and used as a ring buffer.
+
+    Putting and getting items doesn't allocate or free any memory,
+    and the memory used doesn't depend on how many items are in the
+    queue. Otherwise this behaves exactly like ``Queue(maxsize)``:
+    :meth:`put` blocks while the queue is full.
+
+    :keyword bool overwrite: If true, :meth:`put` never blocks; when
+        the queue is full, the oldest item is discarded to make room
+        (and counted as done for the purposes of :meth:`join`). The
+        number of items discarded is kept in :attr:`dropped`.
+
+    .. versionadded:: NEXT
+    """
+
+    __slots__ = (
+        '_head',
+        '_count',
+        'overwrite',
+        'dropped',
+    )
+
+    def __init__(self, maxsize, items=(), unfinished_tasks=None, overwrite=False):
+        if maxsize is None or maxsize <= 0:
+            raise ValueError("RingQueue requires a positive maxsize")
+        items = list(items)
+        if len(items) > maxsize:
+            if not overwrite:
+                raise ValueError("Too many items for a RingQueue of maxsize %d" % (maxsize, ))
+            items = items[-maxsize:]
+        self.overwrite = overwrite
+        #: The number of items discarded because the queue was full.
+        self.dropped = 0
+        Queue.__init__(self, maxsize, items, unfinished_tasks)
+
+    def _create_queue(self, items=()):
+        ring = [None] * self._maxsize
+        count = 0
+        for item in items:
+            ring[count] = item
+            count += 1
+        self._head = 0
+        self._count = count
+        return ring
+
+    def _qsize(self):
+        return self._count
+
+    def _put(self, item):
+        tail = self._head + self._count
+        if tail >= self._maxsize:
+            tail -= self._maxsize
+        self.queue[tail] = item
+        self._count += 1
+        self._did_put_task()
+
+    def _get(self):
+        head = self._head
+        item = self.queue[head]
+        # Don't keep the item alive.
+        self.queue[head] = None
+        head += 1
+        if head == self._maxsize:
+            head = 0
+        self._head = head
+        self._count -= 1
+        return item
+
+    def _peek(self):
+        return self.queue[self._head]
+
+    def _items(self):
+        # The items in order, oldest first.
+        return [self.queue[(self._head + i) % self._maxsize] for i in range(self._count)]
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, nv):
+        if nv != self._maxsize:
+            raise ValueError("The maxsize of a RingQueue can't be changed")
+
+    def copy(self):
+        return type(self)(self._maxsize, self._items(), self.unfinished_tasks, self.overwrite)
+
+    def _format(self):
+        result = ' maxsize=%r' % (self._maxsize, )
+        if self._count:
+            result += ' queue=%r' % (self._items(), )
+        if self.getters:
+            result += ' getters[%s]' % len(self.getters)
+        if self.putters:
+            result += ' putters[%s]' % len(self.putters)
+        if self.dropped:
+            result += ' dropped=%s' % self.dropped
+        if self.unfinished_tasks:
+            result += ' tasks=%s _cond=%s' % (self.unfinished_tasks, self._cond)
+        return result
+
+    def put(self, item, block=True, timeout=None):
+        if self.overwrite and self._count >= self._maxsize and not self.is_shutdown:
+            self._get()
+            self.dropped += 1
+            self.task_done()
+        SimpleQueue.put(self, item, block, timeout)
+
+    def put_many(self, items, block=True, timeout=None):
+        if not self.overwrite:
+            SimpleQueue.put_many(self, items, block, timeout)
+            return
+        # Nothing blocks, and waking getters is only scheduled once
+        # anyway.
+        for item in items:
+            self.put(item)
+
+
 class Channel:
     """
     A queue-like object that can only hold one item at a
@@ -768,6 +969,70 @@ class Channel:
     def put_nowait(self, item):
         self.put(item, False)
 
+    def put_many(self, items, block=True, timeout=None):
+        """
+        Hand each of the *items* to a getter, in order, blocking until
+        they have all been taken (or *timeout* expires, raising
+        :class:`Full`).
+
+        All the items are offered at once, so any number of waiting
+        getters receive them in one pass of the event loop.
+
+        .. versionadded:: NEXT
+        """
+        if self.hub is getcurrent(): # pylint:disable=undefined-variable
+            for item in items:
+                self.put(item, False)
+            return
+
+        if not block:
+            timeout = 0
+
+        # One waiter per item; each is switched when its item is
+        # taken, and we wait for them in order.
+        entries = [(item, Waiter()) for item in items] # pylint:disable=undefined-variable
+        if not entries:
+            return
+        self.putters.extend(entries)
+        timeout = Timeout._start_new_or_dummy(timeout, Full)
+        try:
+            if self.getters:
+                self._schedule_unlock()
+            for entry in entries:
+                waiter = entry[1]
+                result = waiter.get()
+                if result is not waiter:
+                    raise InvalidSwitchError("Invalid switch into Channel.put_many: %r" % (result, ))
+        except:
+            for entry in entries:
+                _safe_remove(self.putters, entry)
+            raise
+        finally:
+            timeout.cancel()
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """
+        Return a list of the items of up to *max_items* waiting
+        putters, waiting for at least one (as in :meth:`get`) if there
+        are none.
+
+        .. versionadded:: NEXT
+        """
+        if max_items < 1:
+            raise ValueError("'max_items' must be a positive number")
+        if self.putters:
+            result = []
+        else:
+            result = [self.get(block, timeout)]
+        released = []
+        while len(result) < max_items and self.putters:
+            item, putter = self.putters.popleft()
+            result.append(item)
+            released.append(putter)
+        if released:
+            self.hub.loop.run_callback(_switch_all, released)
+        return result
+
     def get(self, block=True, timeout=None):
         if self.hub is getcurrent(): # pylint:disable=undefined-variable
             if self.putters:
@@ -816,6 +1081,151 @@ class Channel:
 
     next = __next__ # Py2
 
+class ThreadSafeQueue(object):
+    """
+    An unbounded FIFO queue that can be :meth:`put` into from any
+    thread (or any hub), and that greenlets in the hub of the thread
+    that created it can :meth:`get` from cooperatively.
+
+    This is for handing results from native threads, or from other
+    hubs (see :mod:`gevent.hubthread`), to greenlets. The items are
+    kept in a :class:`collections.deque`, which needs no extra
+    locking, and a waiting getter is woken by a single
+    ``loop.async_`` notification no matter how many items are put
+    before it gets to run.
+
+    Only the owning hub may :meth:`get`. Since the queue is unbounded,
+    :meth:`put` never blocks. Call :meth:`close` when the queue is no
+    longer needed.
+
+    .. versionadded:: NEXT
+    """
+
+    def __init__(self, items=()):
+        #: The hub whose greenlets get from this queue.
+        self.hub = get_hub()
+        self.queue = collections.deque(items)
+        self.getters = collections.deque()
+        # True if a notification has been sent that the hub
+        # hasn't run yet; more puts don't need to send another.
+        self._notified = False
+        # Only keeps the loop running while a greenlet is waiting.
+        self._async = self.hub.loop.async_(ref=False)
+        self._async.start(self._unlock)
+
+    def __repr__(self):
+        return '<%s at %s queue=%r getters[%s]>' % (
+            type(self).__name__, hex(id(self)), self.queue, len(self.getters))
+
+    def qsize(self):
+        """Return the number of items in the queue."""
+        return len(self.queue)
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __bool__(self):
+        # As for SimpleQueue.
+        return True
+
+    def empty(self):
+        """Return ``True`` if the queue is empty, ``False`` otherwise."""
+        return not self.queue
+
+    def full(self):
+        """Always ``False``; the queue is unbounded."""
+        return False
+
+    def put(self, item, block=True, timeout=None): # pylint:disable=unused-argument
+        """
+        Put *item* into the queue. This may be called from any thread.
+
+        It never blocks; *block* and *timeout* are accepted for
+        compatibility with the other queues.
+        """
+        self.queue.append(item)
+        if self.getters and not self._notified:
+            self._notify()
+
+    def put_nowait(self, item):
+        """Put *item* into the queue."""
+        self.put(item)
+
+    def _notify(self):
+        self._notified = True
+        self._async.send()
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return an item from the queue, waiting for one if
+        necessary (as for :meth:`SimpleQueue.get`).
+
+        This must be called in the hub that owns the queue.
+        """
+        try:
+            return self.queue.popleft()
+        except IndexError:
+            pass
+        if not block:
+            raise Empty
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if get_hub() is not self.hub:
+            raise InvalidThreadUseError('ThreadSafeQueue.get() from a different hub')
+        if self.hub is getcurrent(): # pylint:disable=undefined-variable
+            raise Empty
+
+        waiter = Waiter() # pylint:disable=undefined-variable
+        timeout = Timeout._start_new_or_dummy(timeout, Empty)
+        try:
+            self.getters.append(waiter)
+            self._async.ref = True
+            # A put from another thread may have happened before it
+            # could see we were waiting.
+            if self.queue and not self._notified:
+                self._notify()
+            result = waiter.get()
+            if result is not waiter:
+                raise InvalidSwitchError('Invalid switch into ThreadSafeQueue.get: %r' % (result, ))
+            return self.queue.popleft()
+        finally:
+            timeout.cancel()
+            _safe_remove(self.getters, waiter)
+            if not self.getters:
+                self._async.ref = False
+
+    def get_nowait(self):
+        """Remove and return an item from the queue without blocking."""
+        return self.get(False)
+
+    def _unlock(self):
+        # In the owning hub. Reset the flag first, so that any put
+        # that sees it still set has already added its item.
+        self._notified = False
+        while self.getters and self.queue:
+            getter = self.getters.popleft()
+            getter.switch(getter)
+
+    def close(self):
+        """
+        Release the resources used to wake the owning hub. Items may
+        still be taken with :meth:`get_nowait`, but no more should be put.
+        """
+        if self._async is not None:
+            self._async.stop()
+            self._async.close()
+            self._async = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        result = self.get()
+        if result is StopIteration:
+            raise result
+        return result
+
+
 def _init():
     greenlet_init() # pylint:disable=undefined-variable
 
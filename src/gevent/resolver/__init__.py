@@ -20,6 +20,7 @@ from _socket import gethostbyname as native_gethostbyname
 from _socket import gethostbyname_ex as native_gethostbyname_ex
 from _socket import getservbyname as native_getservbyname
 
+from itertools import repeat
 
 from gevent._compat import string_types
 from gevent._compat import text_type
@@ -28,6 +29,7 @@ from gevent._compat import integer_types
 from gevent._compat import PYPY
 from gevent._compat import MAC
 
+from gevent.event import AsyncResult
 from gevent.resolver._addresses import is_ipv6_addr
 # Nothing public here.
 __all__ = ()
@@ -95,6 +97,96 @@ def _resolve_special(hostname, family):
     return hostname
 
 
+# What ``resolve_many`` gives as the result for a host, rather than
+# raising it: the lookup failed, the name couldn't be encoded, or
+# the host isn't a name at all.
+_RESOLVE_ERRORS = (error, UnicodeError, TypeError)
+
+
+def _resolve_one(getaddrinfo, host, args):
+    try:
+        return host, getaddrinfo(host, *args)
+    except _RESOLVE_ERRORS as ex:
+        return host, ex
+
+
+# How many lookups the default ``resolve_many`` runs at once.
+_RESOLVE_MANY_CONCURRENCY = 100
+
+
+def _resolve_many(getaddrinfo, hosts, args):
+    """
+    Call ``getaddrinfo(host, *args)`` for each of *hosts* in its own
+    greenlet, returning an iterator of ``(host, result)`` pairs in
+    the order they finish.
+    """
+    from gevent.pool import Pool
+    pool = Pool(_RESOLVE_MANY_CONCURRENCY)
+    return pool.imap_unordered(_resolve_one, repeat(getaddrinfo), hosts, repeat(args))
+
+
+# What the first caller of a coalesced call gives the others when it
+# is interrupted before it finishes.
+_INTERRUPTED = object()
+
+
+def _copy_result(value):
+    # A copy of a shared result that the caller can modify without
+    # affecting the others: a list, or a tuple of lists (as from
+    # gethostbyname_ex), is copied; anything else is returned as is.
+    if isinstance(value, list):
+        return value[:]
+    if type(value) is tuple: # pylint:disable=unidiomatic-typecheck
+        return tuple(v[:] if isinstance(v, list) else v for v in value)
+    return value
+
+
+class _SingleFlight(object):
+    """
+    Runs only one call at a time for each key.
+
+    Callers that ask for a key while a call for it is running wait for
+    that call and get its result (a copy of any lists in it) or its
+    exception. If the caller running it is killed or times out, one
+    of the others runs it again.
+    """
+
+    def __init__(self):
+        self._running = {}
+
+    def __len__(self):
+        return len(self._running)
+
+    def call(self, key, func, *args):
+        running = self._running
+        try:
+            pending = running.get(key)
+        except TypeError:
+            # Unhashable arguments; let the function complain.
+            return func(*args)
+
+        while pending is not None:
+            value = pending.get()
+            if value is not _INTERRUPTED:
+                return _copy_result(value)
+            pending = running.get(key)
+
+        pending = running[key] = AsyncResult()
+        try:
+            value = func(*args)
+        except Exception as ex: # pylint:disable=broad-except
+            pending.set_exception(ex)
+            raise
+        except:
+            pending.set(_INTERRUPTED)
+            raise
+        else:
+            pending.set(value)
+            return value
+        finally:
+            del running[key]
+
+
 class AbstractResolver(object):
 
     HOSTNAME_ENCODING = 'idna'
@@ -134,6 +226,20 @@ class AbstractResolver(object):
         and k not in ('SOCK_CLOEXEC', 'SOCK_MAX_SIZE')
     }
 
+    # Created when first needed; subclasses don't call our __init__.
+    _single_flight = None
+
+    def _coalesce(self, key, func, *args):
+        """
+        Return ``func(*args)``, sharing the call with any other greenlet
+        that is already making it for *key*.
+
+        .. versionadded:: NEXT
+        """
+        if self._single_flight is None:
+            self._single_flight = _SingleFlight()
+        return self._single_flight.call(key, func, *args)
+
     def close(self):
         """
         Release resources held by this object.
@@ -198,33 +304,78 @@ class AbstractResolver(object):
             # The broadcast specials aren't handled here, but they may produce
             # special errors that are hard to replicate across all systems.
             return native_gethostbyname_ex(hostname)
-        return self._gethostbyname_ex(hostname, family)
+        return self._coalesce(('gethostbyname_ex', hostname, family),
+                              self._gethostbyname_ex, hostname, family)
 
     def _getaddrinfo(self, host_bytes, port, family, socktype, proto, flags):
         raise NotImplementedError
 
+    def _getaddrinfo_is_native(self, host, flags):
+        """
+        Should ``getaddrinfo`` for *host* (bytes or None) be answered
+        by the native function instead of :meth:`_getaddrinfo`?
+        """
+        # This handles cases which do not require network access
+        # 1) host is None
+        # 2) host is of an invalid type
+        # 3) AI_NUMERICHOST flag is set
+        # 4) It's a well-known alias. TODO: This is special casing for c-ares that we don't
+        #    really want to do. It's here because it resolves a discrepancy with the system
+        #    resolvers caught by test cases. In gevent 20.4.0, this only worked correctly on
+        #    Python 3 and not Python 2, by accident.
+        # 5) host is a link-local ipv6; dnspython returns the wrong
+        #    scope-id for those.
+        return (
+            not isinstance(host, bytes)  # 1, 2
+            or (flags & AI_NUMERICHOST) # 3
+            or host in self._LOCAL_HOSTNAMES # 4
+            or (is_ipv6_addr(host) and host.startswith(b'fe80')) # 5
+        )
+
     def getaddrinfo(self, host, port, family=0, socktype=0, proto=0, flags=0):
         host = self._hostname_to_bytes(host) if host is not None else None
 
-        if (
-                not isinstance(host, bytes)  # 1, 2
-                or (flags & AI_NUMERICHOST) # 3
-                or host in self._LOCAL_HOSTNAMES # 4
-                or (is_ipv6_addr(host) and host.startswith(b'fe80')) # 5
-        ):
-            # This handles cases which do not require network access
-            # 1) host is None
-            # 2) host is of an invalid type
-            # 3) AI_NUMERICHOST flag is set
-            # 4) It's a well-known alias. TODO: This is special casing for c-ares that we don't
-            #    really want to do. It's here because it resolves a discrepancy with the system
-            #    resolvers caught by test cases. In gevent 20.4.0, this only worked correctly on
-            #    Python 3 and not Python 2, by accident.
-            # 5) host is a link-local ipv6; dnspython returns the wrong
-            #    scope-id for those.
+        if self._getaddrinfo_is_native(host, flags):
             return native_getaddrinfo(host, port, family, socktype, proto, flags)
 
-        return self._getaddrinfo(host, port, family, socktype, proto, flags)
+        # Many greenlets often look up the same name at once (for
+        # example, when a connection pool reconnects); only one of
+        # them needs to ask.
+        return self._coalesce(('getaddrinfo', host, port, family, socktype, proto, flags),
+                              self._getaddrinfo, host, port, family, socktype, proto, flags)
+
+    def _getaddrinfo_ttl(self, host, port, family=0, socktype=0, proto=0, flags=0):
+        """
+        Like :meth:`getaddrinfo`, but return a tuple ``(result, ttl)``,
+        where *ttl* is how many seconds the answer may be cached, or
+        None if that's unknown. Used by :class:`gevent.resolver.caching.Resolver`.
+
+        By default, this is the ``ttl`` attribute of the result, if
+        any.
+
+        .. versionadded:: NEXT
+        """
+        result = self.getaddrinfo(host, port, family, socktype, proto, flags)
+        return result, getattr(result, 'ttl', None)
+
+    def resolve_many(self, hosts, port=0, family=0, socktype=0, proto=0, flags=0):
+        """
+        Look up each of the names in the iterable *hosts* with
+        :meth:`getaddrinfo` and the other arguments, and return an
+        iterator of ``(host, result)`` pairs, in the order the
+        lookups finish.
+
+        *result* is the list ``getaddrinfo`` returned, or the
+        :exc:`socket.error` (or :exc:`UnicodeError`) it raised. A
+        host that isn't a :class:`str` or :class:`bytes` gets the
+        :exc:`TypeError` that ``getaddrinfo`` raised for it.
+
+        Unless a subclass can do better, each lookup runs in its
+        own greenlet, at most 100 at a time.
+
+        .. versionadded:: NEXT
+        """
+        return _resolve_many(self.getaddrinfo, hosts, (port, family, socktype, proto, flags))
 
     def _getaliases(self, hostname, family):
         # pylint:disable=unused-argument
@@ -240,7 +391,8 @@ class AbstractResolver(object):
         if ip_address in self._LOCAL_AND_BROADCAST_HOSTNAMES:
             return native_gethostbyaddr(ip_address)
 
-        return self._gethostbyaddr(ip_address)
+        return self._coalesce(('gethostbyaddr', ip_address),
+                              self._gethostbyaddr, ip_address)
 
     def _getnameinfo(self, address_bytes, port, sockaddr, flags):
         raise NotImplementedError
@@ -5,6 +5,7 @@ c-ares based hostname resolver.
 from __future__ import absolute_import, print_function, division
 import os
 import warnings
+from functools import partial
 
 from _socket import gaierror
 from _socket import herror
@@ -16,6 +17,7 @@ from gevent._compat import integer_types
 
 from gevent.hub import Waiter
 from gevent.hub import get_hub
+from gevent.queue import Queue
 
 from gevent.socket import AF_UNSPEC
 from gevent.socket import AF_INET
@@ -31,6 +33,8 @@ from gevent._config import AresSettingMixin
 
 from .cares import channel, InvalidIP # pylint:disable=import-error,no-name-in-module
 from . import _lookup_port as lookup_port
+from . import _resolve_one
+from . import _RESOLVE_ERRORS
 from . import AbstractResolver
 
 __all__ = ['Resolver']
@@ -202,24 +206,14 @@ class Resolver(AbstractResolver):
 
         :raises gaierror: If no results are found.
         """
-        # pylint:disable=too-many-locals,too-many-branches
         if isinstance(host, text_type):
             host = host.encode('idna')
 
-
-        if isinstance(port, text_type):
-            port = port.encode('ascii')
-        elif isinstance(port, integer_types):
-            if port == 0:
-                port = None
-            else:
-                port = str(port).encode('ascii')
-
         waiter = Waiter(self.hub)
         self.cares.getaddrinfo(
             waiter,
             host,
-            port,
+            self._port_bytes(port),
             family,
             socktype,
             proto,
@@ -231,8 +225,17 @@ class Resolver(AbstractResolver):
         # (address, port)
         # and INET6 is
         # (address, port, flow info, scope id)
-        result = waiter.get()
+        return self._addrinfo_result(waiter.get(), socktype, proto, fill_in_type_proto)
 
+    @staticmethod
+    def _port_bytes(port):
+        if isinstance(port, text_type):
+            return port.encode('ascii')
+        if isinstance(port, integer_types):
+            return str(port).encode('ascii') if port else None
+        return port
+
+    def _addrinfo_result(self, result, socktype, proto, fill_in_type_proto=True):
         if not result:
             raise gaierror(EAI_NONAME, self.EAI_NONAME_MSG)
 
@@ -257,7 +260,8 @@ class Resolver(AbstractResolver):
                 ]
 
             # pylint:disable=not-an-iterable,unsubscriptable-object
-            result = [
+            # Modify the result in place to keep its TTL.
+            result[:] = [
                 (rfamily,
                  hard_type if not rtype else rtype,
                  hard_proto if not rproto else rproto,
@@ -279,6 +283,57 @@ class Resolver(AbstractResolver):
                 if ares is self.cares:
                     raise
 
+    def resolve_many(self, hosts, port=0, family=0, socktype=0, proto=0, flags=0):
+        """
+        Look up each of the names in the iterable *hosts*, yielding
+        ``(host, result)`` pairs as they finish. See
+        :meth:`gevent.resolver.AbstractResolver.resolve_many`.
+
+        All the queries are given to the c-ares channel before waiting
+        for any of them, so they are all in flight at once, without a
+        greenlet for each one. They aren't coalesced with other
+        lookups of the same names.
+
+        .. versionadded:: NEXT
+        """
+        args = (port, family, socktype, proto, flags)
+        cares_port = self._port_bytes(port)
+        results = Queue()
+        pending = 0
+        for host in hosts:
+            pending += 1
+            try:
+                host_bytes = self._hostname_to_bytes(host) if host is not None else None
+            except (UnicodeError, TypeError) as ex:
+                results.put((host, ex))
+                continue
+            if self._getaddrinfo_is_native(host_bytes, flags):
+                results.put(_resolve_one(self.getaddrinfo, host, args))
+                continue
+            try:
+                self.cares.getaddrinfo(
+                    partial(self._resolve_many_callback, results, host, socktype, proto),
+                    host_bytes,
+                    cares_port,
+                    family,
+                    socktype,
+                    proto,
+                    flags,
+                )
+            except _RESOLVE_ERRORS as ex:
+                results.put((host, ex))
+
+        for _ in range(pending):
+            yield results.get()
+
+    def _resolve_many_callback(self, results, host, socktype, proto, result):
+        # Runs in the hub.
+        try:
+            value = self._addrinfo_result(result.get(), socktype, proto)
+        except error as ex:
+            value = ex
+        results.put((host, value))
+
     def __gethostbyaddr(self, ip_address):
         waiter = Waiter(self.hub)
         try:
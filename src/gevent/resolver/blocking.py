@@ -2,6 +2,8 @@
 
 import _socket
 
+from gevent.resolver import _resolve_one
+
 __all__ = [
     'Resolver',
 ]
@@ -27,6 +29,9 @@ class Resolver(object):
     .. versionchanged:: 1.3a2
        This was previously undocumented and existed in :mod:`gevent.socket`.
 
+    .. versionchanged:: NEXT
+       Add ``resolve_many``.
+
     """
 
     def __init__(self, hub=None):
@@ -43,3 +48,16 @@ class Resolver(object):
             'getnameinfo'
     ):
         locals()[method] = staticmethod(getattr(_socket, method))
+
+    @staticmethod
+    def resolve_many(hosts, port=0, family=0, socktype=0, proto=0, flags=0):
+        """
+        Look up each of the names in the iterable *hosts*, one after
+        the other, yielding ``(host, result)`` pairs. See
+        :meth:`gevent.resolver.AbstractResolver.resolve_many`.
+
+        .. versionadded:: NEXT
+        """
+        args = (port, family, socktype, proto, flags)
+        for host in hosts:
+            yield _resolve_one(_socket.getaddrinfo, host, args)
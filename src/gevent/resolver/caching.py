@@ -0,0 +1,289 @@
+# Copyright (c) 2026 gevent contributors. See LICENSE for details.
+"""
+A resolver that caches the answers of another resolver.
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import, print_function, division
+
+from collections import OrderedDict
+
+import _socket
+from _socket import AF_INET
+from _socket import gaierror
+
+from gevent._compat import perf_counter
+from gevent._config import config
+from gevent.greenlet import Greenlet
+from gevent.hub import get_hub
+from gevent.resolver import _resolve_many
+
+__all__ = ['Resolver']
+
+# The errors that mean the name doesn't exist (NXDOMAIN, or no
+# addresses of the family), as opposed to failing to find out.
+_NEGATIVE_ERRNOS = frozenset(
+    getattr(_socket, name)
+    for name in ('EAI_NONAME', 'EAI_NODATA')
+    if hasattr(_socket, name)
+)
+
+
+class Resolver(object):
+    """
+    A resolver that caches the answers of ``getaddrinfo`` and
+    ``gethostbyname`` from another resolver.
+
+    This is useful for programs that connect to the same few hosts
+    over and over. Select it by setting :attr:`~gevent._config.Config.resolver`
+    to ``caching``; the resolver that does the work is chosen with
+    :attr:`~gevent._config.Config.resolver_cache_backend`.
+
+    Answers are kept for as long as the DNS records allow. The
+    ares and dnspython resolvers know that; for other resolvers, and for
+    names that come from the hosts file, answers are kept for
+    :attr:`~gevent._config.Config.resolver_cache_ttl` seconds. A name
+    that doesn't exist is remembered for
+    :attr:`~gevent._config.Config.resolver_cache_negative_ttl`
+    seconds; other errors, such as timeouts, aren't cached. At most
+    :attr:`~gevent._config.Config.resolver_cache_size` answers are
+    kept; when there are more, the least recently used are dropped.
+
+    So that callers don't have to wait when the answer for a name
+    that is in use expires, an answer that is used in the last
+    :attr:`~gevent._config.Config.resolver_cache_refresh_ahead` of its
+    lifetime is looked up again in a new greenlet, and replaced
+    when that finishes. At most
+    :attr:`~gevent._config.Config.resolver_cache_max_refreshes` of
+    those run at once. If one fails because of an error such as a
+    timeout, the old answer is used until it expires.
+
+    :meth:`resolve_many` answers what it can from the cache, too.
+    The other functions are passed straight to the other resolver.
+
+    :keyword resolver: The resolver to wrap. By default, an instance of
+        the configured ``resolver_cache_backend`` for *hub*.
+
+    .. versionadded:: NEXT
+    """
+
+    #: The number of answers found in the cache.
+    hits = 0
+    #: The number of answers that had to be looked up.
+    misses = 0
+    #: The number of lookups started to refresh answers in use before
+    #: they expire.
+    refreshes = 0
+    #: The number of those refreshes that failed.
+    refresh_errors = 0
+    #: The number of refreshes not started because the maximum number
+    #: were already running.
+    refreshes_skipped = 0
+
+    def __init__(self, hub=None, resolver=None, maxsize=None, ttl=None, negative_ttl=None,
+                 refresh_ahead=None, max_refreshes=None):
+        if hub is None:
+            hub = get_hub()
+        if resolver is None:
+            resolver = config.resolver_cache_backend(hub=hub)
+        #: The resolver that does the work.
+        self.resolver = resolver
+        self.maxsize = maxsize or config.resolver_cache_size
+        self.ttl = ttl if ttl is not None else config.resolver_cache_ttl
+        self.negative_ttl = negative_ttl if negative_ttl is not None else config.resolver_cache_negative_ttl
+        self.refresh_ahead = (refresh_ahead if refresh_ahead is not None
+                              else config.resolver_cache_refresh_ahead)
+        self.max_refreshes = (max_refreshes if max_refreshes is not None
+                              else config.resolver_cache_max_refreshes)
+        # key -> (expiration, is_error, value, refresh_time). Most
+        # recently used last.
+        self._cache = OrderedDict()
+        # key -> the greenlet refreshing it
+        self._refreshing = {}
+        self._getaddrinfo_ttl = getattr(resolver, '_getaddrinfo_ttl', None) or self._getaddrinfo_no_ttl
+
+    def __repr__(self):
+        return '<%s.%s at 0x%x resolver=%r entries=%d>' % (
+            type(self).__module__,
+            type(self).__name__,
+            id(self),
+            self.resolver,
+            len(self._cache),
+        )
+
+    def close(self):
+        for glet in list(self._refreshing.values()):
+            glet.kill(block=False)
+        self._refreshing.clear()
+        self.clear()
+        self.resolver.close()
+
+    def clear(self):
+        """Forget all cached answers."""
+        self._cache.clear()
+
+    def _getaddrinfo_no_ttl(self, *args):
+        return self.resolver.getaddrinfo(*args), None
+
+    def _gethostbyname_no_ttl(self, *args):
+        return self.resolver.gethostbyname(*args), None
+
+    def _get(self, key, func, args):
+        # Return the cached value, raise the cached error, or return
+        # None if there's nothing cached. *func* and *args* are how
+        # to refresh it.
+        cache = self._cache
+        entry = cache.get(key)
+        if entry is not None:
+            now = perf_counter()
+            if entry[0] > now:
+                cache.move_to_end(key)
+                self.hits += 1
+                if entry[1]:
+                    raise gaierror(*entry[2])
+                if entry[3] <= now:
+                    self._start_refresh(key, func, args)
+                return entry[2]
+            del cache[key]
+
+        self.misses += 1
+        return None
+
+    def _lookup(self, key, func, args):
+        value = self._get(key, func, args)
+        if value is not None:
+            return value
+        try:
+            value, ttl = func(*args)
+        except gaierror as ex:
+            self._put_error(key, ex)
+            raise
+        return self._put_value(key, value, ttl)
+
+    def _put_error(self, key, ex):
+        if ex.args and ex.args[0] in _NEGATIVE_ERRNOS:
+            # Keep only the arguments; the exception would keep its
+            # traceback alive.
+            self._put(key, True, ex.args, self.negative_ttl)
+
+    def _put_value(self, key, value, ttl):
+        if isinstance(value, list):
+            # Nobody can change what's cached.
+            value = tuple(value)
+        self._put(key, False, value, self.ttl if ttl is None else ttl)
+        return value
+
+    def _put(self, key, is_error, value, ttl):
+        if ttl <= 0:
+            return
+        cache = self._cache
+        expiration = perf_counter() + ttl
+        refresh_ahead = 0 if is_error else (self.refresh_ahead or 0)
+        refresh_time = expiration - ttl * refresh_ahead
+        cache[key] = (expiration, is_error, value, refresh_time)
+        cache.move_to_end(key)
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+    def _start_refresh(self, key, func, args):
+        refreshing = self._refreshing
+        if key in refreshing:
+            return
+        if len(refreshing) >= self.max_refreshes:
+            self.refreshes_skipped += 1
+            return
+        self.refreshes += 1
+        refreshing[key] = Greenlet.spawn(self._refresh, key, func, args)
+
+    def _refresh(self, key, func, args):
+        try:
+            value, ttl = func(*args)
+        except Exception as ex: # pylint:disable=broad-except
+            self.refresh_errors += 1
+            if isinstance(ex, gaierror) and ex.args and ex.args[0] in _NEGATIVE_ERRNOS:
+                # The name is gone.
+                self._put_error(key, ex)
+            else:
+                # Use what we have until it expires, and don't try
+                # again before then.
+                entry = self._cache.get(key)
+                if entry is not None:
+                    self._cache[key] = entry[:3] + (entry[0],)
+        else:
+            self._put_value(key, value, ttl)
+        finally:
+            self._refreshing.pop(key, None)
+
+    def getaddrinfo(self, host, port, family=0, socktype=0, proto=0, flags=0):
+        if isinstance(host, bytearray):
+            host = bytes(host)
+        return list(self._lookup(
+            ('getaddrinfo', host, port, family, socktype, proto, flags),
+            self._getaddrinfo_ttl,
+            (host, port, family, socktype, proto, flags)
+        ))
+
+    def resolve_many(self, hosts, port=0, family=0, socktype=0, proto=0, flags=0):
+        """
+        Look up each of the names in the iterable *hosts*, yielding
+        ``(host, result)`` pairs as they finish. See
+        :meth:`gevent.resolver.AbstractResolver.resolve_many`.
+
+        Names that are cached are answered first; the rest are given
+        to the ``resolve_many`` of the other resolver, and their
+        answers are cached.
+
+        .. versionadded:: NEXT
+        """
+        args = (port, family, socktype, proto, flags)
+        misses = []
+        for host in hosts:
+            if isinstance(host, bytearray):
+                host = bytes(host)
+            try:
+                value = self._get(('getaddrinfo', host) + args,
+                                  self._getaddrinfo_ttl, (host,) + args)
+            except gaierror as ex:
+                yield host, ex
+                continue
+            except TypeError:
+                # Unhashable; let the other resolver complain.
+                value = None
+            if value is None:
+                misses.append(host)
+            else:
+                yield host, list(value)
+
+        if not misses:
+            return
+        resolve_many = getattr(self.resolver, 'resolve_many', None)
+        if resolve_many is not None:
+            results = resolve_many(misses, *args)
+        else:
+            results = _resolve_many(self.resolver.getaddrinfo, misses, args)
+        for host, result in results:
+            key = ('getaddrinfo', host) + args
+            if isinstance(result, list):
+                result = list(self._put_value(key, result, getattr(result, 'ttl', None)))
+            elif isinstance(result, gaierror):
+                self._put_error(key, result)
+            yield host, result
+
+    def gethostbyname(self, hostname, family=AF_INET):
+        if isinstance(hostname, bytearray):
+            hostname = bytes(hostname)
+        return self._lookup(
+            ('gethostbyname', hostname, family),
+            self._gethostbyname_no_ttl,
+            # The native function doesn't take a family.
+            (hostname,) if family == AF_INET else (hostname, family)
+        )
+
+    def gethostbyname_ex(self, *args):
+        return self.resolver.gethostbyname_ex(*args)
+
+    def gethostbyaddr(self, *args, **kwargs):
+        return self.resolver.gethostbyaddr(*args, **kwargs)
+
+    def getnameinfo(self, *args, **kwargs):
+        return self.resolver.getnameinfo(*args, **kwargs)
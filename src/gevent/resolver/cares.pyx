@@ -277,6 +277,15 @@ class ares_host_result(tuple):
         return (self.family, tuple(self))
 
 
+class ares_addrinfo_result(list):
+    # The result of getaddrinfo, with the smallest TTL of the
+    # records it came from, or None.
+
+    def __init__(self, ttl, iterable):
+        list.__init__(self, iterable)
+        self.ttl = ttl
+
+
 cdef list _parse_h_aliases(hostent* host):
     cdef list result = []
     cdef char** aliases = host.h_aliases
@@ -634,6 +643,7 @@ cdef class channel:
         cdef sockaddr_in* sadr4
         cdef sockaddr_in6* sadr6
         cdef object canonname = ''
+        cdef int ttl = -1
 
         cdef channel channel
         cdef object callback
@@ -668,6 +678,8 @@ cdef class channel:
                 cnames = result.cnames
                 while cnames:
                     canonname = _as_str(cnames.name)
+                    if ttl < 0 or cnames.ttl < ttl:
+                        ttl = cnames.ttl
                     cnames = cnames.next
 
             nodes = result.nodes
@@ -698,9 +710,14 @@ cdef class channel:
                     canonname,
                     sockaddr,
                 ))
+                if ttl < 0 or nodes.ai_ttl < ttl:
+                    ttl = nodes.ai_ttl
                 nodes = nodes.ai_next
 
-            callback(Result(addrs, None))
+            # Answers from the hosts file have a TTL of 0; we can't tell
+            # those from DNS records that really shouldn't be cached,
+            # which are much less common.
+            callback(Result(ares_addrinfo_result(ttl if ttl > 0 else None, addrs), None))
         except:
             channel.loop.handle_error(callback, *sys.exc_info())
         finally:
@@ -481,6 +481,37 @@ class Resolver(AbstractResolver):
                     ex.errno = EAI_FAMILY
                 raise
 
+    def _getaddrinfo_ttl(self, host, port, family=0, socktype=0, proto=0, flags=0):
+        result = self.getaddrinfo(host, port, family, socktype, proto, flags)
+        return result, self._cached_ttl(host, family)
+
+    def _cached_ttl(self, host, family):
+        # The answers for a name we just resolved from the network are
+        # in the resolver's cache, which knows when they expire.
+        # Answers from the hosts file, and names we didn't resolve
+        # ourself, aren't there.
+        if family == AF_INET:
+            rdtypes = (dns.rdatatype.A,)
+        elif family == AF_INET6:
+            rdtypes = (dns.rdatatype.AAAA,)
+        else:
+            rdtypes = (dns.rdatatype.A, dns.rdatatype.AAAA)
+        if isinstance(host, bytes):
+            host = host.decode(self.HOSTNAME_ENCODING)
+        try:
+            qname = dns.name.from_text(host)
+        except Exception: # pylint:disable=broad-except
+            return None
+        cache = self._resolver.network_resolver.cache
+        expirations = []
+        for rdtype in rdtypes:
+            answer = cache.get((qname, rdtype, dns.rdataclass.IN))
+            if answer is not None:
+                expirations.append(answer.expiration)
+        if not expirations:
+            return None
+        return max(0, min(expirations) - time.time())
+
     def _getnameinfo(self, address_bytes, port, sockaddr, flags):
         try:
             return resolver._getnameinfo(sockaddr, flags)
@@ -0,0 +1,786 @@
+# Copyright (c) 2026 gevent contributors. See LICENSE for details.
+"""
+A resolver that speaks DNS to the nameservers itself.
+
+.. versionadded:: NEXT
+"""
+from __future__ import absolute_import, print_function, division
+
+import os
+import struct
+from random import SystemRandom
+
+from _socket import AF_INET
+from _socket import AF_INET6
+from _socket import AF_UNSPEC
+from _socket import AI_CANONNAME
+from _socket import AI_NUMERICHOST
+from _socket import EAI_AGAIN
+from _socket import EAI_FAMILY
+from _socket import EAI_NONAME
+from _socket import NI_NAMEREQD
+from _socket import NI_NOFQDN
+from _socket import NI_NUMERICHOST
+from _socket import SOCK_DGRAM
+from _socket import SOCK_RAW
+from _socket import SOCK_STREAM
+from _socket import SOL_TCP
+from _socket import SOL_UDP
+from _socket import error
+from _socket import gaierror
+from _socket import getaddrinfo as native_getaddrinfo
+from _socket import getnameinfo as native_getnameinfo
+from _socket import herror
+from _socket import inet_ntop
+from _socket import inet_pton
+from _socket import socket as native_socket
+
+from gevent._compat import iteritems
+from gevent._compat import perf_counter
+from gevent._config import config
+from gevent.event import AsyncResult
+from gevent.hub import get_hub
+from gevent.socket import socket
+from gevent.timeout import Timeout
+from gevent.resolver import AbstractResolver
+from gevent.resolver import _lookup_port
+from gevent.resolver._addresses import is_ipv4_addr
+from gevent.resolver._addresses import is_ipv6_addr
+from gevent.resolver._hostsfile import HostsFile
+
+__all__ = ['Resolver']
+
+# Record types and response codes we care about.
+_A = 1
+_CNAME = 5
+_PTR = 12
+_AAAA = 28
+_NOERROR = 0
+_NXDOMAIN = 3
+
+_QTYPE_FAMILY = {
+    _A: AF_INET,
+    _AAAA: AF_INET6,
+}
+
+_FAMILY_QTYPES = {
+    AF_INET: (_A,),
+    AF_INET6: (_AAAA,),
+    AF_UNSPEC: (_A, _AAAA),
+}
+
+_HEADER = struct.Struct('!6H')
+_QUESTION = struct.Struct('!2H')
+_RECORD = struct.Struct('!2HIH')
+_TCP_LENGTH = struct.Struct('!H')
+
+# The longest CNAME chain we follow.
+_MAX_CNAMES = 16
+
+# How often, in seconds, we look at the hosts file for changes.
+HOSTS_INTERVAL = 5.0
+
+
+class _Response(object):
+    # The parts of a DNS response message we use.
+
+    __slots__ = ('id', 'rcode', 'truncated', 'qname', 'qtype', 'answers')
+
+    def __init__(self, qid, rcode, truncated, qname, qtype, answers):
+        self.id = qid
+        self.rcode = rcode
+        self.truncated = truncated
+        self.qname = qname
+        self.qtype = qtype
+        # A list of (name, type, ttl, value). *value* is the address
+        # for A and AAAA records, and the name for CNAME and PTR
+        # records. Names are lowercase bytes without the final dot.
+        self.answers = answers
+
+
+def _encode_name(name):
+    """
+    Return the wire form of *name*, bytes with dots between the labels.
+
+    :raises ValueError: If it isn't a valid name.
+    """
+    labels = name.split(b'.')
+    if labels[-1] == b'':
+        labels.pop()
+    if not labels or len(name) > 253:
+        raise ValueError(name)
+    parts = []
+    for label in labels:
+        if not label or len(label) > 63:
+            raise ValueError(name)
+        parts.append(bytes((len(label),)))
+        parts.append(label)
+    parts.append(b'\0')
+    return b''.join(parts)
+
+
+def _make_query(qid, qname, qtype):
+    # A standard query with recursion desired, for the IN class.
+    return (
+        _HEADER.pack(qid, 0x0100, 1, 0, 0, 0)
+        + _encode_name(qname)
+        + _QUESTION.pack(qtype, 1)
+    )
+
+
+def _read_name(data, offset):
+    # Return the name at *offset*, and the offset of what follows it.
+    labels = []
+    end = None
+    jumps = 0
+    while True:
+        length = data[offset]
+        if length >= 0xC0:
+            # A pointer to the rest of the name.
+            jumps += 1
+            if jumps > 64:
+                raise ValueError('Compression loop')
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+        if length > 63:
+            raise ValueError('Bad label')
+        offset += 1
+        if not length:
+            break
+        labels.append(data[offset:offset + length])
+        offset += length
+    return b'.'.join(labels).lower(), end if end is not None else offset
+
+
+def _parse_response(data):
+    """
+    Return a :class:`_Response`, or None if *data* isn't a response
+    with one question.
+    """
+    try:
+        qid, flags, qdcount, ancount, _, _ = _HEADER.unpack_from(data)
+        if not flags & 0x8000 or qdcount != 1:
+            return None
+        qname, offset = _read_name(data, _HEADER.size)
+        qtype, _ = _QUESTION.unpack_from(data, offset)
+        offset += _QUESTION.size
+        answers = []
+        for _ in range(ancount):
+            name, offset = _read_name(data, offset)
+            rtype, rclass, ttl, rdlength = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            rdata = data[offset:offset + rdlength]
+            if len(rdata) != rdlength:
+                return None
+            if rclass == 1:
+                if rtype == _A and rdlength == 4:
+                    answers.append((name, rtype, ttl, inet_ntop(AF_INET, rdata)))
+                elif rtype == _AAAA and rdlength == 16:
+                    answers.append((name, rtype, ttl, inet_ntop(AF_INET6, rdata)))
+                elif rtype in (_CNAME, _PTR):
+                    answers.append((name, rtype, ttl, _read_name(data, offset)[0]))
+            offset += rdlength
+    except (IndexError, ValueError, struct.error):
+        # Truncated or malformed. A truncated response may still
+        # have a usable header, but we don't need its answers.
+        if len(data) >= _HEADER.size and _HEADER.unpack_from(data)[1] & 0x0200:
+            try:
+                qname, offset = _read_name(data, _HEADER.size)
+                qtype, _ = _QUESTION.unpack_from(data, offset)
+            except (IndexError, ValueError, struct.error):
+                return None
+            return _Response(qid, flags & 0xF, True, qname, qtype, [])
+        return None
+    return _Response(qid, flags & 0xF, bool(flags & 0x0200), qname, qtype, answers)
+
+
+def _follow(response, qname, qtype):
+    """
+    Return the canonical name of *qname* in *response*, the values of
+    its records of *qtype*, and the smallest TTL of the records used.
+    """
+    ttls = []
+    name = qname
+    for _ in range(_MAX_CNAMES):
+        for rname, rtype, ttl, value in response.answers:
+            if rtype == _CNAME and rname == name:
+                name = value
+                ttls.append(ttl)
+                break
+        else:
+            break
+    values = []
+    for rname, rtype, ttl, value in response.answers:
+        if rtype == qtype and rname == name:
+            values.append(value)
+            ttls.append(ttl)
+    return name, values, min(ttls) if values else None
+
+
+def _parse_nameserver(server):
+    """
+    Return ``(family, sockaddr)`` for a nameserver given as an IP
+    address, an ``address:port`` or ``[address]:port`` string, or an
+    ``(address, port)`` tuple.
+    """
+    port = 53
+    if isinstance(server, tuple):
+        server, port = server
+    elif server.startswith('['):
+        server, _, rest = server[1:].partition(']')
+        if rest:
+            port = int(rest[1:])
+    elif server.count(':') == 1:
+        server, port = server.split(':')
+        port = int(port)
+    family, _, _, _, sockaddr = native_getaddrinfo(server, port, AF_UNSPEC, SOCK_DGRAM,
+                                                   0, AI_NUMERICHOST)[0]
+    return family, sockaddr
+
+
+def _read_resolv_conf(fname):
+    """
+    Return the nameservers, search domains and options dictionary
+    from the resolv.conf file *fname*.
+    """
+    nameservers = []
+    search = []
+    options = {}
+    try:
+        with open(fname) as f:
+            lines = f.readlines()
+    except (IOError, OSError):
+        lines = ()
+    for line in lines:
+        parts = line.split()
+        if not parts or parts[0][0] in '#;':
+            continue
+        keyword, args = parts[0], parts[1:]
+        if keyword == 'nameserver' and args:
+            nameservers.append(args[0])
+        elif keyword in ('search', 'domain'):
+            # The last one wins.
+            search = args
+        elif keyword == 'options':
+            for option in args:
+                name, _, value = option.partition(':')
+                options[name] = value
+    return nameservers, search, options
+
+
+class _Socket(object):
+    # One of the UDP sockets of a _Channel, and how many of the
+    # queries sent from it are waiting for answers.
+    __slots__ = ('sock', 'watcher', 'sent', 'waiting')
+
+    def __init__(self, sock, watcher):
+        self.sock = sock
+        self.watcher = watcher
+        self.sent = 0
+        self.waiting = 0
+
+    def close(self):
+        self.watcher.stop()
+        self.watcher.close()
+        self.sock.close()
+
+
+class _Channel(object):
+    """
+    The UDP socket that carries the queries to one nameserver.
+
+    Queries are told apart by their IDs, so any number can be waiting
+    for their answers at once. The socket is only watched for
+    answers while there are queries waiting.
+
+    After :attr:`max_queries` queries, later ones are sent from a new
+    socket, and so from a new source port; the old one is kept only
+    until the queries sent from it are answered or given up on.
+    """
+
+    #: How many queries to send from one socket. Someone forging
+    #: answers has to guess the source port as well as the ID, so
+    #: it shouldn't stay the same for long. (This is c-ares's
+    #: ``udp_max_queries``.)
+    max_queries = 100
+
+    def __init__(self, loop, family, sockaddr):
+        self.loop = loop
+        self.family = family
+        self.sockaddr = sockaddr
+        self._udp = None
+        # Sockets that queries aren't sent from any more, but that
+        # some are still waiting on.
+        self._retired = set()
+        # ID -> (AsyncResult, qname, qtype, _Socket)
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def _open(self):
+        sock = native_socket(self.family, SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            # Only answers from the nameserver are received.
+            sock.connect(self.sockaddr)
+        except:
+            sock.close()
+            raise
+        return _Socket(sock, self.loop.io(sock.fileno(), 1))
+
+    def send(self, random, qname, qtype):
+        """
+        Send a query, returning its ID and the :class:`AsyncResult`
+        that gets the :class:`_Response`.
+        """
+        udp = self._udp
+        if udp is not None and udp.sent >= self.max_queries:
+            if udp.waiting:
+                self._retired.add(udp)
+            else:
+                udp.close()
+            udp = self._udp = None
+        if udp is None:
+            udp = self._udp = self._open()
+
+        pending = self._pending
+        qid = random.getrandbits(16)
+        while qid in pending:
+            qid = random.getrandbits(16)
+        try:
+            udp.sock.send(_make_query(qid, qname, qtype))
+        except error as ex:
+            # This can be the error for an earlier query.
+            self._fail(udp, ex)
+            raise
+        udp.sent += 1
+        udp.waiting += 1
+        result = AsyncResult()
+        pending[qid] = (result, qname.lower(), qtype, udp)
+        if not udp.watcher.active:
+            udp.watcher.start(self._on_readable, udp)
+        return qid, result
+
+    def forget(self, qid):
+        entry = self._pending.pop(qid, None)
+        if entry is None:
+            return
+        udp = entry[3]
+        udp.waiting -= 1
+        if not udp.waiting:
+            if udp is self._udp:
+                udp.watcher.stop()
+            else:
+                self._retired.discard(udp)
+                udp.close()
+
+    def _on_readable(self, udp):
+        # Runs in the hub.
+        pending = self._pending
+        while True:
+            try:
+                data = udp.sock.recv(65535)
+            except BlockingIOError:
+                return
+            except error as ex:
+                self._fail(udp, ex)
+                return
+            response = _parse_response(data)
+            if response is None:
+                continue
+            entry = pending.get(response.id)
+            if (
+                    entry is None
+                    or entry[3] is not udp
+                    or entry[0].ready()
+                    or (response.qname, response.qtype) != entry[1:3]
+            ):
+                # Late, duplicate or not an answer to our question.
+                continue
+            entry[0].set(response)
+
+    def _fail(self, udp, ex):
+        # Probably ECONNREFUSED: nothing is listening there, so none
+        # of the queries sent from this socket will be answered.
+        for result, _, _, sent_from in self._pending.values():
+            if sent_from is udp and not result.ready():
+                result.set_exception(ex)
+
+    def close(self):
+        if self._udp is not None:
+            self._udp.close()
+            self._udp = None
+        for udp in self._retired:
+            udp.close()
+        self._retired.clear()
+        for result, _, _, _ in self._pending.values():
+            if not result.ready():
+                result.set_exception(gaierror(EAI_AGAIN, 'Resolver closed'))
+        self._pending.clear()
+
+
+def _recv_exactly(sock, count):
+    data = b''
+    while len(data) < count:
+        chunk = sock.recv(count - len(data))
+        if not chunk:
+            raise error('Connection closed by nameserver')
+        data += chunk
+    return data
+
+
+class _AddrinfoResult(list):
+    # The result of getaddrinfo, with the smallest TTL of the
+    # records it came from, or None.
+    ttl = None
+
+
+class Resolver(AbstractResolver):
+    """
+    A resolver that looks names up by sending DNS queries to the
+    nameservers itself, over gevent's cooperative sockets.
+
+    Unlike :class:`gevent.resolver.ares.Resolver`, this needs no
+    compiled extension, and unlike
+    :class:`gevent.resolver.dnspython.Resolver`, no third-party
+    package. It is a stub resolver: it sends queries with the
+    recursion desired flag set to the nameservers from
+    ``/etc/resolv.conf`` (or
+    :attr:`~gevent._config.Config.resolver_nameservers`) and uses their
+    answers, following CNAME records and the ``search`` domains, ``ndots``,
+    ``timeout`` and ``attempts`` options in that file.
+
+    The queries to a nameserver share a UDP socket and are matched
+    to their answers by ID (and question), so any number of them can
+    be waiting at once; for ``AF_UNSPEC``, the A and AAAA queries are
+    sent together. The IDs are random, and every so often a new
+    socket (with a new source port) is used. If an answer is truncated, the query
+    is made again over TCP. Names in the hosts file are answered
+    from there, without asking the nameservers.
+
+    .. caution::
+
+        This does not support DNSSEC, DNS over TLS, mDNS, or the
+        other name services that the system resolver may be configured
+        to use (such as NIS or LDAP). On platforms other than Unix,
+        it can only use nameservers that are given explicitly.
+
+    :keyword nameservers: A list of nameservers. Each is an IP address,
+        optionally with a port (``"127.0.0.1:5353"``,
+        ``"[::1]:5353"``), or an ``(address, port)`` tuple.
+    :keyword float timeout: How long to wait for each nameserver to answer.
+    :keyword int tries: How many times to try all the nameservers.
+    :keyword float lifetime: How long, in total, to spend on a lookup. By
+        default, :attr:`~gevent._config.Config.resolver_timeout`;
+        None means no limit beyond *timeout* and *tries*.
+    :keyword search: A list of domains to search for names with fewer
+        than *ndots* dots.
+    :keyword str hosts_file: The path of the hosts file.
+    :keyword str resolv_conf: The path of the file to read the
+        nameservers and the other settings from, if they aren't given.
+
+    .. versionadded:: NEXT
+    """
+
+    def __init__(self, hub=None, nameservers=None, timeout=None, tries=None,
+                 lifetime=None, search=None, ndots=None, hosts_file=None,
+                 resolv_conf='/etc/resolv.conf'):
+        AbstractResolver.__init__(self)
+        if hub is None:
+            hub = get_hub()
+        self.hub = hub
+        conf_nameservers, conf_search, options = _read_resolv_conf(resolv_conf)
+        if nameservers is None:
+            nameservers = config.resolver_nameservers or conf_nameservers or ['127.0.0.1']
+        self.nameservers = [_parse_nameserver(server) for server in nameservers]
+        self.timeout = timeout if timeout is not None else float(options.get('timeout') or 5)
+        self.tries = tries or int(options.get('attempts') or 2)
+        self.lifetime = lifetime if lifetime is not None else config.resolver_timeout
+        search = search if search is not None else conf_search
+        self.search = [
+            domain.encode('idna') if not isinstance(domain, bytes) else domain
+            for domain in search
+        ]
+        self.ndots = ndots if ndots is not None else int(options.get('ndots') or 1)
+        self.hosts_file = HostsFile(hosts_file)
+        self._hosts_checked = None
+        # IDs that can't be predicted from earlier ones.
+        self._random = SystemRandom()
+        self._channels = [
+            _Channel(hub.loop, family, sockaddr)
+            for family, sockaddr in self.nameservers
+        ]
+        self.pid = os.getpid()
+        self.fork_watcher = hub.loop.fork(ref=False)
+        self.fork_watcher.start(self._on_fork)
+
+    def __repr__(self):
+        return '<%s.%s at 0x%x nameservers=%r>' % (
+            type(self).__module__,
+            type(self).__name__,
+            id(self),
+            [sockaddr for _, sockaddr in self.nameservers],
+        )
+
+    def _on_fork(self):
+        # The parent keeps using the sockets, so we need our own.
+        pid = os.getpid()
+        if pid != self.pid:
+            for channel in self._channels:
+                channel.close()
+            self.pid = pid
+
+    def close(self):
+        AbstractResolver.close(self)
+        for channel in self._channels:
+            channel.close()
+        self.fork_watcher.stop()
+
+    def _hosts(self):
+        now = perf_counter()
+        if self._hosts_checked is None or now - self._hosts_checked >= HOSTS_INTERVAL:
+            self._hosts_checked = now
+            self.hosts_file.load()
+        return self.hosts_file
+
+    def _names_to_try(self, name):
+        if name.endswith(b'.'):
+            return [name[:-1]]
+        searched = [name + b'.' + domain for domain in self.search]
+        if name.count(b'.') >= self.ndots:
+            return [name] + searched
+        return searched + [name]
+
+    def _query(self, qname, qtypes):
+        """
+        Ask the nameservers for the records of each of *qtypes* for
+        *qname*, all at once.
+
+        Returns a dictionary from the type to the :class:`_Response`
+        for each type that a nameserver answered definitively. If none
+        does, the dictionary is empty.
+        """
+        deadline = perf_counter() + self.lifetime if self.lifetime else None
+        responses = {}
+        for _ in range(self.tries):
+            for server, channel in zip(self.nameservers, self._channels):
+                remaining = [qtype for qtype in qtypes if qtype not in responses]
+                if not remaining:
+                    return responses
+                timeout = self.timeout
+                if deadline is not None:
+                    timeout = min(timeout, deadline - perf_counter())
+                    if timeout <= 0:
+                        return responses
+                responses.update(self._ask(server, channel, qname, remaining, timeout))
+        return responses
+
+    def _ask(self, server, channel, qname, qtypes, timeout):
+        # Send the queries to one nameserver, then wait for all of
+        # them.
+        sent = []
+        responses = []
+        try:
+            for qtype in qtypes:
+                try:
+                    sent.append((qtype,) + channel.send(self._random, qname, qtype))
+                except (error, ValueError):
+                    # Couldn't send it, or the name (with a search
+                    # domain) is too long.
+                    pass
+            end = perf_counter() + timeout
+            for qtype, _, result in sent:
+                try:
+                    response = result.get(timeout=max(0, end - perf_counter()))
+                except (Timeout, error):
+                    continue
+                if response.truncated:
+                    try:
+                        response = self._query_tcp(server, qname, qtype)
+                    except error:
+                        continue
+                # Other errors, like SERVFAIL, mean another nameserver
+                # might do better.
+                if response.rcode in (_NOERROR, _NXDOMAIN):
+                    responses.append((qtype, response))
+        finally:
+            for _, qid, _ in sent:
+                channel.forget(qid)
+        return responses
+
+    def _query_tcp(self, server, qname, qtype):
+        family, sockaddr = server
+        qid = self._random.getrandbits(16)
+        message = _make_query(qid, qname, qtype)
+        sock = socket(family, SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(sockaddr)
+            sock.sendall(_TCP_LENGTH.pack(len(message)) + message)
+            length, = _TCP_LENGTH.unpack(_recv_exactly(sock, _TCP_LENGTH.size))
+            response = _parse_response(_recv_exactly(sock, length))
+        finally:
+            sock.close()
+        if (
+                response is None
+                or response.truncated
+                or response.id != qid
+                or (response.qname, response.qtype) != (qname.lower(), qtype)
+        ):
+            raise error('Bad response from nameserver')
+        return response
+
+    def _resolve(self, host_bytes, qtypes):
+        """
+        Return the canonical name of *host_bytes*, a list of ``(family,
+        address)``, and the TTL of the answer.
+
+        :raises gaierror: If there are no addresses.
+        """
+        try:
+            key = host_bytes.decode('ascii').lower().rstrip('.')
+            _encode_name(host_bytes)
+        except (UnicodeError, ValueError):
+            raise gaierror(EAI_NONAME, self.EAI_NONAME_MSG)
+
+        hosts = self._hosts()
+        found = []
+        for qtype in qtypes:
+            address = (hosts.v4 if qtype == _A else hosts.v6).get(key)
+            if address:
+                found.append((_QTYPE_FAMILY[qtype], address))
+        if found:
+            return hosts.aliases.get(key, key), found, None
+
+        temporary_failure = False
+        for qname in self._names_to_try(host_bytes):
+            responses = self._query(qname, qtypes)
+            if len(responses) < len(qtypes):
+                temporary_failure = True
+            canonical = None
+            addresses = []
+            ttls = []
+            for qtype in qtypes:
+                if qtype not in responses:
+                    continue
+                name, values, ttl = _follow(responses[qtype], qname.lower(), qtype)
+                if values:
+                    canonical = canonical or name
+                    addresses.extend((_QTYPE_FAMILY[qtype], value) for value in values)
+                    ttls.append(ttl)
+            if addresses:
+                return canonical.decode('ascii'), addresses, min(ttls)
+
+        if temporary_failure:
+            raise gaierror(EAI_AGAIN, 'Temporary failure in name resolution')
+        raise gaierror(EAI_NONAME, self.EAI_NONAME_MSG)
+
+    def _getaddrinfo(self, host_bytes, port, family, socktype, proto, flags):
+        # pylint:disable=too-many-locals
+        if family not in _FAMILY_QTYPES:
+            raise gaierror(EAI_FAMILY, self.EAI_FAMILY_MSG)
+        if is_ipv4_addr(host_bytes) or is_ipv6_addr(host_bytes):
+            return native_getaddrinfo(host_bytes, port, family, socktype, proto,
+                                      flags | AI_NUMERICHOST)
+
+        port, socktypes = _lookup_port(port, socktype)
+        canonical, addresses, ttl = self._resolve(host_bytes, _FAMILY_QTYPES[family])
+
+        if socktypes:
+            type_proto = [
+                (stype, proto or (SOL_TCP if stype == SOCK_STREAM else SOL_UDP))
+                for stype in socktypes
+            ]
+        elif proto:
+            type_proto = [(SOCK_STREAM if proto == SOL_TCP else SOCK_DGRAM, proto)]
+        else:
+            type_proto = [
+                (SOCK_STREAM, SOL_TCP),
+                (SOCK_DGRAM, SOL_UDP),
+                (SOCK_RAW, 0),
+            ]
+
+        result = _AddrinfoResult()
+        result.ttl = ttl
+        for afamily, address in addresses:
+            sockaddr = (address, port) if afamily == AF_INET else (address, port, 0, 0)
+            for stype, sproto in type_proto:
+                result.append((afamily, stype, sproto, '', sockaddr))
+        if flags & AI_CANONNAME:
+            result[0] = result[0][:3] + (canonical,) + result[0][4:]
+        return result
+
+    def _getaliases(self, hostname, family):
+        # Only the hosts file knows about aliases.
+        if isinstance(hostname, bytes):
+            hostname = hostname.decode('ascii', 'replace')
+        hostname = hostname.lower()
+        aliases = self._hosts().aliases
+        canonical = aliases.get(hostname, hostname)
+        result = [canonical] if canonical != hostname else []
+        result.extend(alias for alias, cname in iteritems(aliases)
+                      if cname == canonical and alias != hostname)
+        return result
+
+    def _gethostbyaddr(self, ip_address_bytes):
+        address = ip_address_bytes.decode('ascii', 'replace').split('%', 1)[0]
+        for family in (AF_INET, AF_INET6):
+            try:
+                packed = inet_pton(family, address)
+            except (error, ValueError):
+                continue
+            break
+        else:
+            # A name. Look it up, then look up the address.
+            address = self._getaddrinfo(ip_address_bytes, None, AF_UNSPEC,
+                                        SOCK_DGRAM, 0, 0)[0][4][0]
+            return self._gethostbyaddr(address.encode('ascii'))
+        address = inet_ntop(family, packed)
+
+        hosts = self._hosts()
+        for name, host_address in iteritems(hosts.v4 if family == AF_INET else hosts.v6):
+            try:
+                if inet_pton(family, host_address) == packed:
+                    return name, self._getaliases(name, family), [address]
+            except (error, ValueError):
+                continue
+
+        if family == AF_INET:
+            qname = b'.'.join(reversed(address.encode('ascii').split(b'.'))) + b'.in-addr.arpa'
+        else:
+            nibbles = packed.hex()[::-1]
+            qname = '.'.join(nibbles).encode('ascii') + b'.ip6.arpa'
+        response = self._query(qname, (_PTR,)).get(_PTR)
+        if response is None:
+            raise herror(2, 'Host name lookup failure')
+        _, names, _ = _follow(response, qname, _PTR)
+        if not names:
+            raise herror(1, 'Unknown host')
+        return names[0].decode('ascii'), [], [address]
+
+    def _getnameinfo(self, address_bytes, port, sockaddr, flags):
+        result = self.getaddrinfo(address_bytes, port, AF_UNSPEC, SOCK_DGRAM)
+        if len(result) != 1:
+            raise error('sockaddr resolved to multiple addresses')
+
+        family, _, _, _, address = result[0]
+        if family == AF_INET:
+            if len(sockaddr) != 2:
+                raise error("IPv4 sockaddr must be 2 tuple")
+        elif family == AF_INET6:
+            address = address[:2] + sockaddr[2:]
+
+        # The numbers and the service name don't need the network.
+        host, service = native_getnameinfo(address, (flags | NI_NUMERICHOST) & ~NI_NAMEREQD)
+        if not flags & NI_NUMERICHOST:
+            try:
+                name = self._gethostbyaddr(host.encode('ascii'))[0]
+            except (herror, gaierror):
+                if flags & NI_NAMEREQD:
+                    raise gaierror(EAI_NONAME, self.EAI_NONAME_MSG)
+            else:
+                host = name.split('.', 1)[0] if flags & NI_NOFQDN else name
+        return host, service
@@ -3,12 +3,23 @@
 Native thread-based hostname resolver.
 """
 import _socket
+from itertools import repeat
 
 from gevent.hub import get_hub
+from gevent.resolver import _SingleFlight
+from gevent.resolver import _resolve_one
 
 
 __all__ = ['Resolver']
 
+# The most names ``resolve_many`` looks up in one thread job.
+_MAX_BATCH_SIZE = 32
+
+
+def _resolve_batch(hosts, args):
+    # Runs in a worker thread.
+    return [_resolve_one(_socket.getaddrinfo, host, args) for host in hosts]
+
 
 class Resolver(object):
     """
@@ -21,6 +32,10 @@ class Resolver(object):
     mechanisms. The use of native (non-greenlet) threads ensures that
     a caller doesn't block other greenlets.
 
+    Concurrent identical lookups are only made once; all their callers
+    get the same answer or error. :meth:`resolve_many` looks names up
+    in batches, so that each thread job handles several of them.
+
     This implementation also has the benefit of being very simple in comparison to
     :class:`gevent.resolver_ares.Resolver`.
 
@@ -32,11 +47,18 @@ class Resolver(object):
         particularly in long-lived programs that make many, many DNS
         requests. If you suspect that may be happening to you, try the
         dnspython or ares resolver (and submit a bug report).
+
+    .. versionchanged:: NEXT
+       Concurrent identical lookups are coalesced.
+
+    .. versionchanged:: NEXT
+       Add ``resolve_many``.
     """
     def __init__(self, hub=None):
         if hub is None:
             hub = get_hub()
         self.pool = hub.threadpool
+        self._single_flight = _SingleFlight()
         if _socket.gaierror not in hub.NOT_ERROR:
             # Do not cause lookup failures to get printed by the default
             # error handler. This can be very noisy.
@@ -53,17 +75,43 @@ class Resolver(object):
     # from briefly reading socketmodule.c, it seems that all of the functions
     # below are thread-safe in Python, even if they are not thread-safe in C.
 
+    def _apply(self, func, args, kwargs=None):
+        key = (func, args, tuple(sorted(kwargs.items())) if kwargs else ())
+        return self._single_flight.call(key, self.pool.apply, func, args, kwargs)
+
     def gethostbyname(self, *args):
-        return self.pool.apply(_socket.gethostbyname, args)
+        return self._apply(_socket.gethostbyname, args)
 
     def gethostbyname_ex(self, *args):
-        return self.pool.apply(_socket.gethostbyname_ex, args)
+        return self._apply(_socket.gethostbyname_ex, args)
 
     def getaddrinfo(self, *args, **kwargs):
-        return self.pool.apply(_socket.getaddrinfo, args, kwargs)
+        return self._apply(_socket.getaddrinfo, args, kwargs)
 
     def gethostbyaddr(self, *args, **kwargs):
-        return self.pool.apply(_socket.gethostbyaddr, args, kwargs)
+        return self._apply(_socket.gethostbyaddr, args, kwargs)
 
     def getnameinfo(self, *args, **kwargs):
         return self.pool.apply(_socket.getnameinfo, args, kwargs)
+
+    def resolve_many(self, hosts, port=0, family=0, socktype=0, proto=0, flags=0):
+        """
+        Look up each of the names in the iterable *hosts*, yielding
+        ``(host, result)`` pairs as they finish. See
+        :meth:`gevent.resolver.AbstractResolver.resolve_many`.
+
+        The names are split into batches, enough to keep each thread
+        of the pool busy, and each batch is one job for the pool.
+
+        .. versionadded:: NEXT
+        """
+        hosts = list(hosts)
+        # Two batches per thread, so one slow name doesn't hold up
+        # too many others.
+        size = -(-len(hosts) // (self.pool.maxsize * 2))
+        size = max(1, min(size, _MAX_BATCH_SIZE))
+        batches = [hosts[i:i + size] for i in range(0, len(hosts), size)]
+        args = (port, family, socktype, proto, flags)
+        for results in self.pool.imap_unordered(_resolve_batch, batches, repeat(args)):
+            for result in results:
+                yield result
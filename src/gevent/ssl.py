@@ -533,8 +533,6 @@ class SSLSocket(socket):
                 return None
             return self._sslobj.version()
 
-        # We inherit sendfile from super(); it always uses `send`
-
     def cipher(self):
         self._checkClosed()
         if not self._sslobj:
@@ -601,6 +599,32 @@ class SSLSocket(socket):
                 raise SSLWantWriteError("The operation did not complete (write)")
             raise
 
+    def sendfile(self, file, offset=0, count=None):
+        """
+        Send a file, possibly by using :func:`os.sendfile` if this is
+        not an encrypted connection.
+        """
+        if self._sslobj is not None:
+            return self._sendfile_use_send(file, offset, count)
+        # os.sendfile() works with plain-text sockets only
+        return socket.sendfile(self, file, offset, count)
+
+    def sendall_buffers(self, buffers, flags=0):
+        """
+        Like :meth:`gevent.socket.socket.sendall_buffers`.
+
+        Once the connection is encrypted, vectored I/O is not
+        possible, so the buffers are joined and sent with a single
+        :meth:`sendall`; that produces fewer, larger TLS records than
+        sending them one at a time.
+
+        .. versionadded:: NEXT
+        """
+        self._checkClosed()
+        if self._sslobj:
+            return self.sendall(b''.join(buffers), flags)
+        return socket.sendall_buffers(self, buffers, flags)
+
     def recv(self, buflen=1024, flags=0):
         self._checkClosed()
         if self._sslobj:
@@ -5,6 +5,7 @@ import unittest
 
 
 from greenlet import gettrace
+from greenlet import greenlet
 from greenlet import settrace
 
 from gevent.monkey import get_original
@@ -15,6 +16,10 @@ from gevent.testing import verify
 from gevent.testing.skipping import skipWithoutPSUtil
 
 from gevent import _monitor as monitor
+from gevent import events
+from gevent import util
+from gevent._tracer import CPUAccountingTracer
+from gevent._loop_stats import LoopStats
 from gevent import config as GEVENT_CONFIG
 
 get_ident = get_original(thread_mod_name, 'get_ident')
@@ -22,6 +27,7 @@ get_ident = get_original(thread_mod_name, 'get_ident')
 class MockHub(object):
     _threadpool = None
     _resolver = None
+    loop_stats = None
 
     def __init__(self):
         self.thread_ident = get_ident()
@@ -43,6 +49,12 @@ class MockHub(object):
     def reinit(self):
         "mock loop.reinit"
 
+    def start_loop_stats(self):
+        # Without starting it; there's no real loop.
+        if self.loop_stats is None:
+            self.loop_stats = LoopStats(self)
+        return self.loop_stats
+
 class _AbstractTestPeriodicMonitoringThread(object):
     # Makes sure we don't actually spin up a new monitoring thread.
 
@@ -281,6 +293,90 @@ class TestPeriodicMonitorBlocking(_AbstractTestPeriodicMonitoringThread,
         self.assertTrue(self.pmt.monitor_blocking(self.hub))
 
 
+class TestPeriodicMonitorCPU(_AbstractTestPeriodicMonitoringThread,
+                             unittest.TestCase):
+
+    def test_install(self):
+        old = self.pmt._greenlet_tracer
+        self.pmt.install_cpu_accounting(1)
+        tracer = self.pmt._greenlet_tracer
+        self.assertIsInstance(tracer, CPUAccountingTracer)
+        self.assertIsNot(tracer, old)
+        self.assertIs(gettrace(), tracer)
+        self.assertIs(tracer.previous_trace_function, old.previous_trace_function)
+        self.assertIn(monitor._MonitorEntry(self.pmt.monitor_cpu_usage, 1),
+                      self.pmt.monitoring_functions())
+        self.assertEqual(util.get_cpu_stats(self.hub).label, 'hub')
+
+        # Installing again only changes the period.
+        self.pmt.install_cpu_accounting(2)
+        self.assertIs(self.pmt._greenlet_tracer, tracer)
+        self.assertIn(monitor._MonitorEntry(self.pmt.monitor_cpu_usage, 2),
+                      self.pmt.monitoring_functions())
+
+    def test_monitor_cpu_usage(self):
+        reported = []
+        events.subscribers.append(reported.append)
+        self.addCleanup(events.subscribers.remove, reported.append)
+
+        self.pmt.install_cpu_accounting(1)
+        tracer = self.pmt._greenlet_tracer
+        a = greenlet()
+        b = greenlet()
+        util.set_cpu_label('a', a)
+        tracer('switch', (a, b))
+        tracer('switch', (b, a))
+        tracer('switch', (a, b))
+
+        event = self.pmt.monitor_cpu_usage(self.hub)
+        verify.verifyObject(events.ICPUUsageReport, event)
+        self.assertEqual(reported, [event])
+        self.assertIs(event.hub, self.hub)
+        self.assertEqual({s.label: s.switches for s in event.usage},
+                         {'a': 2, None: 1})
+        self.assertEqual(util.get_cpu_stats(a).switches, 2)
+        repr(event)
+
+        # The totals start over; the per-greenlet stats don't.
+        event = self.pmt.monitor_cpu_usage(self.hub)
+        self.assertEqual(event.usage, [])
+        self.assertEqual(util.get_cpu_stats(a).switches, 2)
+
+        # Blocking is still detected.
+        self.assertFalse(self.pmt.monitor_blocking(self.hub))
+        self.assertTrue(self.pmt.monitor_blocking(self.hub))
+
+
+class TestPeriodicMonitorLoopStats(_AbstractTestPeriodicMonitoringThread,
+                                   unittest.TestCase):
+
+    def test_monitor_loop_stats(self):
+        reported = []
+        events.subscribers.append(reported.append)
+        self.addCleanup(events.subscribers.remove, reported.append)
+
+        self.assertIsNone(self.pmt.monitor_loop_stats(self.hub))
+
+        self.pmt.install_loop_stats(1)
+        self.assertIn(monitor._MonitorEntry(self.pmt.monitor_loop_stats, 1),
+                      self.pmt.monitoring_functions())
+        histograms = self.hub.loop_stats.histograms
+        histograms.iteration_time.add(0.5)
+
+        event = self.pmt.monitor_loop_stats(self.hub)
+        verify.verifyObject(events.ILoopStatsReport, event)
+        self.assertEqual(reported, [event])
+        self.assertIs(event.hub, self.hub)
+        self.assertIs(event.histograms, histograms)
+        self.assertGreaterEqual(event.interval, 0)
+        repr(event)
+
+        # Each report has new histograms.
+        event = self.pmt.monitor_loop_stats(self.hub)
+        self.assertIsNot(event.histograms, histograms)
+        self.assertEqual(event.histograms.iteration_time.count, 0)
+
+
 class MockProcess(object):
 
     def __init__(self, rss):
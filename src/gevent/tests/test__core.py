@@ -13,6 +13,14 @@ from gevent._config import Loop
 
 available_loops = Loop().get_options()
 available_loops.pop('libuv', None)
+# Not selectable by name while the backend is experimental.
+for _name in ('cext', 'cffi'):
+    try:
+        available_loops['libev-iouring-' + _name] = Loop()._import_one(
+            'gevent.libev.core%s.iouring_loop' % _name)
+    except ImportError as e:
+        available_loops['libev-iouring-' + _name] = e
+del _name
 
 def not_available(name):
     return isinstance(available_loops[name], ImportError)
@@ -119,6 +127,36 @@ class TestLibevCext(LibevTestMixin, unittest.TestCase):
 class TestLibevCffi(LibevTestMixin, unittest.TestCase):
     kind = available_loops['libev-cffi']
 
+
+class LibevIouringTestMixin(LibevTestMixin):
+
+    def test_backend_default(self):
+        # pylint: disable=no-member
+        loop = self.kind(default=False)
+        try:
+            expected = list(self.core.recommended_backends())
+            if 'linux_iouring' in self.core.supported_backends():
+                # The kernel may still refuse to create a ring.
+                expected.append('linux_iouring')
+            self.assertIn(loop.backend, expected)
+        finally:
+            loop.destroy()
+
+    def test_backend_explicit(self):
+        loop = self.kind('select', default=False)
+        try:
+            self.assertEqual(loop.backend, 'select')
+        finally:
+            loop.destroy()
+
+@unittest.skipIf(not_available('libev-iouring-cext'), "Needs libev-cext")
+class TestLibevIouringCext(LibevIouringTestMixin, unittest.TestCase):
+    kind = available_loops['libev-iouring-cext']
+
+@unittest.skipIf(not_available('libev-iouring-cffi'), "Needs libev-cffi")
+class TestLibevIouringCffi(LibevIouringTestMixin, unittest.TestCase):
+    kind = available_loops['libev-iouring-cffi']
+
 @unittest.skipIf(not_available('libuv-cffi'), "Needs libuv-cffi")
 class TestLibuvCffi(WatcherTestMixin, unittest.TestCase):
     kind = available_loops['libuv-cffi']
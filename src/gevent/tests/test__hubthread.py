@@ -0,0 +1,161 @@
+from __future__ import absolute_import, print_function, division
+
+import threading
+
+import gevent
+from gevent import socket
+import gevent.testing as greentest
+from gevent.hubthread import HubThread
+from gevent.hubthread import HubThreadGroup
+from gevent.hubthread import HubThreadServer
+
+
+class TestHubThread(greentest.TestCase):
+
+    def test_spawn(self):
+        thread = HubThread()
+        thread.start()
+        results = []
+
+        def work(i):
+            # Blocking calls work; this is a real hub.
+            gevent.sleep(0.001)
+            results.append((i, threading.get_ident(), gevent.get_hub()))
+
+        for i in range(10):
+            thread.spawn(work, i)
+        self.assertTrue(thread.stop(5))
+        self.assertEqual([r[0] for r in sorted(results)], list(range(10)))
+        self.assertEqual(len({r[1] for r in results}), 1)
+        self.assertNotEqual(results[0][1], threading.get_ident())
+        self.assertIsNot(results[0][2], gevent.get_hub())
+        self.assertIsNone(thread.hub)
+
+    def test_stop_waits_for_greenlets(self):
+        thread = HubThread()
+        thread.start()
+        done = []
+
+        def work():
+            gevent.sleep(0.1)
+            done.append(1)
+        thread.spawn(work)
+        self.assertTrue(thread.stop(5))
+        self.assertEqual(done, [1])
+
+    def test_stop_not_started(self):
+        self.assertTrue(HubThread().stop())
+
+    def test_spawn_not_running(self):
+        thread = HubThread()
+        ran = []
+        with self.assertRaisesRegex(RuntimeError, 'not started'):
+            thread.spawn(ran.append, 1)
+        thread.start()
+        self.assertTrue(thread.stop(5))
+        # Nothing was left waiting to run.
+        self.assertEqual(ran, [])
+        with self.assertRaisesRegex(RuntimeError, 'stopped'):
+            thread.spawn(ran.append, 2)
+        self.assertTrue(thread.stop(5))
+        self.assertEqual(ran, [])
+
+    def test_spawn_while_stopping(self):
+        thread = HubThread()
+        thread.start()
+        accepted = []
+        ran = []
+        errors = []
+
+        def spawner():
+            try:
+                while True:
+                    thread.spawn(ran.append, 1)
+                    accepted.append(1)
+            except RuntimeError:
+                pass
+            except Exception as ex: # pylint:disable=broad-except
+                errors.append(ex)
+
+        spawners = [threading.Thread(target=spawner) for _ in range(4)]
+        for t in spawners:
+            t.start()
+        self.assertTrue(thread.stop(5))
+        for t in spawners:
+            t.join(5)
+        self.assertEqual(errors, [])
+        # Everything accepted ran.
+        self.assertEqual(len(ran), len(accepted))
+
+    def test_group_round_robin(self):
+        group = HubThreadGroup(3)
+        group.start()
+        idents = []
+        for _ in range(6):
+            group.spawn(lambda: idents.append(threading.get_ident()))
+        self.assertTrue(group.stop(5))
+        self.assertEqual(len(idents), 6)
+        self.assertEqual(len(set(idents)), 3)
+
+
+class TestHubThreadServer(greentest.TestCase):
+
+    def _echo(self, sock, _address):
+        self.idents.add(threading.get_ident())
+        sock.sendall(sock.recv(100))
+
+    def setUp(self):
+        super(TestHubThreadServer, self).setUp()
+        self.idents = set()
+
+    def _request(self, server, data):
+        with socket.create_connection((greentest.DEFAULT_LOCAL_HOST_ADDR, server.server_port)) as conn:
+            conn.sendall(data)
+            return conn.recv(100)
+
+    def test_handles_in_threads(self):
+        server = HubThreadServer((greentest.DEFAULT_BIND_ADDR, 0), self._echo, hubs=2)
+        server.start()
+        try:
+            glets = [gevent.spawn(self._request, server, b'%d' % i) for i in range(10)]
+            gevent.joinall(glets, raise_error=True)
+        finally:
+            server.stop()
+        self.assertEqual([g.value for g in glets], [b'%d' % i for i in range(10)])
+        self.assertEqual(len(self.idents), 2)
+        self.assertNotIn(threading.get_ident(), self.idents)
+        self.assertEqual(server.connections_accepted, 10)
+
+    def test_restart(self):
+        echo = self._echo
+
+        class Server(HubThreadServer):
+            def handle(self, sock, address): # pylint:disable=method-hidden
+                echo(sock, address)
+
+        server = Server((greentest.DEFAULT_BIND_ADDR, 0), hubs=1)
+        server.start()
+        self.assertEqual(self._request(server, b'a'), b'a')
+        server.stop()
+        server.start()
+        try:
+            self.assertEqual(self._request(server, b'b'), b'b')
+        finally:
+            server.stop()
+
+    def test_shared_group(self):
+        group = HubThreadGroup(2)
+        group.start()
+        try:
+            server = HubThreadServer((greentest.DEFAULT_BIND_ADDR, 0), self._echo, hubs=group)
+            server.start()
+            self.assertEqual(self._request(server, b'x'), b'x')
+            server.stop()
+            # The group is still running.
+            self.assertIsNotNone(group.threads[0].hub)
+        finally:
+            self.assertTrue(group.stop(5))
+
+
+if __name__ == '__main__':
+    greentest.main()
@@ -1,3 +1,6 @@
+import sys
+import time
+
 import gevent
 
 from gevent import testing as greentest
@@ -15,6 +18,74 @@ class Test(greentest.TestCase):
         b = gevent.spawn(func)
         gevent.joinall([a, b, a])
 
+    def test_other_objects(self):
+        from gevent.event import Event
+        event = Event()
+        gevent.spawn_later(0.01, event.set)
+        self.assertEqual(gevent.joinall([event, event]), [event])
+
+    def test_timeout(self):
+        a = gevent.spawn(gevent.sleep, 0)
+        b = gevent.spawn(gevent.sleep, 10)
+        self.assertEqual(gevent.joinall([a, b], timeout=0.01), [a])
+        self.assertFalse(b.has_links())
+        b.kill()
+
+    def test_empty(self):
+        self.assertEqual(gevent.joinall([]), [])
+
+
+class TestSpawnMany(greentest.TestCase):
+
+    def test_spawn_many(self):
+        results = []
+        greenlets = gevent.spawn_many(results.append, range(5))
+        self.assertEqual(len(greenlets), 5)
+        self.assertFalse(results)
+        done = gevent.joinall(greenlets)
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+        self.assertEqual(done, greenlets)
+        self.assertTrue(all(g.dead and g.successful() for g in greenlets))
+
+    def test_kill_before_start(self):
+        results = []
+        greenlets = gevent.spawn_many(results.append, range(3))
+        greenlets[1].kill()
+        gevent.joinall(greenlets)
+        self.assertEqual(results, [0, 2])
+        self.assertIsInstance(greenlets[1].value, gevent.GreenletExit)
+
+    def test_blocking(self):
+        greenlets = gevent.spawn_many(gevent.sleep, [0.02, 0.01])
+        self.assertEqual(gevent.joinall(greenlets), greenlets[::-1])
+
+    def test_not_callable(self):
+        self.assertRaises(TypeError, gevent.spawn_many, 1, ())
+
+    def test_yields_to_loop(self):
+        # Starting lots of greenlets that take a while doesn't keep
+        # the loop's other callbacks waiting beyond the switch
+        # interval.
+        results = []
+        seen = []
+
+        def func(i):
+            time.sleep(0.0002) # Really block.
+            results.append(i)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(0.001)
+        try:
+            greenlets = gevent.spawn_many(func, range(200))
+            gevent.get_hub().loop.run_callback(lambda: seen.append(len(results)))
+            gevent.joinall(greenlets)
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(results, list(range(200)))
+        self.assertEqual(len(seen), 1)
+        self.assertGreater(seen[0], 0)
+        self.assertLess(seen[0], 200)
+
 
 if __name__ == '__main__':
     greentest.main()
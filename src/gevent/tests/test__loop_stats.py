@@ -0,0 +1,121 @@
+from __future__ import absolute_import, print_function, division
+
+import time
+
+import gevent
+import gevent.testing as greentest
+from gevent._loop_stats import Histogram
+from gevent._loop_stats import LoopHistograms
+
+
+class TestHistogram(greentest.TestCase):
+
+    def test_empty(self):
+        hist = Histogram((1, 2))
+        self.assertEqual(hist.counts, [0, 0, 0])
+        self.assertEqual(hist.mean, 0)
+        self.assertEqual(hist.percentile(0.5), 0)
+        repr(hist)
+
+    def test_buckets(self):
+        hist = Histogram((1, 2, 5))
+        for value in 0, 1, 1.5, 2, 3, 7:
+            hist.add(value)
+        self.assertEqual(hist.counts, [2, 2, 1, 1])
+        self.assertEqual(hist.count, 6)
+        self.assertEqual(hist.total, 14.5)
+        self.assertEqual(hist.max, 7)
+        self.assertAlmostEqual(hist.mean, 14.5 / 6)
+
+    def test_percentile(self):
+        hist = Histogram((1, 2, 5))
+        for value in [0.5] * 50 + [1.5] * 40 + [4] * 9 + [10]:
+            hist.add(value)
+        self.assertEqual(hist.percentile(0), 1)
+        self.assertEqual(hist.percentile(0.5), 1)
+        self.assertEqual(hist.percentile(0.9), 2)
+        self.assertEqual(hist.percentile(0.99), 5)
+        # Past the last bound, the largest value.
+        self.assertEqual(hist.percentile(1), 10)
+
+
+class TestLoopStats(greentest.TestCase):
+
+    def _check_histograms(self, histograms):
+        self.assertIsInstance(histograms, LoopHistograms)
+        self.assertGreater(histograms.iteration_time.count, 0)
+        # One spin blocked the loop for about 0.05s.
+        self.assertGreaterEqual(histograms.iteration_time.max, 0.04)
+        if not greentest.LIBUV:
+            self.assertGreater(histograms.poll_time.count, 0)
+            self.assertGreaterEqual(histograms.run_time.max, 0.04)
+            self.assertEqual(histograms.callbacks.count, histograms.run_time.count)
+        self.assertEqual(histograms.watchers.count, histograms.callbacks.count)
+        # The timers firing.
+        self.assertGreaterEqual(histograms.watchers.max, 1)
+        if greentest.LIBUV:
+            self.assertEqual(histograms.callbacks.count, histograms.iteration_time.count)
+        repr(histograms)
+
+    def test_collect(self):
+        hub = gevent.get_hub()
+        loop_stats = hub.start_loop_stats()
+        self.addCleanup(hub.stop_loop_stats)
+        self.assertIs(hub.loop_stats, loop_stats)
+        self.assertTrue(loop_stats.started)
+        # Starting again does nothing.
+        self.assertIs(hub.start_loop_stats(), loop_stats)
+
+        def spin():
+            gevent.sleep(0.001)
+            end = time.time() + 0.05
+            while time.time() < end:
+                pass
+            gevent.sleep(0.001)
+
+        gevent.joinall([gevent.spawn(spin), gevent.spawn(gevent.sleep, 0.01)])
+        gevent.sleep(0.001)
+        self._check_histograms(loop_stats.take())
+
+        # New histograms are started.
+        self.assertEqual(loop_stats.histograms.iteration_time.count, 0)
+
+        hub.stop_loop_stats()
+        self.assertFalse(loop_stats.started)
+        gevent.sleep(0.001)
+        self.assertEqual(loop_stats.histograms.iteration_time.count, 0)
+        self.assertIs(hub.loop_stats, loop_stats)
+
+    def test_first_iteration(self):
+        hub = gevent.get_hub()
+        loop_stats = hub.start_loop_stats()
+        self.addCleanup(hub.stop_loop_stats)
+        # Block the iteration we started in.
+        end = time.time() + 0.05
+        while time.time() < end:
+            pass
+        gevent.sleep(0.001)
+        histograms = loop_stats.take()
+        self.assertGreaterEqual(histograms.iteration_time.max, 0.04)
+        if not greentest.LIBUV:
+            self.assertGreaterEqual(histograms.run_time.max, 0.04)
+
+    def test_iteration_counts(self):
+        hub = gevent.get_hub()
+        loop_stats = hub.start_loop_stats()
+        self.addCleanup(hub.stop_loop_stats)
+        # Each sleep is one iteration, whatever the loop. (libuv
+        # runs an extra iteration that does nothing after each of
+        # these; that's not counted.)
+        for _ in range(20):
+            gevent.sleep(0.001)
+        histograms = loop_stats.take()
+        self.assertGreaterEqual(histograms.iteration_time.count, 20)
+        self.assertLessEqual(histograms.iteration_time.count, 22)
+        self.assertEqual(histograms.callbacks.count, histograms.iteration_time.count)
+        self.assertEqual(histograms.watchers.count, histograms.iteration_time.count)
+        self.assertGreaterEqual(histograms.watchers.max, 1)
+
+
+if __name__ == '__main__':
+    greentest.main()
@@ -134,6 +134,16 @@ def crash(*_args, **_kw):
     raise RuntimeError("Raising an error from the crash() function")
 
 
+class ReusingPool(gevent.pool.Pool):
+
+    def __init__(self, size=None):
+        gevent.pool.Pool.__init__(self, size, reuse_greenlets=True)
+
+
+class TestCoroutinePoolReuse(TestCoroutinePool):
+    klass = ReusingPool
+
+
 class FakeFile(object):
 
     def write(self, *_args):
@@ -486,6 +496,171 @@ class TestPoolUnlimit(TestPool):
     size = None
 
 
+@greentest.ignores_leakcheck
+class TestPoolReuse(TestPool):
+    size = 3
+
+    def setUp(self):
+        TestPool.setUp(self)
+        self.pool = ReusingPool(self.size)
+
+
+class TestPoolReuseUnlimit(TestPoolReuse):
+    size = None
+
+
+class TestPooledTask(greentest.TestCase):
+
+    def setUp(self):
+        greentest.TestCase.setUp(self)
+        self.pool = ReusingPool(2)
+
+    def test_reuses_greenlets(self):
+        current = []
+
+        def record():
+            # Not the greenlet itself; that would stop its reuse.
+            current.append(id(gevent.getcurrent()))
+            return len(current)
+
+        tasks = [self.pool.spawn(record) for _ in range(6)]
+        self.pool.join()
+        self.assertEqual([t.get() for t in tasks], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(set(current)), 2)
+        self.assertTrue(all(t.dead and t.successful() for t in tasks))
+        self.assertEqual(self.pool.free_count(), 2)
+
+    def test_limits_concurrency(self):
+        self.pool.spawn(gevent.sleep, 0.1)
+        self.pool.spawn(gevent.sleep, 0.1)
+        self.assertTrue(self.pool.full())
+        self.pool.join()
+        self.assertFalse(self.pool.full())
+
+    def test_error(self):
+        task = self.pool.spawn(crash, 1, arg=2)
+        task.join()
+        self.assertFalse(task.successful())
+        self.assertIsInstance(task.exception, RuntimeError)
+        self.assertRaises(RuntimeError, task.get)
+        self.assertEqual(len(self.pool), 0)
+        # The greenlet is still usable.
+        self.assertEqual(self.pool.apply(sqr, (3,)), 9)
+    test_error.error_fatal = False
+
+    def test_kill_running(self):
+        task = self.pool.spawn(gevent.sleep, 10)
+        gevent.sleep(0)
+        task.kill()
+        self.assertTrue(task.dead)
+        self.assertTrue(task.successful())
+        self.assertIsInstance(task.value, gevent.GreenletExit)
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(self.pool.apply(sqr, (2,)), 4)
+
+    def test_kill_before_start(self):
+        ran = []
+        task = self.pool.spawn(ran.append, 1)
+        task.kill(ExpectedException('killed'))
+        self.assertIsInstance(task.exception, ExpectedException)
+        self.pool.join()
+        self.assertEqual(ran, [])
+        self.assertEqual(len(self.pool), 0)
+
+    def test_pool_kill(self):
+        for _ in range(2):
+            self.pool.spawn(gevent.sleep, 10)
+        gevent.sleep(0)
+        self.pool.kill()
+        self.assertEqual(len(self.pool), 0)
+        self.assertFalse(self.pool.full())
+
+    def test_max_idle_greenlets(self):
+        pool = ReusingPool()
+        pool.max_idle_greenlets = 1
+        for _ in range(3):
+            pool.spawn(gevent.sleep, 0.01)
+        pool.join()
+        self.assertEqual(len(pool._idle), 1)
+
+    @greentest.skipOnPyPy("Can't tell what refers to the greenlet")
+    def test_leftover_timeout(self):
+        pool = ReusingPool(1)
+        first = pool.spawn(gevent.Timeout.start_new, 0.05)
+        first.join()
+        # It would interrupt this, if it ran in the same greenlet.
+        second = pool.spawn(gevent.sleep, 0.2)
+        self.assertIsNone(second.get())
+        self.assertTrue(second.successful())
+        # Those that don't leave anything behind share a greenlet.
+        current = []
+        for _ in range(3):
+            pool.spawn(lambda: current.append(id(gevent.getcurrent()))).join()
+        self.assertEqual(len(set(current)), 1)
+
+    def test_not_callable(self):
+        self.assertRaises(TypeError, self.pool.spawn, 1)
+        self.assertEqual(self.pool.free_count(), 2)
+
+    def test_greenlet_class(self):
+        with self.assertRaises(ValueError):
+            gevent.pool.Pool(reuse_greenlets=True, greenlet_class=gevent.Greenlet)
+
+
+class TestSpawnMany(greentest.TestCase):
+
+    def test_group(self):
+        group = gevent.pool.Group()
+        greenlets = group.spawn_many(sqr, range(10))
+        self.assertEqual(len(group), 10)
+        group.join()
+        self.assertEqual(len(group), 0)
+        self.assertEqual([g.value for g in greenlets], list(map(squared, range(10))))
+
+    def test_pool_blocks(self):
+        pool = gevent.pool.Pool(3)
+        running = []
+
+        def func(i):
+            running.append(len(pool))
+            gevent.sleep(0.001)
+            return i
+
+        greenlets = pool.spawn_many(func, range(10))
+        pool.join()
+        self.assertEqual([g.value for g in greenlets], list(range(10)))
+        self.assertLessEqual(max(running), 3)
+        self.assertEqual(pool.free_count(), 3)
+
+    def test_pool_reuse(self):
+        pool = ReusingPool(3)
+        tasks = pool.spawn_many(sqr, range(5))
+        pool.join()
+        self.assertEqual([t.value for t in tasks], list(map(squared, range(5))))
+
+    def test_not_callable(self):
+        pool = gevent.pool.Pool(3)
+        self.assertRaises(TypeError, pool.spawn_many, 1, range(3))
+        self.assertEqual(pool.free_count(), 3)
+
+    def test_iterable_raises(self):
+        pool = gevent.pool.Pool(3)
+
+        def items():
+            yield 1
+            yield 2
+            raise ExpectedException('items')
+
+        with self.assertRaises(ExpectedException):
+            pool.spawn_many(sqr, items())
+        self.assertEqual(pool.free_count(), 3)
+        # Still usable at full size.
+        greenlets = pool.spawn_many(sqr, range(3))
+        pool.join()
+        self.assertEqual([g.value for g in greenlets], list(map(squared, range(3))))
+        self.assertEqual(pool.free_count(), 3)
+
+
 class TestPool0(greentest.TestCase):
     size = 0
 
@@ -0,0 +1,141 @@
+"""Tests for gevent.prefork.
+
+The runner is started in a subprocess (this file, with 'subprocess'
+as its first argument) and we talk to it over HTTP.
+"""
+import sys
+
+if sys.argv[1:2] == ['subprocess']: # pragma: no cover
+    import os
+    import gevent
+    from gevent.prefork import PreforkRunner
+    from gevent.pywsgi import WSGIServer
+
+    def application(environ, start_response):
+        if environ['PATH_INFO'] == '/slow':
+            gevent.sleep(0.5)
+        start_response('200 OK', [])
+        return [b'%d %d' % (os.getpid(), os.getppid())]
+
+    def make_server(listener):
+        if 'broken' in sys.argv:
+            raise Exception('broken')
+        return WSGIServer(listener, application, log=None, spawn=10)
+
+    runner = PreforkRunner(('127.0.0.1', 0), make_server, workers=2,
+                           reuse_port='reuse_port' in sys.argv)
+    runner.restart_delay = 0.1
+    sys.stdout.write('%d\n' % runner.address[1])
+    sys.stdout.flush()
+    try:
+        runner.serve_forever()
+    except RuntimeError:
+        sys.exit(2)
+    sys.exit(0)
+
+else:
+    import os
+    import signal
+    import socket
+    import time
+    import unittest
+    from subprocess import Popen, PIPE
+
+    import gevent.testing as greentest
+    from gevent.server import SO_REUSEPORT
+
+    @greentest.skipOnWindows("Requires fork()")
+    class TestPrefork(unittest.TestCase):
+
+        args = ()
+
+        def _start(self, *args):
+            # (not on Py2) pylint:disable=consider-using-with
+            self.process = Popen([sys.executable, __file__, 'subprocess'] + list(self.args + args),
+                                 stdout=PIPE)
+            self.addCleanup(self._cleanup)
+            self.port = int(self.process.stdout.readline())
+
+        def _cleanup(self):
+            if self.process.poll() is None:
+                self.process.kill()
+                self.process.wait()
+            self.process.stdout.close()
+
+        def _get(self, path='/'):
+            deadline = time.time() + 10
+            while True:
+                try:
+                    with socket.create_connection(('127.0.0.1', self.port), timeout=10) as sock:
+                        sock.sendall(b'GET ' + path.encode('ascii') + b' HTTP/1.0\r\n\r\n')
+                        with sock.makefile('rb') as f:
+                            response = f.read()
+                    break
+                except socket.error:
+                    # The workers are still starting.
+                    if time.time() > deadline:
+                        raise
+                    time.sleep(0.05)
+            self.assertTrue(response.startswith(b'HTTP/1.1 200 OK'), response)
+            pid, ppid = response.split(b'\r\n\r\n')[1].split()
+            self.assertEqual(int(ppid), self.process.pid)
+            return int(pid)
+
+        def _pids(self, count=20):
+            return {self._get() for _ in range(count)}
+
+        def _wait_for(self, condition):
+            deadline = time.time() + 10
+            while not condition():
+                self.assertLess(time.time(), deadline)
+                time.sleep(0.05)
+
+        def _stop(self):
+            self.process.send_signal(signal.SIGTERM)
+            self.assertEqual(self.process.wait(10), 0)
+
+        def test_serve_and_stop(self):
+            self._start()
+            pids = self._pids()
+            self.assertNotIn(self.process.pid, pids)
+            self._stop()
+
+        def test_reload(self):
+            self._start()
+            old = self._pids()
+            self.process.send_signal(signal.SIGHUP)
+            self._wait_for(lambda: not self._pids() & old)
+            self._stop()
+
+        def test_replace_dead_worker(self):
+            self._start()
+            dead = self._get()
+            os.kill(dead, signal.SIGKILL)
+            self._wait_for(lambda: dead not in self._pids())
+            self._stop()
+
+        def test_graceful_stop(self):
+            self._start()
+            self._get()
+            with socket.create_connection(('127.0.0.1', self.port), timeout=10) as sock:
+                sock.sendall(b'GET /slow HTTP/1.0\r\n\r\n')
+                time.sleep(0.1)
+                self.process.send_signal(signal.SIGTERM)
+                with sock.makefile('rb') as f:
+                    response = f.read()
+            self.assertTrue(response.startswith(b'HTTP/1.1 200 OK'), response)
+            self.assertEqual(self.process.wait(10), 0)
+
+        def test_worker_fails_to_start(self):
+            self._start('broken')
+            self.assertEqual(self.process.wait(10), 2)
+
+
+    @unittest.skipIf(SO_REUSEPORT is None, "Requires SO_REUSEPORT")
+    class TestPreforkReusePort(TestPrefork):
+
+        args = ('reuse_port',)
+
+
+    if __name__ == '__main__':
+        greentest.main()
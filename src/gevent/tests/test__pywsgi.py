@@ -26,6 +26,7 @@ from contextlib import contextmanager
 from urllib.parse import parse_qs
 import os
 import sys
+import time
 from io import BytesIO as StringIO
 
 import unittest
@@ -35,6 +36,7 @@ import gevent.testing as greentest
 import gevent
 
 from gevent.testing.exception import ExpectedException
+from gevent.event import Event
 from gevent import socket
 from gevent import pywsgi
 from gevent.pywsgi import Input
@@ -634,6 +636,105 @@ class TestBigChunks(TestChunkedApp):
     chunks = [b'a' * 8192] * 3
 
 
+class TestFileWrapper(TestCase):
+
+    validator = None
+    data = b''.join(b'%d\n' % i for i in range(100000))
+    # Set by tests
+    body_file = None
+    headers = ()
+    offset = 0
+
+    def setUp(self):
+        super(TestFileWrapper, self).setUp()
+        import tempfile
+        fd, self.filename = tempfile.mkstemp(prefix='gevent-test-')
+        os.write(fd, self.data)
+        os.close(fd)
+        self._close_on_teardown(lambda: os.remove(self.filename))
+        self.closed = []
+        self.sendfile_calls = []
+        orig_sendfile = socket.socket.sendfile
+        def sendfile(sock, *args):
+            self.sendfile_calls.append(args)
+            return orig_sendfile(sock, *args)
+        socket.socket.sendfile = sendfile
+        self._close_on_teardown(lambda: setattr(socket.socket, 'sendfile', orig_sendfile))
+
+    def application(self, env, start_response):
+        start_response('200 OK', list(self.headers))
+        body = self.body_file or open(self.filename, 'rb') # pylint:disable=consider-using-with
+        body.seek(self.offset)
+        orig_close = body.close
+        def close():
+            self.closed.append(body)
+            orig_close()
+        body.close = close
+        return env['wsgi.file_wrapper'](body, 4096)
+
+    def _get(self):
+        with self.makefile() as fd:
+            fd.write('GET / HTTP/1.1\r\nHost: localhost\r\n\r\n')
+            response = read_http(fd)
+            # Keep-alive still works.
+            fd.write('GET / HTTP/1.1\r\nHost: localhost\r\n\r\n')
+            read_http(fd, body=response.body)
+        self.assertEqual(len(self.closed), 2)
+        return response
+
+    def test_sendfile(self):
+        response = self._get()
+        self.assertEqual(response.body, self.data)
+        response.assertHeader('Content-Length', str(len(self.data)))
+        self.assertEqual(len(self.sendfile_calls), 2)
+
+    def test_sendfile_offset(self):
+        self.offset = 1000
+        response = self._get()
+        self.assertEqual(response.body, self.data[1000:])
+        response.assertHeader('Content-Length', str(len(self.data) - 1000))
+        self.assertEqual(self.sendfile_calls[0][1:], (1000, len(self.data) - 1000))
+
+    def test_sendfile_content_length(self):
+        self.headers = [('Content-Length', '1234')]
+        response = self._get()
+        self.assertEqual(response.body, self.data[:1234])
+        self.assertEqual(self.sendfile_calls[0][1:], (0, 1234))
+
+    def test_sendfile_negative_content_length(self):
+        # Nothing we can send with sendfile; it's iterated like any
+        # other result.
+        self.headers = [('Content-Length', '-5')]
+        with self.makefile() as fd:
+            fd.write('GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n')
+            response = fd.read()
+        if not isinstance(response, bytes):
+            response = response.encode('latin-1')
+        headers, body = response.split(b'\r\n\r\n', 1)
+        self.assertTrue(headers.startswith(b'HTTP/1.1 200 OK\r\n'), headers)
+        self.assertIn(b'\r\nContent-Length: -5', headers)
+        self.assertEqual(body, self.data)
+        self.assertEqual(self.sendfile_calls, [])
+
+    def test_not_a_file(self):
+        self.body_file = StringIO(self.data)
+        with self.makefile() as fd:
+            fd.write('GET / HTTP/1.1\r\nHost: localhost\r\n\r\n')
+            response = read_http(fd, body=self.data, chunks=None)
+        response.assertHeader('Transfer-Encoding', 'chunked')
+        self.assertEqual(response.chunks[0], self.data[:4096])
+        self.assertEqual(self.sendfile_calls, [])
+        self.assertEqual(len(self.closed), 1)
+
+    def test_iterate(self):
+        with open(self.filename, 'rb') as f:
+            wrapper = pywsgi.FileWrapper(f, 1000)
+            self.assertEqual(b''.join(wrapper), self.data)
+            wrapper.close()
+            self.assertTrue(f.closed)
+        pywsgi.FileWrapper(object()).close()
+
+
 class TestNegativeRead(TestCase):
 
     def application(self, env, start_response):
@@ -1679,6 +1780,67 @@ class TestHTTPResponseSplitting(TestCase):
         self.headers = [('Test\r\n', 'Hi')]
         self._assert_failure('carriage return or newline in header name')
 
+    def test_newline_in_header_value_cached_name(self):
+        # Using a header name successfully doesn't skip
+        # checking its value later.
+        self.headers = [('Test', 'Hi')]
+        with self.makefile() as fd:
+            fd.write('GET / HTTP/1.0\r\nHost: localhost\r\n\r\n')
+            read_http(fd)
+        self.assertIsNone(self.start_exc)
+        self.test_newline_in_header_value()
+
+
+class TestResponseHeaders(greentest.BaseTestCase):
+
+    def _start_response(self, status, headers):
+        handler = pywsgi.WSGIHandler.__new__(pywsgi.WSGIHandler)
+        handler.request_version = 'HTTP/1.1'
+        handler.start_response(status, headers)
+        return handler
+
+    def test_repeated(self):
+        for _ in range(2):
+            handler = self._start_response('404 Not Found', [
+                ('Content-Type', 'text/plain'),
+                ('content-length', '0'),
+                ('DATE', 'Thu, 01 Jan 1970 00:00:00 GMT'),
+                ('Connection', 'close'),
+            ])
+            self.assertEqual(handler.status, b'404 Not Found')
+            self.assertEqual(handler.code, 404)
+            self.assertEqual(handler._orig_status, '404 Not Found')
+            self.assertEqual(handler.response_headers, [
+                (b'Content-Type', b'text/plain'),
+                (b'content-length', b'0'),
+                (b'DATE', b'Thu, 01 Jan 1970 00:00:00 GMT'),
+                (b'Connection', b'close'),
+            ])
+            self.assertEqual(handler.provided_content_length, '0')
+            self.assertEqual(handler.provided_date, 'Thu, 01 Jan 1970 00:00:00 GMT')
+            self.assertTrue(handler.close_connection)
+
+    def test_bad_values_with_cached_names(self):
+        self._start_response('200 OK', [('X-Test', 'ok')])
+        with self.assertRaises(UnicodeError):
+            self._start_response('200 OK', [('X-Test', b'bytes')])
+        with self.assertRaises(UnicodeError):
+            self._start_response('200 OK', [('X-Test', '\u20ac')])
+        with self.assertRaises(UnicodeError):
+            self._start_response(b'200 OK', [])
+        with self.assertRaises(ValueError):
+            self._start_response('OK 200', [])
+
+    def test_date(self):
+        handler = self._start_response('200 OK', [])
+        handler.result = []
+        handler.finalize_headers()
+        date = dict(handler.response_headers)[b'Date']
+        self.assertIn(date, (pywsgi.format_date_time(time.time() - 1),
+                             pywsgi.format_date_time(time.time())))
+        # Cached for the second.
+        self.assertIs(pywsgi._current_date(), pywsgi._current_date())
+
 
 class TestInvalidEnviron(TestCase):
     validator = None
@@ -1888,6 +2050,231 @@ class TestInputRaw(greentest.BaseTestCase):
         self.assertEqual(i.readline(n), b'q')
 
 
+class TestPipelining(TestCase):
+
+    validator = None
+    big = b'x' * 100000
+
+    class handler_class(TestCase.handler_class):
+        flushed = None
+
+        def _flush_pipeline_output(self):
+            if self._pipeline_output:
+                self.flushed.append(bytes(self._pipeline_output))
+            super(TestPipelining.handler_class, self)._flush_pipeline_output()
+
+    def setUp(self):
+        super(TestPipelining, self).setUp()
+        self.flushed = self.handler_class.flushed = []
+        self.proceed = Event()
+
+    def tearDown(self):
+        self.handler_class.pipeline_buffer_size = pywsgi.WSGIHandler.pipeline_buffer_size
+        super(TestPipelining, self).tearDown()
+
+    def application(self, env, start_response):
+        path = env['PATH_INFO']
+        # For an upgrade, this is the connection itself.
+        body = env['wsgi.input'].read() if env['wsgi.input_terminated'] else b''
+        if path == '/big':
+            start_response('200 OK', [])
+            return [self.big]
+        if path == '/chunked':
+            start_response('200 OK', [])
+            return iter([b'chunk1', b'chunk2'])
+        if path == '/stream':
+            start_response('200 OK', [])
+            return self._stream()
+        if path == '/upgrade':
+            write = start_response('101 Switching Protocols', [('Connection', 'close')])
+            write(b'')
+            # Now the application would use the socket itself.
+            self.proceed.wait()
+            return []
+        start_response('200 OK', [('Content-Length', str(len(path) + len(body)))])
+        return [path.encode('ascii') + body]
+
+    def _stream(self):
+        yield b'first'
+        self.proceed.wait()
+        yield b'second'
+
+    def _readline_until(self, fd, line):
+        # Without waiting for the application to go on.
+        with gevent.Timeout(5):
+            while fd.readline() != line:
+                pass
+
+    def _request(self, path, body=None):
+        if body is None:
+            return self.format_request(path=path)
+        return self.format_request('POST', path, **{'Content-Length': len(body)}) + body
+
+    def _pipeline(self, *requests):
+        with self.makefile() as fd:
+            fd.write(''.join(requests))
+            return [read_http(fd) for _ in requests]
+
+    def test_responses_sent_together(self):
+        paths = ['/%d' % i for i in range(5)]
+        responses = self._pipeline(*[self._request(path) for path in paths])
+        self.assertEqual([r.body for r in responses], [p.encode('ascii') for p in paths])
+        self.assertEqual(len(self.flushed), 1)
+        self.assertEqual(self.flushed[0].count(b'HTTP/1.1 200 OK'), 5)
+
+    def test_not_pipelined(self):
+        with self.makefile() as fd:
+            for path in '/a', '/b':
+                fd.write(self._request(path))
+                read_http(fd, body=path)
+        self.assertEqual(self.flushed, [])
+
+    def test_request_with_body_not_collected(self):
+        responses = self._pipeline(self._request('/a'), self._request('/b'),
+                                   self._request('/c', 'body'), self._request('/d'),
+                                   self._request('/e'))
+        self.assertEqual([r.body for r in responses], [b'/a', b'/b', b'/cbody', b'/d', b'/e'])
+        # The responses before and after the POST.
+        self.assertEqual([f.count(b'HTTP/1.1') for f in self.flushed], [2, 2])
+
+    def test_large_and_chunked_responses(self):
+        responses = self._pipeline(self._request('/a'), self._request('/big'),
+                                   self._request('/chunked'), self._request('/b'))
+        self.assertEqual([r.body for r in responses],
+                         [b'/a', self.big, b'chunk1chunk2', b'/b'])
+        self.assertEqual(responses[2].chunks, [b'chunk1', b'chunk2'])
+
+    def test_connection_close(self):
+        with self.makefile() as fd:
+            fd.write(self._request('/a') + self.format_request(path='/b', Connection='close'))
+            read_http(fd, body='/a')
+            read_http(fd, body='/b')
+            self.assertEqual(fd.read(), b'')
+        self.assertEqual(len(self.flushed), 1)
+
+    def test_disabled(self):
+        self.handler_class.pipeline_buffer_size = 0
+        responses = self._pipeline(self._request('/a'), self._request('/b'))
+        self.assertEqual([r.body for r in responses], [b'/a', b'/b'])
+        self.assertEqual(self.flushed, [])
+
+    def test_streamed_response_sent_as_produced(self):
+        with self.makefile() as fd:
+            fd.write(self._request('/a') + self._request('/stream') + self._request('/b'))
+            read_http(fd, body='/a')
+            self._readline_until(fd, b'first\r\n')
+            self.proceed.set()
+            self._readline_until(fd, b'0\r\n')
+            self.assertEqual(fd.readline(), b'\r\n')
+            read_http(fd, body='/b')
+
+    def test_upgrade_not_collected(self):
+        with self.makefile() as fd:
+            fd.write(self._request('/a') + self.format_request(path='/upgrade', Connection='Upgrade'))
+            read_http(fd, body='/a')
+            self.assertEqual(fd.readline(), b'HTTP/1.1 101 Switching Protocols\r\n')
+            self._readline_until(fd, b'\r\n')
+            self.proceed.set()
+
+    def test_next_request_check_doesnt_block(self):
+        sock, peer = socket.socketpair()
+        self._close_on_teardown(sock)
+        self._close_on_teardown(peer)
+        sock.settimeout(10)
+        handler = pywsgi.WSGIHandler(sock, ('127.0.0.1', 0), None)
+        self._close_on_teardown(handler.rfile)
+        with gevent.Timeout(1):
+            self.assertFalse(handler._next_request_received())
+        peer.sendall(b'GET /a HTTP/1.1\r\n\r\nGET /b HTTP/1.1\r\n\r\n')
+        self.assertTrue(handler._next_request_received())
+        self.assertEqual(handler.rfile.readline(), b'GET /a HTTP/1.1\r\n')
+        self.assertEqual(handler.rfile.readline(), b'\r\n')
+        # Already buffered.
+        self.assertTrue(handler._next_request_received())
+        self.assertEqual(handler.rfile.readline(), b'GET /b HTTP/1.1\r\n')
+        self.assertEqual(handler.rfile.readline(), b'\r\n')
+        with gevent.Timeout(1):
+            self.assertFalse(handler._next_request_received())
+        # The socket is left as it was.
+        self.assertEqual(sock.gettimeout(), 10)
+
+
+class TestHeaderParsing(greentest.BaseTestCase):
+    # The shortcuts in gevent._http_parser must produce exactly what
+    # http.client and the generic header code do.
+
+    HEADERS = [
+        b'',
+        b'Host: localhost\r\n',
+        b'Host: localhost\r\nAccept: */*\r\nUser-Agent: test/1.0\r\n',
+        b'Host:localhost\nX-Empty:\nX-Spaces:  \t padded value \t \n',
+        b'Cookie: a=b\r\nCookie: c=d\r\nX-Colon: a:b:c\r\n',
+        b'X_Underscore: 1\r\nX-Dash: 2\r\nContent-Length: 3\r\nContent-Type: text/plain\r\n',
+        b'X-Latin-1: caf\xe9\r\nX-Control: a\x85b\r\nX-Bare-CR: a\rb\r\n',
+        b'X-Folded: first\r\n  second\r\n\tthird\r\nHost: localhost\r\n',
+        b' Leading-Space: 1\r\nHost: localhost\r\n',
+        b'Host: localhost\r\nNot a header\r\nX-After: 1\r\n',
+        b'From nobody\r\nHost: localhost\r\n',
+        b'Host: localhost\r\nFrom nobody\r\n',
+        b':empty name\r\nHost: localhost\r\n',
+        b'Content-Type: multipart/form-data; boundary=xyz\r\n',
+        b'Content-Type: message/rfc822\r\n',
+        b'X-Unterminated: value',
+        b'X-Unterminated-CR: value\r',
+    ]
+
+    def _parse_both(self, data, terminator=b'\r\n'):
+        from http import client
+        from gevent import _http_parser
+        data += terminator + b'body'
+        fast = _http_parser.read_headers(StringIO(data), pywsgi.OldMessage)
+        slow = client.parse_headers(StringIO(data), _class=pywsgi.OldMessage)
+        return fast, slow
+
+    def test_read_headers(self):
+        for data in self.HEADERS:
+            for terminator in b'\r\n', b'\n', b'':
+                fast, slow = self._parse_both(data, terminator)
+                self.assertEqual(fast.items(), slow.items(), data)
+                self.assertEqual(list(fast.headers), list(slow.headers))
+                self.assertEqual(fast.as_string(), slow.as_string())
+                self.assertEqual(fast.is_multipart(), slow.is_multipart())
+                self.assertEqual(fast.typeheader, slow.typeheader)
+
+    def test_read_headers_limits(self):
+        from http import client
+        from gevent import _http_parser
+        too_many = b'X-Header: 1\r\n' * 100 + b'\r\n'
+        too_long = b'X-Header: ' + b'x' * 70000 + b'\r\n\r\n'
+        for data in too_many, too_long:
+            with self.assertRaises(client.HTTPException) as fast:
+                _http_parser.read_headers(StringIO(data), pywsgi.OldMessage)
+            with self.assertRaises(client.HTTPException) as slow:
+                client.parse_headers(StringIO(data), _class=pywsgi.OldMessage)
+            self.assertEqual(type(fast.exception), type(slow.exception))
+            self.assertEqual(fast.exception.args, slow.exception.args)
+
+        message = pywsgi.headers_factory(StringIO(too_long))
+        self.assertEqual(message.status, 'Line too long')
+
+    def test_environ_headers(self):
+        # _headers() takes a shortcut for the messages headers_factory
+        # returns; _header_lines() is the general version.
+        handler = pywsgi.WSGIHandler.__new__(pywsgi.WSGIHandler)
+        for data in self.HEADERS:
+            handler.headers = pywsgi.headers_factory(StringIO(data + b'\r\n'))
+            self.assertEqual(handler._headers(), list(handler._header_lines()), data)
+
+    def test_parse_request_line(self):
+        from gevent._http_parser import parse_request_line
+        self.assertEqual(parse_request_line('GET / HTTP/1.1'), ['GET', '/', 'HTTP/1.1'])
+        self.assertEqual(parse_request_line('POST  /a?b  HTTP/1.0'), ['POST', '/a?b', 'HTTP/1.0'])
+        # These need the full checks.
+        for line in ('GET /', 'GET / HTTP/1.2', 'GET / HTTP/1.01', 'GET / http/1.1',
+                     'GET / HTTP/1.1 extra', ''):
+            self.assertIsNone(parse_request_line(line), line)
+
+
 class Test414(TestCase):
 
     @staticmethod
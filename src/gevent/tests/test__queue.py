@@ -126,7 +126,7 @@ class SubscriptMixin:
         try:
             stdlib_kind = getattr(stdlib_queue, kind.__name__)
         except AttributeError:
-            assert kind.__name__ == 'Channel'
+            assert kind.__name__ in ('Channel', 'RingQueue')
             import types
             self.assertIsInstance(kind[int], types.GenericAlias)
         else:
@@ -329,6 +329,69 @@ class TestSimpleQueue(SubscriptMixin, UsesOnlyOneItemMixin, TestCase):
         self.assertEqual(e2.get(), 'timed out')
         self.assertEqual(q.get(), 'sent')
 
+    def test_put_many_get_many(self):
+        self.switch_expected = False
+        q = self._makeOne()
+        q.put_many(range(5))
+        q.put_many(())
+        self.assertEqual(q.qsize(), 5)
+        self.assertEqual(q.get_many(3), [0, 1, 2])
+        self.assertEqual(q.get_many(10), [3, 4])
+        with self.assertRaises(Empty):
+            q.get_many(10, False)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+
+    def test_put_many_wakes_getters(self):
+        q = self._makeOne()
+        getters = [gevent.spawn(q.get) for _ in range(3)]
+        gevent.sleep(0)
+        q.put_many(['a', 'b', 'c', 'd'])
+        gevent.joinall(getters)
+        self.assertEqual([g.value for g in getters], ['a', 'b', 'c'])
+        self.assertEqual(q.get_nowait(), 'd')
+
+    def test_put_many_nowait_full(self):
+        self.switch_expected = False
+        q = self._makeOne(2)
+        q.put(0)
+        with self.assertRaises(Full):
+            q.put_many([1, 2], False)
+        # Nothing was put.
+        self.assertEqual(q.qsize(), 1)
+        q.put_many([1], False)
+        self.assertTrue(q.full())
+
+    def test_put_many_blocks_for_room(self):
+        q = self._makeOne(2)
+        putter = gevent.spawn(q.put_many, range(5))
+        gevent.sleep(0)
+        self.assertFalse(putter.ready())
+        result = q.get_many(10)
+        self.assertEqual(result, [0, 1])
+        while len(result) < 5:
+            result.extend(q.get_many(10))
+        self.assertEqual(result, [0, 1, 2, 3, 4])
+        putter.join()
+        self.assertTrue(putter.successful())
+
+    def test_put_many_timeout(self):
+        q = self._makeOne(2)
+        with self.assertRaises(Full):
+            q.put_many(range(5), timeout=0.01)
+        # What fit stays in the queue.
+        self.assertEqual(q.get_many(10), [0, 1])
+        self.assertFalse(q.putters)
+
+    def test_get_many_waits(self):
+        q = self._makeOne()
+        gevent.spawn_later(0.01, q.put_many, [1, 2, 3])
+        # Everything that's there once the first item arrives.
+        self.assertEqual(q.get_many(2), [1, 2])
+        self.assertEqual(q.get_many(2), [3])
+        with self.assertRaises(Empty):
+            q.get_many(10, timeout=0.01)
+
     def test_subclass_assign_queue(self):
         # https://github.com/gevent/gevent/issues/2136
 
@@ -440,6 +503,37 @@ class TestChannel(SubscriptMixin, UsesOnlyOneItemMixin, TestCase):
         self.assertEqual(['waiting', 'sending hello', 'hello', 'sending world', 'world', 'sent world'], events)
         g.get()
 
+    def test_put_many_get_many(self):
+        channel = self._makeOne()
+        putter = gevent.spawn(channel.put_many, range(5))
+        gevent.sleep(0)
+        self.assertEqual(channel.balance, 5)
+        self.assertEqual(channel.get_many(3), [0, 1, 2])
+        self.assertFalse(putter.ready())
+        self.assertEqual(channel.get_many(3), [3, 4])
+        putter.join()
+        self.assertTrue(putter.successful())
+        with self.assertRaises(ValueError):
+            channel.get_many(0)
+
+    def test_put_many_to_waiting_getters(self):
+        channel = self._makeOne()
+        getters = [gevent.spawn(channel.get) for _ in range(3)]
+        gevent.sleep(0)
+        channel.put_many('abc')
+        gevent.joinall(getters)
+        self.assertEqual([g.value for g in getters], ['a', 'b', 'c'])
+        self.assertEqual(channel.balance, 0)
+
+    def test_put_many_timeout(self):
+        channel = self._makeOne()
+        getter = gevent.spawn(channel.get)
+        gevent.sleep(0)
+        with self.assertRaises(Full):
+            channel.put_many([1, 2, 3], timeout=0.01)
+        self.assertEqual(getter.get(), 1)
+        self.assertEqual(channel.balance, 0)
+
     def test_iterable(self):
         channel = self._makeOne()
         gevent.spawn(channel.put, StopIteration)
@@ -504,6 +598,15 @@ class TestQueue(TestSimpleQueue):
         return self._shutdown_all_methods_in_one_thread(True)
 
 
+    def test_put_many_counts_tasks(self):
+        self.switch_expected = False
+        q = self._makeOne()
+        q.put_many('abc')
+        self.assertEqual(q.unfinished_tasks, 3)
+        for _ in q.get_many(3):
+            q.task_done()
+        self.assertTrue(q.join(0))
+
     def test_issue_45(self):
         """Test that join() exits immediately if not jobs were put into the queue"""
         self.switch_expected = False
@@ -511,6 +614,68 @@ class TestQueue(TestSimpleQueue):
         q.join()
 
 
+class TestRingQueue(TestQueue):
+
+    def _getFUT(self):
+        return queue.RingQueue
+
+    def _makeOne(self, maxsize=16, *args, **kwargs):
+        # pylint:disable=arguments-differ,keyword-arg-before-vararg
+        return TestQueue._makeOne(self, maxsize, *args, **kwargs)
+
+    def test_init_and_bottleneck_methods(self):
+        self.skipTest('Needs to be constructed with a maxsize')
+
+    def test_subclass_assign_queue(self):
+        self.skipTest('Manages its own queue')
+
+    def test_requires_maxsize(self):
+        self.switch_expected = False
+        for maxsize in (None, 0, -1):
+            with self.assertRaises(ValueError):
+                queue.RingQueue(maxsize)
+        with self.assertRaises(ValueError):
+            queue.RingQueue(2, [1, 2, 3])
+        q = queue.RingQueue(2)
+        q.maxsize = 2
+        with self.assertRaises(ValueError):
+            q.maxsize = 3
+
+    def test_wraps_around(self):
+        self.switch_expected = False
+        q = self._makeOne(3, [1, 2])
+        for i in range(3, 10):
+            q.put(i)
+            self.assertEqual(q.get(), i - 2)
+            self.assertEqual(q.peek(), i - 1)
+        self.assertEqual(len(q.queue), 3)
+        self.assertEqual(q.get_many(3), [8, 9])
+        self.assertEqual(q.queue, [None, None, None])
+
+    def test_copy(self):
+        self.switch_expected = False
+        q = self._makeOne(3, [1, 2])
+        q.get()
+        q.put(3)
+        q.put(4)
+        copy = q.copy()
+        self.assertEqual(copy.get_many(3), [2, 3, 4])
+        self.assertEqual(q.qsize(), 3)
+        self.assertIn('queue=[2, 3, 4]', repr(q))
+
+    def test_overwrite(self):
+        self.switch_expected = False
+        q = self._makeOne(3, overwrite=True)
+        q.put_many(range(5))
+        self.assertEqual(q.dropped, 2)
+        self.assertEqual(q.unfinished_tasks, 3)
+        q.put(5, block=False)
+        self.assertEqual(q.dropped, 3)
+        self.assertEqual(q.get_many(3), [3, 4, 5])
+        q = queue.RingQueue(2, [1, 2, 3], overwrite=True)
+        self.assertEqual(q.get_many(3), [2, 3])
+
+
 class TestLifoQueue(SubscriptMixin, TestCase):
     def _getFUT(self):
         return queue.LifoQueue
@@ -521,6 +686,99 @@ class TestPriorityQueue(SubscriptMixin, TestCase):
         return queue.PriorityQueue
 
 
+class TestThreadSafeQueue(TestCase):
+
+    def _makeOne(self, *args):
+        q = queue.ThreadSafeQueue(*args)
+        self.addCleanup(q.close)
+        return q
+
+    def _start_thread(self, func, *args):
+        from gevent._threading import start_new_thread
+        start_new_thread(func, args)
+
+    def test_put_get(self):
+        q = self._makeOne([1])
+        q.put(2)
+        self.assertEqual(len(q), 2)
+        self.assertEqual(q.get(), 1)
+        self.assertEqual(q.get_nowait(), 2)
+        self.assertTrue(q.empty())
+        self.assertFalse(q.full())
+        with self.assertRaises(Empty):
+            q.get_nowait()
+
+    def test_put_from_thread(self):
+        q = self._makeOne()
+        count = 10000
+
+        def produce():
+            for i in range(count):
+                q.put(i)
+            q.put(StopIteration)
+
+        self._start_thread(produce)
+        self.assertEqual(list(q), list(range(count)))
+
+    def test_one_wakeup_per_batch(self):
+        q = self._makeOne()
+        unlocks = []
+        orig_unlock = q._unlock
+
+        def unlock():
+            unlocks.append(len(q))
+            orig_unlock()
+        q._async.stop()
+        q._async.start(unlock)
+
+        getter = gevent.spawn(q.get)
+        gevent.sleep(0)
+        for i in range(10):
+            q.put(i)
+        self.assertEqual(getter.get(), 0)
+        self.assertEqual(unlocks, [10])
+        self.assertEqual(len(q), 9)
+
+    def test_get_timeout(self):
+        q = self._makeOne()
+        with self.assertRaises(Empty):
+            q.get(timeout=0.01)
+        self.assertFalse(q.getters)
+        self.assertFalse(q._async.ref)
+
+    def test_get_in_hub(self):
+        q = self._makeOne()
+        result = []
+
+        def get():
+            try:
+                q.get()
+            except Empty:
+                result.append('Empty')
+        get_hub().loop.run_callback(get)
+        gevent.sleep(0)
+        self.assertEqual(result, ['Empty'])
+
+    def test_get_from_other_thread(self):
+        from gevent.exceptions import InvalidThreadUseError
+        from gevent._threading import Lock
+        q = self._makeOne()
+        result = []
+        done = Lock()
+        done.acquire()
+
+        def get():
+            try:
+                q.get()
+            except InvalidThreadUseError as ex:
+                result.append(ex)
+            finally:
+                done.release()
+        self._start_thread(get)
+        done.acquire()
+        self.assertEqual(len(result), 1)
+
+
 class AbstractTestWeakRefMixin(object):
 
     def test_weak_reference(self):
@@ -554,6 +812,11 @@ class TestGetInterruptPriorityQueue(TestGetInterrupt):
 class TestGetInterruptChannel(TestGetInterrupt):
     kind = queue.Channel
 
+class TestGetInterruptRingQueue(TestGetInterrupt):
+
+    def _makeOne(self):
+        return queue.RingQueue(16)
+
 
 class TestPutInterrupt(AbstractGenericGetTestCase):
     kind = queue.SimpleQueue
@@ -581,6 +844,9 @@ class TestPutInterruptLifoQueue(TestPutInterrupt):
 class TestPutInterruptPriorityQueue(TestPutInterrupt):
     kind = queue.PriorityQueue
 
+class TestPutInterruptRingQueue(TestPutInterrupt):
+    kind = queue.RingQueue
+
 class TestPutInterruptChannel(TestPutInterrupt):
     kind = queue.Channel
 
@@ -600,6 +866,10 @@ class TestGetInterruptSimpleQueue(TestGetInterrupt):
     test_outer_timeout_is_not_lost = test_raises_timeout_Timeout
 
 
+class TestGetInterruptThreadSafeQueue(TestGetInterrupt):
+    kind = queue.ThreadSafeQueue
+
+
 del AbstractGenericGetTestCase
 
 
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the caching resolver.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import socket
+import unittest
+
+import gevent
+from gevent import testing as greentest
+from gevent.resolver import AbstractResolver
+from gevent.resolver.caching import Resolver
+from gevent.resolver.thread import Resolver as ThreadResolver
+
+
+class MockResolver(object):
+
+    ttl = None
+    error = None
+    closed = False
+
+    def __init__(self):
+        self.calls = []
+
+    def _getaddrinfo_ttl(self, host, port, family=0, socktype=0, proto=0, flags=0):
+        self.calls.append(host)
+        if self.error is not None:
+            raise self.error
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port))], self.ttl
+
+    def gethostbyname(self, hostname, family=socket.AF_INET):
+        self.calls.append((hostname, family))
+        if self.error is not None:
+            raise self.error
+        return '10.0.0.1'
+
+    def gethostbyaddr(self, address):
+        return address
+
+    def close(self):
+        self.closed = True
+
+
+class TestCachingResolver(greentest.TestCase):
+
+    def _makeOne(self, **kwargs):
+        self.backend = MockResolver()
+        return Resolver(resolver=self.backend, **kwargs)
+
+    def test_caches(self):
+        resolver = self._makeOne()
+        first = resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(first[0][4], ('10.0.0.1', 80))
+        # Callers can't change the cache.
+        first.append(None)
+        self.assertEqual(resolver.getaddrinfo('example.com', 80), first[:1])
+        self.assertEqual(self.backend.calls, ['example.com'])
+
+        # Different arguments are different answers.
+        resolver.getaddrinfo('example.com', 443)
+        resolver.getaddrinfo(bytearray(b'example.com'), 80)
+        resolver.getaddrinfo(b'example.com', 80)
+        self.assertEqual(self.backend.calls, ['example.com', 'example.com', b'example.com'])
+
+        self.assertEqual(resolver.gethostbyname('example.com'), '10.0.0.1')
+        self.assertEqual(resolver.gethostbyname('example.com'), '10.0.0.1')
+        resolver.gethostbyname('example.com', socket.AF_INET6)
+        self.assertEqual(self.backend.calls[3:], [
+            ('example.com', socket.AF_INET),
+            ('example.com', socket.AF_INET6),
+        ])
+        # Not cached.
+        self.assertEqual(resolver.gethostbyaddr('10.0.0.1'), '10.0.0.1')
+        repr(resolver)
+
+        resolver.close()
+        self.assertTrue(self.backend.closed)
+        self.assertEqual(repr(resolver).count('entries=0'), 1)
+
+    def test_ttl(self):
+        resolver = self._makeOne(ttl=0.05)
+        self.backend.ttl = 0.2
+        resolver.getaddrinfo('example.com', 80)
+        # The default TTL is for answers without one.
+        gevent.sleep(0.1)
+        resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(len(self.backend.calls), 1)
+        gevent.sleep(0.15)
+        resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(len(self.backend.calls), 2)
+
+        # Without one, it applies.
+        self.backend.ttl = None
+        resolver.getaddrinfo('example.org', 80)
+        gevent.sleep(0.1)
+        resolver.getaddrinfo('example.org', 80)
+        self.assertEqual(len(self.backend.calls), 4)
+
+        # A TTL of 0 isn't cached at all.
+        self.backend.ttl = 0
+        resolver.getaddrinfo('example.net', 80)
+        resolver.getaddrinfo('example.net', 80)
+        self.assertEqual(len(self.backend.calls), 6)
+
+    def test_negative(self):
+        resolver = self._makeOne(negative_ttl=0.05)
+        self.backend.error = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        with self.assertRaises(socket.gaierror):
+            resolver.getaddrinfo('nope.example.com', 80)
+        with self.assertRaises(socket.gaierror) as exc:
+            resolver.getaddrinfo('nope.example.com', 80)
+        # A new exception each time.
+        self.assertIsNot(exc.exception, self.backend.error)
+        self.assertEqual(exc.exception.args, self.backend.error.args)
+        self.assertEqual(len(self.backend.calls), 1)
+
+        gevent.sleep(0.1)
+        with self.assertRaises(socket.gaierror):
+            resolver.getaddrinfo('nope.example.com', 80)
+        self.assertEqual(len(self.backend.calls), 2)
+
+    def test_temporary_errors_not_cached(self):
+        resolver = self._makeOne()
+        self.backend.error = socket.gaierror(socket.EAI_AGAIN, 'Temporary failure')
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror):
+                resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(len(self.backend.calls), 2)
+
+        self.backend.error = None
+        resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(len(self.backend.calls), 3)
+
+    def test_lru(self):
+        resolver = self._makeOne(maxsize=2)
+        resolver.getaddrinfo('a', 80)
+        resolver.getaddrinfo('b', 80)
+        # Using 'a' makes 'b' the oldest.
+        resolver.getaddrinfo('a', 80)
+        resolver.getaddrinfo('c', 80)
+        resolver.getaddrinfo('a', 80)
+        self.assertEqual(self.backend.calls, ['a', 'b', 'c'])
+        resolver.getaddrinfo('b', 80)
+        self.assertEqual(self.backend.calls, ['a', 'b', 'c', 'b'])
+
+        resolver.clear()
+        resolver.getaddrinfo('a', 80)
+        self.assertEqual(self.backend.calls[-1], 'a')
+
+    def test_refresh_ahead(self):
+        resolver = self._makeOne(refresh_ahead=0.5)
+        self.backend.ttl = 0.2
+        resolver.getaddrinfo('example.com', 80)
+        resolver.getaddrinfo('example.com', 80)
+        self.assertEqual((resolver.hits, resolver.misses, resolver.refreshes), (1, 1, 0))
+
+        gevent.sleep(0.12)
+        # The cached answer, while it's looked up again.
+        self.backend.ttl = 0.3
+        resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(len(self.backend.calls), 1)
+        self.assertEqual(resolver.refreshes, 1)
+        gevent.sleep(0.01)
+        self.assertEqual(len(self.backend.calls), 2)
+        self.assertEqual(resolver.refreshes, 1)
+
+        # Well past the first expiration, the new answer is used.
+        gevent.sleep(0.1)
+        resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(len(self.backend.calls), 2)
+        self.assertEqual((resolver.hits, resolver.misses, resolver.refreshes), (3, 1, 1))
+        self.assertEqual(resolver.refresh_errors, 0)
+
+    def test_refresh_ahead_limit(self):
+        resolver = self._makeOne(refresh_ahead=0.9, max_refreshes=1)
+        self.backend.ttl = 1
+        resolver.getaddrinfo('a', 80)
+        resolver.getaddrinfo('b', 80)
+        gevent.sleep(0.15)
+        resolver.getaddrinfo('a', 80)
+        resolver.getaddrinfo('a', 80)
+        resolver.getaddrinfo('b', 80)
+        self.assertEqual(resolver.refreshes, 1)
+        self.assertEqual(resolver.refreshes_skipped, 1)
+        gevent.sleep(0.001)
+        self.assertEqual(self.backend.calls, ['a', 'b', 'a'])
+        # Now there's room for it.
+        resolver.getaddrinfo('b', 80)
+        gevent.sleep(0.001)
+        self.assertEqual(self.backend.calls, ['a', 'b', 'a', 'b'])
+        resolver.close()
+
+    def test_refresh_ahead_error(self):
+        resolver = self._makeOne(refresh_ahead=0.9)
+        self.backend.ttl = 0.2
+        resolver.getaddrinfo('example.com', 80)
+        gevent.sleep(0.05)
+        self.backend.error = socket.gaierror(socket.EAI_AGAIN, 'Temporary failure')
+        resolver.getaddrinfo('example.com', 80)
+        gevent.sleep(0.001)
+        self.assertEqual(resolver.refresh_errors, 1)
+        # The old answer is still used, without trying again.
+        self.assertEqual(resolver.getaddrinfo('example.com', 80)[0][4], ('10.0.0.1', 80))
+        gevent.sleep(0.001)
+        self.assertEqual(len(self.backend.calls), 2)
+        self.assertEqual(resolver.refreshes, 1)
+
+        # When the name is gone, so is the answer.
+        gevent.sleep(0.2)
+        self.backend.error = None
+        resolver.getaddrinfo('example.com', 80)
+        gevent.sleep(0.05)
+        self.backend.error = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        resolver.getaddrinfo('example.com', 80)
+        gevent.sleep(0.001)
+        self.assertEqual(resolver.refresh_errors, 2)
+        with self.assertRaises(socket.gaierror):
+            resolver.getaddrinfo('example.com', 80)
+        self.assertEqual(len(self.backend.calls), 4)
+
+    def test_result_ttl(self):
+        # Resolvers can return results that know their TTL.
+        class Result(list):
+            ttl = 42
+
+        class Backend(AbstractResolver):
+            def _getaddrinfo(self, host_bytes, port, family, socktype, proto, flags):
+                return Result([(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port))])
+
+        result, ttl = Backend()._getaddrinfo_ttl('example.com', 80)
+        self.assertEqual(ttl, 42)
+        self.assertEqual(len(result), 1)
+
+    def test_thread_backend(self):
+        resolver = Resolver(resolver=ThreadResolver())
+        self.addCleanup(resolver.close)
+        expected = socket.getaddrinfo(greentest.DEFAULT_LOCAL_HOST_ADDR, 80,
+                                      socket.AF_INET, socket.SOCK_STREAM)
+        for _ in range(2):
+            self.assertEqual(
+                resolver.getaddrinfo(greentest.DEFAULT_LOCAL_HOST_ADDR, 80,
+                                     socket.AF_INET, socket.SOCK_STREAM),
+                expected)
+            self.assertEqual(resolver.gethostbyname('localhost'), '127.0.0.1')
+
+
+@unittest.skipUnless(greentest.resolver_dnspython_available(),
+                     "dnspython not available")
+class TestDnspythonTTL(greentest.TestCase):
+
+    def test_cached_ttl(self):
+        import time
+        from gevent.resolver import dnspython
+
+        class Answer(object):
+            expiration = time.time() + 30
+
+        resolver = dnspython.Resolver()
+        cache = resolver._resolver.network_resolver.cache
+        qname = dnspython.dns.name.from_text('cached.example.com')
+        key = (qname, dnspython.dns.rdatatype.A, dnspython.dns.rdataclass.IN)
+        cache.put(key, Answer())
+        try:
+            ttl = resolver._cached_ttl(b'cached.example.com', socket.AF_INET)
+            self.assertGreater(ttl, 25)
+            self.assertLessEqual(ttl, 30)
+            # There's no AAAA answer.
+            self.assertIsNone(resolver._cached_ttl('cached.example.com', socket.AF_INET6))
+            self.assertIsNone(resolver._cached_ttl('other.example.com', socket.AF_INET))
+        finally:
+            cache.flush(key)
+
+
+if __name__ == '__main__':
+    greentest.main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for coalescing concurrent identical lookups in the resolvers.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import socket
+
+import gevent
+from gevent import testing as greentest
+from gevent.resolver import AbstractResolver
+from gevent.resolver import _SingleFlight
+from gevent.resolver.thread import Resolver as ThreadResolver
+
+CALLERS = 20
+
+
+class TestSingleFlight(greentest.TestCase):
+
+    def setUp(self):
+        super(TestSingleFlight, self).setUp()
+        self.single_flight = _SingleFlight()
+        self.calls = []
+
+    def _lookup(self, name, error=None):
+        self.calls.append(name)
+        gevent.sleep(0.01)
+        if error is not None:
+            raise error
+        return [name]
+
+    def _spawn_callers(self, name):
+        return [gevent.spawn(self.single_flight.call, name, self._lookup, name)
+                for _ in range(CALLERS)]
+
+    def test_shares_result(self):
+        glets = self._spawn_callers('a') + self._spawn_callers('b')
+        gevent.joinall(glets, raise_error=True)
+        self.assertEqual(sorted(self.calls), ['a', 'b'])
+        values = [g.value for g in glets]
+        self.assertEqual(values, [['a']] * CALLERS + [['b']] * CALLERS)
+        # Everyone gets their own list.
+        self.assertEqual(len({id(v) for v in values}), len(values))
+        self.assertEqual(len(self.single_flight), 0)
+
+        # Once it's done, it runs again.
+        self.single_flight.call('a', self._lookup, 'a')
+        self.assertEqual(len(self.calls), 3)
+
+    def test_shares_error(self):
+        error = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+
+        def call():
+            try:
+                self.single_flight.call('a', self._lookup, 'a', error)
+            except socket.gaierror as ex:
+                return ex
+
+        glets = [gevent.spawn(call) for _ in range(CALLERS)]
+        gevent.joinall(glets, raise_error=True)
+        self.assertEqual(self.calls, ['a'])
+        for glet in glets:
+            self.assertIs(glet.value, error)
+        self.assertEqual(len(self.single_flight), 0)
+
+    def test_first_caller_killed(self):
+        glets = self._spawn_callers('a')
+        gevent.sleep(0.001)
+        glets[0].kill()
+        gevent.joinall(glets[1:], raise_error=True)
+        # The next caller ran it again, and the rest shared that.
+        self.assertEqual(self.calls, ['a', 'a'])
+        self.assertEqual([g.value for g in glets[1:]], [['a']] * (CALLERS - 1))
+
+    def test_copies_inner_lists(self):
+        def lookup(name):
+            self.calls.append(name)
+            gevent.sleep(0.01)
+            return (name, ['alias'], ['10.0.0.1'])
+
+        glets = [gevent.spawn(self.single_flight.call, 'a', lookup, 'a')
+                 for _ in range(CALLERS)]
+        gevent.joinall(glets, raise_error=True)
+        self.assertEqual(self.calls, ['a'])
+        values = [g.value for g in glets]
+        self.assertEqual(values, [('a', ['alias'], ['10.0.0.1'])] * CALLERS)
+        for index in 1, 2:
+            self.assertEqual(len({id(v[index]) for v in values}), CALLERS)
+
+    def test_unhashable(self):
+        self.assertEqual(self.single_flight.call(['a'], self._lookup, 'a'), ['a'])
+
+
+class CountingResolver(AbstractResolver):
+
+    def __init__(self):
+        self.calls = 0
+
+    def _getaddrinfo(self, host_bytes, port, family, socktype, proto, flags):
+        self.calls += 1
+        gevent.sleep(0.01)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port))]
+
+
+class CountingPool(object):
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.calls = 0
+
+    def apply(self, func, args=None, kwds=None):
+        self.calls += 1
+        gevent.sleep(0.01)
+        return self.pool.apply(func, args, kwds)
+
+
+class TestResolvers(greentest.TestCase):
+
+    def test_abstract_resolver(self):
+        resolver = CountingResolver()
+        glets = [gevent.spawn(resolver.getaddrinfo, 'example.com', 80)
+                 for _ in range(CALLERS)]
+        glets.append(gevent.spawn(resolver.getaddrinfo, 'example.com', 443))
+        gevent.joinall(glets, raise_error=True)
+        self.assertEqual(resolver.calls, 2)
+        self.assertEqual(glets[0].value, glets[1].value)
+        self.assertEqual(glets[-1].value[0][4], ('10.0.0.1', 443))
+
+        glets = [gevent.spawn(resolver.gethostbyname, 'example.com')
+                 for _ in range(CALLERS)]
+        gevent.joinall(glets, raise_error=True)
+        self.assertEqual(resolver.calls, 3)
+        self.assertEqual({g.value for g in glets}, {'10.0.0.1'})
+
+    def test_thread_resolver(self):
+        resolver = ThreadResolver()
+        resolver.pool = pool = CountingPool(resolver.pool)
+        expected = socket.getaddrinfo('localhost', 80, socket.AF_INET)
+        glets = [gevent.spawn(resolver.getaddrinfo, 'localhost', 80, socket.AF_INET)
+                 for _ in range(CALLERS)]
+        glets.extend(gevent.spawn(resolver.getaddrinfo, 'localhost', 80, family=socket.AF_INET)
+                     for _ in range(CALLERS))
+        gevent.joinall(glets, raise_error=True)
+        # Positional and keyword arguments are different calls.
+        self.assertEqual(pool.calls, 2)
+        self.assertEqual([g.value for g in glets], [expected] * (CALLERS * 2))
+
+        glets = [gevent.spawn(resolver.gethostbyname, 'localhost')
+                 for _ in range(CALLERS)]
+        gevent.joinall(glets, raise_error=True)
+        self.assertEqual(pool.calls, 3)
+
+
+if __name__ == '__main__':
+    greentest.main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for looking up many names at once with ``resolve_many``.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import socket
+
+import gevent
+from gevent import testing as greentest
+from gevent.resolver import AbstractResolver
+from gevent.resolver.blocking import Resolver as BlockingResolver
+from gevent.resolver.caching import Resolver as CachingResolver
+from gevent.resolver.thread import Resolver as ThreadResolver
+
+try:
+    from gevent.resolver.ares import Resolver as AresResolver
+except ImportError: # pragma: no cover
+    AresResolver = None
+
+NONAME = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+
+
+class MockResolver(AbstractResolver):
+
+    def __init__(self):
+        self.calls = []
+
+    def _getaddrinfo(self, host_bytes, port, family, socktype, proto, flags):
+        self.calls.append(host_bytes)
+        # Later names finish first.
+        gevent.sleep(0.001 * (10 - len(self.calls)))
+        if host_bytes.startswith(b'bad'):
+            raise NONAME
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port))]
+
+
+class TestResolveMany(greentest.TestCase):
+
+    def test_abstract_resolver(self):
+        resolver = MockResolver()
+        hosts = ['a.example.com', 'bad.example.com', b'b.example.com', '127.0.0.1']
+        results = list(resolver.resolve_many(hosts, 80))
+        # Everything runs at once, so they finish out of order.
+        self.assertEqual(len(results), len(hosts))
+        self.assertNotEqual([host for host, _ in results], hosts)
+        results = dict(results)
+        self.assertEqual(sorted(resolver.calls),
+                         [b'a.example.com', b'b.example.com', b'bad.example.com'])
+        self.assertEqual(results['a.example.com'][0][4], ('10.0.0.1', 80))
+        self.assertIs(results['bad.example.com'], NONAME)
+        self.assertEqual(results['127.0.0.1'],
+                         socket.getaddrinfo('127.0.0.1', 80))
+
+    def test_caching_resolver(self):
+        backend = MockResolver()
+        resolver = CachingResolver(resolver=backend)
+        resolver.getaddrinfo('a.example.com', 80)
+        hosts = ['a.example.com', 'b.example.com', 'bad.example.com']
+        results = list(resolver.resolve_many(hosts, 80))
+        # The cached name comes first, without a lookup.
+        self.assertEqual(results[0][0], 'a.example.com')
+        self.assertEqual(sorted(backend.calls),
+                         [b'a.example.com', b'b.example.com', b'bad.example.com'])
+        self.assertIsInstance(dict(results)['bad.example.com'], socket.gaierror)
+
+        # Now they're all cached.
+        results = dict(resolver.resolve_many(hosts, 80))
+        self.assertEqual(len(backend.calls), 3)
+        self.assertEqual(results['b.example.com'][0][4], ('10.0.0.1', 80))
+        self.assertIsInstance(results['bad.example.com'], socket.gaierror)
+        self.assertEqual((resolver.hits, resolver.misses), (4, 3))
+
+
+class TestSystemResolvers(greentest.TestCase):
+
+    # Nothing here needs the network. The last label is too long to
+    # encode.
+    BAD_HOST = 'x' * 64 + '.example.com'
+    HOSTS = ['localhost', greentest.DEFAULT_LOCAL_HOST_ADDR, BAD_HOST]
+
+    def _check(self, resolver):
+        hosts = self.HOSTS * 5
+        results = list(resolver.resolve_many(hosts, 80, socket.AF_INET, socket.SOCK_STREAM))
+        self.assertEqual(sorted(host for host, _ in results), sorted(hosts))
+        for host, result in results:
+            if host == self.BAD_HOST:
+                self.assertIsInstance(result, UnicodeError)
+            else:
+                self.assertEqual(result, socket.getaddrinfo(host, 80, socket.AF_INET,
+                                                            socket.SOCK_STREAM))
+
+    def _check_not_names(self, resolver):
+        # Things that aren't names are answered with the TypeError,
+        # like names that can't be looked up; the others still are.
+        hosts = [greentest.DEFAULT_LOCAL_HOST_ADDR, 42, 'localhost', None, ['localhost']]
+        results = list(resolver.resolve_many(hosts, 80, socket.AF_INET, socket.SOCK_STREAM))
+        self.assertEqual(len(results), len(hosts))
+        for host, result in results:
+            if isinstance(host, str):
+                self.assertEqual(result, socket.getaddrinfo(host, 80, socket.AF_INET,
+                                                            socket.SOCK_STREAM))
+            elif host is not None:
+                self.assertIsInstance(result, TypeError)
+
+    def test_not_names(self):
+        self._check_not_names(ThreadResolver())
+        self._check_not_names(BlockingResolver())
+        self._check_not_names(CachingResolver(resolver=ThreadResolver()))
+        self._check_not_names(MockResolver())
+
+    def test_thread_resolver(self):
+        self._check(ThreadResolver())
+
+    def test_blocking_resolver(self):
+        self._check(BlockingResolver())
+
+    @greentest.skipIf(AresResolver is None, "Must be able to import ares")
+    @greentest.skipOnLibuv("Closing the channel can lose the wakeup for the "
+                           "next thread pool results, whatever test comes next")
+    def test_ares_resolver(self):
+        resolver = AresResolver()
+        self.addCleanup(resolver.close)
+        self._check(resolver)
+        self._check_not_names(resolver)
+
+
+if __name__ == '__main__':
+    greentest.main()
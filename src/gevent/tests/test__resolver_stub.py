@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the stub resolver, using a DNS server in this process.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import socket
+import struct
+import tempfile
+
+import gevent
+from gevent import socket as gsocket
+from gevent import testing as greentest
+from gevent.resolver import stub
+from gevent.resolver.stub import Resolver
+
+A = 1
+CNAME = 5
+PTR = 12
+AAAA = 28
+
+
+class StandInServer(object):
+    """
+    Answers DNS queries over UDP and TCP on a localhost port from
+    :attr:`records`.
+    """
+
+    def __init__(self):
+        # (name, type) -> [value]; names are bytes.
+        self.records = {}
+        # Names whose UDP answers are truncated.
+        self.truncate = set()
+        # Names that are answered only after this many seconds.
+        self.delays = {}
+        # Names that aren't answered at all.
+        self.ignore = set()
+        # Send an answer with the wrong ID before each answer.
+        self.spoof = False
+        # (transport, name, type, source address)
+        self.queries = []
+
+        self.udp = gsocket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp.bind(('127.0.0.1', 0))
+        self.port = self.udp.getsockname()[1]
+        self.tcp = gsocket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.tcp.bind(('127.0.0.1', self.port))
+        self.tcp.listen(5)
+        self._greenlets = [gevent.spawn(self._serve_udp), gevent.spawn(self._serve_tcp)]
+
+    def close(self):
+        gevent.killall(self._greenlets)
+        self.udp.close()
+        self.tcp.close()
+
+    def add(self, name, rtype, *values):
+        self.records.setdefault((name.lower(), rtype), []).extend(values)
+
+    def _serve_udp(self):
+        while True:
+            data, address = self.udp.recvfrom(512)
+            gevent.spawn(self._answer_udp, data, address)
+
+    def _answer_udp(self, data, address):
+        qid, name, qtype = self._parse(data)
+        self.queries.append(('udp', name, qtype, address))
+        if name in self.ignore:
+            return
+        gevent.sleep(self.delays.get(name, 0))
+        if self.spoof:
+            self.udp.sendto(self._answer(data, qid ^ 1, b'spoofed', qtype, False), address)
+        self.udp.sendto(self._answer(data, qid, name, qtype, name in self.truncate), address)
+
+    def _serve_tcp(self):
+        while True:
+            conn, _ = self.tcp.accept()
+            with conn:
+                length, = struct.unpack('!H', conn.recv(2))
+                data = conn.recv(length)
+                qid, name, qtype = self._parse(data)
+                self.queries.append(('tcp', name, qtype, None))
+                answer = self._answer(data, qid, name, qtype, False)
+                conn.sendall(struct.pack('!H', len(answer)) + answer)
+
+    @staticmethod
+    def _parse(data):
+        qid, = struct.unpack_from('!H', data)
+        name, offset = stub._read_name(data, 12)
+        qtype, = struct.unpack_from('!H', data, offset)
+        return qid, name, qtype
+
+    def _answer(self, query, qid, name, qtype, truncated):
+        question = query[12:]
+        answers = []
+        owner = name
+        # Follow CNAMEs like a recursive server does.
+        while not truncated:
+            cnames = self.records.get((owner, CNAME))
+            if not cnames:
+                break
+            answers.append(self._record(owner, CNAME, stub._encode_name(cnames[0])))
+            owner = cnames[0]
+        if not truncated:
+            for value in self.records.get((owner, qtype), ()):
+                if qtype == A:
+                    rdata = socket.inet_pton(socket.AF_INET, value)
+                elif qtype == AAAA:
+                    rdata = socket.inet_pton(socket.AF_INET6, value)
+                else:
+                    rdata = stub._encode_name(value)
+                if owner == name:
+                    # Point back at the question.
+                    answers.append(b'\xc0\x0c' + struct.pack('!2HIH', qtype, 1, 300, len(rdata))
+                                   + rdata)
+                else:
+                    answers.append(self._record(owner, qtype, rdata))
+        known = any(key[0] == name for key in self.records)
+        rcode = 0 if known or truncated else 3
+        flags = 0x8180 | rcode | (0x0200 if truncated else 0)
+        header = struct.pack('!6H', qid, flags, 1, len(answers), 0, 0)
+        return header + question + b''.join(answers)
+
+    @staticmethod
+    def _record(name, rtype, rdata):
+        return stub._encode_name(name) + struct.pack('!2HIH', rtype, 1, 60, len(rdata)) + rdata
+
+
+class TestStubResolver(greentest.TestCase):
+
+    HOSTS = u'10.1.1.1 hosted.example hosted-alias\n'
+
+    def setUp(self):
+        super(TestStubResolver, self).setUp()
+        self.server = StandInServer()
+        self.addCleanup(self.server.close)
+        fd, self.hosts_file = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write(self.HOSTS)
+        self.addCleanup(os.remove, self.hosts_file)
+        self.resolver = self._makeOne()
+
+    def _makeOne(self, nameservers=None, **kwargs):
+        kwargs.setdefault('timeout', 0.5)
+        kwargs.setdefault('hosts_file', self.hosts_file)
+        kwargs.setdefault('resolv_conf', os.devnull)
+        resolver = Resolver(nameservers=nameservers or [('127.0.0.1', self.server.port)],
+                            **kwargs)
+        self.addCleanup(resolver.close)
+        return resolver
+
+    def test_getaddrinfo(self):
+        self.server.add(b'www.example.com', A, '10.0.0.1', '10.0.0.2')
+        result = self.resolver.getaddrinfo('www.example.com', 80,
+                                           socket.AF_INET, socket.SOCK_STREAM)
+        self.assertEqual(result, [
+            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, '', ('10.0.0.1', 80)),
+            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, '', ('10.0.0.2', 80)),
+        ])
+        self.assertEqual(result.ttl, 300)
+
+        # Without a socktype, there's one of each.
+        result = self.resolver.getaddrinfo(u'WWW.Example.com.', 'http')
+        self.assertEqual([r[1] for r in result], [socket.SOCK_STREAM] * 2)
+        result = self.resolver.getaddrinfo('www.example.com', 80)
+        self.assertEqual(len(result), 6)
+
+    def test_unspec_pipelined(self):
+        self.server.add(b'www.example.com', A, '10.0.0.1')
+        self.server.add(b'www.example.com', AAAA, '2001:db8::1')
+        self.server.delays[b'www.example.com'] = 0.05
+        result = self.resolver.getaddrinfo('www.example.com', 80, 0, socket.SOCK_STREAM)
+        self.assertEqual([r[4] for r in result],
+                         [('10.0.0.1', 80), ('2001:db8::1', 80, 0, 0)])
+        # Both were asked at once, from the same socket.
+        self.assertEqual([q[2] for q in self.server.queries], [A, AAAA])
+        self.assertEqual(len({q[3] for q in self.server.queries}), 1)
+
+        result = self.resolver.getaddrinfo('www.example.com', 80, socket.AF_INET6,
+                                           socket.SOCK_STREAM)
+        self.assertEqual([r[4] for r in result], [('2001:db8::1', 80, 0, 0)])
+
+    def test_many_at_once(self):
+        count = 20
+        for i in range(count):
+            name = b'host%d.example.com' % i
+            self.server.add(name, A, '10.0.0.%d' % i)
+            # The last ones asked are answered first.
+            self.server.delays[name] = (count - i) * 0.005
+        glets = [gevent.spawn(self.resolver.gethostbyname, 'host%d.example.com' % i)
+                 for i in range(count)]
+        gevent.joinall(glets, raise_error=True)
+        self.assertEqual([g.value for g in glets], ['10.0.0.%d' % i for i in range(count)])
+        self.assertEqual(len({q[3] for q in self.server.queries}), 1)
+
+        results = dict(self.resolver.resolve_many(
+            ['host%d.example.com' % i for i in range(count)], 80, socket.AF_INET))
+        self.assertEqual(results['host3.example.com'][0][4], ('10.0.0.3', 80))
+
+    def test_cname(self):
+        self.server.add(b'www.example.com', CNAME, b'web.example.net')
+        self.server.add(b'web.example.net', CNAME, b'lb.example.org')
+        self.server.add(b'lb.example.org', A, '10.0.0.9')
+        result = self.resolver.getaddrinfo('www.example.com', 80, socket.AF_INET,
+                                           socket.SOCK_STREAM, 0, socket.AI_CANONNAME)
+        self.assertEqual(result[0][3:], ('lb.example.org', ('10.0.0.9', 80)))
+        self.assertEqual(self.resolver.gethostbyname_ex('www.example.com'),
+                         ('lb.example.org', [], ['10.0.0.9']))
+
+    def test_errors(self):
+        self.server.add(b'v6only.example.com', AAAA, '2001:db8::1')
+        for name in ('nowhere.example.com', 'v6only.example.com'):
+            with self.assertRaises(socket.gaierror) as exc:
+                self.resolver.getaddrinfo(name, 80, socket.AF_INET)
+            self.assertEqual(exc.exception.args[0], socket.EAI_NONAME)
+
+        # Like the system resolvers.
+        with self.assertRaises(UnicodeError):
+            self.resolver.getaddrinfo('a..b', 80)
+        with self.assertRaises(socket.gaierror) as exc:
+            self.resolver.getaddrinfo('www.example.com', 80, 12345)
+        self.assertEqual(exc.exception.args[0], socket.EAI_FAMILY)
+
+    def test_truncated_uses_tcp(self):
+        self.server.add(b'big.example.com', A, '10.0.0.1')
+        self.server.truncate.add(b'big.example.com')
+        self.assertEqual(self.resolver.gethostbyname('big.example.com'), '10.0.0.1')
+        self.assertEqual([q[0] for q in self.server.queries], ['udp', 'tcp'])
+
+    def test_wrong_id_answers_ignored(self):
+        self.server.add(b'www.example.com', A, '10.0.0.1')
+        self.server.spoof = True
+        self.assertEqual(self.resolver.gethostbyname('www.example.com'), '10.0.0.1')
+
+    def test_source_port_changes(self):
+        channel = self.resolver._channels[0]
+        channel.max_queries = 2
+        for i in range(6):
+            name = b'%d.example.com' % i
+            self.server.add(name, A, '10.0.0.%d' % i)
+            self.assertEqual(self.resolver.gethostbyname(name.decode('ascii')), '10.0.0.%d' % i)
+        ports = [q[3][1] for q in self.server.queries]
+        self.assertEqual(len(ports), 6)
+        self.assertEqual(len(set(ports)), 3)
+        # Two queries from each.
+        self.assertEqual(ports[0::2], ports[1::2])
+        self.assertFalse(channel._retired)
+
+    def test_retired_socket_still_answered(self):
+        channel = self.resolver._channels[0]
+        channel.max_queries = 1
+        self.server.add(b'slow.example.com', A, '10.0.0.1')
+        self.server.delays[b'slow.example.com'] = 0.1
+        self.server.add(b'fast.example.com', A, '10.0.0.2')
+        slow = gevent.spawn(self.resolver.gethostbyname, 'slow.example.com')
+        gevent.sleep(0.01)
+        self.assertEqual(self.resolver.gethostbyname('fast.example.com'), '10.0.0.2')
+        # The slow one's socket is waiting for its answer.
+        self.assertEqual(len(channel._retired), 1)
+        self.assertEqual(slow.get(), '10.0.0.1')
+        self.assertFalse(channel._retired)
+        ports = {q[1]: q[3][1] for q in self.server.queries}
+        self.assertNotEqual(ports[b'slow.example.com'], ports[b'fast.example.com'])
+
+    def test_timeout(self):
+        resolver = self._makeOne(timeout=0.05, tries=2)
+        self.server.ignore.add(b'slow.example.com')
+        with self.assertRaises(socket.gaierror) as exc:
+            resolver.getaddrinfo('slow.example.com', 80, socket.AF_INET)
+        self.assertEqual(exc.exception.args[0], socket.EAI_AGAIN)
+        self.assertEqual(len(self.server.queries), 2)
+
+        # The total lifetime applies, too.
+        resolver = self._makeOne(timeout=0.05, tries=10, lifetime=0.12)
+        with self.assertRaises(socket.gaierror):
+            resolver.getaddrinfo('slow.example.com', 80, socket.AF_INET)
+        # Three tries fit, give or take the loop's timer resolution.
+        self.assertIn(len(self.server.queries) - 2, (3, 4))
+
+    def test_next_nameserver(self):
+        # Nothing listens on this port, so it's refused at once.
+        closed = gsocket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        closed.bind(('127.0.0.1', 0))
+        dead = closed.getsockname()
+        closed.close()
+        resolver = self._makeOne([dead, '127.0.0.1:%d' % self.server.port], timeout=5)
+        self.server.add(b'www.example.com', A, '10.0.0.1')
+        with gevent.Timeout(2):
+            self.assertEqual(resolver.gethostbyname('www.example.com'), '10.0.0.1')
+            # The refusal of one query can be noticed sending the next.
+            result = resolver.getaddrinfo('www.example.com', 80, 0, socket.SOCK_STREAM)
+            self.assertEqual([r[4] for r in result], [('10.0.0.1', 80)])
+
+    def test_hosts_file(self):
+        self.assertEqual(self.resolver.gethostbyname('hosted-alias'), '10.1.1.1')
+        self.assertEqual(self.resolver.gethostbyname_ex('hosted-alias'),
+                         ('hosted.example', ['hosted.example'], ['10.1.1.1']))
+        self.assertEqual(self.resolver.gethostbyaddr('10.1.1.1'),
+                         ('hosted.example', ['hosted-alias'], ['10.1.1.1']))
+        self.assertEqual(self.server.queries, [])
+
+    def test_search(self):
+        resolver = self._makeOne(search=['corp.example', 'example.com'], ndots=1)
+        self.server.add(b'www.example.com', A, '10.0.0.1')
+        self.server.add(b'db.corp.example', A, '10.0.0.2')
+        self.assertEqual(resolver.gethostbyname('www'), '10.0.0.1')
+        self.assertEqual([q[1] for q in self.server.queries],
+                         [b'www.corp.example', b'www.example.com'])
+        del self.server.queries[:]
+        # Names with enough dots are tried as they are first.
+        self.assertEqual(resolver.gethostbyname('db.corp.example'), '10.0.0.2')
+        self.assertEqual(len(self.server.queries), 1)
+
+    def test_gethostbyaddr(self):
+        self.server.add(b'9.0.0.10.in-addr.arpa', PTR, b'nine.example.com')
+        self.server.add(
+            b'1.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa',
+            PTR, b'six.example.com')
+        self.assertEqual(self.resolver.gethostbyaddr('10.0.0.9'),
+                         ('nine.example.com', [], ['10.0.0.9']))
+        self.assertEqual(self.resolver.gethostbyaddr('2001:db8::1'),
+                         ('six.example.com', [], ['2001:db8::1']))
+        with self.assertRaises(socket.herror):
+            self.resolver.gethostbyaddr('10.0.0.8')
+
+        self.assertEqual(self.resolver.getnameinfo(('10.0.0.9', 80), 0),
+                         ('nine.example.com', 'http'))
+        self.assertEqual(self.resolver.getnameinfo(('10.0.0.9', 80), socket.NI_NOFQDN),
+                         ('nine', 'http'))
+        self.assertEqual(self.resolver.getnameinfo(('10.0.0.8', 80), socket.NI_NUMERICSERV),
+                         ('10.0.0.8', '80'))
+        with self.assertRaises(socket.gaierror):
+            self.resolver.getnameinfo(('10.0.0.8', 80), socket.NI_NAMEREQD)
+
+    def test_numeric(self):
+        self.assertEqual(self.resolver.getaddrinfo('10.0.0.1', 80, socket.AF_INET,
+                                                   socket.SOCK_STREAM),
+                         socket.getaddrinfo('10.0.0.1', 80, socket.AF_INET,
+                                            socket.SOCK_STREAM))
+        self.assertEqual(self.server.queries, [])
+
+
+class TestConfiguration(greentest.TestCase):
+
+    def test_nameservers(self):
+        parse = stub._parse_nameserver
+        self.assertEqual(parse('10.0.0.1'), (socket.AF_INET, ('10.0.0.1', 53)))
+        self.assertEqual(parse('10.0.0.1:5353'), (socket.AF_INET, ('10.0.0.1', 5353)))
+        self.assertEqual(parse('::1'), (socket.AF_INET6, ('::1', 53, 0, 0)))
+        self.assertEqual(parse('[::1]:5353'), (socket.AF_INET6, ('::1', 5353, 0, 0)))
+        self.assertEqual(parse(('10.0.0.1', 5353)), (socket.AF_INET, ('10.0.0.1', 5353)))
+        with self.assertRaises(socket.gaierror):
+            parse('dns.example.com')
+
+    def test_resolv_conf(self):
+        fd, fname = tempfile.mkstemp()
+        self.addCleanup(os.remove, fname)
+        with os.fdopen(fd, 'w') as f:
+            f.write(
+                '# comment\n'
+                'nameserver 10.0.0.1\n'
+                'nameserver 10.0.0.2\n'
+                'domain ignored.example\n'
+                'search corp.example example.com\n'
+                'options ndots:2 timeout:1 attempts:3 rotate\n'
+            )
+        resolver = Resolver(resolv_conf=fname, nameservers=None)
+        self.addCleanup(resolver.close)
+        if not stub.config.resolver_nameservers:
+            self.assertEqual(resolver.nameservers, [
+                (socket.AF_INET, ('10.0.0.1', 53)),
+                (socket.AF_INET, ('10.0.0.2', 53)),
+            ])
+        self.assertEqual(resolver.search, [b'corp.example', b'example.com'])
+        self.assertEqual((resolver.ndots, resolver.timeout, resolver.tries), (2, 1.0, 3))
+
+
+if __name__ == '__main__':
+    greentest.main()
@@ -14,6 +14,7 @@ from gevent.testing import WIN
 
 from gevent import socket
 import gevent
+import gevent.event
 from gevent.server import StreamServer
 from gevent.exceptions import LoopExit
 
@@ -558,6 +559,119 @@ class TestSSLGetCertificate(TestCase):
         with self.assertRaises(BadWrapException):
             self.server._handle(None, None)
 
+class TestAdmissionControl(greentest.TestCase):
+
+    spawn = 'default'
+
+    def _make_server(self, handle, **attrs):
+        server = StreamServer((greentest.DEFAULT_BIND_ADDR, 0), handle, spawn=self.spawn)
+        for k, v in attrs.items():
+            setattr(server, k, v)
+        server.start()
+        self._close_on_teardown(server.stop)
+        return server
+
+    def _connect(self, server):
+        sock = socket.create_connection((greentest.DEFAULT_LOCAL_HOST_ADDR, server.server_port))
+        sock.settimeout(_DEFAULT_SOCKET_TIMEOUT)
+        return self._close_on_teardown(sock)
+
+    def test_max_concurrency(self):
+        release = gevent.event.Event()
+
+        def handle(sock, _address):
+            sock.sendall(b'hi')
+            release.wait()
+
+        server = self._make_server(handle, max_concurrency=1)
+        first = self._connect(server)
+        self.assertEqual(first.recv(2), b'hi')
+
+        second = self._connect(server)
+        # Closed without being handled.
+        self.assertEqual(second.recv(2), b'')
+        self.assertEqual(server.connections_accepted, 1)
+        self.assertEqual(server.connections_shed, 1)
+        self.assertEqual(server.connections_in_flight, 1)
+
+        release.set()
+        self.assertEqual(first.recv(2), b'')
+        self.assertEqual(server.connections_in_flight, 0)
+
+        third = self._connect(server)
+        self.assertEqual(third.recv(2), b'hi')
+        self.assertEqual(server.connections_accepted, 2)
+
+    def test_max_queue_time(self):
+        handled = []
+        # Any wait at all is too long.
+        server = self._make_server(lambda s, a: handled.append(a), max_queue_time=0)
+        sock = self._connect(server)
+        self.assertEqual(sock.recv(2), b'')
+        self.assertEqual(handled, [])
+        self.assertEqual(server.connections_accepted, 0)
+        self.assertEqual(server.connections_shed, 1)
+        self.assertEqual(server.connections_in_flight, 0)
+
+    def test_no_budget(self):
+        server = self._make_server(lambda s, a: s.sendall(b'hi'))
+        sock = self._connect(server)
+        self.assertEqual(sock.recv(2), b'hi')
+        self.assertEqual(server.connections_accepted, 1)
+        self.assertEqual(server.connections_shed, 0)
+
+
+class TestAdmissionControlPool(TestAdmissionControl):
+
+    spawn = 1
+
+    def test_pool_full(self):
+        release = gevent.event.Event()
+        # The pool, not max_concurrency, is the limit here.
+        server = self._make_server(lambda s, a: release.wait(), max_concurrency=10)
+        first = self._connect(server)
+        gevent.sleep(SMALLEST_RELIABLE_DELAY)
+        self.assertEqual(server.connections_accepted, 1)
+        second = self._connect(server)
+        self.assertEqual(second.recv(2), b'')
+        self.assertEqual(server.connections_shed, 1)
+        release.set()
+        self.assertEqual(first.recv(2), b'')
+
+    def test_restart_after_killing_queued_handlers(self):
+        handled = []
+
+        def handle(_sock, address):
+            handled.append(address)
+
+        server = self._make_server(handle, max_concurrency=1)
+        pool = server.pool
+        # A connection whose handler is queued in the pool, but
+        # hasn't run yet...
+        ours, theirs = socket.socketpair()
+        self._close_on_teardown(theirs)
+        theirs.settimeout(_DEFAULT_SOCKET_TIMEOUT)
+        server.do_handle(ours, ('127.0.0.1', 0))
+        self.assertEqual(server.connections_in_flight, 1)
+        # ...when the pool is killed, as stop() does to handlers that
+        # don't finish in time.
+        pool.kill()
+        self.assertEqual(handled, [])
+        self.assertEqual(theirs.recv(2), b'')
+        self.assertEqual(server.connections_in_flight, 0)
+
+        # After a restart, connections aren't shed. (Stopping
+        # forgets the handler and the pool.)
+        server.stop()
+        server.set_handle(handle)
+        server.set_spawn(pool)
+        server.start()
+        sock = self._connect(server)
+        self.assertEqual(sock.recv(2), b'')
+        self.assertEqual(len(handled), 1)
+        self.assertEqual(server.connections_shed, 0)
+
+
 # test non-socket.error exception in accept call: fatal
 # test error in spawn(): non-fatal
 # test error in spawned handler: non-fatal
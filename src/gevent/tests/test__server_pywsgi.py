@@ -102,5 +102,28 @@ class TestSSLGetCertificate(test__server.TestSSLGetCertificate):
 class TestPoolSpawn(test__server.TestPoolSpawn): # pylint:disable=too-many-ancestors
     Settings = Settings
 
+class TestAdmissionControl(greentest.TestCase):
+
+    def test_shed_with_503(self):
+        from gevent import socket as gsocket
+        server = SimpleWSGIServer((greentest.DEFAULT_BIND_ADDR, 0), log=None)
+        server.max_concurrency = 1
+        server.start()
+        self._close_on_teardown(server.stop)
+        address = (greentest.DEFAULT_LOCAL_HOST_ADDR, server.server_port)
+
+        with gsocket.create_connection(address) as first:
+            first.sendall(b'GET /long HTTP/1.1\r\n\r\n')
+            gevent.sleep(0.1)
+            with gsocket.create_connection(address) as second:
+                second.sendall(b'GET /ping HTTP/1.1\r\n\r\n')
+                second.settimeout(greentest.DEFAULT_SOCKET_TIMEOUT)
+                with second.makefile('rb') as f:
+                    result = f.read()
+        self.assertTrue(result.startswith(b'HTTP/1.1 503 Service Unavailable\r\n'), result)
+        self.assertIn(b'Connection: close\r\n', result)
+        self.assertEqual(server.connections_accepted, 1)
+        self.assertEqual(server.connections_shed, 1)
+
 if __name__ == '__main__':
     greentest.main()
@@ -264,6 +264,51 @@ class TestTCP(greentest.TestCase):
         data = b''
         self._test_sendall(data, data, client_method='send')
 
+    def _long_data_buffers(self):
+        # More buffers than can be passed to one sendmsg() call,
+        # of several types, including empty ones.
+        data = self.long_data
+        buffers = []
+        for i, start in enumerate(range(0, len(data), 50)):
+            chunk = data[start:start + 50]
+            kind = i % 4
+            if kind == 1:
+                chunk = bytearray(chunk)
+            elif kind == 2:
+                chunk = memoryview(chunk)
+            elif kind == 3:
+                chunk = array.array('B', chunk)
+                buffers.append(b'')
+            buffers.append(chunk)
+        self.assertGreater(len(buffers), 1024)
+        return buffers
+
+    def test_sendall_buffers(self):
+        self._test_sendall(self._long_data_buffers(), client_method='sendall_buffers')
+
+    def test_sendall_buffers_with_timeout(self):
+        self._test_sendall(self._long_data_buffers(), client_method='sendall_buffers',
+                           timeout=10)
+
+    def test_sendall_buffers_empty(self):
+        self._test_sendall([b'', b''], b'', client_method='sendall_buffers')
+
+    def test_sendfile(self):
+        import tempfile
+        with tempfile.TemporaryFile() as f:
+            f.write(self.long_data)
+            acceptor = gevent.spawn(self.listener.accept)
+            client = self.create_connection()
+            self._close_on_teardown(client)
+            conn, _ = acceptor.get()
+            self._close_on_teardown(conn)
+            sender = gevent.spawn(client.sendfile, f, 100)
+            with conn.makefile('rb') as r:
+                received = r.read(len(self.long_data) - 100)
+            self.assertEqual(sender.get(), len(self.long_data) - 100)
+            self.assertEqual(received, self.long_data[100:])
+            self.assertEqual(f.tell(), len(self.long_data))
+
     def test_fullduplex(self):
         N = 100000
 
@@ -348,6 +393,54 @@ class TestTCP(greentest.TestCase):
             client.close()
             client_sock[0][0].close()
 
+    @greentest.skipOnWindows("On Windows send() accepts whatever is thrown at it")
+    def test_sendall_buffers_timeout(self):
+        client_sock = []
+        acceptor = Thread(target=lambda: client_sock.append(self.listener.accept()))
+        client = self.create_connection()
+        time.sleep(0.1)
+        assert client_sock
+        client.settimeout(0.1)
+        start = time.time()
+        try:
+            with self.assertRaises(self.TIMEOUT_ERROR):
+                client.sendall_buffers([b'hello', self._test_sendall_data])
+            if self._test_sendall_timeout_check_time:
+                took = time.time() - start
+                self.assertTimeWithinRange(took, 0.09, 0.21)
+        finally:
+            acceptor.join()
+            client.close()
+            client_sock[0][0].close()
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Needs AF_UNIX")
+    def test_sendall_buffers_timeout_whole_operation(self):
+        # Being able to send more part way through doesn't start the
+        # timeout over. (A UNIX socket becomes writable only when the
+        # other end reads.)
+        client, conn = socket.socketpair()
+        self._close_on_teardown(client)
+        self._close_on_teardown(conn)
+
+        def drain_once():
+            time.sleep(0.07)
+            conn.setblocking(False)
+            try:
+                while conn.recv(1 << 20):
+                    pass
+            except socket.error:
+                pass
+
+        reader = gevent.spawn(drain_once)
+        client.settimeout(0.1)
+        start = time.time()
+        with self.assertRaises(self.TIMEOUT_ERROR):
+            client.sendall_buffers([b'hello', self._test_sendall_data])
+        took = time.time() - start
+        reader.join()
+        if self._test_sendall_timeout_check_time:
+            self.assertTimeWithinRange(took, 0.09, 0.15)
+
     def test_makefile(self):
         def accept_once():
             conn, _ = self.listener.accept()
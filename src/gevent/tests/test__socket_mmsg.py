@@ -0,0 +1,160 @@
+from __future__ import absolute_import, print_function, division
+
+import subprocess
+import sys
+
+import gevent
+from gevent import socket
+from gevent import _mmsg
+from gevent.event import Event
+from gevent.server import DatagramServer
+import gevent.testing as greentest
+from gevent.testing import DEFAULT_BIND_ADDR
+from gevent.testing import DEFAULT_LOCAL_HOST_ADDR
+
+
+class TestManyDatagrams(greentest.TestCase):
+
+    family = socket.AF_INET
+    host = DEFAULT_LOCAL_HOST_ADDR
+
+    def setUp(self):
+        super(TestManyDatagrams, self).setUp()
+        self.receiver = self._close_on_teardown(socket.socket(self.family, socket.SOCK_DGRAM))
+        self.receiver.bind((self.host, 0))
+        self.sender = self._close_on_teardown(socket.socket(self.family, socket.SOCK_DGRAM))
+        self.sender.bind((self.host, 0))
+        self.address = self.receiver.getsockname()
+
+    def _datagrams(self, count):
+        return [(b'datagram %d' % i, self.address) for i in range(count)]
+
+    def _recv_exactly(self, count, bufsize=100):
+        received = []
+        while len(received) < count:
+            received.extend(self.receiver.recvfrom_many(count - len(received), bufsize))
+        return received
+
+    def test_send_and_receive(self):
+        datagrams = self._datagrams(50)
+        self.assertEqual(self.sender.sendto_many(datagrams), 50)
+        received = self._recv_exactly(50)
+        self.assertEqual([data for data, _ in received],
+                         [data for data, _ in datagrams])
+        sender_address = self.sender.getsockname()
+        for _, address in received:
+            self.assertEqual(address, sender_address)
+
+    def test_receive_waits(self):
+        def send():
+            gevent.sleep(0.1)
+            self.sender.sendto_many(self._datagrams(3))
+        glet = gevent.spawn(send)
+        received = self.receiver.recvfrom_many(10, 100)
+        self.assertGreaterEqual(len(received), 1)
+        self.assertLessEqual(len(received), 3)
+        glet.join()
+
+    def test_receive_truncates(self):
+        self.sender.sendto_many([(b'x' * 100, self.address)])
+        received = self.receiver.recvfrom_many(10, 10)
+        self.assertEqual(received[0][0], b'x' * 10)
+
+    def test_receive_nonblocking(self):
+        self.receiver.setblocking(False)
+        with self.assertRaises(BlockingIOError):
+            self.receiver.recvfrom_many(10, 100)
+
+    def test_receive_timeout(self):
+        self.receiver.settimeout(0.01)
+        with self.assertRaises(socket.timeout):
+            self.receiver.recvfrom_many(10, 100)
+
+    def test_send_connected_and_buffer_types(self):
+        self.sender.connect(self.address)
+        datagrams = [(b'bytes', None), (bytearray(b'bytearray'), None),
+                     (memoryview(b'memoryview'), self.address)]
+        self.assertEqual(self.sender.sendto_many(iter(datagrams)), 3)
+        received = self._recv_exactly(3)
+        self.assertEqual([data for data, _ in received],
+                         [b'bytes', b'bytearray', b'memoryview'])
+
+    def test_send_more_than_batch(self):
+        count = _mmsg.MAX_BATCH + 10
+        # Make sure they fit in the receive buffer.
+        self.receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
+        datagrams = [(b'x', self.address)] * count
+        self.assertEqual(self.sender.sendto_many(datagrams), count)
+        self.assertEqual(len(self._recv_exactly(count)), count)
+
+    def test_loop_fallbacks(self):
+        self.assertEqual(
+            _mmsg._sendto_many_loop(self.sender._sock, self._datagrams(5), 0),
+            5)
+        received = []
+        while len(received) < 5:
+            self.receiver._wait(self.receiver._read_event)
+            received.extend(_mmsg._recvfrom_many_loop(self.receiver._sock, 5, 100, 0))
+        self.assertEqual([data for data, _ in received],
+                         [data for data, _ in self._datagrams(5)])
+
+
+@greentest.skipUnless(socket.has_ipv6, "Needs IPv6")
+class TestManyDatagramsIPv6(TestManyDatagrams):
+
+    family = socket.AF_INET6
+    host = '::1'
+
+    def setUp(self):
+        try:
+            super(TestManyDatagramsIPv6, self).setUp()
+        except OSError as ex:
+            self.skipTest("IPv6 loopback not available: %s" % (ex,))
+
+
+class TestDatagramServerBatch(greentest.TestCase):
+
+    def test_batch_handler(self):
+        received = []
+        done = Event()
+
+        def handle(datagrams):
+            self.assertIsInstance(datagrams, list)
+            received.extend(datagrams)
+            if len(received) >= 20:
+                done.set()
+
+        server = DatagramServer((DEFAULT_BIND_ADDR, 0), handle, batch_size=8)
+        server.start()
+        self._close_on_teardown(server.stop)
+        client = self._close_on_teardown(socket.socket(socket.AF_INET, socket.SOCK_DGRAM))
+        address = (DEFAULT_LOCAL_HOST_ADDR, server.server_port)
+        client.sendto_many([(b'%d' % i, address) for i in range(20)])
+        done.wait(5)
+        self.assertEqual(sorted(int(data) for data, _ in received), list(range(20)))
+
+    def test_bad_batch_size(self):
+        with self.assertRaises(ValueError):
+            DatagramServer((DEFAULT_BIND_ADDR, 0), batch_size=0)
+
+
+class TestImport(greentest.TestCase):
+
+    def _check_ctypes_not_loaded(self, module):
+        script = (
+            'import sys; import %s; '
+            'print("ctypes" in sys.modules, "gevent._mmsg" in sys.modules)'
+        ) % (module,)
+        output = subprocess.check_output([sys.executable, '-c', script])
+        self.assertEqual(output.split(), [b'False', b'False'])
+
+    def test_ctypes_loaded_only_when_used(self):
+        self._check_ctypes_not_loaded('gevent.socket')
+
+    def test_server_doesnt_load_ctypes(self):
+        self._check_ctypes_not_loaded('gevent.server')
+        self._check_ctypes_not_loaded('gevent.pywsgi')
+
+
+if __name__ == '__main__':
+    greentest.main()
@@ -0,0 +1,118 @@
+from __future__ import absolute_import, print_function, division
+
+import gevent
+from gevent import socket
+from gevent import _socketcommon
+import gevent.testing as greentest
+from gevent.testing.sockets import tcp_listener
+
+
+class TestSplice(greentest.TestCase):
+
+    data = b''.join(b'%d,' % i for i in range(50000))
+
+    def _connected_pair(self):
+        listener = self._close_on_teardown(tcp_listener())
+        client = self._close_on_teardown(socket.create_connection(listener.getsockname()))
+        server, _ = listener.accept()
+        self._close_on_teardown(server)
+        return client, server
+
+    def _recvall(self, sock):
+        chunks = []
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                break
+            chunks.append(data)
+        return b''.join(chunks)
+
+    def _send_and_close(self, sock, data):
+        sock.sendall(data)
+        sock.shutdown(socket.SHUT_WR)
+
+    def test_splice(self):
+        # in_client -> in_server => out_client -> out_server
+        in_client, in_server = self._connected_pair()
+        out_client, out_server = self._connected_pair()
+
+        sender = gevent.spawn(self._send_and_close, in_client, self.data)
+        reader = gevent.spawn(self._recvall, out_server)
+        copied = socket.splice(in_server, out_client, bufsize=4096)
+        out_client.shutdown(socket.SHUT_WR)
+        sender.get()
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(reader.get(), self.data)
+
+    def test_splice_count(self):
+        in_client, in_server = self._connected_pair()
+        out_client, out_server = self._connected_pair()
+
+        in_client.sendall(self.data)
+        copied = socket.splice(in_server, out_client, count=1000, bufsize=300)
+        out_client.shutdown(socket.SHUT_WR)
+        self.assertEqual(copied, 1000)
+        self.assertEqual(self._recvall(out_server), self.data[:1000])
+
+    def test_splice_nonblocking(self):
+        a, b = self._connected_pair()
+        a.setblocking(False)
+        with self.assertRaises(ValueError):
+            socket.splice(a, b)
+
+    def test_relay(self):
+        # client <-> proxy_in, proxy_out <-> server
+        client, proxy_in = self._connected_pair()
+        proxy_out, server = self._connected_pair()
+        reply = self.data[::-1]
+
+        def serve():
+            request = self._recvall(server)
+            self._send_and_close(server, reply)
+            return request
+
+        server_glet = gevent.spawn(serve)
+        client_glet = gevent.spawn(self._send_and_close, client, self.data)
+        counts = socket.relay(proxy_in, proxy_out)
+        client_glet.get()
+        self.assertEqual(self._recvall(client), reply)
+        self.assertEqual(server_glet.get(), self.data)
+        self.assertEqual(counts, (len(self.data), len(reply)))
+
+    def test_relay_reverse_fails(self):
+        # Copying from proxy_out to proxy_in fails, while nothing
+        # comes from the client to proxy_in.
+        client, proxy_in = self._connected_pair()
+        proxy_out, server = self._connected_pair()
+        proxy_in.shutdown(socket.SHUT_WR)
+        server.sendall(b'reply')
+
+        def relay():
+            try:
+                socket.relay(proxy_in, proxy_out)
+            except socket.error as ex:
+                return ex
+
+        # Not waiting for the client, which has nothing to send.
+        relay_glet = gevent.spawn(relay)
+        relay_glet.join(5)
+        self.assertTrue(relay_glet.dead)
+        self.assertIsInstance(relay_glet.value, socket.error)
+        client.close()
+
+
+class TestSpliceBuffered(TestSplice):
+    # The fallback used without splice(2).
+
+    def setUp(self):
+        super(TestSpliceBuffered, self).setUp()
+        self.orig_flags = _socketcommon._SPLICE_FLAGS
+        _socketcommon._SPLICE_FLAGS = None
+
+    def tearDown(self):
+        _socketcommon._SPLICE_FLAGS = self.orig_flags
+        super(TestSpliceBuffered, self).tearDown()
+
+
+if __name__ == '__main__':
+    greentest.main()
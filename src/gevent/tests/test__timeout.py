@@ -146,5 +146,67 @@ class Test(greentest.TestCase):
         self.assertIsNone(r)
 
 
+class TestTimerWheel(Test):
+    # Run all the tests through a coarse timer wheel.
+
+    def setUp(self):
+        super(TestTimerWheel, self).setUp()
+        from gevent._timerwheel import TimerWheel
+        hub = get_hub()
+        self.orig_wheel = hub._timer_wheel
+        self.wheel = TimerWheel(hub.loop, SHOULD_EXPIRE / 2)
+        hub.timer_wheel = self.wheel
+
+    def tearDown(self):
+        hub = get_hub()
+        hub.timer_wheel = None
+        hub._timer_wheel = self.orig_wheel
+        super(TestTimerWheel, self).tearDown()
+
+    def test_uses_wheel(self):
+        timeout = gevent.Timeout(SHOULD_EXPIRE)
+        self.assertIsInstance(timeout.timer, type(self.wheel.timer(1)))
+        timeout.start()
+        self.assertTrue(timeout.pending)
+        self.assertEqual(len(self.wheel), 1)
+        timeout.close()
+        self.assertFalse(timeout.pending)
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_short_and_unref_are_precise(self):
+        for timeout in (gevent.Timeout(SHOULD_EXPIRE / 4),
+                        gevent.Timeout(SHOULD_EXPIRE, ref=False),
+                        gevent.Timeout(0)):
+            self.assertNotIsInstance(timeout.timer, type(self.wheel.timer(1)))
+            timeout.close()
+
+    def test_never_early(self):
+        from gevent._compat import monotonic
+        fired = []
+        timers = []
+        begin = monotonic()
+        for i in range(20):
+            t = self.wheel.timer(SHOULD_EXPIRE + i * SHOULD_EXPIRE / 4)
+            t.start(lambda t: fired.append((t, monotonic())), t)
+            timers.append(t)
+        # Stopping one prevents it from firing.
+        timers[-1].stop()
+        gevent.sleep(SHOULD_EXPIRE * 8)
+        self.assertEqual(len(fired), 19)
+        for t, when in fired:
+            self.assertGreaterEqual(when - begin, t.seconds)
+            self.assertFalse(t.active)
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_stop_in_callback(self):
+        fired = []
+        first = self.wheel.timer(SHOULD_EXPIRE)
+        second = self.wheel.timer(SHOULD_EXPIRE)
+        first.start(lambda: (fired.append(1), second.stop()))
+        second.start(fired.append, 2)
+        gevent.sleep(SHOULD_NOT_EXPIRE * 2)
+        self.assertEqual(fired, [1])
+
+
 if __name__ == '__main__':
     greentest.main()
@@ -15,6 +15,7 @@ import gevent
 from gevent import util
 from gevent import local
 from greenlet import getcurrent
+from greenlet import gettrace
 
 from gevent._compat import NativeStrIO
 
@@ -316,5 +317,105 @@ class TestFuncs(greentest.TestCase):
         t.join(10)
         self.assertEqual(completed, [1])
 
+
+class TestCPUAccounting(greentest.TestCase):
+
+    def test_accounting(self):
+        now = [0.0]
+        def timer():
+            return now[0]
+
+        def work(label, amount):
+            util.set_cpu_label(label)
+            now[0] += amount
+            gevent.sleep()
+            now[0] += amount
+
+        trace = gettrace()
+        with util.cpu_accounting(timer) as accounting:
+            glets = [gevent.spawn(work, 'a', 1),
+                     gevent.spawn(work, 'b', 3),
+                     gevent.spawn(work, 'a', 0.5)]
+            gevent.joinall(glets)
+            self.assertEqual(accounting.top(1)[0].label, 'b')
+        self.assertIs(gettrace(), trace)
+
+        top = accounting.top()
+        self.assertEqual([(s.label, s.cpu_time, s.switches) for s in top[:2]],
+                         [('b', 6, 2), ('a', 3, 4)])
+        self.assertEqual([s.label for s in accounting.top(1)], ['b'])
+
+        stats = util.get_cpu_stats(glets[1])
+        self.assertEqual((stats.label, stats.cpu_time, stats.switches),
+                         ('b', 6, 2))
+        # Let the hub finish notifying the links of the last greenlet
+        # so that it doesn't show up in the other tests.
+        gevent.sleep()
+
+    def test_current_greenlet(self):
+        util.set_cpu_label('current')
+        self.assertEqual(util.get_cpu_stats().label, 'current')
+        self.assertIs(util.get_cpu_stats(), util.get_cpu_stats(getcurrent()))
+
+
+class TestGreenletProfiler(greentest.TestCase):
+
+    def setUp(self):
+        super(TestGreenletProfiler, self).setUp()
+        config = gevent.config
+        self.orig_settings = config.monitor_thread, config.print_blocking_reports
+        config.monitor_thread = True
+        # Spinning here isn't a problem worth reporting.
+        config.print_blocking_reports = False
+
+    def tearDown(self):
+        config = gevent.config
+        config.monitor_thread, config.print_blocking_reports = self.orig_settings
+        hub = gevent.get_hub()
+        if hub.periodic_monitoring_thread is not None:
+            hub.periodic_monitoring_thread.kill()
+            hub.periodic_monitoring_thread = None
+        super(TestGreenletProfiler, self).tearDown()
+
+    def test_profile(self):
+        from gevent._compat import perf_counter
+
+        def spin():
+            # The monitoring thread first finishes the sleep it
+            # started before we began profiling.
+            deadline = perf_counter() + gevent.config.max_blocking_time + 0.2
+            while perf_counter() < deadline:
+                pass
+
+        profiler = util.GreenletProfiler(0.005)
+        with profiler:
+            self.assertTrue(profiler.running)
+            glet = gevent.spawn(spin)
+            glet.name = 'spinner'
+            glet.join()
+        self.assertFalse(profiler.running)
+
+        lines = profiler.format_collapsed()
+        spinning = [line for line in lines if line.startswith('spinner;')]
+        self.assertTrue(spinning, lines)
+        stack, count = spinning[0].rsplit(' ', 1)
+        self.assertGreater(int(count), 0)
+        self.assertIn('spin (' + __file__, stack.split(';')[-1])
+
+        out = NativeStrIO()
+        profiler.write_collapsed(out)
+        self.assertEqual(out.getvalue().splitlines(), lines)
+
+        profiler.clear()
+        self.assertEqual(profiler.format_collapsed(), [])
+
+    def test_monitor_thread_disabled(self):
+        gevent.config.monitor_thread = False
+        profiler = util.GreenletProfiler()
+        with self.assertRaises(RuntimeError):
+            profiler.start()
+        self.assertFalse(profiler.running)
+        profiler.stop()
+
 if __name__ == '__main__':
     greentest.main()
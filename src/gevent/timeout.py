@@ -199,6 +199,13 @@ class Timeout(BaseException):
           Timeouts are not absolutely ordered and support no other comparisons; this
           is purely for convenience and may be removed or altered in the future.
 
+    .. versionchanged:: NEXT
+
+          If :attr:`gevent.config.timeout_resolution
+          <gevent._config.Config.timeout_resolution>` is set, timeouts
+          of at least that many seconds may expire up to that many
+          seconds late.
+
     """
 
     # We inherit a __dict__ from BaseException, so __slots__ actually
@@ -220,9 +227,15 @@ class Timeout(BaseException):
 
             self.timer = _FakeTimer
         else:
-            # XXX: A timer <= 0 could cause libuv to block the loop; we catch
-            # that case in libuv/loop.py
-            self.timer = get_hub().loop.timer(seconds or 0.0, ref=ref, priority=priority)
+            hub = get_hub()
+            wheel = hub.timer_wheel
+            if wheel is not None and ref and seconds >= wheel.resolution:
+                # A coarse timer is acceptable. See config.timeout_resolution.
+                self.timer = wheel.timer(seconds)
+            else:
+                # XXX: A timer <= 0 could cause libuv to block the loop; we catch
+                # that case in libuv/loop.py
+                self.timer = hub.loop.timer(seconds or 0.0, ref=ref, priority=priority)
 
     def start(self):
         """Schedule the timeout."""
@@ -23,6 +23,10 @@ __all__ = [
     'GreenletTree',
     'wrap_errors',
     'assert_switches',
+    'cpu_accounting',
+    'get_cpu_stats',
+    'set_cpu_label',
+    'GreenletProfiler',
 ]
 
 # PyPy is very slow at formatting stacks
@@ -650,6 +654,268 @@ class assert_switches(object):
             raise _FailedToSwitch(message)
 
 
+def get_cpu_stats(glet=None):
+    """
+    get_cpu_stats(glet=None) -> GreenletCPUStats
+
+    Return the CPU time accounting for *glet* (by default, the current
+    greenlet).
+
+    The result has the attributes ``label`` (see
+    :func:`set_cpu_label`), ``cpu_time`` (the fractional seconds the
+    greenlet has spent running while its time was being accounted
+    for, by :class:`cpu_accounting` or the :doc:`monitoring thread
+    </monitoring>`) and ``switches`` (the number of times it was
+    switched away from in that time). It is updated each time the
+    greenlet switches away.
+
+    .. versionadded:: NEXT
+    """
+    from gevent._tracer import get_cpu_stats as _get_cpu_stats
+    return _get_cpu_stats(glet if glet is not None else getcurrent())
+
+
+def set_cpu_label(label, glet=None):
+    """
+    Set the label under which the CPU time of *glet* (by default, the
+    current greenlet) is totaled.
+
+    *label* can be any hashable object; greenlets that are never given
+    a label are totaled under ``None``. (The monitoring thread labels
+    its hub ``'hub'``.) It can be
+    changed at any time, for example by a long-running greenlet that
+    handles one request after another. The time the greenlet already
+    used is not moved to the new label.
+
+    .. versionadded:: NEXT
+    """
+    get_cpu_stats(glet).label = label
+
+
+class cpu_accounting(object):
+    """
+    A context manager that accounts for the CPU time used by each
+    greenlet in the current thread while the body of the with
+    statement runs.
+
+    The time is recorded for each greenlet (see :func:`get_cpu_stats`)
+    and totaled by the label given to the greenlets with
+    :func:`set_cpu_label`. The totals are available from :meth:`top`.
+
+    The :doc:`monitoring thread </monitoring>` can also do this
+    continuously; see :attr:`gevent._config.Config.cpu_accounting_period`.
+
+    :keyword timer: A function returning the current time in
+        fractional seconds. The default is :func:`time.perf_counter`,
+        so the time the hub spends waiting for IO is charged to the
+        hub. Pass :func:`time.thread_time` to count only the time the
+        thread is actually running, at a somewhat higher cost per
+        switch.
+
+    Example::
+
+        with cpu_accounting() as accounting:
+            gevent.joinall([gevent.spawn(handle, request) for request in requests])
+        for stats in accounting.top(5):
+            print(stats.label, stats.cpu_time, stats.switches)
+
+    .. versionadded:: NEXT
+    """
+
+    tracer = None
+
+    def __init__(self, timer=None):
+        self.timer = timer
+        self.totals = {}
+
+    def __enter__(self):
+        from gevent import _tracer
+        self.tracer = _tracer.CPUAccountingTracer(self.timer)
+        return self
+
+    def __exit__(self, t, v, tb):
+        tracer = self.tracer
+        self.tracer = None
+        tracer.kill()
+        self.totals = tracer.totals
+
+    def top(self, count=None):
+        """
+        Return the totals for each label, the labels that used the
+        most CPU time first, up to *count* of them.
+
+        This can be called while the with statement is running.
+        """
+        from gevent._tracer import top_cpu_usage
+        totals = self.tracer.totals if self.tracer is not None else self.totals
+        return top_cpu_usage(totals, count)
+
+
+class GreenletProfiler(object):
+    """
+    A sampling profiler for the greenlets of one hub.
+
+    While it is running, the hub's :doc:`monitoring thread
+    </monitoring>` looks at what the hub's native thread is doing
+    every *interval* seconds and records the call stack of the
+    greenlet that is running (or of the hub itself, when it's
+    waiting for or dispatching events). The samples are counted by
+    greenlet name and call stack. :meth:`format_collapsed` returns
+    them in the "collapsed stack" format read by flame graph tools
+    such as ``flamegraph.pl`` and speedscope.
+
+    The work is done in the monitoring thread; the hub only pays for
+    it by briefly giving up the GIL at each sample. At the default
+    interval this is cheap enough to leave running in production.
+
+    The hub's monitoring thread must be enabled (see
+    :attr:`gevent._config.Config.monitor_thread`). The profiler can be
+    started and stopped at any time, for example from a
+    :mod:`gevent.backdoor` console::
+
+        >>> from gevent.util import GreenletProfiler
+        >>> profiler = GreenletProfiler()
+        >>> profiler.start()
+        >>> # ... later ...
+        >>> profiler.stop()
+        >>> with open('/tmp/gevent.folded', 'w') as f:
+        ...     profiler.write_collapsed(f)
+
+    It can also be used as a context manager.
+
+    :keyword float interval: How often to sample, in fractional
+        seconds. The monitoring thread wakes up at most every 5ms.
+        Sampling begins after the monitoring thread finishes the
+        sleep it was in when :meth:`start` was called, which can
+        take up to :attr:`~gevent._config.Config.max_blocking_time`.
+    :keyword hub: The hub to profile. By default, the hub of the thread
+        that calls :meth:`start`.
+    :keyword int max_depth: The most frames recorded for one sample;
+        the innermost ones are kept.
+
+    Greenlets are named by their :attr:`gevent.Greenlet.name`, if one
+    was assigned, and otherwise by their class, so that the samples
+    for similar greenlets are added together.
+
+    .. versionadded:: NEXT
+    """
+
+    def __init__(self, interval=0.01, hub=None, max_depth=100):
+        self.interval = interval
+        self.hub = hub
+        self.max_depth = max_depth
+        #: The samples: ``{(greenlet_name, code_objects): count}``, with
+        #: the code objects of the outermost frame first.
+        self.samples = {}
+        self._monitor = None
+
+    @property
+    def running(self):
+        """Whether the profiler is collecting samples."""
+        return self._monitor is not None
+
+    def start(self):
+        """
+        Start collecting samples, adding to any already collected.
+
+        This must be called in the thread of the hub being profiled.
+        """
+        if self._monitor is not None:
+            return
+        if self.hub is None:
+            from gevent.hub import get_hub
+            self.hub = get_hub()
+        monitor = self.hub.start_periodic_monitoring_thread()
+        if monitor is None:
+            raise RuntimeError("The monitoring thread is not enabled; "
+                               "see gevent.config.monitor_thread")
+        self._monitor = monitor
+        monitor.add_monitoring_function(self.sample, self.interval)
+
+    def stop(self):
+        """
+        Stop collecting samples.
+        """
+        monitor = self._monitor
+        if monitor is not None:
+            self._monitor = None
+            monitor.add_monitoring_function(self.sample, None)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, t, v, tb):
+        self.stop()
+
+    def clear(self):
+        """Discard the samples collected so far."""
+        self.samples = {}
+
+    def sample(self, hub):
+        # Called in the monitoring thread. Only code objects are kept,
+        # so no frames (and their locals) are kept alive.
+        monitor = self._monitor
+        if monitor is None:
+            return
+        frame = sys._current_frames().get(hub.thread_ident)
+        if frame is None:
+            return
+        codes = []
+        max_depth = self.max_depth
+        while frame is not None and len(codes) < max_depth:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        del frame
+        codes.reverse()
+
+        glet = monitor._greenlet_tracer.active_greenlet
+        if glet is hub:
+            name = 'hub'
+        elif glet is None:
+            name = 'unknown'
+        else:
+            # Not the name property: the default one isn't safe to
+            # create from another thread, and is unique to each greenlet.
+            name = getattr(glet, '__dict__', {}).get('name') or type(glet).__name__
+        key = (name, tuple(codes))
+        samples = self.samples
+        samples[key] = samples.get(key, 0) + 1
+
+    def format_collapsed(self):
+        """
+        Return the samples as a sorted list of lines in the collapsed
+        stack format: the greenlet name and the functions from the
+        outermost in, separated by semicolons, followed by a space and
+        the number of samples.
+        """
+        labels = {}
+        counts = {}
+        # Copy in case the monitoring thread adds to it meanwhile.
+        for (name, codes), count in dict(self.samples).items():
+            stack = [name]
+            for code in codes:
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = '%s (%s:%d)' % (
+                        getattr(code, 'co_qualname', code.co_name),
+                        code.co_filename,
+                        code.co_firstlineno,
+                    )
+                stack.append(label)
+            stack = ';'.join(stack)
+            counts[stack] = counts.get(stack, 0) + count
+        return ['%s %d' % item for item in sorted(counts.items())]
+
+    def write_collapsed(self, file):
+        """
+        Write the lines of :meth:`format_collapsed` to the text *file*.
+        """
+        for line in self.format_collapsed():
+            file.write(line)
+            file.write('\n')
+
+
 def clear_stack_frames(frame):
     """Do our best to clear local variables in all frames in a stack."""
     # On Python 3, frames have a .clear() method that can raise a RuntimeError.